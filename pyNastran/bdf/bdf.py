@@ -52,6 +52,11 @@ from .bdf_interface.assign_type import (integer,
                                         integer_or_string, string)
 
 from pyNastran.bdf.bdf_interface.model_group import ModelGroup
+from pyNastran.bdf.bdf_interface.bulk_tokenizer import parse_bulk_data_fast
+from pyNastran.bdf.bdf_interface.bdf_parallel import parse_cards_parallel
+from pyNastran.bdf.bdf_interface.model_cache import read_bdf_cached
+from pyNastran.bdf.bdf_interface.incremental_read import set_file_state, reload_changed
+from pyNastran.bdf.bdf_interface.compact_storage import set_compact_storage
 from .cards.elements.elements import CFAST, CGAP, CRAC2D, CRAC3D, PLOTEL, GENEL
 from .cards.properties.properties import PFAST, PGAP, PRAC2D, PRAC3D
 from .cards.properties.solid import PLSOLID, PSOLID, PIHEX, PCOMPS, PCOMPLS
@@ -545,6 +550,16 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self._remove_disabled_cards = False
         self.use_new_deck_parser = False
 
+        # tokenize the high-volume cards (e.g., GRID, CQUAD4) with numpy
+        self.use_fast_tokenizer = False
+
+        # store the GRIDs and the common elements in numpy columns
+        # (see compact_storage.py)
+        self.use_compact_storage = False
+
+        # the number of processes used to create the cards (see read_bdf)
+        self._nworkers = 1
+
         # file management parameters
         self.active_filenames: list[str] = []
         self.active_filename: Optional[str] = None
@@ -1061,7 +1076,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         self.log.info(f'loading  BDF obj {obj_filename}')
         with open(obj_filename, 'rb') as obj_file:
             obj = load(obj_file)
+        self._load_object(obj)
 
+    def _load_object(self, obj: BDF) -> None:
+        """copies the attributes of an unpickled BDF"""
         # these are properties, functions, etc.
         keys_to_skip = [
             'case_control_deck',
@@ -1299,7 +1317,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                  punch: bool=False,
                  read_includes: bool=True,
                  save_file_structure: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 nworkers: int=1) -> None:
         """
         Read method for the bdf files
 
@@ -1319,6 +1338,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             enables the ``write_bdfs`` method
         encoding : str; default=None -> system default
             the unicode encoding
+        nworkers : int; default=1
+            the number of threads used to read the INCLUDE files and the
+            number of processes used to create the cards (e.g., GRID,
+            CQUAD4); the cards are added to the model in deck order
 
         .. code-block:: python
 
@@ -1338,6 +1361,10 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         """
         self.save_file_structure = save_file_structure
+        self._nworkers = nworkers
+        if self.use_compact_storage and not save_file_structure:
+            # the cards of save_file_structure store the file number
+            set_compact_storage(self)
         if bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
             check_path(bdf_filename, 'bdf_filename')
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
@@ -1349,6 +1376,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                          consider_superelements=self.is_superelements,
                          log=self.log, debug=self.debug)
         obj.use_new_parser = self.use_new_deck_parser
+        obj.nworkers = nworkers
 
         out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
         (system_lines,
@@ -1357,6 +1385,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
          bulk_data_lines, bulk_data_ilines,
          additional_deck_lines) = out
         self._set_pybdf_attributes(obj, save_file_structure)
+        self._ifile_card_count = defaultdict(int)
 
         #assert system_lines == [], system_lines
         #assert executive_control_lines == [], executive_control_lines
@@ -1384,7 +1413,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             self.is_superelements = True
             self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
                           read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+                          encoding=encoding, nworkers=nworkers)
             return
 
         if additional_deck_lines:
@@ -1404,9 +1433,42 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.cross_reference(xref=xref)
         self._xref = xref
+        if save_file_structure and isinstance(bdf_filename, (str, PurePath)):
+            set_file_state(self, bulk_data_ilines)
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
+    def reload_changed(self, validate: bool=True) -> list[str]:
+        """
+        Re-reads the INCLUDE files that changed since the model was read.
+
+        The cards of the changed files are removed and the files are read
+        again.  The new cards and the cards that referenced a removed card
+        are cross-referenced (if the model was cross-referenced).  The
+        model is read again if the main file changed or a changed file
+        can't be read on its own (e.g., it has an INCLUDE).
+
+        Parameters
+        ----------
+        validate : bool; default=True
+            runs various checks on the new cards
+
+        Returns
+        -------
+        filenames : list[str]
+            the files that changed
+
+        .. code-block:: python
+
+           >>> model = read_bdf(bdf_filename, save_file_structure=True)
+           >>> # edit properties.inc
+           >>> model.reload_changed()
+           ['/path/to/properties.inc']
+
+        .. note:: requires ``read_bdf(..., save_file_structure=True)``
+        """
+        return reload_changed(self, validate=validate)
+
     def _parse_all_cards(self, bulk_data_lines: list[str], bulk_data_ilines: Any) -> None:
         """creates and loads all the cards the bulk data section"""
         strict = True
@@ -1424,14 +1486,19 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                             ##bdf_file_obj.write(comment + '\n')
                             #bdf_file_obj.write('\n'.join(cardlines) + '\n')
                         #bdf_file_obj.write('\n')
-        else:
+            self._parse_cards(cards_list, cards_dict, card_count, strict=strict)
+        elif not (self.use_fast_tokenizer and
+                  parse_bulk_data_fast(self, bulk_data_lines, bulk_data_ilines)):
             cards_list, cards_dict, card_count = self.get_bdf_cards(
                 bulk_data_lines, bulk_data_ilines)
             #for card in cards_list:
                 #card_name = card[0]
                 #if card_name == 'CBAR':
                     #print(card)
-        self._parse_cards(cards_list, cards_dict, card_count, strict=strict)
+            if not (self._nworkers > 1 and
+                    parse_cards_parallel(self, cards_list, cards_dict, self._nworkers,
+                                         strict=strict)):
+                self._parse_cards(cards_list, cards_dict, card_count, strict=strict)
 
         if self.values_to_skip:
             for key, values in self.values_to_skip.items():
@@ -4298,6 +4365,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         save_file_structure = self.save_file_structure
         if save_file_structure:
+            # the number of cards of each type in each file (see ``reload_changed``)
+            ifile_card_count = self._ifile_card_count
             for icard, card in enumerate(cards_list):
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 card_name = cast(str, card_name)
@@ -4321,6 +4390,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                     for replicated_card in replicated_cards:
                         self.add_card_ifile(ifile, replicated_card, replicated_card[0],
                                             comment=comment, is_list=True, has_none=True)
+                        ifile_card_count[(ifile, replicated_card[0].upper())] += 1
                     continue
 
                 if self.is_reject(card_name):  # pragma: no cover
@@ -4330,6 +4400,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                 else:
                     self.add_card_ifile(ifile, card_lines, card_name, comment=comment,
                                         is_list=False, has_none=False)
+                    ifile_card_count[(ifile, card_name.upper())] += 1
 
         else:
             for icard, card in enumerate(cards_list):
@@ -4870,7 +4941,9 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
              read_cards: Optional[list[str]]=None,
              encoding: Optional[str]=None,
              log: Optional[SimpleLogger]=None,
-             debug: bool=True, mode: str='msc') -> BDF:
+             debug: bool=True, mode: str='msc',
+             nworkers: int=1,
+             cache_dir: Optional[str]=None) -> BDF:
     """
     Creates the BDF object
 
@@ -4905,6 +4978,13 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    nworkers : int; default=1
+        the number of threads/processes used to read the INCLUDE files
+        and create the cards
+    cache_dir : str; default=None -> no cache
+        the directory of the model cache; the model is loaded from the
+        cache when the main file and the INCLUDE files haven't changed
+        since they were read (see ``bdf_interface.model_cache``)
 
     Returns
     -------
@@ -4943,10 +5023,16 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
 
     if bdf_filename and not isinstance(bdf_filename, StringIO):
         check_path(bdf_filename, 'bdf_filename')
-    model.read_bdf(bdf_filename=bdf_filename, validate=validate,
-                   xref=xref, punch=punch, read_includes=True,
-                   save_file_structure=save_file_structure,
-                   encoding=encoding)
+    if cache_dir is not None and isinstance(bdf_filename, (str, PurePath)):
+        read_bdf_cached(model, str(bdf_filename), cache_dir, validate=validate,
+                        xref=xref, punch=punch,
+                        save_file_structure=save_file_structure,
+                        encoding=encoding, nworkers=nworkers)
+    else:
+        model.read_bdf(bdf_filename=bdf_filename, validate=validate,
+                       xref=xref, punch=punch, read_includes=True,
+                       save_file_structure=save_file_structure,
+                       encoding=encoding, nworkers=nworkers)
 
     #if 0:
         ### TODO: remove all the extra methods
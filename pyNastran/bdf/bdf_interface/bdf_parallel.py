@@ -0,0 +1,178 @@
+"""
+Defines parsing the bulk data cards with a pool of processes.
+
+The bulk data lines are split into cards (``get_bdf_cards``) by the main
+process.  The card objects (e.g., GRID, CQUAD4) are created by the workers
+in chunks and are returned to the main process, which adds them to the
+model in the order of the deck.  Adding the cards in the main process
+keeps the duplicate id checks/error handling the same as ``add_card``.
+
+The cards that depend on the model when they're parsed (e.g., the
+``_card_parser_prepare`` cards, replication) are parsed by the main
+process.
+
+Example
+-------
+>>> model = read_bdf(bdf_filename, nworkers=8)
+"""
+from __future__ import annotations
+import multiprocessing as mp
+from typing import Any, Optional, TYPE_CHECKING
+
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the number of cards that are parsed by a worker at a time
+CHUNK_SIZE = 5000
+
+#: the cards that are not split into fields (see ``create_card_object``)
+UNSPLIT_CARDS = {'DEQATN', 'PBRSECT', 'PBMSECT', 'GMCURV', 'GMSURF', 'OUTPUT', 'ADAPT',
+                 'MONDSP1'}
+
+
+def get_parallel_card_classes(model: BDF, card_names: set[str]) -> dict[str, Any]:
+    """
+    Gets the card classes of the cards that may be created by a worker,
+    which are the cards that are read and don't need the model to be parsed
+    """
+    card_classes = {}
+    for card_name in card_names:
+        if (card_name in model.cards_to_read and card_name in model._card_parser and
+                card_name not in UNSPLIT_CARDS):
+            card_classes[card_name] = model._card_parser[card_name][0]
+    return card_classes
+
+
+def _parse_card_chunk(args: tuple[dict[str, Any], list[tuple[str, str, list[str]]], bool],
+                      ) -> list[Any]:
+    """
+    Creates the card objects of a chunk of cards in a worker process
+    (with ``add_card_lax`` if strict=False; see ``_add_card_helper_lax``)
+
+    Returns
+    -------
+    card_objs : list[card / None]
+        the card objects; None if the card failed, so it can be reparsed
+        (and the error handled) by the main process
+    """
+    card_classes, cards, strict = args
+    card_objs = []
+    for card_name, comment, card_lines in cards:
+        try:
+            card = wipe_empty_fields(to_fields(card_lines, card_name))
+            card_obj = BDFCard(card, has_none=False)
+            card_class = card_classes[card_name]
+            if not strict and hasattr(card_class, 'add_card_lax'):
+                card_objs.append(card_class.add_card_lax(card_obj, comment=comment))
+            else:
+                card_objs.append(card_class.add_card(card_obj, comment=comment))
+        except Exception:
+            card_objs.append(None)
+    return card_objs
+
+
+def parse_cards_parallel(model: BDF, cards_list: list[tuple],
+                         cards_dict: dict[str, list], nworkers: int,
+                         chunk_size: Optional[int]=None, strict: bool=True) -> bool:
+    """
+    Parses the cards from ``get_bdf_cards`` with a pool of nworkers
+    processes (see ``_parse_cards``)
+
+    Parameters
+    ----------
+    model : BDF
+        the model to add the cards to
+    cards_list : list[(card_name, comment, card_lines, (ifile, iline))]
+        the cards in deck order
+    cards_dict : dict[card_name] = cards
+        the cards that are parsed as a group (e.g., BAROR)
+    nworkers : int
+        the number of processes
+    chunk_size : int; default=None -> CHUNK_SIZE
+        the number of cards per work unit
+    strict : bool; default=True
+        False: the cards are parsed with ``add_card_lax``
+
+    Returns
+    -------
+    is_parsed : bool
+        False if the cards should be parsed serially (e.g., replication,
+        ECHOON, model.echo=True, too few cards); the model is unchanged
+
+    """
+    if chunk_size is None:
+        chunk_size = CHUNK_SIZE
+    if model.save_file_structure or model._is_dynamic_syntax or cards_dict:
+        return False
+    if model.echo and not model.force_echo_off:
+        # the cards are echoed in order by the serial parser
+        return False
+
+    card_names = {card[0] for card in cards_list}
+    if any(card_name is None or '=' in card_name for card_name in card_names):
+        return False
+    if 'ECHOON' in card_names or 'ECHOOFF' in card_names:
+        return False
+
+    card_classes = get_parallel_card_classes(model, card_names)
+    icards = [icard for icard, card in enumerate(cards_list) if card[0] in card_classes]
+    nchunks = (len(icards) + chunk_size - 1) // chunk_size
+    if nchunks < 2:
+        model.log.debug(f'{len(icards)} cards; parsing the cards serially')
+        return False
+    model.log.debug(f'parsing {len(icards)} cards in {nchunks} chunks with nworkers={nworkers}')
+
+    args = []
+    for ichunk in range(nchunks):
+        cards = [cards_list[icard][:3] for icard in icards[ichunk*chunk_size:(ichunk+1)*chunk_size]]
+        card_classesi = {card_name: card_classes[card_name]
+                         for card_name in {card[0] for card in cards}}
+        args.append((card_classesi, cards, strict))
+
+    try:
+        with mp.Pool(min(nworkers, nchunks)) as pool:
+            card_objs_list = pool.map(_parse_card_chunk, args)
+    except Exception as error:
+        model.log.warning(f'a worker failed ({type(error).__name__}: {error}); '
+                          'parsing the cards serially')
+        return False
+
+    card_objs = [None] * len(cards_list)
+    for ichunk, card_objsi in enumerate(card_objs_list):
+        for icard, card_obj in zip(icards[ichunk*chunk_size:(ichunk+1)*chunk_size], card_objsi):
+            card_objs[icard] = card_obj
+    del card_objs_list
+    _add_cards(model, cards_list, card_objs, strict)
+    return True
+
+
+def _add_cards(model: BDF, cards_list: list[tuple], card_objs: list[Any],
+               strict: bool) -> None:
+    """
+    Adds the parsed cards to the model in deck order and parses the
+    remaining cards (see ``_parse_cards_list``)
+
+    The failed cards (and the cards that fail to be added; e.g., a
+    duplicate id) are reparsed with ``add_card``/``add_card_lax``, so the
+    errors are the same as the serial parser.
+    """
+    add_card = model.add_card if strict else model.add_card_lax
+    card_parser = model._card_parser
+    for card, card_obj in zip(cards_list, card_objs):
+        card_name, comment, card_lines, (ifile, unused_iline) = card
+        if card_obj is not None:
+            add_card_function = card_parser[card_name][1]
+            try:
+                add_card_function(card_obj)
+                model.increase_card_count(card_name)
+                continue
+            except (SyntaxError, AssertionError, KeyError, ValueError):
+                pass
+        elif model.is_reject(card_name):
+            model.reject_card_lines(card_name, card_lines, comment=comment)
+            continue
+        add_card(card_lines, card_name, comment=comment, ifile=ifile,
+                 is_list=False, has_none=False)
@@ -0,0 +1,598 @@
+"""
+Defines a vectorized tokenizer for the bulk data deck, which is used by
+``BDF.read_bdf`` when ``model.use_fast_tokenizer = True``.
+
+The lines are classified in bulk (card starts/continuations, small field,
+large field, free field) and are grouped into cards.  The fields of the
+high-volume cards (e.g., GRID, CQUAD4) are sliced out and the numbers are
+cast column-wise, so the card objects are created from pre-typed fields.
+
+Any card that the fast path can't reproduce exactly (e.g., comments, tabs,
+replication, unsupported card types) is parsed with ``BDF.get_bdf_cards``,
+so the model is the same as the one from the standard parser.
+
+Example
+-------
+>>> model = BDF()
+>>> model.use_fast_tokenizer = True
+>>> model.read_bdf(bdf_filename)
+"""
+from __future__ import annotations
+from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the number of characters of a line that are classified;
+#: longer lines are parsed by the standard parser
+LINE_WIDTH = 80
+
+#: the maximum width of a field (a large field)
+FIELD_WIDTH = 16
+
+#: the number of lines that are tokenized at once
+CHUNK_SIZE = 100_000
+
+# field types
+STR, INT, FLOAT, NUMBER = 0, 1, 2, 3
+_TYPE_CODES = {' ': STR, 'i': INT, 'f': FLOAT, 'n': NUMBER}
+
+#: the field types of the cards that are supported by the fast path
+#:   ' ' : string (e.g., components, names, blank fields)
+#:   'i' : integer
+#:   'f' : float
+#:   'n' : integer or float
+#: the default type is used for the fields after the last one
+#: (card_name, (field types, default type))
+FAST_CARDS = {
+    'GRID': (' iifffi i', ' '),
+    'CQUAD4': (' iiiiiinf iffff', ' '),
+    'CTRIA3': (' iiiiinf  ifff', ' '),
+    'CHEXA': (' ' + 'i' * 22, ' '),
+    'CTETRA': (' ' + 'i' * 12, ' '),
+    'CBAR': (' iiiinff iiffffff', ' '),
+    'CBUSH': (' iiiinffifiiff', ' '),
+    'RBE2': (' ii ', 'n'),
+    'FORCE': (' iiiffff', ' '),
+    'PLOAD4': (' iiffffiiifff', ' '),
+}
+_NTYPES = max(len(types) for types, unused_default in FAST_CARDS.values()) + 1
+
+# character codes
+_SPACE, _TAB, _STAR, _PLUS, _COMMA, _MINUS, _DOT = 32, 9, 42, 43, 44, 45, 46
+_DOLLAR, _EQUAL = 36, 61
+_LINE_FEED, _CARRIAGE_RETURN = 10, 13
+_E, _D, _LOWER_E, _LOWER_D = 69, 68, 101, 100
+
+
+def parse_bulk_data_fast(model: BDF, bulk_data_lines: list[str],
+                         bulk_data_ilines: Optional[np.ndarray]=None) -> bool:
+    """
+    Parses the bulk data lines into the model using the vectorized tokenizer
+
+    Parameters
+    ----------
+    model : BDF
+        the model to add the cards to
+    bulk_data_lines : list[str]
+        the bulk data lines
+    bulk_data_ilines : (nlines, 2) int ndarray; default=None
+        the (ifile, iline) of each line
+
+    Returns
+    -------
+    is_parsed : bool
+        False if the deck can't be tokenized (e.g., ECHOON, BAROR,
+        replication); the model is unchanged and the standard parser
+        should be used
+
+    """
+    if model.save_file_structure or model._is_dynamic_syntax or model.echo:
+        return False
+    if bulk_data_ilines is None:
+        bulk_data_ilines = np.zeros((len(bulk_data_lines), 2), dtype='int32')
+    if len(bulk_data_lines) != len(bulk_data_ilines):
+        return False
+
+    flags = _classify_lines(bulk_data_lines)
+    if flags is None:
+        return False
+    is_start, is_blank, has_dollar, is_bad, names = flags
+    istarts = np.flatnonzero(is_start)
+    if len(istarts) == 0:
+        return False
+
+    card_names = set(np.unique(names).tolist())
+    if (card_names & {'ECHOON', 'ECHOOFF', 'BAROR', 'BEAMOR'} or
+            any('=' in card_name for card_name in card_names)):
+        # the cards that change the state of the parser
+        return False
+
+    nlines = len(bulk_data_lines)
+    ienddata = np.flatnonzero(names == 'ENDDATA')
+    if len(ienddata):
+        # ENDDATA is parsed by get_bdf_cards, which stops at it
+        ienddata = ienddata[0]
+        istarts = istarts[:ienddata + 1]
+        names = names[:ienddata + 1]
+        nleftover = nlines - istarts[-1] - 1
+        if nleftover:
+            model.log.debug(f'exiting due to ENDDATA found with {nleftover:d} lines left')
+        nlines = istarts[-1] + 1
+
+    is_fast = _get_fast_blocks(model, istarts, names, nlines,
+                               is_blank, has_dollar, is_bad)
+    nblocks = len(istarts)
+    iblock_ends = np.hstack([istarts[1:], nlines])
+
+    # the runs of fast/slow blocks
+    iruns = np.hstack([0, np.flatnonzero(np.diff(is_fast.astype('int8'))) + 1, nblocks])
+    for iblock0, iblock1 in zip(iruns[:-1].tolist(), iruns[1:].tolist()):
+        if not is_fast[iblock0]:
+            iline0 = 0 if iblock0 == 0 else istarts[iblock0]
+            _parse_slow_blocks(model, bulk_data_lines, bulk_data_ilines,
+                               iline0, iblock_ends[iblock1 - 1], iblock1 < nblocks)
+            continue
+
+        # the blocks are tokenized in chunks to bound the memory usage
+        while iblock0 < iblock1:
+            iblock_end = np.searchsorted(iblock_ends, istarts[iblock0] + CHUNK_SIZE)
+            iblock_end = min(max(iblock_end, iblock0 + 1), iblock1)
+            is_last_line = iblock_end == nblocks and len(bulk_data_lines) == nlines
+            _parse_fast_blocks(model, bulk_data_lines, bulk_data_ilines,
+                               istarts[iblock0:iblock_end], iblock_ends[iblock_end - 1],
+                               names[iblock0:iblock_end], is_blank, is_last_line)
+            iblock0 = iblock_end
+    return True
+
+
+def get_line_codes(lines: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the character codes of the lines
+
+    Returns
+    -------
+    codes : (nlines, LINE_WIDTH) uint32 ndarray
+        the unicode code points; 0 is used after the end of the line and
+        line breaks are replaced with spaces (they're stripped from a field)
+    lengths : (nlines, ) int ndarray
+        the length of the lines without the trailing line break
+
+    """
+    nlines = len(lines)
+    lengths = np.fromiter(map(len, lines), dtype='int64', count=nlines)
+    for iline in np.flatnonzero(lengths > LINE_WIDTH).tolist():
+        lengths[iline] = len(lines[iline].rstrip('\r\n'))
+    codes = np.array(lines, dtype=f'U{LINE_WIDTH}').view('uint32')
+    codes[(codes == _LINE_FEED) | (codes == _CARRIAGE_RETURN)] = _SPACE
+    return codes.reshape(nlines, LINE_WIDTH), np.minimum(lengths, LINE_WIDTH + 1)
+
+
+def _classify_lines(lines: list[str]) -> Optional[tuple[np.ndarray, ...]]:
+    """
+    Classifies the lines with the same rules as ``BDF.get_bdf_cards``
+
+    Returns
+    -------
+    is_start : (nlines, ) bool ndarray
+        is the line the first line of a card
+    is_blank : (nlines, ) bool ndarray
+        is the line empty
+    has_dollar : (nlines, ) bool ndarray
+        does the line have a comment
+    is_bad : (nlines, ) bool ndarray
+        the line can't be tokenized (e.g., tabs, long lines)
+    names : (nstarts, ) str ndarray
+        the card names of the starting lines
+
+    None is returned if the card names can't be classified
+    """
+    flags = []
+    for iline0 in range(0, len(lines), CHUNK_SIZE):
+        flagsi = _classify_lines_chunk(lines[iline0:iline0 + CHUNK_SIZE])
+        if flagsi is None:
+            return None
+        flags.append(flagsi)
+    if not flags:
+        return None
+    return tuple(np.hstack(flag) for flag in zip(*flags))
+
+
+def _classify_lines_chunk(lines: list[str]) -> Optional[tuple[np.ndarray, ...]]:
+    """see ``_classify_lines``"""
+    codes, lengths = get_line_codes(lines)
+    icol = np.arange(LINE_WIDTH)
+    is_pad = icol[np.newaxis, :] >= lengths[:, np.newaxis]
+    is_space = (codes == _SPACE) | is_pad
+    is_comma = codes == _COMMA
+    has_comma = is_comma.any(axis=1)
+    has_star = (codes == _STAR).any(axis=1)
+    has_dollar = (codes == _DOLLAR).any(axis=1)
+    is_blank = is_space.all(axis=1) & (lengths <= LINE_WIDTH)
+    is_bad = (
+        (lengths > LINE_WIDTH) |
+        (has_comma & has_star) |
+        (codes == _EQUAL).any(axis=1) |
+        (((codes < _SPACE) | (codes > 126)) & ~is_pad).any(axis=1)  # tabs, unicode
+    )
+
+    # the free field lines with fields that are wider than a large field
+    icomma_lines = np.flatnonzero(has_comma & ~is_bad)
+    if len(icomma_lines):
+        is_commai = is_comma[icomma_lines]
+        icomma = np.maximum.accumulate(np.where(is_commai, icol, -1), axis=1)
+        width = np.where(is_commai | is_pad[icomma_lines], 0, icol - icomma)
+        is_bad[icomma_lines] |= width.max(axis=1) > FIELD_WIDTH
+
+    # line.split('$')[0].split(',')[0].split('\t')[0][:8].rstrip().upper()
+    name = codes[:, :8].copy()
+    is_cut = np.logical_or.accumulate(
+        (name == _COMMA) | (name == _TAB) | (name == _DOLLAR) | is_pad[:, :8], axis=1)
+    name[is_cut] = 0
+    if (((name < _SPACE) | (name > 126)) & (name != 0)).any():
+        return None
+    is_name_blank = ((name == _SPACE) | (name == 0)).all(axis=1)
+    first_char = codes[:, 0]
+    is_start = ~is_name_blank & (first_char != _PLUS) & (first_char != _STAR)
+    if (is_start & (first_char == _SPACE)).any():
+        # a card name with leading spaces
+        return None
+
+    # card_name.rstrip(' *')
+    is_lower = (name >= 97) & (name <= 122)
+    name[is_lower] -= 32
+    is_name_char = (name != _SPACE) & (name != _STAR) & (name != 0)
+    name_length = 8 - np.argmax(is_name_char[:, ::-1], axis=1)
+    name[icol[np.newaxis, :8] >= name_length[:, np.newaxis]] = 0
+    names = np.ascontiguousarray(name[is_start]).view('U8').ravel()
+    return is_start, is_blank, has_dollar, is_bad, names
+
+
+def _get_fast_blocks(model: BDF, istarts: np.ndarray, names: np.ndarray, nlines: int,
+                     is_blank: np.ndarray, has_dollar: np.ndarray,
+                     is_bad: np.ndarray) -> np.ndarray:
+    """
+    Finds the cards that may be tokenized
+
+    A card uses the fast path if it's a supported card type without comments.
+    A comment at the end of the previous card belongs to the card, so the
+    previous card may also not have a comment.
+    """
+    fast_names = [card_name for card_name in FAST_CARDS
+                  if card_name in model.cards_to_read and (
+                      card_name in model._card_parser or
+                      card_name in model._card_parser_prepare)]
+    block_dollar = np.logical_or.reduceat(has_dollar[:nlines], istarts)
+    block_bad = np.logical_or.reduceat(is_bad[:nlines], istarts)
+    pre_dollar = has_dollar[:istarts[0]].any()
+    prev_dollar = np.hstack([pre_dollar, block_dollar[:-1]])
+    is_fast = np.isin(names, fast_names) & ~block_dollar & ~prev_dollar & ~block_bad
+    if not is_blank[:istarts[0]].all():
+        # continuation lines before the first card
+        is_fast[0] = False
+    return is_fast
+
+
+def _parse_slow_blocks(model: BDF, bulk_data_lines: list[str],
+                       bulk_data_ilines: np.ndarray,
+                       iline0: int, iline1: int, is_next_card: bool) -> None:
+    """
+    Parses a run of cards with the standard parser
+
+    The first line of the next card is included, so the last card of the
+    run is closed the same way as the standard parser (e.g., the ifile/iline
+    of the first line); the next card is then dropped.
+    """
+    iline_end = iline1 + 1 if is_next_card else iline1
+    cards_list, cards_dict, card_count = model.get_bdf_cards(
+        bulk_data_lines[iline0:iline_end], bulk_data_ilines[iline0:iline_end, :])
+    if is_next_card:
+        cards_list.pop()
+    model._parse_cards(cards_list, cards_dict, card_count)
+
+
+def _parse_fast_blocks(model: BDF, bulk_data_lines: list[str],
+                       bulk_data_ilines: np.ndarray,
+                       istarts: np.ndarray, iline_end: int, names: np.ndarray,
+                       is_blank: np.ndarray, is_last_line: bool) -> None:
+    """tokenizes and adds a chunk of supported cards"""
+    iline0 = istarts[0]
+    lines = bulk_data_lines[iline0:iline_end]
+    ilines = np.flatnonzero(~is_blank[iline0:iline_end])
+    codes, lengths = get_line_codes(lines)
+    codes = codes[ilines]
+    lengths = lengths[ilines]
+    ilines += iline0
+    is_first = np.isin(ilines, istarts)
+
+    fields, field_types, icard_fields = _get_fields(codes, lengths, is_first, names)
+    values, nonblank = _cast_fields(fields, field_types)
+
+    # the fields of a card are [first field, last non-blank field]
+    ifields = np.where(nonblank, np.arange(len(fields)), -1)
+    icard_fields_end = np.maximum.reduceat(ifields, icard_fields) + 1
+    icard_lines = np.hstack([np.flatnonzero(is_first), len(ilines)])
+    ifiles = bulk_data_ilines[istarts, 0]
+    if is_last_line:
+        # the standard parser uses the last line for the last card
+        ifiles[-1] = bulk_data_ilines[-1, 0]
+
+    card_parser = model._card_parser
+    card_parser_prepare = model._card_parser_prepare
+    increase_card_count = model.increase_card_count
+    for icard, (card_name, i0, i1, ifile) in enumerate(zip(
+            names.tolist(), icard_fields.tolist(), icard_fields_end.tolist(),
+            ifiles.tolist())):
+        card_obj = BDFCard(values[i0:i1], has_none=False)
+        try:
+            if card_name in card_parser:
+                card_class, add_card_function = card_parser[card_name]
+                add_card_function(card_class.add_card(card_obj, comment=''))
+            else:
+                card_parser_prepare[card_name](card_name, card_obj, comment='')
+        except (SyntaxError, AssertionError, KeyError, ValueError):
+            # reparse the card from the lines for the error message
+            card_lines = [bulk_data_lines[iline] for iline in
+                          ilines[icard_lines[icard]:icard_lines[icard + 1]].tolist()]
+            model.add_card(card_lines, card_name, comment='', ifile=ifile,
+                           is_list=False, has_none=False)
+            continue
+        increase_card_count(card_name)
+
+
+def _get_fields(codes: np.ndarray, lengths: np.ndarray, is_first: np.ndarray,
+                names: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Slices the lines into fields (see ``to_fields``)
+
+    Returns
+    -------
+    fields : (nfields, FIELD_WIDTH) uint8 ndarray
+        the ASCII codes of the fields (with spaces)
+    field_types : (nfields, ) int ndarray
+        the STR/INT/FLOAT/NUMBER type of the field
+    icard_fields : (ncards, ) int ndarray
+        the index of the first field of each card
+
+    """
+    is_csv = (codes == _COMMA).any(axis=1)
+    is_large = (codes == _STAR).any(axis=1) & ~is_csv
+    nfields_line = np.where(is_large, 4, 8) + is_first
+    ifields0 = np.hstack([0, np.cumsum(nfields_line)])
+    nfields = ifields0[-1]
+    ifields0 = ifields0[:-1]
+    fields = np.zeros((nfields, FIELD_WIDTH), dtype='uint8')
+
+    # the card name field
+    ifirst = np.flatnonzero(is_first & ~is_csv)
+    fields[ifields0[ifirst], :8] = codes[ifirst, :8]
+
+    # small and large fixed fields
+    for is_large_field, width in [(False, 8), (True, 16)]:
+        nfieldsi = 64 // width
+        iline = np.flatnonzero((is_large == is_large_field) & ~is_csv)
+        ifield = ifields0[iline] + is_first[iline]
+        ifield = ifield[:, np.newaxis] + np.arange(nfieldsi)
+        fields[ifield, :width] = codes[iline, 8:72].reshape(len(iline), nfieldsi, width)
+
+    # free fields
+    iline = np.flatnonzero(is_csv)
+    if len(iline):
+        codesi = codes[iline]
+        icol = np.arange(LINE_WIDTH)
+        is_comma = codesi == _COMMA
+        icomma = np.maximum.accumulate(np.where(is_comma, icol, -1), axis=1)
+        ifield_line = np.cumsum(is_comma, axis=1)
+        is_firsti = is_first[iline, np.newaxis]
+
+        # line.split(',')[:9] or line.split(',')[1:9]
+        is_char = (
+            ~is_comma & (icol < lengths[iline, np.newaxis]) &
+            (ifield_line <= 8) & (is_firsti | (ifield_line >= 1)))
+        irow, icol_char = np.nonzero(is_char)
+        ifield = (ifields0[iline][irow] + ifield_line[irow, icol_char] -
+                  (~is_firsti[irow, 0]).astype('int64'))
+        fields[ifield, icol_char - icomma[irow, icol_char] - 1] = codesi[irow, icol_char]
+
+    # the type of each field from the card name and the field position
+    card_names = sorted(FAST_CARDS)
+    types_table = np.zeros((len(card_names), _NTYPES + 1), dtype='int8')
+    for i, card_name in enumerate(card_names):
+        types, default = FAST_CARDS[card_name]
+        types_table[i, :] = _TYPE_CODES[default]
+        types_table[i, :len(types)] = [_TYPE_CODES[char] for char in types]
+    icard_type = np.searchsorted(card_names, names)
+
+    icard_fields = ifields0[is_first]
+    icard = np.cumsum(is_first) - 1
+    ifield_card = np.arange(nfields) - np.repeat(icard_fields[icard], nfields_line)
+    field_types = types_table[np.repeat(icard_type[icard], nfields_line),
+                              np.minimum(ifield_card, _NTYPES)]
+    return fields, field_types, icard_fields
+
+
+def _cast_fields(fields: np.ndarray, field_types: np.ndarray) -> tuple[list, np.ndarray]:
+    """
+    Strips the fields and casts the numeric fields
+
+    The integers (e.g., -12) and the floats with a decimal point (e.g., 1.,
+    -1.2e3, 1.2D3, 1.2-3) are cast.  Anything else is left as a string, so
+    the card parses it the same way as the standard parser.
+
+    The numeric fields are checked/cast in place (the characters between
+    the first and last non-blank column), so only the strings are stripped.
+
+    Parameters
+    ----------
+    fields : (nfields, FIELD_WIDTH) uint8 ndarray
+        the ASCII codes of the fields (with spaces)
+    field_types : (nfields, ) int ndarray
+        the STR/INT/FLOAT/NUMBER type of the field
+
+    Returns
+    -------
+    values : list[str | int | float | None]
+        the field values
+    nonblank : (nfields, ) bool ndarray
+        is the field not blank
+
+    """
+    values = np.full(len(fields), None, dtype=object)
+    is_char = (fields != _SPACE) & (fields != 0)
+    nonblank = _count_row(is_char) > 0
+    inonblank = np.flatnonzero(nonblank)
+    fields = fields[inonblank]
+    is_char = is_char[inonblank]
+    field_types = field_types[inonblank]
+
+    # the first/last non-blank column
+    ifirst = np.argmax(is_char, axis=1)
+    ilast = FIELD_WIDTH - 1 - np.argmax(is_char[:, ::-1], axis=1)
+
+    # only the INT/NUMBER fields are integers and the FLOAT/NUMBER fields
+    # are floats
+    is_str = np.ones(len(fields), dtype='bool')
+    iint = np.flatnonzero((field_types == INT) | (field_types == NUMBER))
+    if len(iint):
+        iint = iint[_is_integer(fields[iint], ifirst[iint], ilast[iint])]
+        values[inonblank[iint]] = _cast_integers(fields[iint], ilast[iint]).astype(object)
+        is_str[iint] = False
+
+    ifloat = np.flatnonzero(is_str & ((field_types == FLOAT) | (field_types == NUMBER)))
+    if len(ifloat):
+        ifloat = ifloat[_is_float(fields[ifloat], ifirst[ifloat], ilast[ifloat])]
+        values[inonblank[ifloat]] = _cast_floats(fields[ifloat], ifirst[ifloat]).astype(object)
+        is_str[ifloat] = False
+
+    istr = np.flatnonzero(is_str)
+    if len(istr):
+        values[inonblank[istr]] = _strip_fields(fields[istr], ifirst[istr], ilast[istr]).astype(object)
+    return values.tolist(), nonblank
+
+
+def _strip_fields(fields: np.ndarray, ifirst: np.ndarray, ilast: np.ndarray) -> np.ndarray:
+    """strips the fields into a (nfields, ) str ndarray"""
+    # the trailing blanks are nulls, which numpy strips
+    icol = np.arange(FIELD_WIDTH)
+    fields = np.where(icol > ilast[:, np.newaxis], 0, fields).astype('uint8')
+    ishift = np.flatnonzero(ifirst)
+    if len(ishift):
+        # left justify the fields
+        icol_shift = ifirst[ishift, np.newaxis] + icol
+        shifted = np.take_along_axis(
+            fields[ishift], np.minimum(icol_shift, FIELD_WIDTH - 1), axis=1)
+        shifted[icol_shift >= FIELD_WIDTH] = 0
+        fields[ishift] = shifted
+    return fields.view(f'S{FIELD_WIDTH}').ravel().astype(f'U{FIELD_WIDTH}')
+
+
+def _is_integer(fields: np.ndarray, ifirst: np.ndarray, ilast: np.ndarray) -> np.ndarray:
+    """is the field an integer (e.g., 12, -12)"""
+    is_negative = fields[np.arange(len(fields)), ifirst] == _MINUS
+    ndigits = _count_row((fields >= 48) & (fields <= 57))
+    return (ndigits > 0) & (ndigits + is_negative == ilast - ifirst + 1)
+
+
+#: the powers of 10 for each digit of an integer field
+_POWERS = 10 ** np.arange(FIELD_WIDTH, dtype='int64')
+
+
+def _cast_integers(fields: np.ndarray, ilast: np.ndarray) -> np.ndarray:
+    """
+    Casts the integer fields, which are checked by ``_is_integer``
+
+    The blanks (and the sign) aren't digits, so they're summed as 0.
+    """
+    is_digit = (fields >= 48) & (fields <= 57)
+    power = np.maximum(ilast[:, np.newaxis] - np.arange(FIELD_WIDTH), 0)
+    digits = np.where(is_digit, fields - 48, 0).astype('int64')
+    values = (digits * _POWERS[power]).sum(axis=1)
+    values[(fields == _MINUS).any(axis=1)] *= -1
+    return values
+
+
+def _is_float(fields: np.ndarray, ifirst: np.ndarray, ilast: np.ndarray) -> np.ndarray:
+    """
+    Is the field a float with a decimal point, which is
+    [+-]digits.digits[E|D[+-]digits] or [+-]digits.digits[+-]digits
+    with at least one digit in the mantissa and exponent.
+    """
+    irow = np.arange(len(fields))
+    icol = np.arange(FIELD_WIDTH)[np.newaxis, :]
+    is_digit = (fields >= 48) & (fields <= 57)
+    is_dot = fields == _DOT
+    is_sign = (fields == _PLUS) | (fields == _MINUS)
+    is_exp = (fields == _E) | (fields == _D) | (fields == _LOWER_E) | (fields == _LOWER_D)
+    nexp = _count_row(is_exp)
+    is_ok = (
+        (_count_row(is_digit | is_dot | is_sign | is_exp) == ilast - ifirst + 1) &
+        (_count_row(is_dot) == 1) & (nexp <= 1))
+
+    # the start of the exponent (E/D or the sign of an implicit exponent)
+    is_inner_sign = is_sign
+    is_inner_sign[irow, ifirst] = False
+    has_exp_char = nexp > 0
+    iexp = np.where(has_exp_char, np.argmax(is_exp, axis=1), np.argmax(is_inner_sign, axis=1))
+    has_exp = has_exp_char | (_count_row(is_inner_sign) > 0)
+    iexp = np.where(has_exp, iexp, ilast + 1)
+    is_ok &= ~has_exp | is_digit[irow, ilast]
+
+    # only a leading sign or a sign at the start of the exponent
+    iexp_sign = np.where(has_exp_char, iexp + 1, iexp)
+    is_ok &= _count_row(is_inner_sign & (icol != iexp_sign[:, np.newaxis])) == 0
+    is_ok &= np.argmax(is_dot, axis=1) < iexp
+    is_ok &= _count_row(is_digit & (icol < iexp[:, np.newaxis])) > 0
+    return is_ok
+
+
+def _count_row(mask: np.ndarray) -> np.ndarray:
+    """
+    Counts the True values in each row of a (n, FIELD_WIDTH) bool array,
+    which is faster than ``mask.sum(axis=1)`` for short rows
+    """
+    words = np.ascontiguousarray(mask).view('uint64')
+    # the sum of the bytes of a word is in the top byte
+    ones = np.uint64(0x0101010101010101)
+    counts = (words * ones) >> np.uint64(56)
+    return counts.sum(axis=1, dtype='int64')
+
+
+def _cast_floats(fields: np.ndarray, ifirst: np.ndarray) -> np.ndarray:
+    """
+    Casts the float fields (see ``double``), which are checked by
+    ``_is_float``
+
+    The D exponent is replaced with E and an E is added to the implicit
+    exponents (e.g., 1.2-3 -> 1.2E-3), so numpy can cast them.  numpy
+    ignores the leading/trailing blanks.
+    """
+    n = len(fields)
+    irow = np.arange(n)
+    is_exp = (fields == _D) | (fields == _LOWER_D)
+    fields[is_exp] = _E
+
+    is_inner_sign = (fields == _PLUS) | (fields == _MINUS)
+    is_inner_sign[irow, ifirst] = False
+    is_exp |= fields == _E
+    is_exp |= fields == _LOWER_E
+    is_inner_sign[:, 1:] &= ~is_exp[:, :-1]
+    is_implicit = _count_row(is_inner_sign) > 0
+
+    # the fields are right shifted by a column, so the mantissa of an
+    # implicit exponent may be shifted back to make room for the E
+    normalized = np.full((n, FIELD_WIDTH + 1), _SPACE, dtype='uint8')
+    normalized[:, 1:] = fields
+    if is_implicit.any():
+        iimplicit = np.flatnonzero(is_implicit)
+        fields = fields[iimplicit]
+        isign = np.argmax(is_inner_sign[iimplicit], axis=1)
+        icol = np.arange(FIELD_WIDTH)
+        is_mantissa = (icol >= ifirst[iimplicit, np.newaxis]) & (icol < isign[:, np.newaxis])
+        implicit = normalized[iimplicit]
+        implicit[:, :FIELD_WIDTH][is_mantissa] = fields[is_mantissa]
+        implicit[np.arange(len(iimplicit)), isign] = _E
+        normalized[iimplicit] = implicit
+    return normalized.view(f'S{FIELD_WIDTH + 1}').ravel().astype('float64')
@@ -0,0 +1,1033 @@
+"""
+Defines the compact (array-backed) storage of the GRIDs and the common
+elements, which is used by ``BDF.read_bdf`` when
+``model.use_compact_storage = True``.
+
+``model.nodes`` and ``model.elements`` are ``CompactCardDict`` objects,
+which act like dictionaries.  The supported cards (e.g., GRID, CQUAD4,
+CHEXA) are stored in numpy columns (one array per attribute per card
+type), so a card costs ~50-200 bytes instead of a Python object.  Getting
+a card (e.g., ``model.nodes[nid]``) returns a view, which is a subclass
+of the card class (e.g., GRID) that reads and writes the columns, so:
+
+ - the card methods work (e.g., ``node.get_position()``, ``elem.Mass()``)
+ - setting an attribute (e.g., ``node.cp = 1``) changes the model
+ - ``node.xyz`` is a view of the xyz column, so ``node.xyz[2] = 1.0``
+   changes the model
+
+The other cards and cards that can't be stored (e.g., an int ``offt``)
+are stored as objects.
+
+When the model is cross-referenced, the ``*_ref`` attributes of the views
+are looked up in the model when they're accessed (e.g., ``elem.pid_ref``
+is ``model.properties[elem.pid]``).  The nodes are looked up like
+``BDF.Node`` (a GRID, SPOINT or EPOINT).  A card that references a missing
+card isn't cross-referenced (its ``*_ref`` attributes are None).
+
+The rows of the deleted cards are reused, so a view of a deleted card
+shouldn't be used.
+
+The in-place changes to the lists of a view (e.g., ``elem.nodes[0] = 10``)
+are not stored; set the attribute instead (e.g., ``elem.nodes = nids``).
+
+Example
+-------
+>>> model = BDF()
+>>> model.use_compact_storage = True
+>>> model.read_bdf(bdf_filename)
+>>> xyz = model.nodes[1].xyz
+>>> nids, xyz = model.nodes.get_column(GRID, 'xyz')
+"""
+from __future__ import annotations
+import weakref
+from collections.abc import MutableMapping, ItemsView, ValuesView
+from typing import Any, Iterator, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.utils.numpy_utils import integer_types, float_types
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CPENTA15, CHEXA8, CHEXA20)
+from pyNastran.bdf.cards.elements.bars import CBAR
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the value of a blank int_none field
+NONE_INT = np.iinfo('int64').min
+
+#: the initial number of rows of a store
+_INITIAL_SIZE = 1024
+
+#: the minimum number of ids that are added before the sorted ids are updated
+_MIN_PENDING = 65536
+
+#: the number of cards that are added before they're written to the columns
+_BATCH_SIZE = 1024
+
+#: the columns of the cards: (attribute name, kind, width)
+#:   int/int_none    : int64; None is NONE_INT
+#:   float/float_none: float64; None is nan
+#:   number          : an int/float/None (e.g., theta_mcid)
+#:   str             : a string with up to 8 characters
+#:   vector          : a (3, ) float64 array
+#:   vector_none     : a (3, ) float64 array or None
+#:   ids             : a list of ids/None (e.g., nodes); None is 0
+_SHELL_FIELDS = [
+    ('eid', 'int', 0), ('pid', 'int', 0), ('nodes', 'ids', 4),
+    ('zoffset', 'float', 0), ('theta_mcid', 'number', 0), ('tflag', 'int', 0),
+    ('T1', 'float_none', 0), ('T2', 'float_none', 0), ('T3', 'float_none', 0),
+    ('T4', 'float_none', 0),
+]
+
+def _solid_fields(nnodes: int) -> list[tuple[str, str, int]]:
+    return [('eid', 'int', 0), ('pid', 'int', 0), ('nodes', 'ids', nnodes)]
+
+#: the references of the cards: ref name -> (attribute name, model attribute)
+_SHELL_REFS = {'nodes_ref': ('nodes', 'nodes'), 'pid_ref': ('pid', 'properties'),
+               'theta_mcid_ref': ('theta_mcid', 'coords')}
+_SOLID_REFS = {'nodes_ref': ('nodes', 'nodes'), 'pid_ref': ('pid', 'properties')}
+
+#: card class: (fields, refs)
+CARD_SPECS = {
+    GRID: (
+        [('nid', 'int', 0), ('cp', 'int', 0), ('xyz', 'vector', 0), ('cd', 'int', 0),
+         ('ps', 'str', 0), ('seid', 'int', 0)],
+        {'cp_ref': ('cp', 'coords'), 'cd_ref': ('cd', 'coords')},
+    ),
+    CQUAD4: (_SHELL_FIELDS, _SHELL_REFS),
+    CTRIA3: ([(name, kind, 3 if name == 'nodes' else width)
+              for (name, kind, width) in _SHELL_FIELDS if name != 'T4'], _SHELL_REFS),
+    CTETRA4: (_solid_fields(4), _SOLID_REFS),
+    CTETRA10: (_solid_fields(10), _SOLID_REFS),
+    CPENTA6: (_solid_fields(6), _SOLID_REFS),
+    CPENTA15: (_solid_fields(15), _SOLID_REFS),
+    CHEXA8: (_solid_fields(8), _SOLID_REFS),
+    CHEXA20: (_solid_fields(20), _SOLID_REFS),
+    CBAR: (
+        [('eid', 'int', 0), ('pid', 'int', 0), ('ga', 'int', 0), ('gb', 'int', 0),
+         ('x', 'vector_none', 0), ('g0', 'int_none', 0), ('offt', 'str', 0),
+         ('pa', 'int', 0), ('pb', 'int', 0), ('wa', 'vector', 0), ('wb', 'vector', 0)],
+        {'pid_ref': ('pid', 'properties'), 'ga_ref': ('ga', 'nodes'),
+         'gb_ref': ('gb', 'nodes'), 'g0_ref': ('g0', 'nodes')},
+    ),
+}
+#: the references that are looked up like ``BDF.Nodes`` (the GRIDBs of an
+#: axisymmetric model); the other nodes are looked up like ``BDF.Node``
+GRIDB_REFS = {(CQUAD4, 'nodes_ref'), (CTRIA3, 'nodes_ref')}
+#: the attributes that aren't stored, so they must be None (e.g., the
+#: GRID elements_ref of xref_nodes_with_elements)
+NONE_ATTRS = {GRID: ['elements_ref'], CBAR: ['g0_vector']}
+
+NODE_CLASSES = [GRID]
+ELEMENT_CLASSES = [CQUAD4, CTRIA3, CTETRA4, CTETRA10, CPENTA6, CPENTA15,
+                   CHEXA8, CHEXA20, CBAR]
+
+
+def set_compact_storage(model: BDF) -> None:
+    """converts model.nodes/elements to ``CompactCardDict`` objects"""
+    if not isinstance(model.nodes, CompactCardDict):
+        nodes = CompactCardDict(NODE_CLASSES)
+        nodes.update(model.nodes)
+        model.nodes = nodes
+    if not isinstance(model.elements, CompactCardDict):
+        elements = CompactCardDict(ELEMENT_CLASSES)
+        elements.update(model.elements)
+        model.elements = elements
+
+
+class Column:
+    """
+    A growable numpy column of a card attribute
+
+    The rows of a vector column are views (e.g., ``node.xyz``), so the
+    vectors are stored in blocks that aren't reallocated when the column
+    grows.
+    """
+    def __init__(self, kind: str, width: int=0):
+        self.kind = kind
+        self.blocks: list[np.ndarray] = []
+        if kind in {'int', 'int_none'}:
+            self.data = np.full(_INITIAL_SIZE, NONE_INT, dtype='int64')
+        elif kind in {'float', 'float_none'}:
+            self.data = np.full(_INITIAL_SIZE, np.nan, dtype='float64')
+        elif kind == 'number':
+            self.data = np.zeros(_INITIAL_SIZE, dtype='float64')
+            self.code = np.zeros(_INITIAL_SIZE, dtype='int8')
+        elif kind == 'str':
+            self.data = np.zeros(_INITIAL_SIZE, dtype='|S8')
+        elif kind in {'vector', 'vector_none'}:
+            self.data = None
+            self.blocks = [_vector_block()]
+        elif kind == 'ids':
+            self.data = np.zeros((_INITIAL_SIZE, width), dtype='int64')
+        else:  # pragma: no cover
+            raise NotImplementedError(kind)
+        self.width = width
+        self._set_methods()
+
+    def _set_methods(self) -> None:
+        """sets the set/get methods of the kind"""
+        self.set = getattr(self, '_set_' + self.kind)
+        self.get = getattr(self, '_get_' + self.kind)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['set'], state['get']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._set_methods()
+
+    def resize(self, nrows: int) -> None:
+        """grows the column to nrows"""
+        blocks = self.blocks
+        if blocks:
+            while len(blocks) * _INITIAL_SIZE < nrows:
+                blocks.append(_vector_block())
+            return
+        data = self.data
+        new_data = np.empty((nrows, ) + data.shape[1:], dtype=data.dtype)
+        new_data[:len(data)] = data
+        self.data = new_data
+        if self.kind == 'number':
+            code = np.zeros(nrows, dtype='int8')
+            code[:len(self.code)] = self.code
+            self.code = code
+
+    # set(row, value) sets a value; raises a TypeError if the value
+    # can't be stored
+    def _set_int(self, row: int, value: Any) -> None:
+        if not isinstance(value, integer_types):
+            raise TypeError(value)
+        self.data[row] = value
+
+    def _set_int_none(self, row: int, value: Any) -> None:
+        if value is None:
+            self.data[row] = NONE_INT
+        elif isinstance(value, integer_types):
+            self.data[row] = value
+        else:
+            raise TypeError(value)
+
+    def _set_float(self, row: int, value: Any) -> None:
+        if not isinstance(value, float_types):
+            raise TypeError(value)
+        self.data[row] = value
+
+    def _set_float_none(self, row: int, value: Any) -> None:
+        if value is None:
+            self.data[row] = np.nan
+        elif isinstance(value, float_types):
+            self.data[row] = value
+        else:
+            raise TypeError(value)
+
+    def _set_number(self, row: int, value: Any) -> None:
+        if value is None:
+            self.code[row] = 0
+        elif isinstance(value, integer_types):
+            self.data[row] = value
+            self.code[row] = 1
+        elif isinstance(value, float_types):
+            self.data[row] = value
+            self.code[row] = 2
+        else:
+            raise TypeError(value)
+
+    def _set_str(self, row: int, value: Any) -> None:
+        if not isinstance(value, str) or len(value) > 8 or not value.isascii():
+            raise TypeError(value)
+        self.data[row] = value.encode('ascii')
+
+    def _set_vector(self, row: int, value: Any) -> None:
+        if value is None or len(value) != 3:
+            raise TypeError(value)
+        self.blocks[row // _INITIAL_SIZE][row % _INITIAL_SIZE, :] = value
+
+    def _set_vector_none(self, row: int, value: Any) -> None:
+        if value is None:
+            value = (np.nan, np.nan, np.nan)
+        self._set_vector(row, value)
+
+    def _set_ids(self, row: int, value: Any) -> None:
+        if (not isinstance(value, (list, tuple)) or len(value) != self.width or
+                not all(nid is None or (isinstance(nid, integer_types) and nid != 0)
+                        for nid in value)):
+            raise TypeError(value)
+        self.data[row, :] = [0 if nid is None else nid for nid in value]
+
+    def set_rows(self, rows: np.ndarray, values: list[Any]) -> None:
+        """
+        Sets the values of the rows; raises a TypeError if a value can't
+        be stored (the rows may be partially set)
+        """
+        kind = self.kind
+        if kind in {'int', 'int_none'}:
+            if kind == 'int_none':
+                values = [NONE_INT if value is None else value for value in values]
+            self.data[rows] = _to_int_array(values, (len(rows), ))
+        elif kind == 'float':
+            if not all(isinstance(value, float_types) for value in values):
+                raise TypeError(kind)
+            self.data[rows] = values
+        elif kind == 'float_none':
+            if not all(value is None or isinstance(value, float_types) for value in values):
+                raise TypeError(kind)
+            self.data[rows] = [np.nan if value is None else value for value in values]
+        elif kind == 'number':
+            code = [0 if value is None else
+                    1 if isinstance(value, integer_types) else
+                    2 if isinstance(value, float_types) else -1 for value in values]
+            if -1 in code:
+                raise TypeError(kind)
+            self.data[rows] = [0. if value is None else value for value in values]
+            self.code[rows] = code
+        elif kind == 'str':
+            if not all(isinstance(value, str) and len(value) <= 8 and value.isascii()
+                       for value in values):
+                raise TypeError(kind)
+            self.data[rows] = values
+        elif kind in {'vector', 'vector_none'}:
+            nan = (np.nan, np.nan, np.nan)
+            if kind == 'vector_none':
+                values = [nan if value is None else value for value in values]
+            elif any(value is None for value in values):
+                raise TypeError(kind)
+            try:
+                vectors = np.array(values, dtype='float64')
+            except (TypeError, ValueError):
+                raise TypeError(kind)
+            if vectors.shape != (len(rows), 3):
+                raise TypeError(kind)
+            iblocks = rows // _INITIAL_SIZE
+            for iblock in np.unique(iblocks):
+                i = iblocks == iblock
+                self.blocks[iblock][rows[i] % _INITIAL_SIZE, :] = vectors[i, :]
+        else:
+            # a blank id is 0, so an id of 0 isn't allowed
+            try:
+                ids = _to_int_array(
+                    [[NONE_INT if nid is None else nid for nid in value] for value in values],
+                    (len(rows), self.width))
+            except TypeError:
+                raise TypeError(kind)
+            if (ids == 0).any():
+                raise TypeError(kind)
+            ids[ids == NONE_INT] = 0
+            self.data[rows, :] = ids
+
+    # get(row) gets a value
+    def _get_int(self, row: int) -> int:
+        return int(self.data[row])
+
+    def _get_int_none(self, row: int) -> Optional[int]:
+        value = self.data[row]
+        return None if value == NONE_INT else int(value)
+
+    def _get_float(self, row: int) -> float:
+        return float(self.data[row])
+
+    def _get_float_none(self, row: int) -> Optional[float]:
+        value = self.data[row]
+        return None if np.isnan(value) else float(value)
+
+    def _get_number(self, row: int) -> Any:
+        code = self.code[row]
+        if code == 0:
+            return None
+        value = self.data[row]
+        return int(value) if code == 1 else float(value)
+
+    def _get_str(self, row: int) -> str:
+        return self.data[row].decode('ascii')
+
+    def _get_vector(self, row: int) -> np.ndarray:
+        return self.blocks[row // _INITIAL_SIZE][row % _INITIAL_SIZE]
+
+    def _get_vector_none(self, row: int) -> Optional[np.ndarray]:
+        value = self.blocks[row // _INITIAL_SIZE][row % _INITIAL_SIZE]
+        return None if np.isnan(value[0]) else value
+
+    def _get_ids(self, row: int) -> list[Optional[int]]:
+        return [None if nid == 0 else nid for nid in self.data[row].tolist()]
+
+    def get_rows(self, rows: np.ndarray) -> np.ndarray:
+        """gets the raw values of the rows (e.g., NONE_INT/nan for None)"""
+        if self.blocks:
+            return np.vstack(self.blocks)[rows]
+        return self.data[rows]
+
+
+def _vector_block() -> np.ndarray:
+    """a block of a vector column"""
+    return np.full((_INITIAL_SIZE, 3), np.nan, dtype='float64')
+
+
+def _to_int_array(values: list[Any], shape: tuple[int, ...]) -> np.ndarray:
+    """converts a list of ints; raises a TypeError if a value isn't an int"""
+    try:
+        array = np.array(values)
+    except (TypeError, ValueError):  # e.g., a ragged list
+        raise TypeError(values)
+    if array.dtype.kind != 'i' or array.shape != shape:
+        raise TypeError(values)
+    return array
+
+
+class CardStore:
+    """the columns of a card type"""
+    def __init__(self, card_class: type):
+        fields, refs = CARD_SPECS[card_class]
+        self.card_class = card_class
+        self.columns = {name: Column(kind, width) for name, kind, width in fields}
+        self.refs = refs
+        self.none_keys = list(refs) + NONE_ATTRS.get(card_class, [])
+        self.allowed_keys = set(self.columns) | set(self.none_keys) | {
+            '_comment', '_store', '_row'}
+        self.comments: dict[int, str] = {}
+        self.nrows = 0
+        self.capacity = _INITIAL_SIZE
+
+        #: the rows of the removed cards, which are reused
+        self.free_rows: list[int] = []
+
+        #: the cards that were added, but aren't written to the columns
+        #: (see ``flush``)
+        self.pending_rows: list[int] = []
+        self.pending_cards: list[Any] = []
+
+        #: the views that are in use (row -> weakref), so a view isn't
+        #: created on every access; the dead views are removed when there
+        #: are max_views views (see ``view``)
+        self.views: dict[int, weakref.ref] = {}
+        self.max_views = _INITIAL_SIZE
+
+        #: the model when the store is cross-referenced
+        self.model: Optional[BDF] = None
+
+        #: the rows that reference a missing card, which aren't
+        #: cross-referenced
+        self.bad_rows: set[int] = set()
+
+    def append(self, card: Any) -> int:
+        """
+        Adds a card and returns the row
+
+        The card is written to the columns by ``flush``.  Raises a
+        TypeError if the card can't be stored (e.g., an extra attribute).
+        """
+        card_dict = card.__dict__
+        if not card_dict.keys() <= self.allowed_keys:
+            raise TypeError(card)
+        if self.model is None:
+            for key in self.none_keys:
+                if card_dict.get(key) is not None:
+                    raise TypeError(card)
+
+        free_rows = self.free_rows
+        if free_rows:
+            row = free_rows.pop()
+            self.views.pop(row, None)
+            self.bad_rows.discard(row)
+        else:
+            row = self.nrows
+            if row == self.capacity:
+                self.capacity *= 2
+                for column in self.columns.values():
+                    column.resize(self.capacity)
+            self.nrows += 1
+        comment = card.comment
+        if comment:
+            self.comments[row] = comment
+        self.pending_rows.append(row)
+        self.pending_cards.append(card)
+        return row
+
+    def flush(self) -> list[tuple[int, Any]]:
+        """
+        Writes the pending cards to the columns, which is faster than
+        writing one card at a time
+
+        Returns
+        -------
+        bad_cards : list[(ipending, card)]
+            the cards that can't be stored (e.g., an unsupported value)
+            and the index of the card in the pending cards; the rows are
+            removed
+        """
+        rows = self.pending_rows
+        cards = self.pending_cards
+        if not rows:
+            return []
+        self.pending_rows = []
+        self.pending_cards = []
+        try:
+            rows_array = np.array(rows)
+            for name, column in self.columns.items():
+                column.set_rows(rows_array, [getattr(card, name) for card in cards])
+            return []
+        except TypeError:
+            pass
+
+        # find the bad cards
+        bad_cards = []
+        for ipending, (row, card) in enumerate(zip(rows, cards)):
+            try:
+                for name, column in self.columns.items():
+                    column.set(row, getattr(card, name))
+            except TypeError:
+                bad_cards.append((ipending, card))
+                self.remove(row)
+        return bad_cards
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['views']
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.views = {}
+
+    def remove(self, row: int) -> None:
+        """removes a card, so the row can be reused"""
+        self.comments.pop(row, None)
+        self.free_rows.append(row)
+
+    def view(self, row: int) -> Any:
+        """gets the view of a row"""
+        views = self.views
+        ref = views.get(row)
+        if ref is not None:
+            view = ref()
+            if view is not None:
+                return view
+
+        view_class = _VIEW_CLASSES[self.card_class]
+        view = view_class.__new__(view_class)
+        view._store = self
+        view._row = row
+        views[row] = weakref.ref(view)
+        if len(views) > self.max_views:
+            # a weakref callback is slow, so the dead views are removed
+            # in a batch
+            self.views = views = {row: ref for row, ref in views.items()
+                                  if ref() is not None}
+            self.max_views = max(_INITIAL_SIZE, 2 * len(views))
+        return view
+
+    def cross_reference(self, model: BDF, rows: np.ndarray) -> list[int]:
+        """
+        Cross-references the store
+
+        Returns
+        -------
+        bad_rows : list[int]
+            the rows that reference a missing card
+        """
+        if self.card_class is GRID and model.grdset:
+            cd = self.columns['cd'].data
+            cd[rows[cd[rows] == 0]] = model.grdset.cd
+
+        is_bad = np.zeros(len(rows), dtype='bool')
+        for ref_name, (name, model_attr) in self.refs.items():
+            column = self.columns[name]
+            values = column.get_rows(rows)
+            is_gridb = (self.card_class, ref_name) in GRIDB_REFS
+            cards_list = _get_ref_cards(model, model_attr, is_gridb)
+            ids = np.hstack([_get_ids(cards) for cards in cards_list])
+            if column.kind == 'ids':
+                is_missing = (values != 0) & ~np.isin(values, ids)
+                is_bad |= is_missing.any(axis=1)
+                continue
+
+            is_ref = values != NONE_INT
+            if column.kind == 'number':
+                is_ref = column.code[rows] == 1
+                values = values.astype('int64')
+            elif self.card_class is GRID and name == 'cd':
+                is_ref &= values != -1
+            is_bad |= is_ref & ~np.isin(values, ids)
+        bad_rows = rows[is_bad].tolist()
+        self.model = model
+        self.bad_rows = set(bad_rows)
+        return bad_rows
+
+    def uncross_reference(self) -> None:
+        """Removes cross-reference links"""
+        self.model = None
+        self.bad_rows = set()
+
+
+def _get_ids(cards: Any) -> np.ndarray:
+    """gets the ids of a dictionary of cards"""
+    if isinstance(cards, CompactCardDict):
+        return cards.get_ids()
+    return np.array(list(cards), dtype='int64')
+
+
+def _get_ref_cards(model: BDF, model_attr: str, is_gridb: bool) -> list[Any]:
+    """
+    Gets the dictionaries a reference is looked up in.  The nodes are
+    looked up like ``BDF.Node`` (a GRID, SPOINT or EPOINT) and the shell
+    nodes of an axisymmetric model are GRIDBs (see ``BDF.Nodes``).
+    """
+    if model_attr != 'nodes':
+        return [getattr(model, model_attr)]
+    if is_gridb and model._is_axis_symmetric and model.axif is not None:
+        return [model.gridb]
+    return [model.nodes, model.spoints, model.epoints]
+
+
+def _get_card(cards_list: list[Any], card_id: int) -> Any:
+    """gets a card from the first dictionary that has it; None if it doesn't exist"""
+    for cards in cards_list:
+        card = cards.get(card_id)
+        if card is not None:
+            return card
+    return None
+
+
+def _make_property(name: str) -> property:
+    """makes a property to read/write a column"""
+    def getter(self):
+        return self._store.columns[name].get(self._row)
+
+    def setter(self, value):
+        self._store.columns[name].set(self._row, value)
+    return property(getter, setter)
+
+
+def _make_ref_property(name: str, model_attr: str, is_gridb: bool) -> property:
+    """
+    Makes a property to look up a reference in the model
+
+    The reference is None when the model isn't cross-referenced.
+    Setting a reference does nothing because the references are looked
+    up in the model.
+    """
+    def getter(self):
+        store = self._store
+        model = store.model
+        row = self._row
+        if model is None or row in store.bad_rows:
+            return None
+        column = store.columns[name]
+        value = column.get(row)
+        cards_list = _get_ref_cards(model, model_attr, is_gridb)
+        if isinstance(value, list):
+            return [None if nid is None else _get_card(cards_list, nid)
+                    for nid in value]
+        if not isinstance(value, int):
+            # None or a float theta
+            return None
+        return _get_card(cards_list, value)
+
+    def setter(self, value):
+        pass
+    return property(getter, setter)
+
+
+def _get_comment(self) -> str:
+    try:
+        return self._store.comments[self._row]
+    except KeyError:
+        raise AttributeError('_comment')
+
+
+def _set_comment(self, comment: str) -> None:
+    if comment:
+        self._store.comments[self._row] = comment
+    else:
+        self._store.comments.pop(self._row, None)
+
+
+def _get_g0_vector(self) -> Optional[np.ndarray]:
+    """see ``CBAR.cross_reference``"""
+    if self._store.model is None:
+        return None
+    if self.g0:
+        return self.g0_ref.get_position() - self.ga_ref.get_position()
+    return self.x
+
+
+def _make_view_class(card_class: type) -> type:
+    """makes the view class of a card class (e.g., GRID -> GRIDView)"""
+    fields, refs = CARD_SPECS[card_class]
+    namespace = {name: _make_property(name) for name, unused_kind, unused_width in fields}
+    for ref_name, (name, model_attr) in refs.items():
+        is_gridb = (card_class, ref_name) in GRIDB_REFS
+        namespace[ref_name] = _make_ref_property(name, model_attr, is_gridb)
+    namespace['_comment'] = property(_get_comment, _set_comment)
+    for name in NONE_ATTRS.get(card_class, []):
+        namespace[name] = None
+
+    def __eq__(self, card: Any) -> bool:
+        # BaseCard.__eq__ checks the class of self, so a view is equal to
+        # the card it was made from
+        if not isinstance(card, card_class) or self.type != card.type:
+            return False
+        return self._is_same_fields(self.raw_fields(), card.raw_fields())
+    namespace['__eq__'] = __eq__
+    namespace['__hash__'] = card_class.__hash__
+    if card_class is CBAR:
+        namespace['g0_vector'] = property(_get_g0_vector, lambda self, value: None)
+    namespace['card_class'] = card_class
+    namespace['__doc__'] = f'a {card_class.__name__} that is stored in a CardStore'
+    namespace['__module__'] = __name__
+    return type(card_class.__name__ + 'View', (card_class, ), namespace)
+
+
+_VIEW_CLASSES = {card_class: _make_view_class(card_class) for card_class in CARD_SPECS}
+# the views are module attributes, so they can be pickled (e.g., a FORCE
+# that references a GRIDView)
+globals().update({view_class.__name__: view_class for view_class in _VIEW_CLASSES.values()})
+
+
+class IdIndex:
+    """
+    Maps ids to slots (the order the ids were added)
+
+    The ids are stored in a sorted array, which is updated after a batch
+    of ids is added, so an id costs ~24 bytes instead of a dictionary
+    entry.
+    """
+    def __init__(self):
+        self.ids = np.zeros(_INITIAL_SIZE, dtype='int64')
+        self.is_active = np.zeros(_INITIAL_SIZE, dtype='bool')
+        self.nslots = 0
+        self.nactive = 0
+
+        #: the number of slots that are written to ids/is_active (see ``write``)
+        self.nwritten = 0
+        self.sorted_ids = np.zeros(0, dtype='int64')
+        self.sorted_slots = np.zeros(0, dtype='int64')
+
+        #: the range of the sorted ids, so a new id (e.g., the next id of
+        #: a read) is found without a search
+        self.min_sorted = 0
+        self.max_sorted = -1
+
+        #: the ids that were added after the sorted ids were updated
+        self.pending: dict[int, int] = {}
+
+    def get(self, key: int) -> int:
+        """gets the slot of an id; -1 if the id doesn't exist"""
+        slot = self.pending.get(key)
+        if slot is not None:
+            return slot
+        if not self.min_sorted <= key <= self.max_sorted:
+            return -1
+        sorted_ids = self.sorted_ids
+        i = sorted_ids.searchsorted(key)
+        if i < len(sorted_ids) and sorted_ids[i] == key:
+            slot = self.sorted_slots[i]
+            if self.is_active[slot]:
+                return int(slot)
+        return -1
+
+    def add(self, key: int) -> int:
+        """adds an id that doesn't exist and returns the slot"""
+        slot = self.nslots
+        self.pending[key] = slot
+        self.nslots += 1
+        self.nactive += 1
+        if len(self.pending) > max(_MIN_PENDING, len(self.sorted_ids) // 4):
+            self._update_sorted()
+        return slot
+
+    def remove(self, key: int, slot: int) -> None:
+        """removes an id"""
+        self.pending.pop(key, None)
+        if slot < self.nwritten:
+            self.is_active[slot] = False
+        self.nactive -= 1
+
+    def active_slots(self) -> np.ndarray:
+        """gets the active slots in the order they were added"""
+        self.write()
+        return np.flatnonzero(self.is_active[:self.nslots])
+
+    def write(self) -> None:
+        """
+        Writes the ids that were added to the arrays, which is faster
+        than writing one id at a time
+        """
+        nwritten = self.nwritten
+        nslots = self.nslots
+        if nwritten == nslots:
+            return
+        if nslots > len(self.ids):
+            size = max(2 * len(self.ids), nslots)
+            ids = np.zeros(size, dtype='int64')
+            ids[:nwritten] = self.ids[:nwritten]
+            is_active = np.zeros(size, dtype='bool')
+            is_active[:nwritten] = self.is_active[:nwritten]
+            self.ids = ids
+            self.is_active = is_active
+
+        # the slots of the pending ids are increasing, so the new ids
+        # are at the end
+        keys = []
+        slots = []
+        for key, slot in reversed(self.pending.items()):
+            if slot < nwritten:
+                break
+            keys.append(key)
+            slots.append(slot)
+        self.ids[slots] = keys
+        self.is_active[slots] = True
+        self.nwritten = nslots
+
+    def _update_sorted(self) -> None:
+        """merges the pending ids into the sorted ids"""
+        slots = self.active_slots()
+        ids = self.ids[slots]
+        # the ids are mostly sorted, so a stable (merge) sort is fast
+        isort = np.argsort(ids, kind='stable')
+        self.sorted_ids = ids[isort]
+        self.sorted_slots = slots[isort]
+        if len(ids):
+            self.min_sorted = int(self.sorted_ids[0])
+            self.max_sorted = int(self.sorted_ids[-1])
+        else:
+            self.min_sorted = 0
+            self.max_sorted = -1
+        self.pending = {}
+
+
+class CompactCardDict(MutableMapping):
+    """
+    A dictionary of cards (e.g., model.nodes), where the supported cards
+    are stored in ``CardStore`` objects (see the module docstring)
+    """
+    def __init__(self, card_classes: list[type]):
+        self._stores = [CardStore(card_class) for card_class in card_classes]
+        self._store_codes = {card_class: i for i, card_class in enumerate(card_classes)}
+        self._index = IdIndex()
+        self._codes = np.zeros(_INITIAL_SIZE, dtype='int8')
+        self._rows = np.zeros(_INITIAL_SIZE, dtype='int64')
+
+        self._objects: dict[int, Any] = {}
+
+        #: the codes/rows of the cards that were added after the last
+        #: flush (see ``_flush``)
+        self._new_codes: list[int] = []
+        self._new_rows: list[int] = []
+
+    @property
+    def stores(self) -> list[CardStore]:
+        """the stores, where the new cards are written to the columns"""
+        if self._new_codes:
+            self._flush()
+        return self._stores
+
+    @property
+    def objects(self) -> dict[int, Any]:
+        """the cards that aren't stored in the columns"""
+        if self._new_codes:
+            self._flush()
+        return self._objects
+
+    def _flush(self) -> None:
+        """
+        Writes the cards that were added to the arrays and the columns,
+        which is faster than writing one card at a time
+        """
+        codes = np.array(self._new_codes, dtype='int8')
+        rows = np.array(self._new_rows, dtype='int64')
+        self._new_codes = []
+        self._new_rows = []
+        index = self._index
+        index.write()
+        slot0 = index.nslots - len(codes)
+        if index.nslots > len(self._codes):
+            nslots = len(index.ids)
+            new_codes = np.zeros(nslots, dtype='int8')
+            new_codes[:slot0] = self._codes[:slot0]
+            new_rows = np.zeros(nslots, dtype='int64')
+            new_rows[:slot0] = self._rows[:slot0]
+            self._codes = new_codes
+            self._rows = new_rows
+        self._codes[slot0:index.nslots] = codes
+        self._rows[slot0:index.nslots] = rows
+
+        for code, store in enumerate(self._stores):
+            bad_cards = store.flush()
+            if not bad_cards:
+                continue
+            # the pending cards of a store are the new cards of the store
+            slots = slot0 + np.flatnonzero(codes == code)
+            for ipending, card in bad_cards:
+                # the card can't be stored, so it's an object
+                slot = slots[ipending]
+                self._objects[int(index.ids[slot])] = card
+                self._codes[slot] = -1
+                self._rows[slot] = -1
+
+    def __getitem__(self, key: int) -> Any:
+        slot = self._index.get(key)
+        if slot < 0:
+            raise KeyError(key)
+        if self._new_codes:
+            self._flush()
+        code = self._codes[slot]
+        if code < 0:
+            return self._objects[key]
+        return self._stores[code].view(int(self._rows[slot]))
+
+    def __setitem__(self, key: int, card: Any) -> None:
+        index = self._index
+        slot = index.get(key)
+        if slot >= 0:
+            self._remove(key, slot)
+        index.add(key)
+
+        code = self._store_codes.get(type(card), -1)
+        row = -1
+        if code >= 0:
+            try:
+                row = self._stores[code].append(card)
+            except TypeError:
+                code = -1
+        if code < 0:
+            self._objects[key] = card
+        self._new_codes.append(code)
+        self._new_rows.append(row)
+        if len(self._new_codes) >= _BATCH_SIZE:
+            self._flush()
+
+    def __delitem__(self, key: int) -> None:
+        slot = self._index.get(key)
+        if slot < 0:
+            raise KeyError(key)
+        self._remove(key, slot)
+
+    def _remove(self, key: int, slot: int) -> None:
+        if self._new_codes:
+            # a new card may become an object
+            self._flush()
+        code = self._codes[slot]
+        if code < 0:
+            del self._objects[key]
+        else:
+            self._stores[code].remove(int(self._rows[slot]))
+        self._index.remove(key, slot)
+
+    def __contains__(self, key: Any) -> bool:
+        if not isinstance(key, integer_types):
+            return False
+        return self._index.get(key) >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.get_ids().tolist())
+
+    def items(self) -> ItemsView:
+        return _CompactItemsView(self)
+
+    def values(self) -> ValuesView:
+        return _CompactValuesView(self)
+
+    def _iter_items(self) -> Iterator[tuple[int, Any]]:
+        """iterates over the cards without looking up the ids"""
+        ids = self.get_ids()
+        slots = self._index.active_slots()
+        codes = self._codes[slots].tolist()
+        rows = self._rows[slots].tolist()
+        objects = self._objects
+        stores = self._stores
+        for key, code, row in zip(ids.tolist(), codes, rows):
+            if code < 0:
+                yield key, objects[key]
+            else:
+                yield key, stores[code].view(row)
+
+    def __len__(self) -> int:
+        return self._index.nactive
+
+    def __repr__(self) -> str:
+        return f'CompactCardDict(n={len(self)}; nobjects={len(self.objects)})'
+
+    def get_ids(self) -> np.ndarray:
+        """gets the ids in the order they were added"""
+        if self._new_codes:
+            self._flush()
+        index = self._index
+        slots = index.active_slots()
+        return index.ids[slots]
+
+    def get_rows(self, card_class: type) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the ids and rows of the cards of a store
+
+        Returns
+        -------
+        ids : (n, ) int ndarray
+            the ids of the cards in the order they were added
+        rows : (n, ) int ndarray
+            the rows of the store
+        """
+        if self._new_codes:
+            self._flush()
+        index = self._index
+        slots = index.active_slots()
+        code = self._store_codes[card_class]
+        slots = slots[self._codes[slots] == code]
+        return index.ids[slots], self._rows[slots]
+
+    def get_positions(self, card_class: Optional[type]) -> np.ndarray:
+        """
+        Gets the positions of the cards of a store in the iteration order
+        (e.g., list(model.elements)); None gets the objects
+        """
+        if self._new_codes:
+            self._flush()
+        code = -1 if card_class is None else self._store_codes[card_class]
+        slots = self._index.active_slots()
+        return np.flatnonzero(self._codes[slots] == code)
+
+    def get_column(self, card_class: type, name: str) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Gets a column of the cards of a store
+
+        >>> nids, xyz = model.nodes.get_column(GRID, 'xyz')
+        """
+        ids, rows = self.get_rows(card_class)
+        store = self._stores[self._store_codes[card_class]]
+        return ids, store.columns[name].get_rows(rows)
+
+    def cross_reference(self, model: BDF) -> list[Any]:
+        """
+        Cross-references the stored cards; the objects aren't
+        cross-referenced
+
+        Returns
+        -------
+        bad_cards : list[card]
+            the cards that reference a missing card
+        """
+        bad_cards = []
+        for card_class, code in self._store_codes.items():
+            store = self._stores[code]
+            unused_ids, rows = self.get_rows(card_class)
+            bad_rows = store.cross_reference(model, rows)
+            bad_cards.extend(store.view(row) for row in bad_rows)
+        return bad_cards
+
+    def uncross_reference(self) -> None:
+        """Removes cross-reference links of the stored cards"""
+        for store in self._stores:
+            store.uncross_reference()
+
+
+class _CompactItemsView(ItemsView):
+    def __iter__(self) -> Iterator[tuple[int, Any]]:
+        return self._mapping._iter_items()
+
+
+class _CompactValuesView(ValuesView):
+    def __iter__(self) -> Iterator[Any]:
+        return (card for unused_key, card in self._mapping._iter_items())
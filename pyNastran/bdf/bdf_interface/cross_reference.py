@@ -74,6 +74,7 @@ from typing import Any
 
 from numpy import zeros, argsort, arange, array_equal, array
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.compact_storage import CompactCardDict
 
 class XrefMesh(BDFAttributes):
     """Links up the various cards in the BDF."""
@@ -329,7 +330,12 @@ class XrefMesh(BDFAttributes):
     def _cross_reference_nodes(self) -> None:
         """Links the nodes to coordinate systems"""
         grdset = self.grdset
-        for node in self.nodes.values():
+        nodes = self.nodes
+        if isinstance(nodes, CompactCardDict):
+            for node in nodes.cross_reference(self):
+                self._store_xref_error(KeyError(f'missing coord for GRID nid={node.nid}'), node)
+            nodes = nodes.objects
+        for node in nodes.values():
             try:
                 node.cross_reference(self, grdset)
             except Exception:
@@ -360,7 +366,13 @@ class XrefMesh(BDFAttributes):
         Links the elements to nodes, properties (and materials depending on
         the card).
         """
-        for elem in self.elements.values():
+        elements = self.elements
+        if isinstance(elements, CompactCardDict):
+            for elem in elements.cross_reference(self):
+                error = KeyError(f'missing node/property for {elem.type} eid={elem.eid}')
+                self._store_xref_error(error, elem)
+            elements = elements.objects
+        for elem in elements.values():
             try:
                 elem.cross_reference(self)
             except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
@@ -0,0 +1,327 @@
+"""
+Defines re-reading the INCLUDE files of a BDF that changed since it was read.
+
+A model that is read with ``save_file_structure=True`` stores the file
+number (``ifile``) of each card.  ``read_bdf`` also stores the (size, mtime)
+of the main/INCLUDE files and the number of cards of each type in each
+file.  When an INCLUDE file changes:
+
+ 1. the cards of that file are removed from the model
+ 2. the file is split into cards and the cards are added to the model
+ 3. the cards that referenced a removed card (e.g., the elements of a
+    changed PSHELL) and the new cards are cross-referenced
+
+The other files are not read.  The model is read again when the change
+can't be applied to the cards of the file (e.g., the main file changed,
+an INCLUDE was added, a DMIG changed).
+
+Example
+-------
+>>> model = read_bdf(bdf_filename, save_file_structure=True)
+>>> # edit properties.inc
+>>> model.reload_changed()
+['/path/to/properties.inc']
+"""
+from __future__ import annotations
+import os
+from collections import defaultdict
+from collections.abc import MutableMapping
+from typing import Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.cards.base_card import BaseCard
+from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy, _make_ilines
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the cards that are assembled after all the cards are read, so changing
+#: them requires reading the model again
+FULL_READ_CARDS = {'DMIG', 'DMI', 'DMIJ', 'DMIJI', 'DMIK', 'DMIAX', 'GRDSET'}
+
+#: the cards that change the location of other cards, so changing them
+#: requires cross-referencing the model again
+FULL_XREF_TYPES = {'CORD1R', 'CORD1C', 'CORD1S', 'CORD2R', 'CORD2C', 'CORD2S',
+                   'CORD3G', 'CORD3R'}
+
+
+def get_file_stats(filenames: list[str]) -> list[tuple[int, int]]:
+    """gets the (size, mtime) of each file"""
+    stats = []
+    for filename in filenames:
+        stat = os.stat(filename)
+        stats.append((stat.st_size, stat.st_mtime_ns))
+    return stats
+
+
+def set_file_state(model: BDF, bulk_data_ilines: Any) -> None:
+    """stores the file stats that are used by ``reload_changed``"""
+    model._file_stats = get_file_stats(model.active_filenames)
+    bulk_data_ilines = np.asarray(bulk_data_ilines)
+    if bulk_data_ilines.ndim == 2 and bulk_data_ilines.size:
+        model._bulk_ifiles = set(np.unique(bulk_data_ilines[:, 0]).tolist())
+    else:
+        model._bulk_ifiles = set()
+
+
+def get_changed_files(model: BDF) -> list[int]:
+    """gets the file numbers of the files that changed since they were read"""
+    ifiles = []
+    for ifile, filename in enumerate(model.active_filenames):
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            ifiles.append(ifile)
+            continue
+        if (stat.st_size, stat.st_mtime_ns) != model._file_stats[ifile]:
+            ifiles.append(ifile)
+    return ifiles
+
+
+def reload_changed(model: BDF, validate: bool=True) -> list[str]:
+    """
+    Re-reads the INCLUDE files that changed since the model was read
+    (see ``BDF.reload_changed``)
+
+    Returns
+    -------
+    filenames : list[str]
+        the files that were read
+    """
+    if not getattr(model, '_file_stats', None):
+        raise RuntimeError('reload_changed requires a BDF that was read from a file '
+                           'with read_bdf(..., save_file_structure=True)')
+    log = model.log
+    ifiles = get_changed_files(model)
+    if not ifiles:
+        return []
+
+    filenames = [model.active_filenames[ifile] for ifile in ifiles]
+    cards_list = _get_changed_cards(model, ifiles)
+    if cards_list is None:
+        log.info('reading the model again')
+        _read_again(model, validate)
+        return filenames
+
+    log.debug(f'reloading {filenames}')
+    ifiles_set = set(ifiles)
+    removed_cards = _remove_cards(model, ifiles_set)
+    _remove_card_count(model, ifiles_set)
+
+    model._parse_cards_list(cards_list)
+    model.pop_parse_errors()
+    new_cards = [card for card in _iter_cards(model)
+                 if getattr(card, 'ifile', None) in ifiles_set]
+    if validate:
+        for card in new_cards:
+            card.validate()
+
+    if model._xref:
+        _cross_reference_changed(model, removed_cards, new_cards)
+    for ifile in ifiles:
+        stat = os.stat(model.active_filenames[ifile])
+        model._file_stats[ifile] = (stat.st_size, stat.st_mtime_ns)
+    return filenames
+
+
+def _get_changed_cards(model: BDF, ifiles: list[int]) -> list[Any] | None:
+    """
+    Splits the changed files into cards
+
+    Returns
+    -------
+    cards_list : list[card] / None
+        the cards in the format of ``get_bdf_cards``; None if the model
+        must be read again
+    """
+    ifile_card_count = model._ifile_card_count
+    cards_list = []
+    for ifile in ifiles:
+        # the main file defines the structure of the deck (e.g., the
+        # INCLUDE files/the case control deck)
+        if ifile == 0 or ifile not in model._bulk_ifiles:
+            return None
+        filename = model.active_filenames[ifile]
+        if not os.path.exists(filename):
+            return None
+
+        obj = BDFInputPy(model.read_includes, model.dumplines, model._encoding,
+                         nastran_format=model.nastran_format,
+                         consider_superelements=model.is_superelements,
+                         log=model.log, debug=model.debug)
+        lines = [line.rstrip('\r\n') for line in obj.get_main_lines(filename)]
+        for line in lines:
+            line_upper = line.split('$')[0].lstrip().upper()
+            if line_upper.startswith(('INCLUDE', 'BEGIN', 'ENDDATA')):
+                return None
+
+        ilines = _make_ilines(len(lines), ifile)
+        cards_listi, cards_dict, unused_card_count = model.get_bdf_cards(lines, ilines)
+        card_names = {card[0] for card in cards_listi}
+        old_card_names = {card_name for (jfile, card_name) in ifile_card_count
+                          if jfile == ifile}
+        if cards_dict or (card_names | old_card_names) & FULL_READ_CARDS:
+            return None
+        if any(card_name is None or '=' in card_name or model.is_reject(card_name)
+               for card_name in card_names):
+            return None
+        cards_list.extend(cards_listi)
+    return cards_list
+
+
+def _read_again(model: BDF, validate: bool) -> None:
+    """reads the model with the same options"""
+    bdf_filename = model.active_filenames[0]
+    xref = model._xref
+    punch = model.punch
+    read_includes = model.read_includes
+    encoding = model._encoding
+    model.clear_attributes()
+    model.read_bdf(bdf_filename, validate=validate, xref=xref, punch=punch,
+                   read_includes=read_includes, save_file_structure=True,
+                   encoding=encoding)
+
+
+def _iter_cards(model: BDF):
+    """iterates over the cards of the model"""
+    for value in list(model.__dict__.values()):
+        if isinstance(value, BaseCard):
+            yield value
+        elif isinstance(value, MutableMapping):
+            for obj in value.values():
+                if isinstance(obj, BaseCard):
+                    yield obj
+                elif isinstance(obj, list):
+                    for card in obj:
+                        if isinstance(card, BaseCard):
+                            yield card
+        elif isinstance(value, list):
+            for card in value:
+                if isinstance(card, BaseCard):
+                    yield card
+
+
+def _remove_cards(model: BDF, ifiles: set[int]) -> list[Any]:
+    """removes the cards that were read from the files"""
+    def is_removed(card) -> bool:
+        return isinstance(card, BaseCard) and getattr(card, 'ifile', None) in ifiles
+
+    removed_cards = []
+    removed_keys = defaultdict(list)
+    for name, value in list(model.__dict__.items()):
+        if isinstance(value, BaseCard):
+            if is_removed(value):
+                setattr(model, name, None)
+                removed_cards.append(value)
+        elif isinstance(value, MutableMapping):
+            for key, obj in list(value.items()):
+                if isinstance(obj, list):
+                    cards = [card for card in obj if not is_removed(card)]
+                    if len(cards) == len(obj):
+                        continue
+                    for card in obj:
+                        if is_removed(card):
+                            removed_cards.append(card)
+                            removed_keys[card.type].append(key)
+                    if cards:
+                        value[key] = cards
+                    else:
+                        del value[key]
+                elif is_removed(obj):
+                    del value[key]
+                    removed_cards.append(obj)
+                    removed_keys[obj.type].append(key)
+        elif isinstance(value, list) and value:
+            cards = [card for card in value if not is_removed(card)]
+            if len(cards) != len(value):
+                removed_cards.extend(card for card in value if is_removed(card))
+                value[:] = cards
+
+    type_to_id_map = model._type_to_id_map
+    for card_type, keys in removed_keys.items():
+        if card_type not in type_to_id_map:
+            continue
+        nremove = defaultdict(int)
+        for key in keys:
+            nremove[key] += 1
+        ids = []
+        for key in type_to_id_map[card_type]:
+            if nremove.get(key, 0):
+                nremove[key] -= 1
+                continue
+            ids.append(key)
+        if ids:
+            type_to_id_map[card_type] = ids
+        else:
+            del type_to_id_map[card_type]
+    return removed_cards
+
+
+def _remove_card_count(model: BDF, ifiles: set[int]) -> None:
+    """removes the cards of the files from the card_count"""
+    card_count = model.card_count
+    ifile_card_count = model._ifile_card_count
+    for (ifile, card_name), count in list(ifile_card_count.items()):
+        if ifile not in ifiles:
+            continue
+        del ifile_card_count[(ifile, card_name)]
+        card_count[card_name] -= count
+        if card_count[card_name] <= 0:
+            del card_count[card_name]
+
+
+def _cross_reference_changed(model: BDF, removed_cards: list[Any],
+                             new_cards: list[Any]) -> None:
+    """
+    Cross-references the new cards and the cards that referenced a
+    removed card
+    """
+    if any(card.type in FULL_XREF_TYPES for card in removed_cards + new_cards):
+        model.log.debug('a coordinate system changed; cross-referencing the model')
+        new_ids = {id(card) for card in new_cards}
+        for card in _iter_cards(model):
+            if id(card) not in new_ids:
+                card.uncross_reference()
+        model.cross_reference()
+        return
+
+    removed_ids = {id(card) for card in removed_cards}
+    dependents = [card for card in _iter_cards(model)
+                  if _references(card, removed_ids)]
+    for card in dependents:
+        card.uncross_reference()
+
+    grdset = model.grdset
+    for card in dependents + new_cards:
+        try:
+            if card.type == 'GRID':
+                card.cross_reference(model, grdset)
+            else:
+                card.cross_reference(model)
+        except (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError) as error:
+            model._store_xref_error(error, card)
+    model.pop_xref_errors()
+
+
+def _references(card: Any, removed_ids: set[int]) -> bool:
+    """does the card reference one of the removed cards"""
+    for key, value in card.__dict__.items():
+        if not key.endswith('_ref') or value is None:
+            continue
+        if _references_value(value, removed_ids):
+            return True
+    return False
+
+
+def _references_value(value: Any, removed_ids: set[int]) -> bool:
+    """
+    is the *_ref value one of the removed cards
+
+    The references may be nested (e.g., LOAD.load_ids_ref is a list of
+    lists of loads).
+    """
+    if id(value) in removed_ids:
+        return True
+    if isinstance(value, (list, tuple)):
+        return any(_references_value(valuei, removed_ids) for valuei in value)
+    return False
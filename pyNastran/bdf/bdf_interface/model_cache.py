@@ -0,0 +1,387 @@
+"""
+Defines a binary cache of the BDF models that were read by ``read_bdf``.
+
+The cache is content addressed.  The key is the hash of the main file
+and the read options; the manifest stores the (size, mtime, hash) of the
+main file and all the INCLUDE files.  A cache entry is valid when every
+file has the same size and either the same mtime or the same hash (e.g.,
+the file was touched, but not changed).
+
+The nodes/elements/properties are stored as columns (a numpy array per
+attribute per card type; e.g., the xyz of the GRIDs is an (nnodes, 3)
+array), so the cards are restored without unpickling each card.  The
+attributes that can't be stored as an array (and the rest of the model)
+are pickled.
+
+Example
+-------
+>>> model = read_bdf(bdf_filename, cache_dir='bdf_cache')  # miss; parses the deck
+>>> model = read_bdf(bdf_filename, cache_dir='bdf_cache')  # hit; loads the cache
+"""
+from __future__ import annotations
+import os
+import json
+import hashlib
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from time import perf_counter
+from typing import Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+import pyNastran
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the version of the cache format
+CACHE_VERSION = 1
+
+#: the card dictionaries that are stored as columns
+COLUMN_DICTS = ['nodes', 'elements', 'properties']
+
+#: the codes of the 'number' column (e.g., theta_mcid is an int/float/None)
+_NONE, _INT, _FLOAT = 0, 1, 2
+_MAX_EXACT_INT = 2 ** 53
+
+
+def read_bdf_cached(model: BDF, bdf_filename: str, cache_dir: str,
+                    validate: bool=True, xref: bool=True, punch: bool=False,
+                    save_file_structure: bool=False,
+                    encoding: Optional[str]=None, nworkers: int=1) -> bool:
+    """
+    Reads a BDF using the model cache (see ``read_bdf``)
+
+    Returns
+    -------
+    is_hit : bool
+        was the model loaded from the cache
+    """
+    log = model.log
+    t0 = perf_counter()
+    key = get_cache_key(model, bdf_filename, punch=punch,
+                        save_file_structure=save_file_structure, encoding=encoding)
+    cache_filename = os.path.join(cache_dir, f'{key}.npz')
+    manifest_filename = os.path.join(cache_dir, f'{key}.json')
+
+    reason = check_manifest(manifest_filename)
+    if reason is None:
+        try:
+            load_model_cache(model, cache_filename)
+        except Exception as error:  # a corrupt/old cache is reparsed
+            reason = f'failed to load the cache ({type(error).__name__}: {error})'
+        else:
+            log.info(f'model cache hit for {bdf_filename}; loaded {cache_filename} '
+                     f'in {perf_counter() - t0:.3f} sec')
+            if validate:
+                model.validate()
+            model.cross_reference(xref=xref)
+            model._xref = xref
+            return True
+
+    model.read_bdf(bdf_filename, validate=validate, xref=False, punch=punch,
+                   save_file_structure=save_file_structure, encoding=encoding,
+                   nworkers=nworkers)
+    dt_read = perf_counter() - t0
+    os.makedirs(cache_dir, exist_ok=True)
+    save_model_cache(model, cache_filename)
+    write_manifest(manifest_filename, model.active_filenames)
+    log.info(f'model cache miss for {bdf_filename} ({reason}); read the deck in '
+             f'{dt_read:.3f} sec and wrote {cache_filename} in '
+             f'{perf_counter() - t0 - dt_read:.3f} sec')
+    model.cross_reference(xref=xref)
+    model._xref = xref
+    return False
+
+
+def get_cache_key(model: BDF, bdf_filename: str, **kwargs: Any) -> str:
+    """
+    Gets the cache key, which is the hash of the main file, the path,
+    the read options and the pyNastran version
+    """
+    abs_filename = os.path.abspath(bdf_filename)
+    options = {
+        'filename': abs_filename,
+        'file_hash': _hash_file(abs_filename),
+        'version': pyNastran.__version__,
+        'cache_version': CACHE_VERSION,
+        'mode': model._nastran_format,
+        'is_superelements': model.is_superelements,
+        'cards_to_read': sorted(model.cards_to_read),
+    }
+    options.update(kwargs)
+    options_str = json.dumps(options, sort_keys=True, default=str)
+    return hashlib.sha1(options_str.encode('utf8')).hexdigest()
+
+
+def _hash_file(filename: str) -> str:
+    """gets the sha1 of a file"""
+    sha1 = hashlib.sha1()
+    with open(filename, 'rb') as file_obj:
+        for block in iter(lambda: file_obj.read(1 << 20), b''):
+            sha1.update(block)
+    return sha1.hexdigest()
+
+
+def write_manifest(manifest_filename: str, filenames: list[str]) -> None:
+    """writes the (size, mtime, hash) of the files that were read"""
+    files = []
+    for filename in dict.fromkeys(filenames):
+        stat = os.stat(filename)
+        files.append({
+            'filename': filename,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha1': _hash_file(filename),
+        })
+    _write_atomic(manifest_filename, json.dumps({'files': files}, indent=1).encode('utf8'))
+
+
+def check_manifest(manifest_filename: str) -> Optional[str]:
+    """
+    Checks that the files in the manifest haven't changed
+
+    Returns
+    -------
+    reason : str / None
+        why the cache is invalid; None if the cache is valid
+    """
+    if not os.path.exists(manifest_filename):
+        return 'no cache'
+    with open(manifest_filename, 'r') as manifest_file:
+        manifest = json.load(manifest_file)
+
+    for file_data in manifest['files']:
+        filename = file_data['filename']
+        if not os.path.exists(filename):
+            return f'{filename} was removed'
+        stat = os.stat(filename)
+        if stat.st_size != file_data['size']:
+            return f'{filename} changed'
+        if stat.st_mtime_ns != file_data['mtime_ns'] and _hash_file(filename) != file_data['sha1']:
+            return f'{filename} changed'
+    return None
+
+
+def _write_atomic(filename: str, data: bytes) -> None:
+    """writes a file, so a partial file is never read"""
+    tmp_filename = f'{filename}.{os.getpid()}.tmp'
+    with open(tmp_filename, 'wb') as file_obj:
+        file_obj.write(data)
+    os.replace(tmp_filename, filename)
+
+
+def save_model_cache(model: BDF, cache_filename: str) -> None:
+    """
+    Writes the uncross-referenced model to an npz file
+
+    The COLUMN_DICTS are stored as columns and the rest of the model is
+    pickled.
+    """
+    arrays = {}
+    layouts = {}
+    dicts = {}
+    for dict_name in COLUMN_DICTS:
+        cards = getattr(model, dict_name)
+        layout = _encode_cards(cards, dict_name, arrays)
+        if layout is not None:
+            layouts[dict_name] = layout
+            dicts[dict_name] = cards
+            setattr(model, dict_name, {})
+    try:
+        model_bytes = dumps(model, protocol=HIGHEST_PROTOCOL)
+    finally:
+        for dict_name, cards in dicts.items():
+            setattr(model, dict_name, cards)
+
+    meta = dumps({'model': model_bytes, 'layouts': layouts}, protocol=HIGHEST_PROTOCOL)
+    arrays['meta'] = np.frombuffer(meta, dtype='uint8')
+
+    tmp_filename = f'{cache_filename}.{os.getpid()}.tmp.npz'
+    np.savez(tmp_filename, **arrays)
+    os.replace(tmp_filename, cache_filename)
+
+
+def load_model_cache(model: BDF, cache_filename: str) -> None:
+    """loads the model from an npz file written by ``save_model_cache``"""
+    with np.load(cache_filename, allow_pickle=False) as npz:
+        arrays = dict(npz.items())
+    meta = loads(arrays.pop('meta').tobytes())
+    obj = loads(meta['model'])
+    for dict_name, layout in meta['layouts'].items():
+        setattr(obj, dict_name, _decode_cards(layout, dict_name, arrays))
+    model._load_object(obj)
+    model.case_control_deck.solmap_to_value = model._solmap_to_value
+    model.case_control_deck.rsolmap_to_str = model.rsolmap_to_str
+
+
+def _encode_cards(cards: dict[int, Any], dict_name: str,
+                  arrays: dict[str, np.ndarray]) -> Optional[dict[str, Any]]:
+    """
+    Stores the cards as columns
+
+    The cards are grouped by the class and attribute names; a column is
+    stored for each attribute of a group.
+
+    Returns
+    -------
+    layout : dict / None
+        the ids, groups and pickled columns; None if the cards can't be
+        stored as columns (e.g., a non-integer id, a CompactCardDict)
+    """
+    if not isinstance(cards, dict) or not all(type(key) is int for key in cards):
+        return None
+    if not all(hasattr(card, '__dict__') for card in cards.values()):
+        return None
+
+    groups = {}
+    igroups = np.zeros(len(cards), dtype='int32')
+    for i, card in enumerate(cards.values()):
+        group_key = (type(card), tuple(card.__dict__))
+        igroup = groups.setdefault(group_key, len(groups))
+        igroups[i] = igroup
+
+    group_cards = [[] for unused_i in range(len(groups))]
+    for card, igroup in zip(cards.values(), igroups.tolist()):
+        group_cards[igroup].append(card)
+
+    group_layouts = []
+    for igroup, ((card_class, attrs), cardsi) in enumerate(zip(groups, group_cards)):
+        kinds = []
+        pickled = {}
+        for iattr, attr in enumerate(attrs):
+            values = [card.__dict__[attr] for card in cardsi]
+            name = f'{dict_name}/{igroup}/{iattr}'
+            kind = _encode_column(values, name, arrays)
+            if kind is None:
+                kind = 'pickle'
+                pickled[iattr] = values
+            kinds.append(kind)
+        group_layouts.append((card_class, attrs, kinds, len(cardsi), pickled))
+
+    arrays[f'{dict_name}/ids'] = np.array(list(cards), dtype='int64')
+    arrays[f'{dict_name}/igroup'] = igroups
+    return {'groups': group_layouts}
+
+
+def _decode_cards(layout: dict[str, Any], dict_name: str,
+                  arrays: dict[str, np.ndarray]) -> dict[int, Any]:
+    """creates the cards from the columns (see ``_encode_cards``)"""
+    group_cards = []
+    for igroup, (card_class, attrs, kinds, ncards, pickled) in enumerate(layout['groups']):
+        columns = []
+        for iattr, kind in enumerate(kinds):
+            if kind == 'pickle':
+                columns.append(pickled[iattr])
+            else:
+                name = f'{dict_name}/{igroup}/{iattr}'
+                columns.append(_decode_column(kind, name, arrays, ncards))
+
+        new = card_class.__new__
+        cards = []
+        for row in zip(*columns):
+            card = new(card_class)
+            card.__dict__.update(zip(attrs, row))
+            cards.append(card)
+        group_cards.append(iter(cards))
+
+    ids = arrays[f'{dict_name}/ids'].tolist()
+    igroups = arrays[f'{dict_name}/igroup'].tolist()
+    return {key: next(group_cards[igroup]) for key, igroup in zip(ids, igroups)}
+
+
+def _encode_column(values: list[Any], name: str,
+                   arrays: dict[str, np.ndarray]) -> Optional[str]:
+    """
+    Stores the values of an attribute as arrays
+
+    Returns
+    -------
+    kind : str / None
+        the type of the column; None if the values can't be stored as
+        arrays
+    """
+    types = {type(value) for value in values}
+    if types == {type(None)}:
+        return 'none'
+    if types == {bool}:
+        arrays[name] = np.array(values, dtype='bool')
+        return 'bool'
+    if types == {int}:
+        if max(abs(min(values)), abs(max(values))) >= 2 ** 63:
+            return None
+        arrays[name] = np.array(values, dtype='int64')
+        return 'int'
+    if types == {float}:
+        arrays[name] = np.array(values, dtype='float64')
+        return 'float'
+    if types == {str}:
+        if any(value.endswith('\x00') for value in values):
+            return None
+        arrays[name] = np.array(values, dtype='str')
+        return 'str'
+    if types <= {int, float, type(None)}:
+        return _encode_numbers(values, name, arrays)
+    if types == {list}:
+        return _encode_lists(values, name, arrays)
+    if types == {np.ndarray}:
+        shapes_dtypes = {(value.shape, value.dtype) for value in values}
+        if len(shapes_dtypes) == 1 and values[0].dtype.kind in 'biuf':
+            arrays[name] = np.array(values)
+            return 'array'
+    return None
+
+
+def _encode_numbers(values: list[Any], name: str,
+                    arrays: dict[str, np.ndarray]) -> Optional[str]:
+    """stores a column of int/float/None values"""
+    codes = np.array([_NONE if value is None else _INT if type(value) is int else _FLOAT
+                      for value in values], dtype='int8')
+    numbers = [0. if value is None else value for value in values]
+    if any(type(value) is int and abs(value) >= _MAX_EXACT_INT for value in numbers):
+        return None
+    arrays[name] = np.array(numbers, dtype='float64')
+    arrays[name + '/code'] = codes
+    return 'number'
+
+
+def _encode_lists(values: list[list[Any]], name: str,
+                  arrays: dict[str, np.ndarray]) -> Optional[str]:
+    """stores a column of equal length lists of int/None (e.g., the nodes)"""
+    nvalues = {len(value) for value in values}
+    if len(nvalues) != 1 or nvalues == {0}:
+        return None
+    item_types = {type(item) for value in values for item in value}
+    if not item_types <= {int, type(None)}:
+        return None
+    is_none = np.array([[item is None for item in value] for value in values], dtype='bool')
+    ints = [[0 if item is None else item for item in value] for value in values]
+    try:
+        arrays[name] = np.array(ints, dtype='int64')
+    except OverflowError:
+        return None
+    if is_none.any():
+        arrays[name + '/is_none'] = is_none
+        return 'int_list_none'
+    return 'int_list'
+
+
+def _decode_column(kind: str, name: str, arrays: dict[str, np.ndarray],
+                   nvalues: int) -> list[Any]:
+    """gets the values of an attribute (see ``_encode_column``)"""
+    if kind == 'none':
+        return [None] * nvalues
+    if kind in {'bool', 'int', 'float', 'str', 'int_list'}:
+        return arrays[name].tolist()
+    if kind == 'array':
+        return list(arrays[name])
+    if kind == 'number':
+        numbers = arrays[name].tolist()
+        codes = arrays[name + '/code'].tolist()
+        return [None if code == _NONE else int(number) if code == _INT else number
+                for number, code in zip(numbers, codes)]
+    assert kind == 'int_list_none', kind
+    values = arrays[name].tolist()
+    for value, is_none in zip(values, arrays[name + '/is_none'].tolist()):
+        for i, is_nonei in enumerate(is_none):
+            if is_nonei:
+                value[i] = None
+    return values
@@ -24,6 +24,7 @@ import os
 import shlex
 import warnings
 from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
 from itertools import count
 from collections import defaultdict
 from typing import Optional, Union, Any, cast
@@ -186,6 +187,10 @@ class BDFInputPy:
         self.log = get_logger2(log, debug)
         self.use_new_parser = False
 
+        # the number of threads used to read the INCLUDE files
+        self.nworkers = 1
+        self._include_cache = {}
+
     def get_lines(self, bdf_filename: Union[str, StringIO],
                   punch: Optional[bool]=False,
                   make_ilines: bool=True) -> tuple[list[str], list[str], list[str],
@@ -360,8 +365,58 @@ class BDFInputPy:
                 lines = bdf_file.readlines()
             except UnicodeDecodeError:
                 _show_bad_file(self, bdf_filename, encoding=self.encoding)
+        if self.read_includes and self.nworkers > 1:
+            self._prefetch_includes(lines)
         return lines
 
+    def _prefetch_includes(self, lines: list[str]) -> None:
+        """
+        Reads the INCLUDE files (and their INCLUDE files) with a pool of
+        threads, so ``lines_to_deck_lines`` doesn't wait on each file.
+
+        The files are stored by filename in ``_include_cache``.  A file that
+        can't be read (e.g., missing, bad encoding) isn't stored, so it's
+        read (and the error is raised) in the usual way.
+        """
+        # the files are read a level (the includes of the previous files) at a time
+        bdf_filenames = self._find_include_filenames(lines)
+        read_filenames = set()
+        with ThreadPoolExecutor(self.nworkers) as executor:
+            while bdf_filenames:
+                bdf_filenames = [bdf_filename2 for bdf_filename2 in dict.fromkeys(bdf_filenames)
+                                 if bdf_filename2 not in read_filenames]
+                read_filenames.update(bdf_filenames)
+                abs_filenames = [os.path.join(self.include_dir, bdf_filename2)
+                                 for bdf_filename2 in bdf_filenames]
+                lines_list = executor.map(_read_include_file, abs_filenames,
+                                          [self.encoding] * len(abs_filenames))
+
+                next_filenames = []
+                for bdf_filename2, lines2 in zip(bdf_filenames, lines_list):
+                    if lines2 is not None:
+                        self._include_cache[bdf_filename2] = lines2
+                        next_filenames.extend(self._find_include_filenames(lines2))
+                bdf_filenames = next_filenames
+        self.log.debug(f'read {len(self._include_cache)} INCLUDE files '
+                       f'with nworkers={self.nworkers}')
+
+    def _find_include_filenames(self, lines: list[str]) -> list[str]:
+        """gets the INCLUDE filenames in a file (see ``lines_to_deck_lines``)"""
+        bdf_filenames = []
+        nlines = len(lines)
+        for i, line in enumerate(lines):
+            line = line.rstrip('\r\n\t')
+            if not line.upper().startswith('INCLUDE'):
+                continue
+            try:
+                unused_j, include_lines = self._get_include_lines(lines, line, i, nlines)
+                bdf_filenames.append(
+                    get_include_filename(include_lines, include_dir=self.include_dir))
+            except Exception:
+                # the error is raised when the file is merged
+                continue
+        return bdf_filenames
+
     def lines_to_deck_lines(self, lines: list[str],
                             make_ilines: bool=True) -> tuple[list[str], int]:
         """
@@ -457,31 +512,15 @@ class BDFInputPy:
             raise
             #raise IOError(msg)
 
-        read_again = False
-        with self._open_file(bdf_filename2, basename=False) as bdf_file:
-            #print('bdf_file.name = %s' % bdf_file.name)
-            try:
-                lines2 = bdf_file.readlines()
-            except UnicodeDecodeError:
-                #try:
-                bdf_file.seek(0)
-                try:
-                    encoding2 = _check_pynastran_encoding(bdf_filename2, encoding=self.encoding)
-                except UnicodeDecodeError:
-                    encoding2 = self.encoding
-
-                #print('***encoding=%s encoding2=%s' % (self.encoding, encoding2))
-                if self.encoding != encoding2:
-                    read_again = True
-                else:
-                    msg = (
-                        'Invalid Encoding: encoding=%r.  Fix it by:\n'
-                        '  1.  try a different encoding (e.g., latin1, cp1252, utf8)\n'
-                        "  2.  call read_bdf(...) with `encoding`'\n"
-                        "  3.  Add '$ pyNastran : encoding=latin1"
-                        ' (or other encoding) to the top of the main/INCLUDE file\n' % (
-                            self.encoding))
-                    raise RuntimeError(msg)
+        if bdf_filename2 in self._include_cache:
+            # the file was read by _prefetch_includes
+            bdf_filename_inc = os.path.join(self.include_dir, bdf_filename2)
+            self.log.debug('opening %r' % bdf_filename_inc)
+            self.active_filenames.append(bdf_filename_inc)
+            lines2 = self._include_cache.pop(bdf_filename2)
+            read_again = False
+        else:
+            lines2, read_again, encoding2 = self._read_include(bdf_filename2)
 
         if read_again:
             self.active_filenames.pop()
@@ -564,6 +603,48 @@ class BDFInputPy:
             #print("  *%s" % line.rstrip())
         return lines, nlines, ilines
 
+    def _read_include(self, bdf_filename2: str) -> tuple[Optional[list[str]], bool, str]:
+        """
+        Reads an include file
+
+        Returns
+        -------
+        lines2 : list[str] / None
+            the lines of the file; None if it must be read again
+        read_again : bool
+            should the file be read again with encoding2
+        encoding2 : str
+            the encoding from the '$ pyNastran : encoding=...' header
+        """
+        lines2 = None
+        read_again = False
+        encoding2 = self.encoding
+        with self._open_file(bdf_filename2, basename=False) as bdf_file:
+            #print('bdf_file.name = %s' % bdf_file.name)
+            try:
+                lines2 = bdf_file.readlines()
+            except UnicodeDecodeError:
+                #try:
+                bdf_file.seek(0)
+                try:
+                    encoding2 = _check_pynastran_encoding(bdf_filename2, encoding=self.encoding)
+                except UnicodeDecodeError:
+                    encoding2 = self.encoding
+
+                #print('***encoding=%s encoding2=%s' % (self.encoding, encoding2))
+                if self.encoding != encoding2:
+                    read_again = True
+                else:
+                    msg = (
+                        'Invalid Encoding: encoding=%r.  Fix it by:\n'
+                        '  1.  try a different encoding (e.g., latin1, cp1252, utf8)\n'
+                        "  2.  call read_bdf(...) with `encoding`'\n"
+                        "  3.  Add '$ pyNastran : encoding=latin1"
+                        ' (or other encoding) to the top of the main/INCLUDE file\n' % (
+                            self.encoding))
+                    raise RuntimeError(msg)
+        return lines2, read_again, encoding2
+
     def _get_include_lines(self, lines: list[str], line: str,
                            i: int, nlines: int) -> tuple[int, list[str]]:
         """
@@ -765,6 +846,15 @@ class BDFInputPy:
                 raise IOError('Not a file: bdf_filename=%r' % bdf_filename)
 
 
+def _read_include_file(bdf_filename: str, encoding: str) -> Optional[list[str]]:
+    """reads an include file in a thread; None if it can't be read"""
+    try:
+        with open(_filename(bdf_filename), 'r', encoding=encoding) as bdf_file:
+            return bdf_file.readlines()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
 def _is_bulk_data_line(text: str) -> bool:
     """
     Returns True if there is a Bulk Data Deck
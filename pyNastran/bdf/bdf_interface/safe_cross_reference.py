@@ -10,6 +10,7 @@ from typing import Any
 import numpy as np
 from numpy import zeros, argsort, arange, array_equal
 from pyNastran.bdf.bdf_interface.cross_reference import XrefMesh
+from pyNastran.bdf.bdf_interface.compact_storage import CompactCardDict
 
 
 class SafeXrefMesh(XrefMesh):
@@ -241,7 +242,12 @@ class SafeXrefMesh(XrefMesh):
         """
         xref_errors = defaultdict(list)
         missing_safe_xref = set()
-        for elem in self.elements.values():
+        elements = self.elements
+        if isinstance(elements, CompactCardDict):
+            # the missing references are None
+            elements.cross_reference(self)
+            elements = elements.objects
+        for elem in elements.values():
             if hasattr(elem, 'safe_cross_reference'):
                 elem.safe_cross_reference(self, xref_errors)
             else:
@@ -186,7 +186,7 @@ def get_bdf_stats(model: BDF, return_type: str='string',
         # ----
         #new
         'bolt', 'boltld', 'boltfor', 'boltseq', 'boltfrc',
-        'use_new_deck_parser',
+        'use_new_deck_parser', 'use_fast_tokenizer', 'use_compact_storage',
 
     ] + list_attrs + card_dict_groups + scalar_attrs
     missed_attrs = []
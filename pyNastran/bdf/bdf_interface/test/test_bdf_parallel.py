@@ -0,0 +1,206 @@
+"""tests reading a BDF with a pool of workers"""
+# pylint: disable=W0212
+import os
+import unittest
+import tempfile
+from io import StringIO
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.bdf_parallel import parse_cards_parallel, CHUNK_SIZE
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes the model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+def _write_plate_includes(dirname: str, nx: int) -> str:
+    """
+    Writes an nx by nx CQUAD4 plate split into include files
+    (with a nested include)
+    """
+    nid = 1
+    grid_lines = []
+    for j in range(nx + 1):
+        for i in range(nx + 1):
+            grid_lines.append('GRID,%i,,%s,%s,0.\n' % (nid, i / nx, j / nx))
+            nid += 1
+
+    eid = 1
+    quad_lines = []
+    for j in range(nx):
+        for i in range(nx):
+            n1 = j * (nx + 1) + i + 1
+            quad_lines.append('CQUAD4,%i,1,%i,%i,%i,%i\n' % (
+                eid, n1, n1 + 1, n1 + nx + 2, n1 + nx + 1))
+            eid += 1
+
+    with open(os.path.join(dirname, 'grids.inc'), 'w') as inc_file:
+        inc_file.writelines(grid_lines)
+    with open(os.path.join(dirname, 'quads.inc'), 'w') as inc_file:
+        inc_file.writelines(quad_lines)
+    with open(os.path.join(dirname, 'properties.inc'), 'w') as inc_file:
+        inc_file.write("PSHELL,1,1,0.1\nINCLUDE 'materials.inc'\n")
+    with open(os.path.join(dirname, 'materials.inc'), 'w') as inc_file:
+        inc_file.write('MAT1,1,3.0e7,,0.3\n')
+
+    bdf_filename = os.path.join(dirname, 'plate.bdf')
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write(
+            'SOL 101\nCEND\nBEGIN BULK\n'
+            "INCLUDE 'grids.inc'\n"
+            "INCLUDE 'quads.inc'\n"
+            "INCLUDE 'properties.inc'\n"
+            'ENDDATA\n')
+    return bdf_filename
+
+
+class TestBDFParallel(unittest.TestCase):
+    """tests reading a BDF with a pool of workers"""
+
+    def test_read_bdf_nworkers(self):
+        """the parallel and serial readers create the same model"""
+        log = SimpleLogger(level='error')
+        # there are enough cards for 2 chunks
+        nx = int((CHUNK_SIZE / 2) ** 0.5) + 1
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_plate_includes(dirname, nx)
+            model1 = read_bdf(bdf_filename, xref=False, log=log)
+            model2 = read_bdf(bdf_filename, xref=False, log=log, nworkers=2)
+        assert len(model2.elements) == nx ** 2, len(model2.elements)
+        self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+        self.assertEqual(model1.card_count, model2.card_count)
+        self.assertEqual(list(model1.nodes), list(model2.nodes))
+        self.assertEqual(list(model1.elements), list(model2.elements))
+        self.assertEqual(model1.active_filenames, model2.active_filenames)
+
+    def test_prefetch_includes(self):
+        """the include files are read by a pool of threads"""
+        log = SimpleLogger(level='error')
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_plate_includes(dirname, 2)
+            with open(os.path.join(dirname, 'missing.bdf'), 'w') as bdf_file:
+                bdf_file.write("BEGIN BULK\nINCLUDE 'missing.inc'\n")
+
+            pybdf = BDFInputPy(True, False, 'utf8', log=log)
+            pybdf.nworkers = 2
+            pybdf.get_main_lines(bdf_filename)
+            filenames = sorted(os.path.basename(filename) for filename in pybdf._include_cache)
+            self.assertEqual(filenames,
+                             ['grids.inc', 'materials.inc', 'properties.inc', 'quads.inc'])
+
+            # the cached files are merged
+            pybdf = BDFInputPy(True, False, 'utf8', log=log)
+            pybdf.nworkers = 2
+            lines = pybdf.get_lines(bdf_filename)[3]
+            assert pybdf._include_cache == {}, pybdf._include_cache
+            assert 'MAT1,1,3.0e7,,0.3' in lines, lines
+
+            # the missing file is raised when it's merged
+            pybdf = BDFInputPy(True, False, 'utf8', log=log)
+            pybdf.nworkers = 2
+            with self.assertRaises(IOError):
+                pybdf.get_lines(os.path.join(dirname, 'missing.bdf'), punch=True)
+
+    def test_parse_cards_parallel_errors(self):
+        """the duplicate ids/card errors are the same as the serial parser"""
+        log = SimpleLogger(level='error')
+        lines = [
+            'GRID,1,,0.,0.,0.',
+            'GRID,2,,1.,0.,0.',
+            'GRID,3,,1.,1.,0.',
+            'GRID,3,,2.,1.,0.',  # duplicate
+            'GRID,4,,0.,1.,0.',
+            'GRID,5,,a,1.,0.',  # bad
+            'CQUAD4,10,1,1,2,3,4',
+            'CQUAD4,11,1,1,2,3,4',
+            'PSHELL,1,1,0.1',
+            'MAT1,1,3.0e7,,0.3',
+            'CTRIA3,12,1,1,2,3',
+        ]
+        ilines = np.zeros((len(lines), 2), dtype='int32')
+        ilines[:, 1] = np.arange(len(lines))
+
+        models = []
+        for is_parallel in [False, True]:
+            model = BDF(log=log)
+            model._nparse_errors = 100
+            cards_list, cards_dict, card_count = model.get_bdf_cards(lines, ilines)
+            if is_parallel:
+                assert parse_cards_parallel(model, cards_list, cards_dict,
+                                            nworkers=2, chunk_size=3)
+            else:
+                model._parse_cards(cards_list, cards_dict, card_count)
+            models.append(model)
+
+        model1, model2 = models
+        assert len(model2._stored_parse_errors) == 2, model2._stored_parse_errors
+        self.assertEqual(model1._stored_parse_errors, model2._stored_parse_errors)
+        self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+        self.assertEqual(model1.card_count, model2.card_count)
+
+        # too few cards / replication are parsed serially
+        model = BDF(log=log)
+        cards_list, cards_dict, unused_card_count = model.get_bdf_cards(lines, ilines)
+        assert parse_cards_parallel(model, cards_list, cards_dict, nworkers=2) is False
+        cards_list, cards_dict, unused_card_count = model.get_bdf_cards(
+            lines + ['=,*1,,*1.'], np.vstack([ilines, [0, len(lines)]]))
+        assert parse_cards_parallel(model, cards_list, cards_dict, nworkers=2,
+                                    chunk_size=1) is False
+        assert len(model.nodes) == 0
+
+    def test_parse_cards_parallel_settings(self):
+        """strict=False and model.echo are the same as the serial parser"""
+        log = SimpleLogger(level='error')
+        lines = [
+            'GRID,1,,0.,0.,0.',
+            'GRID,2,,1.,0.,0.',
+            'GRID,3,,1.,1.,0.',
+            'CTRIA3,10,1,1.0,2,3',  # a float node id is allowed by add_card_lax
+            'CTRIA3,11,1,1,2,3.0',
+            'PSHELL,1,1,0.1',
+        ]
+        ilines = np.zeros((len(lines), 2), dtype='int32')
+        ilines[:, 1] = np.arange(len(lines))
+
+        models = []
+        for is_parallel in [False, True]:
+            model = BDF(log=log)
+            cards_list, cards_dict, card_count = model.get_bdf_cards(lines, ilines)
+            if is_parallel:
+                assert parse_cards_parallel(model, cards_list, cards_dict, nworkers=2,
+                                            chunk_size=2, strict=False)
+            else:
+                model._parse_cards(cards_list, cards_dict, card_count, strict=False)
+            models.append(model)
+
+        model1, model2 = models
+        self.assertEqual(model2.elements[10].node_ids, [1, 2, 3])
+        self.assertEqual(model2.elements[11].node_ids, [1, 2, 3])
+        self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+        self.assertEqual(model1.card_count, model2.card_count)
+
+        # the echoed cards are parsed serially and model.echo is unchanged
+        model = BDF(log=log)
+        cards_list, cards_dict, unused_card_count = model.get_bdf_cards(lines, ilines)
+        model.force_echo_off = True
+        model.echo = True
+        assert parse_cards_parallel(model, cards_list, cards_dict, nworkers=2,
+                                    chunk_size=2, strict=False)
+        assert model.echo is True
+        model = BDF(log=log)
+        model.force_echo_off = False
+        model.echo = True
+        assert parse_cards_parallel(model, cards_list, cards_dict, nworkers=2,
+                                    chunk_size=2) is False
+        assert len(model.elements) == 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,139 @@
+"""tests the vectorized bulk data tokenizer"""
+# pylint: disable=W0212
+import unittest
+from io import StringIO
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.bulk_tokenizer import (
+    parse_bulk_data_fast, get_line_codes, _cast_fields, FIELD_WIDTH, FLOAT, NUMBER)
+
+BULK_DATA = (
+    '$ header comment\n'
+    '\n'
+    'GRID           1       0      0.      0.      0.\n'
+    'GRID           2            1.+0      0.      0.       0     456\n'
+    'grid,3,,1.0D+0,1.,-.5E-1\n'
+    'GRID*                  4               0             1.0             1.0\n'
+    '*                    1.5\n'
+    'GRID           5         -1.5-3    2.e1    +2.5\n'
+    '$ a comment on GRID 6\n'
+    'GRID           6       0     1.0     1.0     0.0\n'
+    'GRID           7       0     1.0     1.0     0.0\n'
+    'GRID\t8\t0\t2.0\t1.0\t0.0\n'
+    '\n'
+    'CQUAD4         1       1       1       2       3       4     0.0     0.1\n'
+    'CQUAD4         2       1       1       2       3       4       1\n'
+    'CQUAD4  3       1       1       2       3       4                       +\n'
+    '+               0       1.      1.      1.      1.\n'
+    'CTRIA3,4,1,1,2,3,45.\n'
+    'CHEXA          5       2       1       2       3       4       5       6\n'
+    '               7       8\n'
+    'CHEXA,6,2,1,2,3,4,5,6\n'
+    ',7,8,,,,,,\n'
+    ',,,,,,,,\n'
+    'CTETRA         7       2       1       2       3       4\n'
+    'CBAR           8       3       1       2      0.      1.      0.\n'
+    'CBAR           9       3       1       2       5              GOO\n'
+    'CBUSH         10       4       1       2      1.      0.      0.       0\n'
+    'RBE2          11       1  123456       2       3       4  1.0e-5\n'
+    'RBE2          12       1     123       2       3\n'
+    'FORCE         13       1       0    10.0      1.      0.      0.\n'
+    'PLOAD4        14       1     1.0\n'
+    'PLOAD4        15       1     1.0                            THRU       4\n'
+
+    'PSHELL         1       1     0.1       1               1\n'
+    'PSOLID         2       1\n'
+    'PBAR           3       1      1.      1.      1.      1.\n'
+    'PBUSH          4       K      1.      1.      1.      1.      1.      1.\n'
+    'MAT1           1   3.0e7             0.3\n'
+    'ENDDATA\n'
+    'GRID           100     0      0.      0.      0.\n'
+)
+
+
+def _read_bulk_data(bulk_data: str, use_fast_tokenizer: bool) -> BDF:
+    """reads a bulk data deck"""
+    model = BDF(log=SimpleLogger(level='error'))
+    model.use_fast_tokenizer = use_fast_tokenizer
+    model.read_bdf(StringIO(bulk_data), punch=True, xref=False)
+    return model
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes the model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+class TestBulkTokenizer(unittest.TestCase):
+    """tests the vectorized bulk data tokenizer"""
+
+    def test_tokenizer_same_model(self):
+        """the fast and standard parsers create the same model"""
+        model1 = _read_bulk_data(BULK_DATA, use_fast_tokenizer=False)
+        model2 = _read_bulk_data(BULK_DATA, use_fast_tokenizer=True)
+        assert len(model2.nodes) == 8, model2.nodes.keys()
+        assert len(model2.elements) == 10, model2.elements.keys()
+        assert model2.nodes[6].comment == '$ a comment on GRID 6\n', model2.nodes[6].comment
+        self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+        self.assertEqual(model1.card_count, model2.card_count)
+        self.assertEqual(model1.reject_count, model2.reject_count)
+
+        # the typed fields
+        node = model2.nodes[5]
+        self.assertEqual(node.xyz.tolist(), [-1.5e-3, 20., 2.5])
+        self.assertEqual(model2.nodes[3].xyz.tolist(), [1., 1., -0.05])
+        self.assertEqual(model2.elements[10].x, [1., 0., 0.])
+        self.assertEqual(model2.elements[9].g0, 5)
+
+    def test_tokenizer_errors(self):
+        """the errors are the same as the standard parser"""
+        bulk_data = (
+            'GRID           1       0      1.      0.      0.\n'
+            'GRID          2.       0      1.      0.      0.\n'
+            'GRID           3       0       1      0.      0.\n'
+        )
+        msgs = []
+        for use_fast_tokenizer in [False, True]:
+            with self.assertRaises(Exception) as error:
+                _read_bulk_data(bulk_data, use_fast_tokenizer)
+            msgs.append(str(error.exception))
+        self.assertEqual(msgs[0], msgs[1])
+
+    def test_tokenizer_fallback(self):
+        """replication and ECHOON use the standard parser"""
+        for bulk_data in ['GRID,1,,0.,0.,0.\n=,*1,=,*1.\n',
+                          'ECHOON\nGRID,1,,0.,0.,0.\n']:
+            model = BDF(log=SimpleLogger(level='error'))
+            lines = bulk_data.splitlines()
+            ilines = np.zeros((len(lines), 2), dtype='int32')
+            assert parse_bulk_data_fast(model, lines, ilines) is False
+            assert len(model.nodes) == 0
+
+            model1 = _read_bulk_data(bulk_data, use_fast_tokenizer=False)
+            model2 = _read_bulk_data(bulk_data, use_fast_tokenizer=True)
+            self.assertEqual(_write_bdf(model1), _write_bdf(model2))
+
+    def test_cast_fields(self):
+        """tests casting the fields"""
+        strings = ['1', '-12', '+12', '1.', '-.5', '1.5+3', '1.5-3', '-1.D2', '2.e-1',
+                   '1e5', '.', '1.2.3', 'THRU', '1.5E', '', '  7  ', '1 2', ' A B', '1. 5',
+                   '  -1.5-3', '2.5']
+        field_types = [NUMBER] * (len(strings) - 1) + [FLOAT]
+        codes = get_line_codes([f'{string:<{FIELD_WIDTH}s}' for string in strings])[0]
+        fields = codes[:, :FIELD_WIDTH].astype('uint8')
+        values = _cast_fields(fields, np.array(field_types))[0]
+        expected = [1, -12, '+12', 1., -0.5, 1.5e3, 1.5e-3, -100., 0.2,
+                    '1e5', '.', '1.2.3', 'THRU', '1.5E', None, 7, '1 2', 'A B', '1. 5',
+                    -1.5e-3, 2.5]
+        self.assertEqual(values, expected)
+        self.assertEqual([type(value) for value in values],
+                         [type(value) for value in expected])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,235 @@
+"""tests the compact (array-backed) storage of the GRIDs/elements"""
+import os
+import pickle
+import unittest
+import tempfile
+from io import StringIO
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF, GRID, CQUAD4, CTRIA3
+from pyNastran.bdf.errors import CrossReferenceError
+from pyNastran.bdf.bdf_interface.compact_storage import CompactCardDict
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes the model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+def _write_model(dirname: str) -> str:
+    """writes a small model with supported and unsupported cards"""
+    bdf_filename = os.path.join(dirname, 'model.bdf')
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write(
+            'SOL 101\nCEND\nBEGIN BULK\n'
+            '$ the first grid\n'
+            'GRID,1,,0.,0.,0.\n'
+            'GRID,2,1,1.,0.,0.,,123\n'
+            'GRID,3,,1.,1.,0.\n'
+            'GRID,4,,0.,1.,0.\n'
+            'GRID,5,,0.,0.,1.\n'
+            'GRID,6,,0.,0.,2.\n'
+            'CORD2R,1,,0.,0.,0.,0.,0.,1.\n,1.,0.,0.\n'
+            '$ the quad\n'
+            'CQUAD4,1,1,1,2,3,4,1\n'
+            'CQUAD4,2,1,1,2,3,4,15.,0.1\n'
+            'CTRIA3,3,1,1,2,3,,,,,1.,2.,3.\n'
+            'CTETRA,4,2,1,2,3,5\n'
+            'CBAR,5,3,1,2,0.,0.,1.\n'
+            'CROD,6,4,1,6\n'
+            'PSHELL,1,1,0.1\n'
+            'PSOLID,2,1\n'
+            'PBAR,3,1,0.1,1.,1.,1.\n'
+            'PROD,4,1,0.1\n'
+            'MAT1,1,3.0e7,,0.3,1.0\n'
+            'ENDDATA\n')
+    return bdf_filename
+
+
+def _read(bdf_filename: str, use_compact_storage: bool) -> BDF:
+    """reads the model with the standard/compact storage"""
+    model = BDF(log=SimpleLogger(level='error'))
+    model.use_compact_storage = use_compact_storage
+    model.read_bdf(bdf_filename)
+    return model
+
+
+class TestCompactStorage(unittest.TestCase):
+    """tests BDF.use_compact_storage"""
+
+    def test_compact_storage(self):
+        """the compact model is the same as the standard model"""
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model0 = _read(bdf_filename, False)
+            model = _read(bdf_filename, True)
+
+        assert isinstance(model.nodes, CompactCardDict)
+        assert isinstance(model.elements, CompactCardDict)
+        self.assertEqual(_write_bdf(model), _write_bdf(model0))
+        self.assertEqual(list(model.nodes), list(model0.nodes))
+        self.assertEqual(list(model.elements), list(model0.elements))
+        self.assertEqual(model.card_count, model0.card_count)
+        self.assertAlmostEqual(mass_properties(model)[0], mass_properties(model0)[0])
+
+        # the CROD is stored as an object
+        self.assertEqual(list(model.elements.objects), [6])
+        assert model.elements[6] is model.elements[6]
+
+        node = model.nodes[2]
+        assert isinstance(node, GRID)
+        self.assertEqual(node, model0.nodes[2])
+        self.assertEqual(node.cp, 1)
+        self.assertEqual(node.ps, '123')
+        assert node.cp_ref is model.coords[1]
+        assert np.allclose(node.get_position(), model0.nodes[2].get_position())
+        self.assertEqual(model.nodes[1].comment, '$ the first grid\n')
+
+        elem = model.elements[1]
+        assert isinstance(elem, CQUAD4)
+        self.assertEqual(elem.node_ids, [1, 2, 3, 4])
+        self.assertEqual(elem.theta_mcid, 1)
+        assert elem.pid_ref is model.properties[1]
+        assert elem.nodes_ref[1] is not None
+        self.assertEqual(model.elements[2].theta_mcid, 15.)
+        self.assertAlmostEqual(elem.Area(), model0.elements[1].Area())
+        self.assertEqual(model.elements[4].node_ids, [1, 2, 3, 5])
+        assert np.allclose(model.elements[5].x, [0., 0., 1.])
+
+        nids, xyz = model.nodes.get_column(GRID, 'xyz')
+        self.assertEqual(nids.tolist(), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(xyz.shape, (6, 3))
+
+    def test_compact_storage_edit(self):
+        """the views change the model"""
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model = _read(bdf_filename, True)
+
+        # in-place edits of the xyz column
+        model.nodes[3].xyz[2] = 5.
+        self.assertEqual(model.nodes[3].xyz[2], 5.)
+        model.nodes[3].cd = 1
+        self.assertEqual(model.nodes[3].cd, 1)
+        model.elements[1].nodes = [1, 2, 3, 5]
+        self.assertEqual(model.elements[1].node_ids, [1, 2, 3, 5])
+
+        # replacing and adding cards
+        model.elements[1].uncross_reference()
+        model.elements[1] = CQUAD4(1, 1, [1, 2, 3, 4], theta_mcid=2.0, comment='quad')
+        self.assertEqual(model.elements[1].comment, '$quad\n')
+        model.elements[7] = CQUAD4(7, 1, [1, 2, 3, 4], zoffset=0.1)
+        self.assertEqual(model.elements[7].zoffset, 0.1)
+        model.nodes[10] = GRID(10, xyz=[1., 2., 3.])
+
+        del model.nodes[6]
+        del model.elements[6]
+        assert 6 not in model.nodes
+        assert 6 not in model.elements
+        assert 10 in model.nodes
+        with self.assertRaises(KeyError):
+            model.nodes[6]
+        self.assertEqual(list(model.nodes), [1, 2, 3, 4, 5, 10])
+        self.assertEqual(len(model.elements), 6)
+
+        model.uncross_reference()
+        assert model.elements[7].pid_ref is None
+        model.cross_reference()
+        assert model.elements[7].pid_ref is model.properties[1]
+        model2 = BDF(log=model.log)
+        model2.read_bdf(StringIO(_write_bdf(model)), punch=False)
+        self.assertEqual(model2.nodes[3].xyz[2], 5.)
+        self.assertEqual(model2.elements[7].zoffset, 0.1)
+
+    def test_compact_storage_references(self):
+        """the nodes are looked up like BDF.Node and a bad card isn't cross-referenced"""
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model = BDF(log=SimpleLogger(level='error'))
+            model.use_compact_storage = True
+            model.read_bdf(bdf_filename, xref=False)
+
+        model.add_spoint([100])
+        model.elements[8] = CQUAD4(8, 1, [1, 2, 3, 100])
+        model.elements[9] = CTRIA3(9, 1, [1, 2, 99])
+        with self.assertRaises(CrossReferenceError):
+            model.cross_reference()
+
+        elem = model.elements[8]
+        assert elem.nodes_ref[3] is model.spoints[100]
+        assert elem.pid_ref is model.properties[1]
+        bad_elem = model.elements[9]
+        self.assertEqual(bad_elem.node_ids, [1, 2, 99])
+        assert bad_elem.nodes_ref is None
+        assert bad_elem.pid_ref is None
+
+        # the bad row is reused by a good card
+        del model.elements[9]
+        model.elements[9] = CTRIA3(9, 1, [1, 2, 3])
+        assert model.elements[9].pid_ref is model.properties[1]
+
+    def test_compact_storage_gridb(self):
+        """the shells of an axisymmetric model reference GRIDBs"""
+        bdf_filename = os.path.join(MODEL_PATH, 'other', 'd07d2.bdf')
+        model0 = _read(bdf_filename, False)
+        model = _read(bdf_filename, True)
+        self.assertEqual(_write_bdf(model), _write_bdf(model0))
+        for eid, elem in model.elements.items():
+            self.assertEqual(elem.node_ids, model0.elements[eid].node_ids)
+            assert elem.nodes_ref is not None
+
+    def test_compact_storage_rows(self):
+        """the views are reused and stay valid as the columns grow"""
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model = _read(bdf_filename, True)
+
+        node = model.nodes[3]
+        xyz = node.xyz
+        assert model.nodes[3] is node
+        for nid in range(1000, 4000):
+            model.nodes[nid] = GRID(nid, xyz=[float(nid), 0., 0.])
+        xyz[0] = 5.
+        self.assertEqual(model.nodes[3].xyz[0], 5.)
+        self.assertEqual(model.nodes[3999].xyz[0], 3999.)
+        nids, xyz_all = model.nodes.get_column(GRID, 'xyz')
+        self.assertEqual(len(nids), 3006)
+        self.assertEqual(xyz_all[2, 0], 5.)
+
+        # the rows of the deleted cards are reused
+        store = model.nodes.stores[0]
+        nrows = store.nrows
+        for nid in range(1000, 1100):
+            del model.nodes[nid]
+        for nid in range(5000, 5100):
+            model.nodes[nid] = GRID(nid, xyz=[1., 2., 3.])
+        self.assertEqual(store.nrows, nrows)
+        self.assertEqual(model.nodes[5099].nid, 5099)
+        assert 1000 not in model.nodes
+
+        # a card with a value that can't be stored is an object
+        quad = CQUAD4(10, 1, [1, 2, 3, 4])
+        quad.zoffset = 1
+        model.elements[10] = quad
+        assert model.elements[10] is quad
+        self.assertEqual(sorted(model.elements.objects), [6, 10])
+
+        nodes = pickle.loads(pickle.dumps(model.nodes))
+        elements = pickle.loads(pickle.dumps(model.elements))
+        self.assertEqual(list(nodes), list(model.nodes))
+        self.assertEqual(nodes[3].xyz[0], 5.)
+        self.assertEqual(elements[1].node_ids, [1, 2, 3, 4])
+        self.assertEqual(elements[10].zoffset, 1)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,129 @@
+"""tests re-reading the changed INCLUDE files of a BDF"""
+import os
+import unittest
+import tempfile
+
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF, read_bdf
+
+
+def _write_model(dirname: str) -> str:
+    """writes a model with a property and an element INCLUDE file"""
+    with open(os.path.join(dirname, 'properties.inc'), 'w') as inc_file:
+        inc_file.write(
+            'PSHELL,1,1,0.1\n'
+            'MAT1,1,3.0e7,,0.3\n')
+    with open(os.path.join(dirname, 'elements.inc'), 'w') as inc_file:
+        inc_file.write(
+            'CQUAD4,1,1,1,2,3,4\n'
+            'CTRIA3,2,1,1,2,3\n'
+            'FORCE,10,3,,1.0,0.,0.,1.\n')
+
+    bdf_filename = os.path.join(dirname, 'model.bdf')
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write(
+            'SOL 101\nCEND\nSUBCASE 1\n  LOAD = 10\nBEGIN BULK\n'
+            'GRID,1,,0.,0.,0.\n'
+            'GRID,2,,1.,0.,0.\n'
+            'GRID,3,,1.,1.,0.\n'
+            'GRID,4,,0.,1.,0.\n'
+            'LOAD,20,1.,2.,10\n'
+            "INCLUDE 'properties.inc'\n"
+            "INCLUDE 'elements.inc'\n"
+            'ENDDATA\n')
+    return bdf_filename
+
+
+def _rewrite(filename: str, old: str, new: str) -> None:
+    """changes a file and makes sure the mtime changes"""
+    with open(filename, 'r') as inc_file:
+        lines = inc_file.read()
+    stat = os.stat(filename)
+    with open(filename, 'w') as inc_file:
+        inc_file.write(lines.replace(old, new))
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestIncrementalRead(unittest.TestCase):
+    """tests BDF.reload_changed"""
+
+    def test_reload_changed(self):
+        """only the changed INCLUDE file is read"""
+        log = SimpleLogger(level='error')
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model = read_bdf(bdf_filename, save_file_structure=True, log=log)
+            self.assertEqual(model.reload_changed(), [])
+            cquad4 = model.elements[1]
+            node1 = model.nodes[1]
+
+            properties_filename = os.path.join(dirname, 'properties.inc')
+            _rewrite(properties_filename, 'PSHELL,1,1,0.1', 'PSHELL,1,1,0.2\nPSHELL,2,1,0.3')
+            filenames = model.reload_changed()
+            self.assertEqual(filenames, [os.path.abspath(properties_filename)])
+
+            # the elements weren't read again, but they reference the new PSHELL
+            assert model.elements[1] is cquad4
+            assert model.nodes[1] is node1
+            assert cquad4.pid_ref is model.properties[1]
+            self.assertEqual(cquad4.pid_ref.t, 0.2)
+            assert model.properties[1].mid1_ref is model.materials[1]
+            self.assertEqual(model.card_count['PSHELL'], 2)
+            self.assertEqual(sorted(model._type_to_id_map['PSHELL']), [1, 2])
+
+            elements_filename = os.path.join(dirname, 'elements.inc')
+            _rewrite(elements_filename, 'CTRIA3,2,1,1,2,3', 'CTRIA3,2,2,1,2,4')
+            model.reload_changed()
+            assert model.elements[1] is not cquad4
+            self.assertEqual(model.elements[2].node_ids, [1, 2, 4])
+            assert model.elements[2].pid_ref is model.properties[2]
+            self.assertEqual(model.elements[2].Thickness(), 0.3)
+            assert model.loads[10][0].node_ref is model.nodes[3]
+            self.assertEqual(model.card_count['CQUAD4'], 1)
+
+            model2 = read_bdf(bdf_filename, log=log)
+            self.assertEqual(model.card_count, model2.card_count)
+            self.assertEqual(model.get_card_ids_by_card_types(),
+                             model2.get_card_ids_by_card_types())
+
+    def test_reload_changed_load_combination(self):
+        """a LOAD references the new FORCE (a list of lists of loads)"""
+        log = SimpleLogger(level='error')
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model = read_bdf(bdf_filename, save_file_structure=True, log=log)
+            load = model.load_combinations[20][0]
+            elements_filename = os.path.join(dirname, 'elements.inc')
+            _rewrite(elements_filename, 'FORCE,10,3,,1.0', 'FORCE,10,3,,5.0')
+            model.reload_changed()
+
+            force = model.loads[10][0]
+            self.assertEqual(force.mag, 5.0)
+            assert load.load_ids_ref[0][0] is force
+            self.assertEqual(load.load_ids_ref[0][0].mag, 5.0)
+
+    def test_reload_changed_main(self):
+        """the model is read again when the main file changes"""
+        log = SimpleLogger(level='error')
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model = read_bdf(bdf_filename, save_file_structure=True, log=log)
+            _rewrite(bdf_filename, 'GRID,4,,0.,1.,0.', 'GRID,4,,0.,2.,0.\nGRID,5,,0.,3.,0.')
+            self.assertEqual(model.reload_changed(), [os.path.abspath(bdf_filename)])
+            self.assertEqual(list(model.nodes), [1, 2, 3, 4, 5])
+            assert model.elements[1].nodes_ref[3] is model.nodes[4]
+
+    def test_reload_changed_no_file_structure(self):
+        """a model must be read with save_file_structure=True"""
+        log = SimpleLogger(level='error')
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            model = BDF(log=log)
+            model.read_bdf(bdf_filename)
+            with self.assertRaises(RuntimeError):
+                model.reload_changed()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -0,0 +1,112 @@
+"""tests the binary model cache of read_bdf"""
+import os
+import unittest
+import tempfile
+from io import StringIO
+
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.bdf_interface.model_cache import read_bdf_cached
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes the model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+def _write_model(dirname: str) -> str:
+    """writes a small model with an include file"""
+    with open(os.path.join(dirname, 'elements.inc'), 'w') as inc_file:
+        inc_file.write(
+            '$ the quad\n'
+            'CQUAD4,1,1,1,2,3,4,1\n'
+            'CQUAD4,2,1,1,2,3,4,15.,0.1\n'
+            'CTRIA3,3,1,1,2,3,,,,,1.,2.,3.\n'
+            'CTETRA,4,2,1,2,3,5\n'
+            'CTETRA,5,2,1,2,3,5,6\n'
+            'CONM2,6,1,,1.0\n')
+
+    bdf_filename = os.path.join(dirname, 'model.bdf')
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write(
+            'SOL 101\nCEND\nSUBCASE 1\n  DISP = ALL\nBEGIN BULK\n'
+            '$ the first grid\n'
+            'GRID,1,,0.,0.,0.\n'
+            'GRID,2,1,1.,0.,0.,,123\n'
+            'GRID,3,,1.,1.,0.\n'
+            'GRID,4,,0.,1.,0.\n'
+            'GRID,5,,0.,0.,1.\n'
+            'GRID,6,,0.,0.,2.\n'
+            'GRID,8,,0.,0.,3.\n'
+            'CORD2R,1,,0.,0.,0.,0.,0.,1.\n,1.,0.,0.\n'
+            'PSHELL,1,1,0.1\n'
+            'PCOMP,3,,,,,,,,\n,1,0.1,45.,YES,1,0.2,-45.\n'
+            'PSOLID,2,1\n'
+            'MAT1,1,3.0e7,,0.3\n'
+            "INCLUDE 'elements.inc'\n"
+            'ENDDATA\n')
+    return bdf_filename
+
+
+class TestModelCache(unittest.TestCase):
+    """tests the binary model cache of read_bdf"""
+
+    def test_model_cache(self):
+        """the cached model is the same as the read model"""
+        log = SimpleLogger(level='error')
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            cache_dir = os.path.join(dirname, 'cache')
+            model0 = read_bdf(bdf_filename, log=log)
+            model1 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+            model2 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+
+        expected = _write_bdf(model0)
+        self.assertEqual(_write_bdf(model1), expected)
+        self.assertEqual(_write_bdf(model2), expected)
+        self.assertEqual(model0.card_count, model2.card_count)
+        self.assertEqual(list(model0.nodes), list(model2.nodes))
+        self.assertEqual(list(model0.elements), list(model2.elements))
+        self.assertEqual(model2.elements[1].theta_mcid, 1)
+        self.assertEqual(model2.elements[5].nodes, [1, 2, 3, 5, 6, None, None, None, None, None])
+        self.assertEqual(model2.nodes[1].comment, '$ the first grid\n')
+        assert model2.nodes[2].cp_ref is model2.coords[1]
+        assert model2.case_control_deck.has_parameter(1, 'DISPLACEMENT')
+
+    def test_model_cache_invalidate(self):
+        """the cache is invalidated when an include file changes"""
+        log = SimpleLogger(level='error')
+        with tempfile.TemporaryDirectory() as dirname:
+            bdf_filename = _write_model(dirname)
+            cache_dir = os.path.join(dirname, 'cache')
+            is_hits = []
+            for unused_i in range(2):
+                model = BDF(log=log)
+                is_hits.append(read_bdf_cached(model, bdf_filename, cache_dir, xref=False))
+            self.assertEqual(is_hits, [False, True])
+
+            # touching a file doesn't invalidate the cache
+            inc_filename = os.path.join(dirname, 'elements.inc')
+            stat = os.stat(inc_filename)
+            os.utime(inc_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            model = BDF(log=log)
+            assert read_bdf_cached(model, bdf_filename, cache_dir, xref=False)
+
+            # a change with the same size does
+            with open(inc_filename, 'r') as inc_file:
+                lines = inc_file.read()
+            with open(inc_filename, 'w') as inc_file:
+                inc_file.write(lines.replace('CONM2,6,1,,1.0', 'CONM2,6,1,,2.0'))
+            model = BDF(log=log)
+            assert not read_bdf_cached(model, bdf_filename, cache_dir, xref=False)
+            self.assertEqual(model.masses[6].mass, 2.0)
+            model = BDF(log=log)
+            assert read_bdf_cached(model, bdf_filename, cache_dir, xref=False)
+            self.assertEqual(model.masses[6].mass, 2.0)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
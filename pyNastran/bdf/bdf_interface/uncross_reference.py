@@ -1,6 +1,7 @@
 """Unlinks up the various cards in the BDF."""
 from typing import Any
 from pyNastran.bdf.bdf_interface.safe_cross_reference import SafeXrefMesh
+from pyNastran.bdf.bdf_interface.compact_storage import CompactCardDict
 
 class UnXrefMesh(SafeXrefMesh):
     """
@@ -42,7 +43,11 @@ class UnXrefMesh(SafeXrefMesh):
 
     def _uncross_reference_nodes(self) -> None:
         """uncross references the GRID objects"""
-        for node in self.nodes.values():
+        nodes = self.nodes
+        if isinstance(nodes, CompactCardDict):
+            nodes.uncross_reference()
+            nodes = nodes.objects
+        for node in nodes.values():
             node.uncross_reference()
         for point in self.points.values():
             point.uncross_reference()
@@ -56,7 +61,11 @@ class UnXrefMesh(SafeXrefMesh):
 
     def _uncross_reference_elements(self) -> None:
         """uncross references the element objects"""
-        for element in self.elements.values():
+        elements = self.elements
+        if isinstance(elements, CompactCardDict):
+            elements.uncross_reference()
+            elements = elements.objects
+        for element in elements.values():
             try:
                 element.uncross_reference()
             except TypeError:
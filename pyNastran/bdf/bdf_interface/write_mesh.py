@@ -14,7 +14,8 @@ from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
 from pyNastran.bdf.bdf_interface.write_mesh_utils import (
-    find_aero_location, write_dict, get_properties_by_element_type)
+    find_aero_location, write_dict, write_grids_8, write_elements_8,
+    get_properties_by_element_type)
 from pyNastran.bdf.cards.nodes import write_xpoints
 
 try:
@@ -296,6 +297,8 @@ class WriteMesh(BDFAttributes):
             if is_long_ids:
                 for (eid, element) in sorted(self.elements.items()):
                     bdf_file.write(element.write_card_16(is_double))
+            elif size == 8:
+                write_elements_8(bdf_file, self.elements)
             else:
                 for (eid, element) in sorted(self.elements.items()):
                     try:
@@ -886,7 +889,10 @@ class WriteMesh(BDFAttributes):
             bdf_file.write('$NODES\n')
             if self.grdset:
                 bdf_file.write(self.grdset.write_card(size))
-            write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            if size == 8 and not is_long_ids:
+                write_grids_8(bdf_file, self.nodes)
+            else:
+                write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
@@ -7,6 +7,7 @@ This file defines:
 from __future__ import annotations
 import os
 from collections import defaultdict
+from collections.abc import MutableMapping
 from typing import Union, Optional, Any, TYPE_CHECKING
 
 import numpy as np
@@ -710,7 +711,7 @@ class WriteMeshs(WriteMesh):
 
 def _get_ifiles_dict(cards_dict):
     """gets the ids for a dictionary by file number"""
-    assert isinstance(cards_dict, dict), cards_dict
+    assert isinstance(cards_dict, MutableMapping), cards_dict
     ifiles_dict = defaultdict(list)
     for unused_id, card in sorted(cards_dict.items()):
         ifiles_dict[card.ifile].append(card)
@@ -718,7 +719,7 @@ def _get_ifiles_dict(cards_dict):
 
 def write_bdf_dict_ids(bdf_file, cards, ids, size, is_double, is_long_ids):
     """writes a dictionary by ifile"""
-    assert isinstance(cards, dict), cards
+    assert isinstance(cards, MutableMapping), cards
     assert isinstance(cards, (list, tuple, np.ndarray)), ids
     if bdf_file is None:
         return
@@ -731,7 +732,7 @@ def write_bdf_dict_ids(bdf_file, cards, ids, size, is_double, is_long_ids):
 
 def write_bdfs_dict(bdf_files, cards, size, is_double, is_long_ids):
     """writes a dictionary by ifile"""
-    assert isinstance(cards, dict), cards
+    assert isinstance(cards, MutableMapping), cards
     ifiles_dict = _get_ifiles_dict(cards)
     for file_id, file_cards in ifiles_dict.items():
         bdf_file = bdf_files[file_id]
@@ -750,7 +751,7 @@ def _write_bdf_dict_cards(bdf_file, cards, size, is_double, is_long_ids):
 
 def _get_ifiles_dict_list(cards):
     """gets the ids for a dictionary of lists by file number"""
-    assert isinstance(cards, dict), cards
+    assert isinstance(cards, MutableMapping), cards
     ifiles_dict_list = defaultdict(list)
     for (unused_id, cardsi) in sorted(cards.items()):
         assert isinstance(cardsi, list), cardsi
@@ -2,6 +2,8 @@
 """
 This file defines:
   - write_dict(bdf_file, my_dict, size, is_double, is_long_ids)
+  - write_grids_8(bdf_file, nodes)
+  - write_elements_8(bdf_file, elements)
   - write_aero_in_flutter, write_aero_in_gust = find_aero_location(model)
   - ptype_to_pid, property_type_to_property_class, ...
         properties_by_class = get_properties_by_element_type(model)
@@ -9,7 +11,14 @@ This file defines:
 """
 from __future__ import annotations
 from collections import defaultdict
-from typing import Any, TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.field_writer_8_array import float_8_codes, int_8_codes
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CHEXA8, CPENTA6, CTETRA4
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
@@ -26,6 +35,155 @@ def write_dict(bdf_file, my_dict: dict[int, Any], size: int,
             bdf_file.write(node.write_card(size, is_double))
 
 
+#: the elements that are written by write_elements_8
+#: card_class: (the fields of the card, the defaults of the blank fields)
+_ELEMENT_FORMATS = {
+    CQUAD4: (['CQUAD4  ', 8, 8, 8, 8, 8, 8, '\n'],
+             {'zoffset': 0.0, 'tflag': 0, 'T1': 1.0, 'T2': 1.0, 'T3': 1.0, 'T4': 1.0}),
+    CTRIA3: (['CTRIA3  ', 8, 8, 8, 8, 8, '\n'],
+             {'zoffset': 0.0, 'tflag': 0, 'T1': 1.0, 'T2': 1.0, 'T3': 1.0}),
+    CTETRA4: (['CTETRA  ', 8, 8, 8, 8, 8, 8, '\n'], None),
+    CPENTA6: (['CPENTA  ', 8, 8, 8, 8, 8, 8, 8, 8, '\n'], None),
+    CHEXA8: (['CHEXA   ', 8, 8, 8, 8, 8, 8, 8, 8, '\n        ', 8, 8, '\n'], None),
+}
+
+
+def write_grids_8(bdf_file, nodes: dict[int, Any]) -> None:
+    """
+    Writes the GRIDs in a sorted order in 8-field format
+
+    The fields of the GRIDs are formatted a column at a time (see
+    ``float_8_codes``).  The GRIDs with a CD/PS/SEID (or an id that is
+    too long) are written with ``write_card``.
+    """
+    cards = []
+    igrids = []
+    grids = []
+    data = []
+    for (unused_nid, node) in sorted(nodes.items()):
+        if type(node) is GRID and node.Cd() == 0 and node.ps == '' and node.seid == 0:
+            igrids.append(len(cards))
+            grids.append(node)
+            cards.append(node.comment)
+            xyz = node.xyz
+            data.append((node.nid, node.Cp(), xyz[0], xyz[1], xyz[2]))
+        else:
+            cards.append(node.write_card(8))
+
+    if igrids:
+        data_array = np.array(data, dtype='float64')
+        nids = np.array([datai[0] for datai in data], dtype='int64')
+        cps = np.array([datai[1] for datai in data], dtype='int64')
+        nid_codes, is_valid_nid = int_8_codes(nids)
+        cp_codes, is_valid_cp = int_8_codes(cps)
+        cp_codes[cps == 0] = ord(' ')
+        codes = _join_codes([
+            'GRID    ', nid_codes, cp_codes,
+            float_8_codes(data_array[:, 2]),
+            float_8_codes(data_array[:, 3]),
+            float_8_codes(data_array[:, 4]), '\n'])
+        _add_lines(cards, igrids, grids, codes, is_valid_nid & is_valid_cp)
+    bdf_file.write(''.join(cards))
+
+
+def write_elements_8(bdf_file, elements: dict[int, Any]) -> None:
+    """
+    Writes the elements in a sorted order in 8-field format
+
+    The default CQUAD4, CTRIA3, CTETRA4, CPENTA6 and CHEXA8 cards are
+    formatted a column at a time (see ``int_8_codes``).  The other
+    elements are written with ``write_card``.
+    """
+    cards = []
+    icards = defaultdict(list)
+    card_objs = defaultdict(list)
+    data = defaultdict(list)
+    for (eid, element) in sorted(elements.items()):
+        element_format = _ELEMENT_FORMATS.get(type(element))
+        if element_format is not None and _is_blank(element, element_format[1]):
+            if element.nodes_ref is None:
+                datai = [element.eid, element.Pid()] + element.nodes
+            else:
+                datai = [element.eid, element.Pid()] + element.node_ids
+            if all(isinstance(value, int) for value in datai):
+                icards[type(element)].append(len(cards))
+                card_objs[type(element)].append(element)
+                cards.append(element.comment)
+                data[type(element)].append(datai)
+                continue
+        try:
+            cards.append(element.write_card(8))
+        except Exception:
+            print(f'failed printing element...type={element.type} eid={eid}')
+            raise
+
+    for card_class, icardsi in icards.items():
+        values = np.array(data[card_class], dtype='int64')
+        int_codes, is_valid = int_8_codes(values.ravel())
+        int_codes = int_codes.reshape(values.shape[0], values.shape[1] * 8)
+        is_valid = is_valid.reshape(values.shape).all(axis=1)
+
+        fields = []
+        ifield = 0
+        for field in _ELEMENT_FORMATS[card_class][0]:
+            if isinstance(field, str):
+                fields.append(field)
+            else:
+                fields.append(int_codes[:, ifield*8:(ifield+1)*8])
+                ifield += 1
+        _add_lines(cards, icardsi, card_objs[card_class], _join_codes(fields), is_valid)
+    bdf_file.write(''.join(cards))
+
+
+def _is_blank(element: Any, defaults: Optional[dict[str, Any]]) -> bool:
+    """
+    Are the optional fields of a shell blank (e.g., T1=1.0 or None), so
+    the card is only the ids?
+    """
+    if defaults is None:
+        return True
+    theta_mcid = element.theta_mcid
+    if not (theta_mcid is None or (isinstance(theta_mcid, float) and theta_mcid == 0.0)):
+        return False
+    for name, default in defaults.items():
+        value = getattr(element, name)
+        if not (value is None or value == default):
+            return False
+    return True
+
+
+def _join_codes(fields: list[Any]) -> np.ndarray:
+    """
+    Joins the (n, 8) ASCII codes of the fields and the constant strings
+    (e.g., 'GRID    ') into (n, nchars) lines
+    """
+    nlines = next(len(field) for field in fields if not isinstance(field, str))
+    codes_list = []
+    for field in fields:
+        if isinstance(field, str):
+            field = np.frombuffer(field.encode('ascii'), dtype='uint8')
+            field = np.broadcast_to(field, (nlines, len(field)))
+        codes_list.append(field)
+    return np.hstack(codes_list)
+
+
+def _add_lines(cards: list[str], icards: list[int], card_objs: list[Any],
+               codes: np.ndarray, is_valid: np.ndarray) -> None:
+    """
+    Adds the formatted lines to the comments of the cards (cards[icard])
+
+    The cards that can't be formatted (e.g., an id that is too long) are
+    written with ``write_card``, so the error is the same.
+    """
+    nchars = codes.shape[1]
+    text = np.ascontiguousarray(codes).tobytes().decode('ascii')
+    for iline, (icard, card_obj) in enumerate(zip(icards, card_objs)):
+        if is_valid[iline]:
+            cards[icard] += text[iline*nchars:(iline+1)*nchars]
+        else:
+            cards[icard] = card_obj.write_card(8)
+
+
 def find_aero_location(model: BDF) -> tuple[bool, bool]:
     """Determines where the AERO card should be written"""
     write_aero_in_flutter = False
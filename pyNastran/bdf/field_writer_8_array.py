@@ -0,0 +1,179 @@
+"""
+Defines functions for writing arrays of 8 character fields.
+
+The fields are the same as ``print_float_8`` and ``'%8d'``.  The values
+are formatted as (n, 8) arrays of ASCII codes, so a column of values
+(e.g., the x coordinates of the GRIDs) is formatted in one pass.
+
+The floats that ``print_float_8`` writes in fixed point notation
+(e.g., 1.5, -.25, 1234.5) are formatted with integer arithmetic.  The
+small/large values (scientific notation) and the values that are too
+close to a rounding tie to be rounded in float64 are formatted with
+``print_float_8``.
+"""
+import numpy as np
+
+from pyNastran.bdf.field_writer_8 import print_float_8
+
+_SPACE, _DOT, _MINUS, _ZERO = 32, 46, 45, 48
+
+#: the number of decimals for the fixed point positive/negative floats
+#: (see print_float_8); the upper/lower bound of each range
+_POSITIVE_BOUNDS = np.array([1., 10., 100., 1000., 10000., 100000., 1000000.])
+_POSITIVE_NDECIMALS = np.array([7, 6, 5, 4, 3, 2, 1])
+_NEGATIVE_BOUNDS = -np.array([1., 10., 100., 1000., 10000., 100000.])
+_NEGATIVE_NDECIMALS = np.array([6, 5, 4, 3, 2, 1])
+
+#: the number of digits of a scaled float (the largest is ~1e7)
+_NDIGITS = 9
+_POWERS = 10 ** np.arange(_NDIGITS - 1, -1, -1, dtype='int64')
+
+#: the distance from a rounding tie (in the last decimal place), where
+#: float64 may round differently than the exact decimal value
+_TIE_TOLERANCE = 1e-6
+
+
+def print_float_8_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of floats in nastran 8-character width syntax
+    (see ``print_float_8``)
+
+    Returns
+    -------
+    fields : (n, ) str ndarray
+        the 8 character fields
+    """
+    codes = float_8_codes(values)
+    return codes.view('S8').ravel().astype('U8')
+
+
+def print_int_8_array(values: np.ndarray) -> np.ndarray:
+    """
+    Prints an array of integers as '%8d'
+
+    Returns
+    -------
+    fields : (n, ) str ndarray
+        the 8 character fields; an integer that is too long is '********'
+    """
+    codes, is_valid = int_8_codes(values)
+    codes[~is_valid] = ord('*')
+    return codes.view('S8').ravel().astype('U8')
+
+
+def int_8_codes(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Formats integers as '%8d'
+
+    Returns
+    -------
+    codes : (n, 8) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        does the integer fit in 8 characters
+    """
+    values = np.asarray(values, dtype='int64').ravel()
+    is_negative = values < 0
+    abs_values = np.abs(values)
+    ndigits = (abs_values[:, np.newaxis] >= 10 ** np.arange(1, 8, dtype='int64')).sum(axis=1) + 1
+    is_valid = (abs_values < 10 ** 8) & (ndigits + is_negative <= 8)
+
+    icol = np.arange(8)
+    digits = (abs_values[:, np.newaxis] // _POWERS[-8:]) % 10
+    codes = (digits + _ZERO).astype('uint8')
+    is_blank = icol < (8 - ndigits)[:, np.newaxis]
+    codes[is_blank] = _SPACE
+    ineg = np.flatnonzero(is_negative & is_valid)
+    codes[ineg, 7 - ndigits[ineg]] = _MINUS
+    return codes, is_valid
+
+
+def float_8_codes(values: np.ndarray) -> np.ndarray:
+    """
+    Formats floats the same as ``print_float_8``
+
+    Returns
+    -------
+    codes : (n, 8) uint8 ndarray
+        the ASCII codes of the fields
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    nvalues = len(values)
+    codes = np.full((nvalues, 8), _SPACE, dtype='uint8')
+
+    is_zero = values == 0.
+    codes[is_zero, 6] = _ZERO
+    codes[is_zero, 7] = _DOT
+
+    # the fixed point values
+    is_positive = (values >= 0.001) & (values < 1000000.)
+    is_negative = (values <= -0.01) & (values > -100000.)
+    ifixed = np.flatnonzero(is_positive | is_negative)
+    codes_fixed, is_valid = _fixed_8_codes(values[ifixed])
+    codes[ifixed[is_valid]] = codes_fixed[is_valid]
+
+    # scientific notation, nan, and the ties
+    is_scalar = ~(is_zero | is_positive | is_negative)
+    is_scalar[ifixed[~is_valid]] = True
+    for ivalue in np.flatnonzero(is_scalar):
+        codes[ivalue] = np.frombuffer(print_float_8(values[ivalue]).encode('ascii'),
+                                      dtype='uint8')
+    return codes
+
+
+def _fixed_8_codes(values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Formats the floats that print_float_8 writes in fixed point notation
+    (e.g., '%8.6f' % 1.5 -> '1.500000' -> '     1.5')
+
+    The value is scaled by the number of decimals and rounded to an
+    integer.  The leading zeros of the integer part and the trailing zeros
+    of the decimal part are stripped and the decimal point is inserted
+    while the characters are right justified.
+
+    Returns
+    -------
+    codes : (n, 8) uint8 ndarray
+        the ASCII codes of the fields
+    is_valid : (n, ) bool ndarray
+        False if the value is too close to a rounding tie
+    """
+    nvalues = len(values)
+    is_negative = values < 0.
+    ndecimals = np.where(
+        is_negative,
+        _NEGATIVE_NDECIMALS[np.minimum(
+            np.searchsorted(-_NEGATIVE_BOUNDS, -values, side='right'), 5)],
+        _POSITIVE_NDECIMALS[np.minimum(
+            np.searchsorted(_POSITIVE_BOUNDS, values, side='right'), 6)])
+
+    scaled = np.abs(values) * 10. ** ndecimals
+    fraction = scaled - np.floor(scaled)
+    is_valid = np.abs(fraction - 0.5) > _TIE_TOLERANCE
+    ints = np.rint(scaled).astype('int64')
+
+    # the digits and the decimal point (the last column), which is
+    # before digit idot
+    #   1.5 -> 001500000 -> 001.5
+    idot = _NDIGITS - ndecimals
+    digits = np.empty((nvalues, _NDIGITS + 1), dtype='uint8')
+    digits[:, :_NDIGITS] = (ints[:, np.newaxis] // _POWERS) % 10 + _ZERO
+    digits[:, _NDIGITS] = _DOT
+
+    # the characters are [digits[:idot], '.', digits[idot:]]; the sign is
+    # before the first character
+    is_nonzero = digits[:, :_NDIGITS] != _ZERO
+    ifirst = np.argmax(is_nonzero, axis=1)
+    ilast = _NDIGITS - 1 - np.argmax(is_nonzero[:, ::-1], axis=1)
+    istart = np.minimum(ifirst, idot) - is_negative
+    iend = np.maximum(ilast + 2, idot + 1)
+    is_valid &= iend - istart <= 8
+
+    # right justify the characters in 8 columns
+    ichar = iend[:, np.newaxis] - 8 + np.arange(8)
+    idot2 = idot[:, np.newaxis]
+    isource = np.where(ichar < idot2, ichar, np.where(ichar == idot2, _NDIGITS, ichar - 1))
+    codes = np.take_along_axis(digits, np.clip(isource, 0, _NDIGITS), axis=1)
+    codes[ichar < istart[:, np.newaxis]] = _SPACE
+    codes[(ichar == istart[:, np.newaxis]) & is_negative[:, np.newaxis]] = _MINUS
+    return codes, is_valid
@@ -6,7 +6,8 @@ defines:
                                   size=8, is_double=False,
                                   remove_collapsed_elements=False,
                                   avoid_collapsed_elements=False,
-                                  crash_on_collapse=False, log=None, debug=True)
+                                  crash_on_collapse=False, log=None, debug=True,
+                                  method='new', chunk_size=None)
 
 """
 from __future__ import annotations
@@ -17,10 +18,11 @@ from numpy.linalg import norm  # type: ignore
 import scipy
 from scipy.spatial import KDTree
 
-from pyNastran.nptyping_interface import NDArrayNint, NDArrayN3float
+from pyNastran.nptyping_interface import NDArrayNint, NDArrayN2int, NDArrayN3float
 from pyNastran.femutils.utils import unique2d
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.compact_storage import CompactCardDict
 from pyNastran.bdf.mesh_utils.internal_utils import get_bdf_model
 if TYPE_CHECKING:  # pragma: no cover
     from cpylog import SimpleLogger
@@ -37,7 +39,8 @@ def bdf_equivalence_nodes(bdf_filename: str,
                           avoid_collapsed_elements: bool=False,
                           crash_on_collapse: bool=False,
                           log: Optional[SimpleLogger]=None,
-                          debug: bool=True, method: str='new') -> BDF:
+                          debug: bool=True, method: str='new',
+                          chunk_size: Optional[int]=None) -> BDF:
     """
     Equivalences nodes; keeps the lower node id; creates two nodes with the same
 
@@ -84,6 +87,15 @@ def bdf_equivalence_nodes(bdf_filename: str,
     method: str; default='new'
         'new': doesn't require neq_max; new in v1.3
         'old': use neq_max; used in v1.2
+        'pairs': doesn't require neq_max; finds all the pairs at once,
+                 merges chains of coincident nodes with a union-find and
+                 renumbers the nodes with a single id map; use this for
+                 large models
+    chunk_size : int; default=None
+        the max number of nodes in a KDTree (method='pairs' only);
+        the nodes are split into slabs along the longest axis, which
+        limits the memory use of the tree
+        None: use a single tree
     log : logger(); default=None
         bdf logging
 
@@ -111,7 +123,7 @@ def bdf_equivalence_nodes(bdf_filename: str,
         bdf_filename, tol,
         renumber_nodes=renumber_nodes, neq_max=neq_max,
         xref=xref, node_set=node_set, log=log, debug=debug,
-        method=method,
+        method=method, chunk_size=chunk_size,
         idtype='int32', fdtype='float64')
     model.log.debug(f'equivalence {len(nid_pairs):d} nodes')
 
@@ -191,6 +203,7 @@ def _bdf_equivalence_nodes(bdf_filename: str, tol: float,
                            log: Optional[SimpleLogger]=None,
                            debug: bool=True,
                            method: str='new',
+                           chunk_size: Optional[int]=None,
                            idtype: str='int32',
                            fdtype: str='float64') -> tuple[BDF,
                                                            list[tuple[int, int]]]:
@@ -203,6 +216,10 @@ def _bdf_equivalence_nodes(bdf_filename: str, tol: float,
 
     log = model.log
     log.debug(f'bdf_equivalence_nodes; tol={tol}')
+    if method == 'pairs':
+        nid_pairs = _eq_nodes_pairs(model, nodes_xyz, nids, tol,
+                                    node_set=node_set, chunk_size=chunk_size)
+        return model, nid_pairs
 
     nid_pairs = _nodes_xyz_nids_to_nid_pairs(
         nodes_xyz, nids, all_node_set,
@@ -524,6 +541,169 @@ def _update_grid(node1: GRID, node2: GRID) -> None:
     #node1.cp_ref = None
     #node2.cp_ref = None
 
+def _eq_nodes_pairs(model: BDF,
+                    nodes_xyz: NDArrayN3float,
+                    nids: NDArrayNint,
+                    tol: float,
+                    node_set: Optional[list[NDArrayNint]]=None,
+                    chunk_size: Optional[int]=None) -> NDArrayN2int:
+    """
+    Equivalences the nodes with method='pairs'
+
+    Returns
+    -------
+    nid_pairs : (npairs, 2) int ndarray
+        the (kept, removed) node ids
+
+    """
+    log = model.log
+    if tol < 0.0 or len(nids) == 0:
+        return np.zeros((0, 2), dtype=nids.dtype)
+
+    ipairs = _get_index_pairs(nodes_xyz, tol, chunk_size=chunk_size)
+    if node_set is not None:
+        ipairs = _filter_index_pairs_by_node_set(nids, ipairs, node_set)
+    log.debug(f'found {len(ipairs):d} close node pairs')
+
+    iroot = _get_merge_roots(len(nids), ipairs)
+    iremoved = np.flatnonzero(iroot != np.arange(len(nids)))
+    nid_pairs = np.column_stack([nids[iroot[iremoved]], nids[iremoved]])
+    _apply_nid_map(model, nid_pairs)
+    return nid_pairs
+
+def _get_index_pairs(nodes_xyz: NDArrayN3float, tol: float,
+                     chunk_size: Optional[int]=None) -> NDArrayN2int:
+    """
+    Gets the (i, j) pairs of nodes that are within tol, where i < j
+
+    Parameters
+    ----------
+    nodes_xyz : (nnodes, 3) float ndarray
+        the xyzs to equivalence
+    tol : float
+        the spherical equivalence tolerance
+    chunk_size : int; default=None
+        the max number of nodes in a slab; the tree of a slab also
+        includes the nodes within tol of the slab
+        None: use a single tree
+
+    Returns
+    -------
+    ipairs : (npairs, 2) int ndarray
+        the indices into nodes_xyz
+
+    """
+    nnodes = nodes_xyz.shape[0]
+    if chunk_size is None or nnodes <= chunk_size:
+        kdt = _get_tree(nodes_xyz)
+        return kdt.query_pairs(tol, output_type='ndarray')
+
+    # split the nodes into slabs along the longest axis
+    iaxis = np.argmax(nodes_xyz.max(axis=0) - nodes_xyz.min(axis=0))
+    isort = np.argsort(nodes_xyz[:, iaxis], kind='stable')
+    xyz_sort = nodes_xyz[isort, :]
+    x = xyz_sort[:, iaxis]
+
+    ipairs_list = []
+    for i0 in range(0, nnodes, chunk_size):
+        i1 = min(i0 + chunk_size, nnodes)
+        # the slab and the nodes within tol of it
+        j0 = np.searchsorted(x, x[i0] - tol, side='left')
+        j1 = np.searchsorted(x, x[i1 - 1] + tol, side='right')
+        kdt = _get_tree(xyz_sort[j0:j1, :], msg=f'; slab={i0}:{i1}')
+        ipairs = kdt.query_pairs(tol, output_type='ndarray') + j0
+
+        # a pair is found by every slab that contains both nodes, so
+        # only keep the pairs whose first node is in the slab
+        ipair_min = ipairs.min(axis=1)
+        ipairs_list.append(ipairs[(ipair_min >= i0) & (ipair_min < i1)])
+
+    ipairs = isort[np.vstack(ipairs_list)]
+    ipairs.sort(axis=1)
+    return ipairs
+
+def _filter_index_pairs_by_node_set(nids: NDArrayNint,
+                                    ipairs: NDArrayN2int,
+                                    node_set: list[NDArrayNint]) -> NDArrayN2int:
+    """only keep the pairs where both nodes are in the same node_set"""
+    is_valid = np.zeros(len(ipairs), dtype='bool')
+    for seti in node_set:
+        is_in_set = np.isin(nids, seti)
+        is_valid |= is_in_set[ipairs[:, 0]] & is_in_set[ipairs[:, 1]]
+    return ipairs[is_valid]
+
+def _get_merge_roots(nnodes: int, ipairs: NDArrayN2int) -> NDArrayNint:
+    """
+    Merges the chains of pairs (e.g., 1-2 and 2-3) with an array-based
+    union-find
+
+    Returns
+    -------
+    iroot : (nnodes, ) int ndarray
+        the lowest node index of the group of each node
+
+    """
+    iroot = np.arange(nnodes)
+    if len(ipairs) == 0:
+        return iroot
+
+    i1 = ipairs[:, 0]
+    i2 = ipairs[:, 1]
+    while True:
+        # link the roots of each pair to the lower root
+        iroot1 = iroot[i1]
+        iroot2 = iroot[i2]
+        is_linked = (iroot1 != iroot2)
+        if not is_linked.any():
+            break
+        iroot1 = iroot1[is_linked]
+        iroot2 = iroot2[is_linked]
+        iroot_min = np.minimum(iroot1, iroot2)
+        np.minimum.at(iroot, iroot1, iroot_min)
+        np.minimum.at(iroot, iroot2, iroot_min)
+
+        # path compression
+        while True:
+            iroot_new = iroot[iroot]
+            if np.array_equal(iroot_new, iroot):
+                break
+            iroot = iroot_new
+    return iroot
+
+def _apply_nid_map(model: BDF, nid_pairs: NDArrayN2int) -> None:
+    """
+    Applies the (kept, removed) node ids to the model
+
+    The removed GRIDs take the id/location of the kept GRID, so the
+    cross-referenced cards (e.g., elements, rigid elements, loads) are
+    written with the kept id.  The node ids of the array-backed elements
+    (see ``use_compact_storage``) are renumbered in place.
+    """
+    if len(nid_pairs) == 0:
+        return
+    nodes = model.nodes
+    for nid1, nid2 in nid_pairs.tolist():
+        _update_grid(nodes[nid1], nodes[nid2])
+
+    if not isinstance(model.elements, CompactCardDict):
+        return
+    isort = np.argsort(nid_pairs[:, 1])
+    nids_removed = nid_pairs[isort, 1]
+    nids_kept = nid_pairs[isort, 0]
+    for store in model.elements.stores:
+        for name in ('nodes', 'ga', 'gb', 'g0'):
+            column = store.columns.get(name)
+            if column is None:
+                continue
+            _map_ids(column.data[:store.nrows], nids_removed, nids_kept)
+
+def _map_ids(ids: np.ndarray, ids_old: NDArrayNint, ids_new: NDArrayNint) -> None:
+    """renumbers ids in place; ids_old must be sorted"""
+    i = np.searchsorted(ids_old, ids)
+    i[i == len(ids_old)] = 0
+    is_mapped = (ids_old[i] == ids)
+    ids[is_mapped] = ids_new[i[is_mapped]]
+
 def _nodes_xyz_nids_to_nid_pairs(nodes_xyz: NDArrayN3float,
                                  nids: NDArrayNint,
                                  all_node_set: NDArrayNint,
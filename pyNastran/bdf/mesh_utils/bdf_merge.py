@@ -5,6 +5,7 @@ defines:
 
 """
 from __future__ import annotations
+from collections.abc import MutableMapping
 from io import StringIO
 from pathlib import PurePath
 from typing import Optional, Any, TYPE_CHECKING
@@ -161,7 +162,7 @@ def bdf_merge(bdf_filenames: list[str],
         for data_member in data_members:
             data1 = getattr(model, data_member)
             data2 = getattr(model2, data_member)
-            if isinstance(data1, dict):
+            if isinstance(data1, MutableMapping):
                 #model.log.info('  working on %s' % (data_member))
                 for key, value in data2.items():
                     if data_member in 'coords' and key == 0:
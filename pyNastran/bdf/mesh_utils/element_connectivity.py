@@ -0,0 +1,197 @@
+"""
+defines:
+ - groups = get_element_node_arrays(model, etypes, element_ids=None)
+ - iedges = get_edge_indices(card_class, nnodes)
+ - ifaces = get_face_indices(card_class, nnodes)
+ - isort, istart, counts = group_rows(rows)
+
+The node ids of the elements are stored as one (nelements, nnodes) array
+per element class, so the edges/faces of all the elements of a class are
+found with one numpy operation instead of calling ``elem.get_edge_ids()``
+or ``elem.faces`` for each element.  The edges/faces of a class are
+defined by the card (e.g., ``CHEXA8.faces``), so they're the same as the
+element methods.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from functools import lru_cache
+from typing import Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.compact_storage import CompactCardDict
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: (card_class, nnodes): (eids, positions, nids)
+ElementArrays = dict[tuple[type, int], tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+
+def get_element_node_arrays(model: BDF, etypes: Optional[set[str]],
+                            element_ids: Optional[list[int]]=None) -> ElementArrays:
+    """
+    Gets the node ids of the elements grouped by the element class
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    etypes : set[str] / None
+        the element types to consider (e.g., {'CTRIA3', 'CQUAD4'})
+        None : all the element types
+    element_ids : list[int]; default=None -> all elements
+        a subset of elements to consider
+
+    Returns
+    -------
+    groups : dict[(card_class, nnodes)] = (eids, positions, nids)
+        eids : (n, ) int ndarray
+            the element ids
+        positions : (n, ) int ndarray
+            the position of the element in model.elements/element_ids,
+            which is used to sort the results in the order of a loop
+            over the elements
+        nids : (n, nnodes) int ndarray
+            the node ids; 0 is a blank node
+
+    """
+    elements = model.elements
+    groups = {}
+    if element_ids is None and isinstance(elements, CompactCardDict):
+        for store in elements.stores:
+            card_class = store.card_class
+            if etypes is not None and card_class.type not in etypes:
+                continue
+            eids, rows = elements.get_rows(card_class)
+            if len(eids) == 0:
+                continue
+            columns = store.columns
+            if 'nodes' in columns:
+                nids = columns['nodes'].get_rows(rows)
+            else:  # CBAR
+                nids = np.column_stack([columns['ga'].get_rows(rows),
+                                        columns['gb'].get_rows(rows)])
+            groups[(card_class, nids.shape[1])] = (
+                eids, elements.get_positions(card_class), nids)
+        positions = elements.get_positions(None)
+        ids = elements.get_ids()[positions]
+        cards = ((position, eid, elements.objects[eid])
+                 for position, eid in zip(positions.tolist(), ids.tolist()))
+    elif element_ids is None:
+        cards = ((position, eid, elem)
+                 for position, (eid, elem) in enumerate(elements.items()))
+    else:
+        cards = ((position, eid, elements[eid])
+                 for position, eid in enumerate(element_ids))
+
+    lists = defaultdict(lambda: ([], [], []))
+    for position, eid, elem in cards:
+        if etypes is not None and elem.type not in etypes:
+            continue
+        card_class = type(elem)
+        # a view of the compact storage
+        card_class = getattr(card_class, 'card_class', card_class)
+        nodes = getattr(elem, 'nodes', None)
+        if nodes is None:
+            nodes = elem.node_ids
+        eids, positions, nids = lists[(card_class, len(nodes))]
+        eids.append(eid)
+        positions.append(position)
+        nids.append(nodes)
+
+    for key, (eids, positions, nids) in lists.items():
+        eids = np.array(eids, dtype='int64')
+        positions = np.array(positions, dtype='int64')
+        nids = _to_nid_array(nids)
+        if key in groups:
+            eids0, positions0, nids0 = groups[key]
+            eids = np.hstack([eids0, eids])
+            positions = np.hstack([positions0, positions])
+            nids = np.vstack([nids0, nids])
+        groups[key] = (eids, positions, nids)
+    return groups
+
+
+def _to_nid_array(nids: list[list[Optional[int]]]) -> np.ndarray:
+    """converts a list of node ids with blanks (None) to an int array"""
+    try:
+        return np.array(nids, dtype='int64')
+    except TypeError:
+        nids_array = np.array(nids, dtype='object')
+        nids_array[np.equal(nids_array, None)] = 0
+        return nids_array.astype('int64')
+
+
+def _make_template(card_class: type, nnodes: int) -> Any:
+    """makes an element where the node ids are the 1-based node positions"""
+    template = card_class.__new__(card_class)
+    template.nodes = list(range(1, nnodes + 1))
+    template.nodes_ref = None
+    return template
+
+
+@lru_cache(maxsize=None)
+def get_edge_indices(card_class: type, nnodes: int) -> np.ndarray:
+    """
+    Gets the node indices of the edges of an element class
+    (see ``elem.get_edge_ids()``)
+
+    Returns
+    -------
+    iedges : (nedges, 2) int ndarray
+        the 0-based node indices of the edges
+
+    """
+    edges = _make_template(card_class, nnodes).get_edge_ids()
+    return np.array(edges, dtype='int64') - 1
+
+
+@lru_cache(maxsize=None)
+def get_face_indices(card_class: type, nnodes: int) -> tuple[np.ndarray, ...]:
+    """
+    Gets the node indices of the faces of an element class
+    (see ``elem.faces``)
+
+    Returns
+    -------
+    ifaces : tuple[(nfacei, ) int ndarray, ...]
+        the 0-based node indices of the faces in the face id order
+
+    """
+    faces = _make_template(card_class, nnodes).faces
+    return tuple(np.array(face, dtype='int64') - 1 for unused_face_id, face in faces.items())
+
+
+def group_rows(rows: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Groups the identical rows of a 2D int array
+
+    Parameters
+    ----------
+    rows : (n, m) int ndarray
+        the rows (e.g., the sorted node ids of the edges)
+
+    Returns
+    -------
+    isort : (n, ) int ndarray
+        the indices of the rows sorted by value; identical rows are in
+        the original order
+    istart : (ngroups, ) int ndarray
+        the index of the first row of each group in isort
+    counts : (ngroups, ) int ndarray
+        the number of rows in each group
+
+    """
+    nrows = len(rows)
+    if nrows == 0:
+        empty = np.zeros(0, dtype='int64')
+        return empty, empty, empty
+    # lexsort is stable and uses the last key as the primary key
+    isort = np.lexsort(rows.T[::-1])
+    sorted_rows = rows[isort]
+    is_new = np.ones(nrows, dtype='bool')
+    is_new[1:] = np.any(sorted_rows[1:] != sorted_rows[:-1], axis=1)
+    istart = np.flatnonzero(is_new)
+    counts = np.diff(np.append(istart, nrows))
+    return isort, istart, counts
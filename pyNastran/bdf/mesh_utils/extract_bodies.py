@@ -1,11 +1,20 @@
 """
 defines:
   - extract_bodies(bdf_filename)
+  - bodies = get_bodies(model, consider_rigid=True, consider_masses=True,
+                        consider_mpcs=False, mpc_id=0)
 
 """
-from collections import defaultdict
+from __future__ import annotations
+from typing import Optional, Iterable
+
 import numpy as np
-from pyNastran.bdf.bdf import BDF, read_bdf, print_card_16
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components
+
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.element_connectivity import get_element_node_arrays
+
 
 def extract_bodies(bdf_filename, mpc_id=0):
     """
@@ -21,6 +30,14 @@ def extract_bodies(bdf_filename, mpc_id=0):
         >0 : use this MPC set
         not supported
 
+    Returns
+    -------
+    body_eids : dict[ibody] = [eids, rigid_eids]
+        eids : (n, ) int ndarray
+            the sorted element ids
+        rigid_eids : (n, ) int ndarray
+            the sorted rigid element ids
+
     Considers:
      - elements
      - rigid_elements
@@ -31,10 +48,7 @@ def extract_bodies(bdf_filename, mpc_id=0):
       - MPCADD
       - DMIx
 
-    Doesn't support:
-      - xref
-      - duplicate element ids
-      - large values
+    See ``get_bodies`` for the masses/MPCs.
 
     """
     if isinstance(bdf_filename, BDF):
@@ -42,158 +56,187 @@ def extract_bodies(bdf_filename, mpc_id=0):
     else:
         model = read_bdf(bdf_filename, xref=False)
 
-    debug = False
-    nnodes = len(model.nodes)
-    nspoints = 0
-    nepoints = 0
-    if model.spoints:
-        nspoints = len(model.spoints)
-    if model.epoints:
-        nepoints = len(model.epoints)
-    npoints = nnodes + nspoints + nepoints
-    nelements = len(model.elements) + len(model.rigid_elements) + len(model.masses)
-    if npoints == 0 or nelements == 0:
+    bodies = get_bodies(model, consider_rigid=True, consider_masses=False)
+    body_eids = {
+        ibody: [body['eids'].astype('int32'), body['rigid_eids'].astype('int32')]
+        for ibody, body in bodies.items()
+    }
+    nbodies = len(body_eids)
+    if nbodies > 1:
+        model.log.info('nbodies = %i' % nbodies)
+    return body_eids
+
+
+def get_bodies(model: BDF,
+               consider_rigid: bool=True,
+               consider_masses: bool=True,
+               consider_mpcs: bool=False,
+               mpc_id: int=0) -> dict[int, dict[str, np.ndarray]]:
+    """
+    Finds the isolated bodies (the connected sets of nodes)
+
+    A sparse node-element incidence matrix is made from the connectivity
+    of the elements/rigid elements/masses/MPCs and the bodies are the
+    connected components of the graph.
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    consider_rigid : bool; default=True
+        consider the rigid elements (e.g., RBE2, RBE3)
+    consider_masses : bool; default=True
+        consider the mass elements (e.g., CONM2)
+    consider_mpcs : bool; default=False
+        consider the MPCs (each MPC connects its nodes)
+    mpc_id : int; default=0
+        0 : consider all MPCs
+        >0 : use this MPC/MPCADD set
+
+    Returns
+    -------
+    bodies : dict[ibody] = body
+        ibody : int
+            the body number; the bodies are sorted by their first element
+            (model.elements, then the rigid elements, masses, MPCs)
+        body : dict[str] = (n, ) int ndarray
+            nids : the sorted node ids
+            eids : the sorted element ids
+            rigid_eids : the sorted rigid element ids
+            mass_eids : the sorted mass element ids
+
+    """
+    # the MPCs connect the nodes, but aren't stored
+    connector_names = ['eids', 'rigid_eids', 'mass_eids']
+    connectors = [_get_element_connectivity(model)]
+    connectors.append(_get_card_connectivity(
+        (eid, elem.independent_nodes + elem.dependent_nodes)
+        for eid, elem in model.rigid_elements.items()) if consider_rigid else None)
+    connectors.append(_get_card_connectivity(
+        (eid, mass.node_ids) for eid, mass in model.masses.items()) if consider_masses else None)
+    connectors.append(_get_mpc_connectivity(model, mpc_id) if consider_mpcs else None)
+
+    ids_list = []
+    itypes_list = []
+    iconnector_list = []
+    nids_list = []
+    nconnectors = 0
+    for itype, connector in enumerate(connectors):
+        if connector is None:
+            continue
+        ids, nids_per_connector, nids = connector
+        ids_list.append(ids)
+        itypes_list.append(np.full(len(ids), itype, dtype='int8'))
+        iconnector_list.append(nconnectors + np.repeat(np.arange(len(ids)), nids_per_connector))
+        nids_list.append(nids)
+        nconnectors += len(ids)
+
+    if nconnectors == 0:
         return {}
+    connector_ids = np.hstack(ids_list)
+    connector_itypes = np.hstack(itypes_list)
+    iconnectors = np.hstack(iconnector_list)
+    nids = np.hstack(nids_list)
+
+    # blank/grounded nodes (e.g., CELAS1) don't connect anything
+    is_node = nids > 0
+    iconnectors = iconnectors[is_node]
+    unique_nids, inodes = np.unique(nids[is_node], return_inverse=True)
+    nnodes = len(unique_nids)
+
+    # the graph has a vertex for each node and each connector; an edge
+    # connects a connector to each of its nodes (the incidence matrix)
+    nvertices = nnodes + nconnectors
+    incidence = scipy.sparse.coo_matrix(
+        (np.ones(len(inodes), dtype='int8'), (nnodes + iconnectors, inodes)),
+        shape=(nvertices, nvertices)).tocsr()
+    unused_nbodies, labels = connected_components(incidence, directed=False)
+
+    # number the bodies in the order of the connectors
+    connector_labels = labels[nnodes:]
+    unique_labels, ifirst = np.unique(connector_labels, return_index=True)
+    ibodies = np.zeros(labels.max() + 1, dtype='int64')
+    ibodies[unique_labels[np.argsort(ifirst)]] = np.arange(len(unique_labels))
+    node_bodies = ibodies[labels[:nnodes]]
+    connector_bodies = ibodies[connector_labels]
+
+    bodies = {ibody: {'nids': np.zeros(0, dtype='int64')} for ibody in range(len(unique_labels))}
+    for ibody, nidsi in _split_by_body(node_bodies, unique_nids):
+        bodies[ibody]['nids'] = nidsi
+    for itype, name in enumerate(connector_names):
+        is_type = (connector_itypes == itype)
+        for body in bodies.values():
+            body[name] = np.zeros(0, dtype='int64')
+        for ibody, idsi in _split_by_body(connector_bodies[is_type], connector_ids[is_type]):
+            bodies[ibody][name] = np.unique(idsi)
+    return bodies
+
+
+def _split_by_body(ibodies: np.ndarray,
+                   ids: np.ndarray) -> list[tuple[int, np.ndarray]]:
+    """groups the ids by the body number"""
+    if len(ids) == 0:
+        return []
+    isort = np.argsort(ibodies, kind='stable')
+    ibodies = ibodies[isort]
+    ids = ids[isort]
+    istart = np.flatnonzero(np.diff(ibodies)) + 1
+    return list(zip(ibodies[np.hstack([0, istart])].tolist(), np.split(ids, istart)))
+
+
+def _get_element_connectivity(model: BDF) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the node ids of the elements
 
-    nid_to_eid_map = defaultdict(list)
-    eid_to_nid_map = defaultdict(list)
-    for eid, elem in model.elements.items():
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        node_ids = elem.node_ids
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                continue
-            nid_to_eid_map[nid].append(eid)
-
-    rigid_offset = 0
-    if len(model.elements):
-        rigid_offset = max(model.elements)
-    for eid, elem in model.rigid_elements.items():
-        if debug:  # pragma: no cover
-            print(print_card_16(elem.repr_fields()))
-        eid += rigid_offset
-        assert eid not in model.elements, 'eid=%s cannot be used twice' % eid
-        #node_ids = elem.node_ids
-        node_ids = elem.independent_nodes + elem.dependent_nodes
-        eid_to_nid_map[eid] = node_ids
-        for nid in node_ids:
-            if nid is None:
-                raise RuntimeError(elem)
-            nid_to_eid_map[nid].append(eid)
-    #mpc_offset = rigid_offset + max(model.rigid_elements)
-
-    if len(nid_to_eid_map) == 0:
-        raise RuntimeError(model.get_bdf_stats())
-        #return {}
-
-    nids_used = set()
-    eids_used = set()
-    ibody = 0
-    keys = list(nid_to_eid_map.keys())
-    all_nids_to_check = set(keys)
-    key0 = keys[0]
-    nids_to_check = set([key0])
-    if debug:  # pragma: no cover
-        print('all_nids_to_check= ', all_nids_to_check)
-    body_eids = {ibody : set()}
-    nbodies_max = 3
-    while all_nids_to_check:
-        if debug:  # pragma: no cover
-            print(all_nids_to_check)
-        while nids_to_check:
-            #if len(nids_to_check) < 10:
-                #print('nids_to_check =', nids_to_check)
-            nid = nids_to_check.pop()
-            if debug:  # pragma: no cover
-                print('nid = ', nid)
-                print('all_nids_to_check =', all_nids_to_check)
-            if nid not in all_nids_to_check:
-                msg = 'nids_to_check = %s' % nids_to_check
-                raise RuntimeError(msg)
-            if debug:  # pragma: no cover
-                print('nids_used         =', nids_used)
-                print('all_nids_to_check =', all_nids_to_check)
-
-            nids_used.add(nid)
-            if debug:  # pragma: no cover
-                print('  adding nid=%s' % nid)
-            all_nids_to_check.remove(nid)
-            if debug:  # pragma: no cover
-                print('  nids_used         =', nids_used)
-                print('  all_nids_to_check =', all_nids_to_check)
-
-            eids = nid_to_eid_map[nid]
-            if debug:  # pragma: no cover
-                print('  eids = %s' % eids)
-            for eidi in eids:
-                if eidi in eids_used:
-                    continue
-                eids_used.add(eidi)
-                try:
-                    elem = model.elements[eidi]
-                except KeyError:
-                    elem = model.rigid_elements[eidi - rigid_offset]
-                if debug:  # pragma: no cover
-                    print(print_card_16(elem.repr_fields()))
-                    print('adding eidi=%s' % eidi)
-                body_eids[ibody].add(eidi)
-                nidsi = eid_to_nid_map[eidi]
-                for nidi in nidsi:
-                    if nidi not in nids_used:
-                        nids_to_check.add(nidi)
-                        if debug:  # pragma: no cover
-                            print('  adding nid=%s' % nidi)
-                del nidsi # , elem
-            if debug:  # pragma: no cover
-                print('next eid\n')
-                print('---------------------------')
-            del nid, eids
-
-        if len(body_eids[ibody]) == 0:
-            return body_eids
-            # unused node
-            #try:
-                #nid = nids_to_check.pop()
-            #except KeyError:
-                #break
-            #continue
-            #msg = 'cannot find a new body...nbodies=%s\nelements:' % ibody
-            #for nid, eids in sorted(nid_to_eid_map.items()):
-                #msg += '  nid=%r eids=%s\n' % (nid, eids)
-                #for eid in eids:
-                    #try:
-                        #elem = model.elements[eid]
-                    #except KeyError:
-                        #elem = model.rigid_elements[eid - rigid_offset]
-                    #msg += print_card_16(elem.repr_fields())
-
-                    #msg += 'eid=%s used=%s\n\n' % (eid, eid in eids_used)
-                #msg += '----------------\n'
-            #msg += ''
-            #raise RuntimeError(msg + model.get_bdf_stats())
-        ibody += 1
-        if ibody > nbodies_max:
-            raise RuntimeError('Too many bodies...\n' + model.get_bdf_stats())
-        body_eids[ibody] = set()
-        #print('--------------------------------------')
-    if len(body_eids[ibody]) == 0:
-        del body_eids[ibody]
-
-    body_eids2 = {}
-    for ibody, body in sorted(body_eids.items()):
-        abody = np.unique(np.array(list(body), dtype='int64'))
-        ielem = np.where(abody <= rigid_offset)
-        irigid = np.where(abody > rigid_offset)
-        #ielem = np.asarray(ielem, dtype='int32')
-        #ielem = np.asarray(ielem, dtype='int32')
-        body_eids2[ibody] = [
-            np.asarray(abody[ielem], dtype='int32'),
-            np.asarray(abody[irigid], dtype='int32')
-        ]
-    #print('body_eids = %s' % body_eids2)
-    nbodies = len(body_eids2)
-    if nbodies > 1:
-        print('nbodies = %i' % nbodies)
-    return body_eids2
+    Returns
+    -------
+    eids : (nelements, ) int ndarray
+        the element ids
+    nids_per_element : (nelements, ) int ndarray
+        the number of nodes of each element
+    nids : (sum(nids_per_element), ) int ndarray
+        the node ids; 0 is a blank node
+
+    """
+    groups = get_element_node_arrays(model, None)
+    if not groups:
+        empty = np.zeros(0, dtype='int64')
+        return empty, empty, empty
+    eids = np.hstack([eidsi for eidsi, unused_positions, unused_nids in groups.values()])
+    nids_per_element = np.hstack([np.full(len(eidsi), nidsi.shape[1])
+                                  for eidsi, unused_positions, nidsi in groups.values()])
+    nids = np.hstack([nidsi.ravel() for unused_eids, unused_positions, nidsi in groups.values()])
+    return eids, nids_per_element, nids
+
+
+def _get_card_connectivity(cards: Iterable[tuple[int, list[Optional[int]]]],
+                           ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the node ids of the rigid elements/masses/MPCs
+    (see ``_get_element_connectivity``)
+
+    Parameters
+    ----------
+    cards : Iterable[(id, nids)]
+        the id and node ids of the cards
+    """
+    ids = []
+    nids_per_card = []
+    nids = []
+    for card_id, card_nids in cards:
+        nidsi = [0 if nid is None else nid for nid in card_nids]
+        ids.append(card_id)
+        nids_per_card.append(len(nidsi))
+        nids.extend(nidsi)
+    return (np.array(ids, dtype='int64'), np.array(nids_per_card, dtype='int64'),
+            np.array(nids, dtype='int64'))
+
+
+def _get_mpc_connectivity(model: BDF, mpc_id: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """gets the node ids of the MPCs (see ``_get_element_connectivity``)"""
+    if mpc_id == 0:
+        mpcs = [mpc for mpcsi in model.mpcs.values() for mpc in mpcsi]
+    else:
+        mpcs = model.get_reduced_mpcs(mpc_id, consider_mpcadd=True, stop_on_failure=False)
+    return _get_card_connectivity(
+        (mpc.conid, mpc.node_ids) for mpc in mpcs if mpc.type == 'MPC')
@@ -2,14 +2,26 @@
 defines:
     edges = free_edges(model, eids=None)
     edges = non_paired_edges(model, eids=None)
+    edges, edge_eids = get_edge_arrays(model, eids=None)
 
 """
 from __future__ import annotations
 from collections import defaultdict
 from typing import Optional, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.mesh_utils.element_connectivity import (
+    get_element_node_arrays, get_edge_indices, group_rows)
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
 
+SHELL_ELEMENTS = {
+    'CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
+    'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
+    'CSHEAR',
+}
+
 def free_edges(model: BDF, eids: Optional[list[int]]=None, maps=None) -> list[tuple[int, int]]:
     """
     Gets the free edges for shell elements.
@@ -32,11 +44,11 @@ def free_edges(model: BDF, eids: Optional[list[int]]=None, maps=None) -> list[tu
         list of node ids of each edges
 
     """
-    if maps is not None:
-        edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
+    if maps is None:
+        edges, counts = _get_edge_counts(model, eids=eids)
+        return [tuple(edge) for edge in edges[counts == 1].tolist()]
 
+    edge_to_eid_map = maps['edge_to_eid_map']
     edges = []
     for edge, eids in edge_to_eid_map.items():
         if len(eids) == 1:
@@ -65,39 +77,93 @@ def non_paired_edges(model: BDF, eids: list[int]=None, maps=None) -> list[tuple[
         the non-paired edges
 
     """
-    if maps is not None:
-        edge_to_eid_map = maps['edge_to_eid_map']
-    else:
-        edge_to_eid_map = _get_edge_to_eids_map(model, eids=eids)
+    if maps is None:
+        edges, counts = _get_edge_counts(model, eids=eids)
+        return [tuple(edge) for edge in edges[counts != 2].tolist()]
 
+    edge_to_eid_map = maps['edge_to_eid_map']
     edges = []
     for edge, eids in edge_to_eid_map.items():
         if len(eids) != 2:
             edges.append(edge)
     return edges
 
+def get_edge_arrays(model: BDF,
+                    eids: Optional[list[int]]=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the edges of the shell elements as arrays
+    (see ``elem.get_edge_ids()``)
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF model
+    eids : list[int]; default=None
+        a subset of elements to consider
+
+    Returns
+    -------
+    edges : (nedges, 2) int ndarray
+        the sorted node ids of each edge in the order of a loop over
+        the elements; edges with a blank node are skipped
+    edge_eids : (nedges, ) int ndarray
+        the element id of each edge
+
+    """
+    if isinstance(eids, int):
+        eids = [eids]
+    groups = get_element_node_arrays(model, SHELL_ELEMENTS, element_ids=eids)
+
+    edges_list = []
+    eids_list = []
+    positions_list = []
+    iedges_list = []
+    for (card_class, nnodes), (eidsi, positions, nids) in groups.items():
+        iedges = get_edge_indices(card_class, nnodes)
+        nedges = len(iedges)
+        edges_list.append(nids[:, iedges].reshape(-1, 2))
+        eids_list.append(np.repeat(eidsi, nedges))
+        positions_list.append(np.repeat(positions, nedges))
+        iedges_list.append(np.tile(np.arange(nedges), len(eidsi)))
+
+    if not edges_list:
+        return np.zeros((0, 2), dtype='int64'), np.zeros(0, dtype='int64')
+    isort = np.lexsort((np.hstack(iedges_list), np.hstack(positions_list)))
+    edges = np.sort(np.vstack(edges_list)[isort], axis=1)
+    edge_eids = np.hstack(eids_list)[isort]
+    is_valid = edges[:, 0] > 0
+    return edges[is_valid], edge_eids[is_valid]
+
+
+def _get_edge_counts(model: BDF,
+                     eids: Optional[list[int]]=None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the unique edges and the number of elements that use them
+
+    Returns
+    -------
+    edges : (nedges, 2) int ndarray
+        the unique edges in the order they're found
+    counts : (nedges, ) int ndarray
+        the number of elements with the edge
+
+    """
+    edges, edge_eids = get_edge_arrays(model, eids=eids)
+
+    # an element counts once (e.g., a duplicate element id)
+    isort, istart, unused_counts = group_rows(np.column_stack([edges, edge_eids]))
+    edges = edges[np.sort(isort[istart])]
+
+    isort, istart, counts = group_rows(edges)
+    ifirst = isort[istart]
+    iorder = np.argsort(ifirst)
+    return edges[ifirst[iorder]], counts[iorder]
+
+
 def _get_edge_to_eids_map(model, eids=None):
     """helper method"""
+    edges, edge_eids = get_edge_arrays(model, eids=eids)
     edge_to_eids = defaultdict(set)
-    shell_elements = ['CTRIA3', 'CTRIAX', 'CTRIA6', 'CTRIAX6',
-                      'CQUAD4', 'CQUAD', 'CQUAD8', 'CQUADR', 'CQUADX', 'CQUADX8',
-                      'CSHEAR']
-    if eids is None:
-        for eid, elem in model.elements.items():
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
-    else:
-        if isinstance(eids, int):
-            eids = [eids]
-        for eid in eids:
-            elem = model.elements[eid]
-            if elem.type not in shell_elements:
-                continue
-            edges = elem.get_edge_ids()
-            for edge in edges:
-                edge_to_eids[edge].add(eid)
-
+    for edge, eid in zip(edges.tolist(), edge_eids.tolist()):
+        edge_to_eids[tuple(edge)].add(eid)
     return edge_to_eids
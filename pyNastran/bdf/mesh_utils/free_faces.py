@@ -1,18 +1,24 @@
 """
 defines:
  - get_element_faces(model, element_ids=None)
+ - faces, sorted_faces, face_eids = get_face_arrays(model, element_ids=None)
  - get_solid_skin_faces(model)
  - write_skin_solid_faces(model, skin_filename,
                           write_solids=False, write_shells=True,
                           size=8, is_double=False, encoding=None)
 
 """
-from copy import deepcopy
 from collections import defaultdict
 from typing import Optional, Any
 
+import numpy as np
+
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.bdf import read_bdf, BDF
+from pyNastran.bdf.mesh_utils.element_connectivity import (
+    get_element_node_arrays, get_face_indices, group_rows)
+
+SOLID_ELEMENTS = {'CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM'}
 
 def get_element_faces(model: BDF,
                       element_ids: Optional[list[int]]=None) -> Any:
@@ -53,6 +59,65 @@ def get_element_faces(model: BDF,
     return eid_faces
 
 
+def get_face_arrays(model: BDF,
+                    element_ids: Optional[list[int]]=None) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the faces of the solid elements as arrays (see ``elem.faces``).
+    This includes internal faces.
+
+    Parameters
+    ----------
+    model : BDF()
+        the BDF object
+    element_ids : list[int] / None
+        skin a subset of element faces
+        default=None -> all elements
+
+    Returns
+    -------
+    faces : (nfaces, nmax) int ndarray
+        the node ids of each face in the order of a loop over the
+        elements; the blank nodes and the unused columns are 0
+    sorted_faces : (nfaces, nmax) int ndarray
+        the sorted node ids of each face; the 0s are first, so
+        a face with blank midside nodes matches the linear face
+    face_eids : (nfaces, ) int ndarray
+        the element id of each face
+
+    """
+    groups = get_element_node_arrays(model, SOLID_ELEMENTS, element_ids=element_ids)
+    pieces = []
+    for (card_class, nnodes), (eids, positions, nids) in groups.items():
+        for iface, face_indices in enumerate(get_face_indices(card_class, nnodes)):
+            pieces.append((nids[:, face_indices], eids, positions, iface))
+
+    if not pieces:
+        empty = np.zeros(0, dtype='int64')
+        return np.zeros((0, 0), dtype='int64'), np.zeros((0, 0), dtype='int64'), empty
+
+    nfaces = sum(len(facesi) for facesi, unused_eids, unused_positions, unused_iface in pieces)
+    nmax = max(facesi.shape[1] for facesi, unused_eids, unused_positions, unused_iface in pieces)
+    faces = np.zeros((nfaces, nmax), dtype='int64')
+    sorted_faces = np.zeros((nfaces, nmax), dtype='int64')
+    face_eids = np.zeros(nfaces, dtype='int64')
+    positions = np.zeros(nfaces, dtype='int64')
+    ifaces = np.zeros(nfaces, dtype='int64')
+    i0 = 0
+    for facesi, eids, positionsi, iface in pieces:
+        i1 = i0 + len(facesi)
+        nnodes = facesi.shape[1]
+        faces[i0:i1, :nnodes] = facesi
+        # the unused columns and the blank nodes are first
+        sorted_faces[i0:i1, nmax-nnodes:] = np.sort(facesi, axis=1)
+        face_eids[i0:i1] = eids
+        positions[i0:i1] = positionsi
+        ifaces[i0:i1] = iface
+        i0 = i1
+
+    isort = np.lexsort((ifaces, positions))
+    return faces[isort], sorted_faces[isort], face_eids[isort]
+
+
 def get_solid_skin_faces(model: BDF) -> Any:
     """
     Gets the elements and faces that are skinned from solid elements
@@ -72,48 +137,59 @@ def get_solid_skin_faces(model: BDF) -> Any:
        key : sorted face
        value : unsorted face
 
+    .. note:: the blank nodes (e.g., the midside nodes of a CHEXA20)
+              are not included in the faces
+
     """
-    eid_faces = get_element_faces(model)
-    face_set = defaultdict(int)
+    faces, sorted_faces, face_eids = get_face_arrays(model)
+    isort, istart, counts = group_rows(sorted_faces)
+
+    # the faces are stored in the order they're found; the face_map has
+    # the last unsorted face
+    iorder = np.argsort(isort[istart])
+    istart = istart[iorder]
+    counts = counts[iorder]
+    tfaces = list(map(tuple, _remove_blanks(sorted_faces[isort[istart]], is_sorted=True)))
+    raw_faces = _remove_blanks(faces[isort[istart + counts - 1]], is_sorted=False)
+    face_map = dict(zip(tfaces, raw_faces))
+
     eid_set = defaultdict(list)
-    face_map = {}
-    for eid, face in eid_faces:
-        #print(eid, face)
-        raw_face = deepcopy(face)
-        try:
-            face.sort()
-        except Exception:
-            print('face = %s' % str(face))
-            raise
-        tface = tuple(face)
-        #print(tface)
-        face_set[tface] += 1
-        eid_set[tface].append(eid)
-        face_map[tface] = raw_face
-
-    #print('eid_set:')
-    #for tface, eidset in eid_set.items():
-        #print(tface, eidset)
-
-    #print('face_set:')
-    #for tface, faceset in face_set.items():
-        #print(tface, faceset)
-
-    #print('face_map:')
-    #for tface, facemap in face_map.items():
-        #print(tface, facemap)
-
-    del_faces = []
-    for face, face_count in face_set.items():
-        if face_count == 2:
-            del_faces.append(face)
-
-    for face in del_faces:
-        del face_set[face]
-        del eid_set[face]
+    eids = face_eids[isort].tolist()
+    for tface, i0, count in zip(tfaces, istart.tolist(), counts.tolist()):
+        if count != 2:
+            eid_set[tface] = eids[i0:i0 + count]
     return eid_set, face_map
 
 
+def _remove_blanks(faces: np.ndarray, is_sorted: bool) -> list[list[int]]:
+    """
+    Converts the faces to lists without the 0s
+
+    Parameters
+    ----------
+    faces : (nfaces, nmax) int ndarray
+        the faces from ``get_face_arrays``
+    is_sorted : bool
+        True : the 0s are first (sorted_faces)
+        False : the 0s are usually last (faces)
+
+    """
+    nmax = faces.shape[1]
+    nnodes = np.count_nonzero(faces, axis=1)
+    face_lists = [None] * len(faces)
+    for nnodesi in np.unique(nnodes).tolist():
+        ifaces = np.flatnonzero(nnodes == nnodesi)
+        facesi = faces[ifaces, nmax-nnodesi:] if is_sorted else faces[ifaces, :nnodesi]
+        is_blank = np.any(facesi == 0, axis=1)
+        for iface, face in zip(ifaces[~is_blank].tolist(), facesi[~is_blank].tolist()):
+            face_lists[iface] = face
+
+        # blank midside nodes
+        for iface in ifaces[is_blank].tolist():
+            face_lists[iface] = [nid for nid in faces[iface].tolist() if nid]
+    return face_lists
+
+
 def write_skin_solid_faces(model, skin_filename,
                            write_solids=False, write_shells=True,
                            size=8, is_double=False, encoding=None,
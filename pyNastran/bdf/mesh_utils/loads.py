@@ -4,10 +4,13 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_loadcases
+      find the net force/moment on the model for many load cases
 
 """
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING
+from collections import defaultdict
+from typing import Optional, Iterable, TYPE_CHECKING
 from math import radians, sin, cos
 import numpy as np
 from numpy import array, cross, allclose, mean
@@ -15,11 +18,22 @@ from numpy.linalg import norm  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.utils import get_xyz_cid0_dict, transform_load
 from pyNastran.bdf.cards.loads.static_loads import update_pload4_vector, PLOAD, PLOAD2, PLOAD4
+from pyNastran.bdf.mesh_utils.element_connectivity import get_element_node_arrays
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.nptyping_interface import NDArray3float
     from pyNastran.bdf.bdf import BDF, Subcase
 
 
+#: the loads considered by sum_forces_moments_loadcases
+SUM_LOAD_TYPES = {
+    'FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1', 'MOMENT2',
+    'PLOAD', 'PLOAD1', 'PLOAD2', 'PLOAD4', 'GRAV'}
+TRIA_SHELLS = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+QUAD_SHELLS = {'CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR'}
+#: the elements supported by PLOAD2 in sum_forces_moments
+PLOAD2_SHELLS = {'CTRIA3', 'CQUAD4', 'CSHEAR', 'CQUADR', 'CTRIAR'}
+
+
 def isnan(value):
     return value is None or np.isnan(value)
 
@@ -199,6 +213,414 @@ def sum_forces_moments(model: BDF,
     F2, M2 = transform_load(F, M, cid0, cid, model)
     return F2, M2
 
+def sum_forces_moments_loadcases(model: BDF,
+                                 p0: int | np.ndarray,
+                                 loadcase_ids: Iterable[int],
+                                 cid: int=0,
+                                 include_grav: bool=False,
+                                 ) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    load cases at once.
+
+    This is the array version of ``sum_forces_moments``.  The node
+    locations are found once and the loads are grouped by card type, so
+    the force/moment of each load card is calculated once with numpy
+    and then scaled into every load case that uses it (e.g., through a
+    LOAD card).
+
+    Considers:
+      - FORCE, FORCE1, FORCE2
+      - MOMENT, MOMENT1, MOMENT2
+      - PLOAD, PLOAD1, PLOAD2, PLOAD4
+      - GRAV
+      - LOAD
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : list[int]
+        the LOAD=ID values to analyze
+    cid : int; default=0
+        the coordinate system for the summation
+    include_grav : bool; default=False
+        includes gravity in the summation
+
+    Returns
+    -------
+    forces : (nloadcases, 3) float ndarray
+        the forces
+    moments : (nloadcases, 3) float ndarray
+        the moments
+
+    Examples
+    --------
+    >>> forces, moments = sum_forces_moments_loadcases(model, [0., 0., 0.], [1, 2, 3])
+    >>> force2, moment2 = forces[1, :], moments[1, :]
+
+    """
+    loadcase_ids = list(loadcase_ids)
+    for loadcase_id in loadcase_ids:
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+    p = _get_load_summation_point(model, p0, cid=0)
+
+    # Reduce the LOAD cards of each load case to the scale factors on the
+    # load sets (e.g., the FORCE/PLOAD4 cards of a sid).  The load sets
+    # are shared between the load cases.
+    iload_sets = {}
+    load_sets = []
+    unsupported_types_by_set = []
+    icase_list = []
+    iset_list = []
+    scale_list = []
+    for icase, loadcase_id in enumerate(loadcase_ids):
+        load_case = model.Load(loadcase_id, consider_load_combinations=True)
+        unsupported_types = set()
+        for load_set, scale in _iter_load_sets(model, load_case, 1.0, []):
+            key = id(load_set)
+            iset = iload_sets.get(key)
+            if iset is None:
+                iset = iload_sets[key] = len(load_sets)
+                load_sets.append([load for load in load_set
+                                  if load.type in SUM_LOAD_TYPES])
+                unsupported_types_by_set.append(
+                    {load.type for load in load_set
+                     if load.type not in SUM_LOAD_TYPES and load.type != 'LOAD'})
+            icase_list.append(icase)
+            iset_list.append(iset)
+            scale_list.append(scale)
+            unsupported_types.update(unsupported_types_by_set[iset])
+        for load_type in unsupported_types:
+            model.log.warning('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
+
+    # the force/moment of each load card about p in the global frame
+    icards = {}
+    cards_by_type = defaultdict(list)
+    icards_by_type = defaultdict(list)
+    icard_list = []
+    iset_card_list = []
+    for iset, load_set in enumerate(load_sets):
+        for load in load_set:
+            key = id(load)
+            icard = icards.get(key)
+            if icard is None:
+                icard = icards[key] = len(icards)
+                cards_by_type[load.type].append(load)
+                icards_by_type[load.type].append(icard)
+            icard_list.append(icard)
+            iset_card_list.append(iset)
+
+    force_moment = np.zeros((len(icards), 6), dtype='float64')
+    if icards:
+        nid_cp_cd, xyz_cid0 = model.get_xyz_in_coord_array(cid=0, fdtype='float64')[:2]
+        nids = nid_cp_cd[:, 0]
+        for load_type, loads in cards_by_type.items():
+            if load_type == 'GRAV':
+                if not include_grav:
+                    continue
+                force_momenti = _sum_grav_array(model, loads, p)
+            else:
+                func = _SUM_LOAD_ARRAY_FUNCS[load_type]
+                force_momenti = func(model, loads, nids, xyz_cid0, p)
+            force_moment[icards_by_type[load_type], :] = force_momenti
+
+    # sum the cards into the load sets and the load sets into the load cases
+    force_moment_sets = np.zeros((len(load_sets), 6), dtype='float64')
+    if icard_list:
+        np.add.at(force_moment_sets, np.array(iset_card_list),
+                  force_moment[icard_list, :])
+
+    nloadcases = len(loadcase_ids)
+    force_moment_cases = np.zeros((nloadcases, 6), dtype='float64')
+    if iset_list:
+        scales = np.array(scale_list, dtype='float64')
+        np.add.at(force_moment_cases, np.array(icase_list),
+                  scales[:, np.newaxis] * force_moment_sets[iset_list, :])
+    forces = force_moment_cases[:, :3]
+    moments = force_moment_cases[:, 3:]
+    if cid != 0:
+        cid0 = 0
+        for icase in range(nloadcases):
+            forces[icase, :], moments[icase, :] = transform_load(
+                forces[icase, :], moments[icase, :], cid0, cid, model)
+    return forces, moments
+
+def _iter_load_sets(model: BDF, load_case: list, scale: float,
+                    unallowed_load_ids: list[int]):
+    """
+    Reduces the LOAD cards of a load case like ``BDF.get_reduced_loads``,
+    but keeps the load sets together
+
+    Yields
+    ------
+    load_set : list[load]
+        the cards of a LOAD/FORCE/PLOAD4/etc. id; the LOAD cards are
+        skipped by the caller
+    scale : float
+        the scale factor on the load set
+
+    """
+    yield load_case, scale
+    for load in load_case:
+        if load.type != 'LOAD':
+            continue
+        load_ids = load.get_load_ids()
+        load_scale = load.scale * scale
+        assert len(load_ids) == len(load.scale_factors), str(load)
+        for load_idi, scalei in zip(load_ids, load.scale_factors):
+            # prevents recursion
+            if load_idi in unallowed_load_ids:
+                msg = 'There is a recursion error.  LOAD trace=%s; load_id=%s' % (
+                    unallowed_load_ids, load_idi)
+                raise RuntimeError(msg)
+            load_casei = model.Load(load_idi, consider_load_combinations=True)
+            yield from _iter_load_sets(model, load_casei, load_scale * scalei,
+                                       unallowed_load_ids + [load_idi])
+
+def _get_node_index(nids: np.ndarray, node_ids) -> np.ndarray:
+    """gets the index of the node ids in the sorted node ids"""
+    node_ids = np.asarray(node_ids)
+    inode = np.searchsorted(nids, node_ids)
+    inode[inode == len(nids)] = 0
+    is_missing = (nids[inode] != node_ids)
+    if is_missing.any():
+        raise KeyError('nodes=%s are missing' % np.unique(node_ids[is_missing]).tolist())
+    return inode
+
+def _get_global_vectors(loads: list, vectors: np.ndarray) -> np.ndarray:
+    """transforms the FORCE/MOMENT vectors from the CID frame to the global frame"""
+    cids = np.array([load.Cid() for load in loads])
+    for cidi in np.unique(cids):
+        if cidi == 0:
+            continue
+        i = np.flatnonzero(cids == cidi)
+        coord = loads[i[0]].cid_ref
+        vectors[i, :] = coord.transform_vector_to_global_array(vectors[i, :])
+    return vectors
+
+def _sum_force_array(model: BDF, loads: list, nids: np.ndarray,
+                     xyz_cid0: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """helper method for ``sum_forces_moments_loadcases`` for FORCE/FORCE1/FORCE2"""
+    vectors = np.array([load.xyz for load in loads], dtype='float64')
+    if loads[0].type == 'FORCE':
+        vectors = _get_global_vectors(loads, vectors)
+    mags = np.array([load.mag for load in loads], dtype='float64')
+    inode = _get_node_index(nids, [load.node_id for load in loads])
+    force = mags[:, np.newaxis] * vectors
+    r = xyz_cid0[inode, :] - p
+    return np.hstack([force, cross(r, force)])
+
+def _sum_moment_array(model: BDF, loads: list, nids: np.ndarray,
+                      xyz_cid0: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """helper method for ``sum_forces_moments_loadcases`` for MOMENT/MOMENT1/MOMENT2"""
+    vectors = np.array([load.xyz for load in loads], dtype='float64')
+    if loads[0].type == 'MOMENT':
+        vectors = _get_global_vectors(loads, vectors)
+    mags = np.array([load.mag for load in loads], dtype='float64')
+    force_moment = np.zeros((len(loads), 6), dtype='float64')
+    force_moment[:, 3:] = mags[:, np.newaxis] * vectors
+    return force_moment
+
+def _get_face_area_vectors(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the area vector (area * normal) and centroid of tri/quad faces
+
+    Parameters
+    ----------
+    xyz : (n, 3, 3) or (n, 4, 3) float ndarray
+        the corner node locations of the faces
+
+    Returns
+    -------
+    area_vectors : (n, 3) float ndarray
+        the area * normal of the faces
+    centroids : (n, 3) float ndarray
+        the centroids of the faces
+
+    """
+    n1 = xyz[:, 0, :]
+    n2 = xyz[:, 1, :]
+    n3 = xyz[:, 2, :]
+    if xyz.shape[1] == 3:
+        axb = cross(n1 - n2, n1 - n3)
+    else:
+        axb = cross(n1 - n3, n2 - xyz[:, 3, :])
+    return 0.5 * axb, xyz.mean(axis=1)
+
+def _get_shell_area_vectors(model: BDF, eids: np.ndarray, etypes: set[str],
+                            nids: np.ndarray, xyz_cid0: np.ndarray,
+                            ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the area vector (area * normal) and centroid of shell elements
+
+    Returns
+    -------
+    is_shell : (n, ) bool ndarray
+        is the element one of the etypes
+    is_tri : (n, ) bool ndarray
+        is the element a triangle
+    area_vectors : (n, 3) float ndarray
+        the area * normal of the elements
+    centroids : (n, 3) float ndarray
+        the centroids of the elements
+
+    """
+    ueids, ieids = np.unique(eids, return_inverse=True)
+    nueids = len(ueids)
+    is_shell = np.zeros(nueids, dtype='bool')
+    is_tri = np.zeros(nueids, dtype='bool')
+    area_vectors = np.zeros((nueids, 3), dtype='float64')
+    centroids = np.zeros((nueids, 3), dtype='float64')
+    groups = get_element_node_arrays(model, etypes, element_ids=ueids.tolist())
+    for (card_class, unused_nnodes), (unused_eids, positions, elem_nids) in groups.items():
+        nface = 3 if card_class.type in TRIA_SHELLS else 4
+        inode = _get_node_index(nids, elem_nids[:, :nface])
+        area_vectors[positions, :], centroids[positions, :] = _get_face_area_vectors(
+            xyz_cid0[inode, :])
+        is_shell[positions] = True
+        is_tri[positions] = (nface == 3)
+    return is_shell[ieids], is_tri[ieids], area_vectors[ieids, :], centroids[ieids, :]
+
+def _get_card_element_ids(loads: list) -> tuple[np.ndarray, np.ndarray]:
+    """gets the card index and element id of each element of PLOAD2/PLOAD4 cards"""
+    eids_list = [load.eids for load in loads]
+    counts = [len(eids) for eids in eids_list]
+    icards = np.repeat(np.arange(len(loads)), counts)
+    eids = np.array([eid for eids in eids_list for eid in eids], dtype='int64')
+    return icards, eids
+
+def _sum_pload_array(model: BDF, loads: list, nids: np.ndarray,
+                     xyz_cid0: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """helper method for ``sum_forces_moments_loadcases`` for PLOAD"""
+    force_moment = np.zeros((len(loads), 6), dtype='float64')
+    nnodes = np.array([len(load.node_ids) for load in loads])
+    for nnodesi in np.unique(nnodes):
+        if nnodesi not in [3, 4]:
+            load = loads[np.flatnonzero(nnodes == nnodesi)[0]]
+            msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(load.node_ids)
+            raise RuntimeError(msg)
+        i = np.flatnonzero(nnodes == nnodesi)
+        inode = _get_node_index(nids, [loads[j].node_ids for j in i])
+        area_vectors, centroids = _get_face_area_vectors(xyz_cid0[inode, :])
+        pressures = np.array([loads[j].pressure for j in i], dtype='float64')
+        force = pressures[:, np.newaxis] * area_vectors
+        force_moment[i, :3] = force
+        force_moment[i, 3:] = cross(centroids - p, force)
+    return force_moment
+
+def _sum_pload1_array(model: BDF, loads: list, nids: np.ndarray,
+                      xyz_cid0: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """helper method for ``sum_forces_moments_loadcases`` for PLOAD1"""
+    force_moment = np.zeros((len(loads), 6), dtype='float64')
+    for i, load in enumerate(loads):
+        node_ids = load.eid_ref.node_ids
+        inode = _get_node_index(nids, node_ids)
+        xyz = dict(zip(node_ids, xyz_cid0[inode, :]))
+        _pload1_total(model, load.sid, load, 1.0, xyz,
+                      force_moment[i, :3], force_moment[i, 3:], p)
+    return force_moment
+
+def _sum_pload2_array(model: BDF, loads: list, nids: np.ndarray,
+                      xyz_cid0: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """helper method for ``sum_forces_moments_loadcases`` for PLOAD2"""
+    force_moment = np.zeros((len(loads), 6), dtype='float64')
+    icards, eids = _get_card_element_ids(loads)
+    is_shell, unused_is_tri, area_vectors, centroids = _get_shell_area_vectors(
+        model, eids, PLOAD2_SHELLS, nids, xyz_cid0)
+    if not is_shell.all():
+        etypes = {model.elements[eid].type for eid in eids[~is_shell]}
+        for etype in sorted(etypes):
+            model.log.warning('etype=%r loadtype=%r not supported' % (etype, 'PLOAD2'))
+    icards = icards[is_shell]
+    pressures = np.array([load.pressure for load in loads], dtype='float64')[icards]
+    force = pressures[:, np.newaxis] * area_vectors[is_shell, :]
+    moment = cross(centroids[is_shell, :] - p, force)
+    np.add.at(force_moment, icards, np.hstack([force, moment]))
+    return force_moment
+
+def _sum_pload4_array(model: BDF, loads: list, nids: np.ndarray,
+                      xyz_cid0: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """
+    helper method for ``sum_forces_moments_loadcases`` for PLOAD4
+
+    Surface pressures on shells are summed with numpy; line loads and
+    solid faces use ``_pload4_helper``.
+    """
+    nloads = len(loads)
+    force_moment = np.zeros((nloads, 6), dtype='float64')
+    pressures = np.zeros((nloads, 2), dtype='float64')  # tri, quad
+    load_dirs = np.full((nloads, 3), np.nan, dtype='float64')
+    for i, load in enumerate(loads):
+        assert load.line_load_dir == 'NORM', f'line_load_dir = {load.line_load_dir!r}'
+        pressures[i, 0] = _mean_pressure_on_pload4(load.pressures[:3], load, None)
+        pressures[i, 1] = _mean_pressure_on_pload4(load.pressures[:4], load, None)
+        if np.abs(load.nvector).max() != 0.:
+            load_dirs[i, :] = update_pload4_vector(load, None, load.Cid())
+
+    icards, eids = _get_card_element_ids(loads)
+    is_shell, is_tri, area_vectors, centroids = _get_shell_area_vectors(
+        model, eids, TRIA_SHELLS | QUAD_SHELLS, nids, xyz_cid0)
+    is_surf = np.array([load.surf_or_line == 'SURF' for load in loads])
+    is_summed = is_shell & is_surf[icards]
+
+    # surface pressure on shells
+    icards_summed = icards[is_summed]
+    area_vectors = area_vectors[is_summed, :]
+    pressure = np.where(is_tri[is_summed], pressures[icards_summed, 0], pressures[icards_summed, 1])
+    load_dir = load_dirs[icards_summed, :]
+    is_normal = np.isnan(load_dir[:, 0])
+    load_dir[is_normal, :] = area_vectors[is_normal, :]
+    is_nvector = ~is_normal
+    load_dir[is_nvector, :] *= norm(area_vectors[is_nvector, :], axis=1)[:, np.newaxis]
+    force = pressure[:, np.newaxis] * load_dir
+    moment = cross(centroids[is_summed, :] - p, force)
+    np.add.at(force_moment, icards_summed, np.hstack([force, moment]))
+
+    # line loads and solids
+    if not is_summed.all():
+        xyz = dict(zip(nids.tolist(), xyz_cid0))
+        for icard, eid in zip(icards[~is_summed], eids[~is_summed]):
+            load = loads[icard]
+            elem = model.elements[eid]
+            fi, mi = _pload4_helper(load.sid, load, 1.0, elem, xyz, p)
+            force_moment[icard, :3] += fi
+            force_moment[icard, 3:] += mi
+    return force_moment
+
+def _sum_grav_array(model: BDF, loads: list, p: np.ndarray) -> np.ndarray:
+    """
+    helper method for ``sum_forces_moments_loadcases`` for GRAV
+
+    The mass and first moment of mass of the elements are the same for
+    all the GRAV cards, so they're calculated once.
+    """
+    mass = 0.
+    mass_moment = np.zeros(3, dtype='float64')
+    for elem in model.elements.values():
+        massi = elem.Mass()
+        mass += massi
+        mass_moment += massi * (elem.Centroid() - p)
+
+    gravity = np.array([load.GravityVector() for load in loads], dtype='float64')
+    return np.hstack([mass * gravity, cross(mass_moment, gravity)])
+
+_SUM_LOAD_ARRAY_FUNCS = {
+    'FORCE': _sum_force_array,
+    'FORCE1': _sum_force_array,
+    'FORCE2': _sum_force_array,
+    'MOMENT': _sum_moment_array,
+    'MOMENT1': _sum_moment_array,
+    'MOMENT2': _sum_moment_array,
+    'PLOAD': _sum_pload_array,
+    'PLOAD1': _sum_pload1_array,
+    'PLOAD2': _sum_pload2_array,
+    'PLOAD4': _sum_pload4_array,
+}
+
 def _pload1_total(model, loadcase_id, load, scale, xyz, F, M, p):
     """helper method for ``sum_forces_moments``"""
     elem = load.eid_ref
@@ -226,9 +648,9 @@ def _pload1_bar_beam(model, unused_loadcase_id, load, elem, scale, xyz, F, M, p)
     p2 = load.p2 * scale
 
     nodes = elem.node_ids
-    n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-    n1 += elem.wa
-    n2 += elem.wb
+    # don't use += or the node locations are changed
+    n1 = xyz[nodes[0]] + elem.wa
+    n2 = xyz[nodes[1]] + elem.wb
 
     bar_vector = n2 - n1
     L = norm(bar_vector)
@@ -638,8 +1060,9 @@ def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
             force_dir = array([0., 1., 0.])
         elif load.Type == 'FZ' and x1 == x2:
             force_dir = array([0., 0., 1.])
-        F += p1 * force_dir
-        M += cross(r - p, F)
+        f = p1 * force_dir
+        F += f
+        M += cross(r - p, f)
     elif load.Type in ['MX', 'MY', 'MZ']:
         if load.Type == 'MX' and x1 == x2:
             moment_dir = array([1., 0., 0.])
@@ -666,14 +1089,15 @@ def _bar_eq_pload1(model: BDF, load, elem, xyz, Ldir,
             force_dir = k
         #print('    force_dir =', force_dir, load.Type)
         try:
-            F += p1 * force_dir
+            f = p1 * force_dir
         except FloatingPointError:
             msg = 'eid = %s\n' % elem.eid
             msg += 'i = %s\n' % Ldir
             msg += 'force_dir = %s\n' % force_dir
             msg += 'load = \n%s' % str(load)
             raise FloatingPointError(msg)
-        M += cross(r - p, F)
+        F += f
+        M += cross(r - p, f)
         del force_dir
 
     elif load.Type in ['MXE', 'MYE', 'MZE']:
@@ -4,6 +4,9 @@
 Defines:
   - mass_poperties
       get the mass & moment of inertia of the model
+  - mass_properties_groups
+      get the mass & moment of inertia of multiple element/mass subsets
+      about multiple reference points
 
 """
 from __future__ import annotations
@@ -11,7 +14,7 @@ from itertools import count
 from collections import defaultdict
 from typing import cast, Optional, Any, TYPE_CHECKING
 
-from numpy import array, cross, dot
+from numpy import array, cross
 from numpy.linalg import norm  # type: ignore
 import numpy as np
 
@@ -76,6 +79,19 @@ NO_MASS = {
     'CHACAB', 'CAABSF',
 }
 
+#: the element types with array-based mass properties: type -> group
+MASS_GROUPS = {
+    'CTRIA3': 'tri', 'CTRIAR': 'tri', 'CQUAD4': 'quad', 'CQUADR': 'quad',
+    'CTETRA': 'tetra', 'CPYRAM': 'pyram', 'CPENTA': 'penta', 'CHEXA': 'hexa',
+    'CROD': 'line', 'CONROD': 'line', 'CTUBE': 'line', 'CBAR': 'line',
+}
+#: the number of corner nodes of a group
+MASS_GROUP_NNODES = {
+    'tri': 3, 'quad': 4, 'tetra': 4, 'pyram': 5, 'penta': 6, 'hexa': 8, 'line': 2,
+}
+MASS_GROUP_SHELLS = {'CTRIA3', 'CTRIAR', 'CQUAD4', 'CQUADR'}
+MASS_GROUP_SOLIDS = {'CTETRA', 'CPYRAM', 'CPENTA', 'CHEXA'}
+
 def transform_inertia(mass: float, xyz_cg: np.ndarray,
                       xyz_ref: np.ndarray, xyz_ref2: np.ndarray,
                       I_ref: np.ndarray) -> np.ndarray:
@@ -161,14 +177,16 @@ def _mass_properties_elements_init(model: BDF,
             elements = []
         else:
             assert len(model.elements) > 0
-            elements = [element for eid, element in model.elements.items() if eid in element_ids]
+            element_ids_set = set(element_ids)
+            elements = [element for eid, element in model.elements.items() if eid in element_ids_set]
 
         if mass_ids is None:
             mass_ids = []
             masses = []
         else:
             assert len(model.masses) > 0
-            masses = [mass for eid, mass in model.masses.items() if eid in mass_ids]
+            mass_ids_set = set(mass_ids)
+            masses = [mass for eid, mass in model.masses.items() if eid in mass_ids_set]
     assert element_ids is not None, element_ids
     assert mass_ids is not None, mass_ids
     return element_ids, elements, mass_ids, masses
@@ -267,60 +285,444 @@ def _mass_properties(model: BDF, elements: list[Element], masses: list[int],
                      reference_point: np.ndarray,
                      is_cg: bool) -> tuple[float, np.ndarray, np.ndarray]:
     """helper method for ``mass_properties``"""
-    mass = 0.
-    cg = array([0., 0., 0.])
-    inertia = array([0., 0., 0., 0., 0., 0., ])
-    no_mass = NO_MASS
-    mass_inertia = {'CONM2'}
-    for pack in (elements, masses):
-        for element in pack:
-            if element.type == 'CBEAM':
-                mass = _get_cbeam_mass_no_nsm(model, element, mass, cg, inertia, reference_point)
-                continue
-            if element.type in mass_inertia:
-                centroid, m, dI = element.centroid_mass_inertia()
-                di_list = [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, inertia)
-                inertia = [i1 + di for i1, di in zip(inertia, di_list)]
-                continue
+    unused_ids, unused_is_mass, point_masses, centroids, ipoint_inertia, inertias = _get_point_masses(
+        model, elements, masses)
+    mass, cg, inertia = _sum_point_masses(
+        point_masses, centroids, inertias.sum(axis=0),
+        reference_point[np.newaxis, :], is_cg)
+    return mass, cg, inertia[0, :]
+
+def mass_properties_groups(model: BDF, groups=None, reference_points=None,
+                           sym_axis=None, scale=None, inertia_reference: str='cg'):
+    """
+    Calculates the mass properties of multiple element/mass subsets
+    about multiple reference points, while considering WTMASS.
 
-            try:
-                p = element.center_of_mass()  # was Centroid()
-            except AttributeError:
-                if element.type in no_mass:
-                    continue
-                model.log.error(element.rstrip())
-                raise
+    The element masses/centroids are only calculated once, so this is
+    faster than calling ``mass_properties`` for each subset/reference point.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    groups : list[tuple[element_ids, mass_ids]]; default=None -> [(None, None)]
+        the element/mass ids of each subset, which are the same as the
+        ``element_ids``/``mass_ids`` of ``mass_properties`` (e.g.,
+        (None, None) is the whole model and (eids, None) doesn't
+        include the masses)
+    reference_points : list[ndarray/int]; default=None -> [<0,0,0>]
+        the origins of the frame
+        ndarray : a (3, ) xyz location
+        int : the node id
+    sym_axis : str / list[str]; default=None
+        see ``mass_properties``
+    scale : float; default=None -> PARAM,WTMASS
+        see ``mass_properties``
+    inertia_reference : str; default='cg'
+        'cg' : inertia is taken about the cg (it doesn't depend on the
+               reference point)
+        'ref' : inertia is about the reference point
+
+    Returns
+    -------
+    mass : (ngroups, ) float ndarray
+        the mass of each subset; wtmass is considered
+    cg : (ngroups, 3) float ndarray
+        the cg of each subset
+    inertia : (ngroups, nreference_points, 6) float ndarray
+        moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]) of each
+        subset about each reference point; wtmass is considered
+
+    Examples
+    --------
+    **mass properties of each property about two points**
+
+    >>> pid_eids = model.get_element_ids_dict_with_pids()
+    >>> groups = [(eids, None) for pid, eids in sorted(pid_eids.items())]
+    >>> mass, cg, inertia = mass_properties_groups(
+    ...     model, groups, reference_points=[[0., 0., 0.], [1., 0., 0.]],
+    ...     inertia_reference='ref')
 
+    """
+    if groups is None:
+        groups = [(None, None)]
+    if reference_points is None:
+        reference_points = [None]
+
+    is_cg = True
+    xyz_refs = []
+    for reference_point in reference_points:
+        xyz_ref, is_cg = _update_reference_point(
+            model, reference_point, inertia_reference)
+        xyz_refs.append(xyz_ref)
+    xyz_refs = np.array(xyz_refs, dtype='float64')
+
+    group_ids = []
+    all_element_ids = set()
+    all_mass_ids = set()
+    is_all = False
+    for element_ids, mass_ids in groups:
+        if isinstance(element_ids, integer_types):
+            element_ids = [element_ids]
+        if isinstance(mass_ids, integer_types):
+            mass_ids = [mass_ids]
+        if element_ids is None and mass_ids is None:
+            is_all = True
+        else:
+            element_ids = [] if element_ids is None else element_ids
+            mass_ids = [] if mass_ids is None else mass_ids
+            all_element_ids.update(element_ids)
+            all_mass_ids.update(mass_ids)
+        group_ids.append((element_ids, mass_ids))
+
+    if is_all:
+        elements = model.elements.values()
+        masses = model.masses.values()
+    else:
+        elements = [model.elements[eid] for eid in sorted(all_element_ids)
+                    if eid in model.elements]
+        masses = [model.masses[eid] for eid in sorted(all_mass_ids)
+                  if eid in model.masses]
+    ids, is_mass, point_masses, centroids, ipoint_inertia, inertias = _get_point_masses(
+        model, elements, masses)
+
+    ngroups = len(groups)
+    nreference_points = len(xyz_refs)
+    mass = np.zeros(ngroups, dtype='float64')
+    cg = np.zeros((ngroups, 3), dtype='float64')
+    inertia = np.zeros((ngroups, nreference_points, 6), dtype='float64')
+    for igroup, (element_ids, mass_ids) in enumerate(group_ids):
+        if element_ids is None:
+            ipoint = slice(None)
+            iinertia = slice(None)
+        else:
+            ielement = np.isin(ids, np.asarray(element_ids, dtype=ids.dtype))
+            imass = np.isin(ids, np.asarray(mass_ids, dtype=ids.dtype))
+            ipoint = np.where(is_mass, imass, ielement)
+            iinertia = ipoint[ipoint_inertia]
+        massi, cgi, inertiai = _sum_point_masses(
+            point_masses[ipoint], centroids[ipoint], inertias[iinertia].sum(axis=0),
+            xyz_refs, is_cg)
+        for iref in range(nreference_points):
+            massi2, cgi2, inertia[igroup, iref, :] = _apply_mass_symmetry(
+                model, sym_axis, scale, massi, cgi.copy(), inertiai[iref, :])
+        mass[igroup] = massi2
+        cg[igroup, :] = cgi2
+    return mass, cg, inertia
+
+def _get_mass_key(elem: Element) -> tuple[Any, ...]:
+    """
+    Gets the key of the mass per area/volume/length of an element, so
+    it's calculated once per property
+    """
+    etype = elem.type
+    if etype in MASS_GROUP_SHELLS:
+        tscales = elem.get_thickness_scale()
+        return (elem.pid, elem.tflag, tuple(tscales))
+    elif etype in MASS_GROUP_SOLIDS:
+        return ('solid', elem.pid)
+    elif etype == 'CONROD':
+        return (etype, elem.mid, elem.A, elem.nsm)
+    return (etype, elem.pid)
+
+def _get_mass_per_measure(elem: Element) -> float:
+    """
+    Gets the mass per area (shells), volume (solids) or length
+    (line elements) of an element, which is consistent with ``elem.Mass()``
+    """
+    etype = elem.type
+    if etype in MASS_GROUP_SHELLS:
+        mass_per_measure = elem.pid_ref.MassPerArea(
+            tflag=elem.tflag, tscales=elem.get_thickness_scale())
+    elif etype in MASS_GROUP_SOLIDS:
+        mass_per_measure = elem.Rho()
+    elif etype in {'CROD', 'CONROD'}:
+        mass_per_measure = elem.Rho() * elem.Area() + elem.Nsm()
+    elif etype == 'CTUBE':
+        mass_per_measure = elem.pid_ref.MassPerLength()
+    else:
+        mass_per_measure = elem.MassPerLength()
+    return float(mass_per_measure)
+
+def _get_point_masses(model: BDF, elements: list[Element],
+                      masses: list[Any]) -> tuple[np.ndarray, np.ndarray, np.ndarray,
+                                                  np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the point masses of the elements/masses.
+
+    The shells, solids and line elements in ``MASS_GROUPS`` are grouped by
+    type, so the area/volume/length and centroid are calculated with numpy
+    and the mass per area/volume/length is calculated once per property.
+    The other elements (e.g., CBEAM, CONM2) use their methods.
+
+    Returns
+    -------
+    ids : (npoints, ) int ndarray
+        the element/mass id of each point mass
+    is_mass : (npoints, ) bool ndarray
+        is the point mass from a mass element (e.g., CONM2)
+    point_masses : (npoints, ) float ndarray
+        the masses
+    centroids : (npoints, 3) float ndarray
+        the locations of the masses
+    ipoint_inertia : (ninertias, ) int ndarray
+        the point mass index of the intrinsic inertias
+    inertias : (ninertias, 6) float ndarray
+        the intrinsic inertia of the masses (e.g., CONM2)
+        [Ixx, Iyy, Izz, Ixy, Ixz, Iyz]
+
+    """
+    # group the elements
+    mass_per_measures: dict[tuple[Any, ...], Optional[float]] = {}
+    group_data = defaultdict(lambda: ([], [], [], []))
+    fallback_elements = []
+    for elem in elements:
+        etype = elem.type
+        if etype not in MASS_GROUPS:
+            fallback_elements.append(elem)
+            continue
+        key = _get_mass_key(elem)
+        if key in mass_per_measures:
+            mass_per_measure = mass_per_measures[key]
+        else:
             try:
-                m = element.Mass()
-                #print(f'eid={element.eid:d} type={element.type} mass={m}')
-            #except AttributeError:
-                #raise
-            #except SystemExit:
-                #raise
+                mass_per_measure = _get_mass_per_measure(elem)
             except Exception:
-                #raise
-                if element.type in no_mass:
-                    continue
-                # PLPLANE
-                if element.pid_ref.type == 'PSHELL':
-                    model.log.warning('p=%s reference_point=%s type(reference_point)=%s' % (
-                        p, reference_point, type(reference_point)))
-                    raise
-                model.log.warning("could not get the inertia for element/property\n%s%s" % (
-                    element, element.pid_ref))
-                continue
-            mass = _increment_inertia(p, reference_point, m, mass, cg, inertia)
+                # the element methods will raise/warn
+                mass_per_measure = None
+            mass_per_measures[key] = mass_per_measure
+
+        group = MASS_GROUPS[etype]
+        nnodes = MASS_GROUP_NNODES[group]
+        nodes = getattr(elem, 'nodes', None)
+        if nodes is None:
+            nodes = elem.node_ids
+        nodes = nodes[:nnodes]
+        if mass_per_measure is None or None in nodes:
+            fallback_elements.append(elem)
+            continue
+        group_elements, eids, nids, mass_per_measuresi = group_data[group]
+        group_elements.append(elem)
+        eids.append(elem.eid)
+        nids.append(nodes)
+        mass_per_measuresi.append(mass_per_measure)
+
+    ids_list = []
+    point_masses_list = []
+    centroids_list = []
+    if group_data:
+        all_nids, xyz_cid0 = _get_nid_xyzcid0(model)
+        # GRIDBs are in the node arrays, but not model.nodes
+        is_grid = np.isin(all_nids, np.fromiter(model.nodes.keys(), dtype='int64'))
+        if not np.all(is_grid):
+            all_nids = all_nids[is_grid]
+            xyz_cid0 = xyz_cid0[is_grid, :]
+        nall_nids = len(all_nids)
+        for group, (group_elements, eids, nids, mass_per_measuresi) in group_data.items():
+            nids = np.array(nids, dtype='int64')
+            inids = np.searchsorted(all_nids, nids)
+            # the elements with nodes that aren't GRIDs use the element methods
+            if nall_nids:
+                inids[inids == nall_nids] = 0
+                is_grid = np.all(all_nids[inids] == nids, axis=1)
+            else:
+                is_grid = np.zeros(len(nids), dtype='bool')
+            if not np.all(is_grid):
+                fallback_elements.extend(
+                    elem for elem, is_gridi in zip(group_elements, is_grid.tolist())
+                    if not is_gridi)
+                inids = inids[is_grid, :]
+            xyz = xyz_cid0[inids, :]
+            measure, centroid = _get_measure_centroid(group, xyz)
+            ids_list.append(np.array(eids, dtype='int64')[is_grid])
+            point_masses_list.append(
+                np.array(mass_per_measuresi, dtype='float64')[is_grid] * measure)
+            centroids_list.append(centroid)
+
+    fallback_ids = []
+    fallback_is_mass = []
+    fallback_masses = []
+    fallback_centroids = []
+    ipoint_inertia_list = []
+    inertias_list = []
+    for is_mass, pack in ((False, fallback_elements), (True, masses)):
+        for element in pack:
+            for m, centroid, dinertia in _get_element_point_masses(model, element):
+                if dinertia is not None:
+                    ipoint_inertia_list.append(len(fallback_masses))
+                    inertias_list.append(dinertia)
+                fallback_ids.append(element.eid)
+                fallback_is_mass.append(is_mass)
+                fallback_masses.append(m)
+                fallback_centroids.append(centroid)
+
+    # the fallback masses are first, so the intrinsic inertia indices are correct
+    nfallback = len(fallback_masses)
+    ngroup_points = sum(len(ids) for ids in ids_list)
+    ids = np.hstack([np.array(fallback_ids, dtype='int64')] + ids_list)
+    is_mass = np.zeros(nfallback + ngroup_points, dtype='bool')
+    is_mass[:nfallback] = fallback_is_mass
+    point_masses = np.hstack([np.array(fallback_masses, dtype='float64')] + point_masses_list)
+    centroids = np.vstack([np.array(fallback_centroids, dtype='float64').reshape(nfallback, 3)] +
+                          centroids_list)
+    ipoint_inertia = np.array(ipoint_inertia_list, dtype='int64')
+    inertias = np.array(inertias_list, dtype='float64').reshape(len(ipoint_inertia), 6)
+    return ids, is_mass, point_masses, centroids, ipoint_inertia, inertias
+
+def _get_measure_centroid(group: str, xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the area/volume/length and centroid of a group of elements,
+    which are consistent with the element methods (e.g., ``CHEXA8.Volume()``)
+
+    Parameters
+    ----------
+    group : str
+        the element group (see ``MASS_GROUPS``)
+    xyz : (nelements, nnodes, 3) float ndarray
+        the positions of the corner nodes
+
+    Returns
+    -------
+    measure : (nelements, ) float ndarray
+        the area (tri, quad), volume (solids; the tetra volume is signed)
+        or length (line)
+    centroid : (nelements, 3) float ndarray
+        the centroids
+
+    """
+    if group == 'tri':
+        n1, n2, n3 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :]
+        measure = 0.5 * norm(cross(n1 - n2, n1 - n3), axis=1)
+        centroid = (n1 + n2 + n3) / 3.
+    elif group == 'quad':
+        measure, centroid = _quad_area_centroid(xyz)
+    elif group == 'tetra':
+        n1, n2, n3, n4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+        measure = -np.einsum('ij,ij->i', n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
+        centroid = (n1 + n2 + n3 + n4) / 4.
+    elif group == 'pyram':
+        area1, centroid1 = _quad_area_centroid(xyz[:, :4, :])
+        n5 = xyz[:, 4, :]
+        measure = np.abs(area1 / 3. * norm(centroid1 - n5, axis=1))
+        centroid = (centroid1 + n5) / 2.
+    elif group == 'penta':
+        n1, n2, n3, n4, n5, n6 = [xyz[:, i, :] for i in range(6)]
+        area1 = 0.5 * norm(cross(n3 - n1, n2 - n1), axis=1)
+        area2 = 0.5 * norm(cross(n6 - n4, n5 - n4), axis=1)
+        centroid1 = (n1 + n2 + n3) / 3.
+        centroid2 = (n4 + n5 + n6) / 3.
+        measure = np.abs((area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1))
+        centroid = (centroid1 + centroid2) / 2.
+    elif group == 'hexa':
+        area1, centroid1 = _quad_area_centroid(xyz[:, :4, :])
+        area2, centroid2 = _quad_area_centroid(xyz[:, 4:, :])
+        measure = np.abs((area1 + area2) / 2. * norm(centroid1 - centroid2, axis=1))
+        centroid = (centroid1 + centroid2) / 2.
+    elif group == 'line':
+        n1, n2 = xyz[:, 0, :], xyz[:, 1, :]
+        measure = norm(n2 - n1, axis=1)
+        centroid = (n1 + n2) / 2.
+    else:  # pragma: no cover
+        raise NotImplementedError(group)
+    return measure, centroid
+
+def _quad_area_centroid(xyz: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """vectorized version of ``area_centroid`` for (n, 4, 3) positions"""
+    n1, n2, n3, n4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+    area = 0.5 * norm(cross(n3 - n1, n4 - n2), axis=1)
+    centroid = (n1 + n2 + n3 + n4) / 4.
+    return area, centroid
+
+def _get_element_point_masses(model: BDF,
+                              element: Any) -> list[tuple[float, np.ndarray, Optional[np.ndarray]]]:
+    """
+    Gets the point masses of an element using the element methods
+
+    Returns
+    -------
+    point_masses : list[(mass, centroid, inertia)]
+        inertia : (6, ) float ndarray / None
+            the intrinsic inertia (e.g., CONM2)
+
+    """
+    if element.type == 'CBEAM':
+        return _get_cbeam_point_masses(model, element)
+    if element.type == 'CONM2':
+        centroid, m, dI = element.centroid_mass_inertia()
+        di_list = [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
+        return [(m, centroid, np.array(di_list, dtype='float64'))]
+
+    try:
+        p = element.center_of_mass()  # was Centroid()
+    except AttributeError:
+        if element.type in NO_MASS:
+            return []
+        model.log.error(element.rstrip())
+        raise
+
+    try:
+        m = element.Mass()
+    except Exception:
+        if element.type in NO_MASS:
+            return []
+        # PLPLANE
+        if element.pid_ref.type == 'PSHELL':
+            model.log.warning('p=%s' % p)
+            raise
+        model.log.warning("could not get the inertia for element/property\n%s%s" % (
+            element, element.pid_ref))
+        return []
+    return [(m, p, None)]
+
+def _sum_point_masses(point_masses: np.ndarray, centroids: np.ndarray,
+                      intrinsic_inertia: np.ndarray,
+                      reference_points: np.ndarray,
+                      is_cg: bool) -> tuple[float, np.ndarray, np.ndarray]:
+    """
+    Sums the point masses about multiple reference points
+
+    Parameters
+    ----------
+    point_masses : (npoints, ) float ndarray
+        the masses
+    centroids : (npoints, 3) float ndarray
+        the locations of the masses
+    intrinsic_inertia : (6, ) float ndarray
+        the summed intrinsic inertia of the masses (e.g., CONM2)
+    reference_points : (nreference_points, 3) float ndarray
+        the reference points
+    is_cg : bool
+        is the inertia about the cg
+
+    Returns
+    -------
+    mass : float
+        the mass
+    cg : (3, ) float ndarray
+        the cg
+    inertia : (nreference_points, 6) float ndarray
+        the inertia about each reference point (or the cg)
+
+    """
+    nreference_points = len(reference_points)
+    inertia = np.zeros((nreference_points, 6), dtype='float64')
+    mass = 0.
+    cg = np.zeros(3, dtype='float64')
+    for iref, reference_point in enumerate(reference_points):
+        mass = _increment_inertia_array(
+            centroids, reference_point, point_masses, 0., cg, inertia[iref, :])
+        inertia[iref, :] += intrinsic_inertia
+        if iref != nreference_points - 1:
+            cg[:] = 0.
 
     if mass:
         cg /= mass
 
     # only transform if we're calculating the inertia about the cg
     if is_cg:
-        xyz_ref = reference_point
-        xyz_ref2 = cg
-        inertia = transform_inertia(mass, cg, xyz_ref, xyz_ref2, inertia)
+        for iref, reference_point in enumerate(reference_points):
+            inertia[iref, :] = transform_inertia(
+                mass, cg, reference_point, cg, inertia[iref, :])
     return mass, cg, inertia
 
 def _mass_properties_no_xref(model: BDF, elements: list[int], masses: list[int],
@@ -422,6 +824,33 @@ def _increment_inertia(centroid: np.ndarray, reference_point: np.ndarray,
     cg += m * centroid
     return mass
 
+def _increment_inertia_array(centroids: np.ndarray, reference_point: np.ndarray,
+                             masses: np.ndarray, mass: float,
+                             cg: np.ndarray,
+                             inertia: np.ndarray) -> float:
+    """vectorized version of ``_increment_inertia`` for multiple point masses"""
+    i = (masses != 0.)
+    m = masses[i]
+    if len(m) == 0:
+        return mass
+    centroids = centroids[i, :]
+    dxyz = centroids - reference_point
+    x = dxyz[:, 0]
+    y = dxyz[:, 1]
+    z = dxyz[:, 2]
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    inertia[0] += (m * (y2 + z2)).sum()  # Ixx
+    inertia[1] += (m * (x2 + z2)).sum()  # Iyy
+    inertia[2] += (m * (x2 + y2)).sum()  # Izz
+    inertia[3] += (m * x * y).sum()      # Ixy
+    inertia[4] += (m * x * z).sum()      # Ixz
+    inertia[5] += (m * y * z).sum()      # Iyz
+    mass += m.sum()
+    cg += m @ centroids
+    return mass
+
 def mass_properties_nsm(model: BDF, element_ids=None, mass_ids=None, nsm_id=None,
                         reference_point=None,
                         sym_axis=None, scale=None, inertia_reference: str='cg',
@@ -638,51 +1067,29 @@ def _get_mass_nsm(model: BDF,
     """helper method for ``mass_properties_nsm``"""
     element_ids_set = set(element_ids)
     mass_ids_set = set(mass_ids)
-    if etype in {'CROD', 'CONROD'}:
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2 = elem.node_ids
-            length = norm(xyz[n2] - xyz[n1])
-            centroid = (xyz[n1] + xyz[n2]) / 2.
-            mpl = elem.MassPerLength()
-            if elem.type == 'CONROD':
-                #nsm = property_nsms[nsm_id]['CONROD'][eid] + element_nsms[nsm_id][eid]
-                length_eids_pids['CONROD'].append((eid, -42))  # faked number
-                lengths['CONROD'].append(length)
-                nsm_centroids_length['CONROD'].append(centroid)
-            else:
-                pid = elem.pid
-                #nsm = property_nsms[nsm_id]['PROD'][pid] + element_nsms[nsm_id][eid]
-                length_eids_pids['PROD'].append((eid, pid))
-                nsm_centroids_length['PROD'].append(centroid)
-                lengths['PROD'].append(length)
-            #m = (mpl + nsm) * length
-            massi = mpl * length
-            #if massi != elem.Mass():  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n%s' % (massi, elem.Mass(), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
-    elif etype == 'CTUBE':
+    if etype in {'CROD', 'CONROD', 'CTUBE'}:
         eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            pid = elem.pid
-            n1, n2 = elem.node_ids
-            length = norm(xyz[n2] - xyz[n1])
-            centroid = (xyz[n1] + xyz[n2]) / 2.
-            mpl = elem.pid_ref.MassPerLength()
-            length_eids_pids['PTUBE'].append((eid, pid))
-            lengths['PTUBE'].append(length)
-            #nsm = property_nsms[nsm_id]['PTUBE'][pid] + element_nsms[nsm_id][eid]
-            #m = (mpl + nsm) * length
-            massi = mpl * length
-            #if massi != elem.Mass():  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n%s' % (massi, elem.Mass(), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
+        elements, length, centroid = _get_group_geometry(model, xyz, eids2, 'line')
+        if etype == 'CTUBE':
+            ptype = 'PTUBE'
+            mpl = np.array([elem.pid_ref.MassPerLength() for elem in elements])
+        else:
+            ptype = 'PROD' if etype == 'CROD' else 'CONROD'
+            mpl = np.array([elem.MassPerLength() for elem in elements])
+
+        if etype == 'CONROD':
+            #nsm = property_nsms[nsm_id]['CONROD'][eid] + element_nsms[nsm_id][eid]
+            length_eids_pids[ptype].extend((eid, -42) for eid in eids2)  # faked number
+        else:
+            #nsm = property_nsms[nsm_id]['PROD'][pid] + element_nsms[nsm_id][eid]
+            length_eids_pids[ptype].extend(
+                (eid, elem.pid) for eid, elem in zip(eids2, elements))
+        lengths[ptype].extend(length)
+        nsm_centroids_length[ptype].extend(centroid)
+        #m = (mpl + nsm) * length
+        massi = mpl * length
+        mass = _increment_inertia_subset(
+            eids2, element_ids_set, centroid, reference_point, massi, mass, cg, I)
     elif etype == 'CBAR':
         mass = _get_cbar_mass(
             model, xyz, element_ids_set, all_eids,
@@ -749,7 +1156,7 @@ def _get_mass_nsm(model: BDF,
             di_list = [dI[0][0], dI[1][1], dI[2][2], dI[0][1], dI[0][2], dI[1][2]]
             if eid in mass_ids_set:
                 mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-                I = [i1 + di for i1, di in zip(I, di_list)]
+                I += np.array(di_list)
 
     elif etype in {'CONM1', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4'}:
         eids2 = get_sub_eids(all_mass_ids, eids, etype)
@@ -759,99 +1166,14 @@ def _get_mass_nsm(model: BDF,
             centroid = elem.Centroid()
             if eid in mass_ids_set:
                 mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-    elif etype == 'CTETRA':
+    elif etype in {'CTETRA', 'CPYRAM', 'CPENTA', 'CHEXA', 'CHEXA1', 'CHEXA2'}:
         eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4 = elem.node_ids[:4]
-            centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            #V = -dot(n1 - n4, cross(n2 - n4, n3 - n4)) / 6.
-            volume = -dot(xyz[n1] - xyz[n4], cross(xyz[n2] - xyz[n4], xyz[n3] - xyz[n4])) / 6.
-            m = elem.Rho() * volume
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype == 'CPYRAM':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5 = elem.node_ids[:5]
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            area1 = 0.5 * norm(cross(xyz[n3]-xyz[n1], xyz[n4]-xyz[n2]))
-            centroid5 = xyz[n5]
-
-            #V = (l * w) * h / 3
-            #V = A * h / 3
-            centroid = (centroid1 + centroid5) / 2.
-
-            #(n1, n2, n3, n4, n5) = self.get_node_positions()
-            #area1, c1 = area_centroid(n1, n2, n3, n4)
-            #volume = area1 / 3. * norm(c1 - n5)
-            volume = area1 / 3. * norm(centroid1 - centroid5)
-            m = elem.Rho() * volume
-            if CHECK_MASS and (m != elem.Mass() or not np.array_equal(centroid, elem.Centroid())):  # pragma: no cover
-                msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    str(centroid), str(elem.Centroid()), str(elem))
-                raise RuntimeError(msg)
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CPYRAM', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype == 'CPENTA':
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5, n6 = elem.node_ids[:6]
-            area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n2] - xyz[n1]))
-            area2 = 0.5 * norm(cross(xyz[n6] - xyz[n4], xyz[n5] - xyz[n4]))
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-            centroid2 = (xyz[n4] + xyz[n5] + xyz[n6]) / 3.
-            centroid = (centroid1 + centroid2) / 2.
-            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-            m = elem.Rho() * volume
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CPENTA', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
-
-    elif etype in ['CHEXA', 'CHEXA1', 'CHEXA2']:
-        eids2 = get_sub_eids(all_eids, eids, etype)
-        for eid in eids2:
-            elem = model.elements[eid]
-            n1, n2, n3, n4, n5, n6, n7, n8 = elem.node_ids[:8]
-            #(A1, c1) = area_centroid(n1, n2, n3, n4)
-            centroid1 = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-            area1 = 0.5 * norm(cross(xyz[n3] - xyz[n1], xyz[n4] - xyz[n2]))
-            #(A2, c2) = area_centroid(n5, n6, n7, n8)
-            centroid2 = (xyz[n5] + xyz[n6] + xyz[n7] + xyz[n8]) / 4.
-            area2 = 0.5 * norm(cross(xyz[n7] - xyz[n5], xyz[n8] - xyz[n6]))
-
-            volume = (area1 + area2) / 2. * norm(centroid1 - centroid2)
-            m = elem.Rho() * volume
-            centroid = (centroid1 + centroid2) / 2.
-            #if m != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-                #msg = 'mass_new=%s mass_old=%s\n' % (m, elem.Mass())
-                #msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                    #str(centroid), str(elem.Centroid()), str(elem))
-                #raise RuntimeError(msg)
-            #print('*centroid1=%s centroid2=%s' % (str(centroid1), str(centroid2)))
-            #print('*area1=%s area2=%s length=%s' % (area1, area2, norm(centroid1 - centroid2)))
-            #print('*eid=%s type=%s mass=%s rho=%s V=%s' % (
-                #elem.eid, 'CHEXA', m, elem.Rho(), volume))
-            if eid in element_ids_set:
-                mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+        group = MASS_GROUPS.get(etype, 'hexa')
+        elements, volume, centroid = _get_group_geometry(model, xyz, eids2, group)
+        rho = np.array([elem.Rho() for elem in elements])
+        m = rho * volume
+        mass = _increment_inertia_subset(
+            eids2, element_ids_set, centroid, reference_point, m, mass, cg, I)
 
     elif etype == 'CBEND':
         model.log.info('elem.type=%s mass is innaccurate' % etype)
@@ -927,26 +1249,16 @@ def _get_cbar_mass(model: BDF, xyz: dict[int, np.ndarray],
                    reference_point) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, 'CBAR')
-    for eid in eids2:
-        elem = model.elements[eid]
-        pid = elem.pid
-        n1, n2 = elem.node_ids
-        centroid = (xyz[n1] + xyz[n2]) / 2.
-        length: float = norm(xyz[n2] - xyz[n1])
-        mpl = elem.pid_ref.MassPerLength()
-        length_eids_pids['PBAR'].append((eid, pid))
-        lengths['PBAR'].append(length)
-        nsm_centroids_length['PBAR'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PBAR'][pid] + element_nsms[nsm_id][eid]
-        #m = (mpl + nsm) * length
-        massi = mpl * length
-        #if massi != elem.Mass() or not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            #msg = 'mass_new=%s mass_old=%s\n' % (massi, elem.Mass())
-            #msg += 'centroid_new=%s centroid_old=%s\n%s' % (
-                #str(centroid), str(elem.Centroid()), str(elem))
-            #raise RuntimeError(msg)
-        if eid in element_ids_set:
-            mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
+    elements, length, centroid = _get_group_geometry(model, xyz, eids2, 'line')
+    mpl = np.array([elem.pid_ref.MassPerLength() for elem in elements])
+    length_eids_pids['PBAR'].extend((eid, elem.pid) for eid, elem in zip(eids2, elements))
+    lengths['PBAR'].extend(length)
+    nsm_centroids_length['PBAR'].extend(centroid)
+    #nsm = property_nsms[nsm_id]['PBAR'][pid] + element_nsms[nsm_id][eid]
+    #m = (mpl + nsm) * length
+    massi = mpl * length
+    mass = _increment_inertia_subset(
+        eids2, element_ids_set, centroid, reference_point, massi, mass, cg, I)
     return mass
 
 def _get_cbeam_mass(model, xyz, element_ids, all_eids,
@@ -1064,10 +1376,14 @@ def _get_cbeam_mass(model, xyz, element_ids, all_eids,
             raise RuntimeError(msg)
     return mass
 
-def _get_cbeam_mass_no_nsm(model: BDF, elem: CBEAM,
-                           mass: float, cg: np.ndarray, inertia: np.ndarray,
-                           reference_point: np.ndarray) -> float:
-    """helper method for mass_properties"""
+def _get_cbeam_point_masses(model: BDF,
+                            elem: CBEAM) -> list[tuple[float, np.ndarray, None]]:
+    """
+    helper method for mass_properties
+
+    The structural mass is at the centroid, while the non-structural
+    mass is on the NSM axis.
+    """
     prop = elem.pid_ref
     xyz1, xyz2 = elem.get_node_positions()
     centroid = (xyz1 + xyz2) / 2.
@@ -1118,7 +1434,7 @@ def _get_cbeam_mass_no_nsm(model: BDF, elem: CBEAM,
         nsm_n2 = (p2 + jhat * prop.m1 + khat * prop.m2)
         nsm_centroid = (nsm_n1 + nsm_n2) / 2.
     elif prop.type == 'PBMSECT':
-        return mass
+        return []
         #mass_per_length = prop.MassPerLength()
         #m = mass_per_length * length
         #nsm = prop.nsm
@@ -1135,27 +1451,7 @@ def _get_cbeam_mass_no_nsm(model: BDF, elem: CBEAM,
             str(centroid), str(elem.Centroid()), str(elem))
         raise RuntimeError(msg)
 
-    #nsm = (nsm_per_length + nsmi) * length
-    (x, y, z) = centroid - reference_point
-    (xm, ym, zm) = nsm_centroid - reference_point
-    x2 = x * x
-    y2 = y * y
-    z2 = z * z
-    xm2 = xm * xm
-    ym2 = ym * ym
-    zm2 = zm * zm
-
-    # Ixx, Iyy, Izz, Ixy, Ixz, Iyz
-    inertia[0] += m * (y2 + z2) + nsm * (ym2 + zm2)
-    inertia[1] += m * (x2 + z2) + nsm * (xm2 + zm2)
-    inertia[2] += m * (x2 + y2) + nsm * (xm2 + ym2)
-    inertia[3] += m * x * y + nsm * xm * ym
-    inertia[4] += m * x * z + nsm * xm * zm
-    inertia[5] += m * y * z + nsm * ym * zm
-    massi = m + nsm
-    mass += massi
-    cg += m * centroid + nsm * nsm_centroid
-    return mass
+    return [(m, centroid, None), (nsm, nsm_centroid, None)]
 
 def _get_tri_mass(model: BDF,
                   xyz: dict[int, np.ndarray],
@@ -1169,68 +1465,10 @@ def _get_tri_mass(model: BDF,
                   reference_point: np.ndarray) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, 'tri')
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3 = elem.node_ids[:3]
-        prop = elem.pid_ref
-        pid = elem.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3]) / 3.
-        area: float = 0.5 * norm(cross(xyz[n1] - xyz[n2], xyz[n1] - xyz[n3]))
-        #areas_prop[pid] += area
-        if prop.type == 'PSHELL':
-            tflag = elem.tflag
-            ti = prop.Thickness()
-            if tflag == 0:
-                # absolute
-                t1 = ti if elem.T1 is None else elem.T1
-                t2 = ti if elem.T2 is None else elem.T2
-                t3 = ti if elem.T3 is None else elem.T3
-            elif tflag == 1:
-                # relative
-                t1 = ti if elem.T1 is None else elem.T1 * ti
-                t2 = ti if elem.T2 is None else elem.T2 * ti
-                t3 = ti if elem.T3 is None else elem.T3 * ti
-            else:  # pragma: no cover
-                raise RuntimeError('tflag=%r' % tflag)
-            assert t1 + t2 + t3 > 0., 't1=%s t2=%s t3=%s' % (t1, t2, t3)
-            t = (t1 + t2 + t3) / 3.
-
-            # m/A = rho * A * t + nsm
-            #mass_per_area = elem.nsm + rho * elem.t
-
-            #areas_prop[pid] += area
-            mpa = prop.nsm + prop.Rho() * t
-            #mpa = elem.pid_ref.MassPerArea()
-        elif prop.type in ['PCOMP', 'PCOMPG']:
-            # TODO: do PCOMPs even support differential thickness?
-            #       I don't think so...
-
-            #rho_t = prop.get_rho_t()
-            #nsm = prop.nsm
-            #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-            #mpa = sum(rho_t) + nsm
-
-            # works for PCOMP
-            # F:\Program Files\Siemens\NXNastran\nxn10p1\nxn10p1\nast\tpl\cqr3compbuck.dat
-            mpa = prop.get_mass_per_area()
-        elif prop.type in ['PLPLANE', 'PPLANE']:
-            continue
-        else:
-            raise NotImplementedError(prop.type)
-        area_eids_pids['PSHELL'].append((eid, pid))
-        areas['PSHELL'].append(area)
-
-        nsm_centroids_area['PSHELL'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PSHELL'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        massi = area * mpa
-        if CHECK_MASS and not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
-        if eid in element_ids:
-            mass = _increment_inertia(centroid, reference_point, massi, mass, cg, inertia)
-    return mass
+    return _get_shell_mass(model, xyz, element_ids, eids2, 'tri',
+                           area_eids_pids, areas, nsm_centroids_area,
+                           mass, cg, inertia, reference_point,
+                           skip_properties={'PLPLANE', 'PPLANE'})
 
 def _get_quad_mass(model: BDF, xyz: dict[int, np.ndarray], element_ids: set[int], all_eids: np.ndarray,
                    #area
@@ -1242,85 +1480,121 @@ def _get_quad_mass(model: BDF, xyz: dict[int, np.ndarray], element_ids: set[int]
                    reference_point: np.ndarray) -> float:
     """helper method for ``get_mass_new``"""
     eids2 = get_sub_eids(all_eids, eids, 'quad')
-    for eid in eids2:
-        elem = model.elements[eid]
-        n1, n2, n3, n4 = elem.node_ids[:4]
-        prop = elem.pid_ref
-        pid = prop.pid
-        centroid = (xyz[n1] + xyz[n2] + xyz[n3] + xyz[n4]) / 4.
-        x31 = xyz[n3] - xyz[n1]
-        x42 = xyz[n4] - xyz[n2]
-        area: float = 0.5 * norm(cross(x31, x42))
-
-        if prop.type == 'PSHELL':
-            tflag = elem.tflag
-            ti = prop.Thickness()
-            if tflag == 0:
-                # absolute
-                t1 = ti if elem.T1 is None else elem.T1
-                t2 = ti if elem.T2 is None else elem.T2
-                t3 = ti if elem.T3 is None else elem.T3
-                t4 = ti if elem.T4 is None else elem.T4
-            elif tflag == 1:
-                # relative
-                t1 = ti if elem.T1 is None else elem.T1 * ti
-                t2 = ti if elem.T2 is None else elem.T2 * ti
-                t3 = ti if elem.T3 is None else elem.T3 * ti
-                t4 = ti if elem.T4 is None else elem.T4 * ti
-            else:  # pragma: no cover
-                raise RuntimeError('tflag=%r' % tflag)
-            assert t1 + t2 + t3 + t4 > 0., 't1=%s t2=%s t3=%s t4=%s' % (t1, t2, t3, t4)
-            t = (t1 + t2 + t3 + t4) / 4.
-
-            # m/A = rho * A * t + nsm
-            #mass_per_area = model.nsm + rho * model.t
-
-            #areas_prop[pid] += area
-            rho = prop.Rho()
-            mpa = prop.nsm + rho * t
-            #mpa = elem.pid_ref.MassPerArea()
-            #m = mpa * area
-        elif prop.type in ['PCOMP', 'PCOMPG']:
-            # PCOMP, PCOMPG
-            #rho_t = prop.get_rho_t()
-            #nsm = prop.nsm
-            #rho_t = [mat.Rho() * t for (mat, t) in zip(prop.mids_ref, prop.ts)]
-            #mpa = sum(rho_t) + nsm
-            mpa = prop.get_mass_per_area()
-        elif prop.type in ['PLPLANE', 'PPLANE', 'PMIC']:
-            continue
-            #raise NotImplementedError(prop.type)
+    return _get_shell_mass(model, xyz, element_ids, eids2, 'quad',
+                           area_eids_pids, areas, nsm_centroids_area,
+                           mass, cg, inertia, reference_point,
+                           skip_properties={'PLPLANE', 'PPLANE', 'PMIC'})
+
+def _get_shell_mass(model: BDF, xyz: dict[int, np.ndarray],
+                    element_ids: set[int], eids: np.ndarray, group: str,
+                    #area
+                    area_eids_pids: dict[str, list[tuple[int, int]]],
+                    areas: dict[str, list[float]],
+                    nsm_centroids_area: dict[str, list[np.ndarray]],
+                    #other
+                    mass: float, cg: np.ndarray, inertia: np.ndarray,
+                    reference_point: np.ndarray,
+                    skip_properties: set[str]) -> float:
+    """helper method for ``_get_tri_mass`` and ``_get_quad_mass``"""
+    elements, area, centroid = _get_group_geometry(model, xyz, eids, group)
+    mass_per_areas: dict[tuple[Any, ...], Optional[float]] = {}
+    mpa_list = []
+    is_mass_list = []
+    for elem in elements:
+        key = (elem.pid, elem.tflag, tuple(elem.get_thickness_scale()))
+        if key in mass_per_areas:
+            mpa = mass_per_areas[key]
         else:
-            raise NotImplementedError(prop.type)
-        area_eids_pids['PSHELL'].append((eid, pid))
-        areas['PSHELL'].append(area)
-        nsm_centroids_area['PSHELL'].append(centroid)
-        #nsm = property_nsms[nsm_id]['PSHELL'][pid] + element_nsms[nsm_id][eid]
-        #m = area * (mpa + nsm)
-        m = area * mpa
-        if CHECK_MASS and not np.array_equal(centroid, elem.Centroid()):  # pragma: no cover
-            msg = 'centroid_new=%s centroid_old=%s\n%s' % (
-                str(centroid), str(elem.Centroid()), str(elem))
-            raise RuntimeError(msg)
-        #elem = model.elements[eid]
-
-        #mass_expected = elem.Mass()
-        #if not np.allclose(m, mass_expected):  # pragma: no cover
-            #msg = 'massi=%s expected=%s' % (m, mass_expected)
-            #for node in elem.nodes_ref:
-                #node.comment = ''
-            #elem.comment = ''
-            #prop.comment = ''
-            #prop.mid1_ref.comment = ''
-            #msg += elem.get_stats()
-            #msg += prop.get_stats()
-            #msg += prop.mid_ref.get_stats()
-            #raise RuntimeError(msg)
-        #print('eid=%s type=%s mass=%s; area=%s mpa=%s'  % (elem.eid, elem.type, m, area, mpa))
-        if eid in element_ids:
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, inertia)
+            mpa = _get_shell_mass_per_area_nsm(elem, skip_properties)
+            mass_per_areas[key] = mpa
+        is_mass_list.append(mpa is not None)
+        if mpa is not None:
+            mpa_list.append(mpa)
+
+    is_mass = np.array(is_mass_list, dtype='bool')
+    eids = eids[is_mass]
+    area = area[is_mass]
+    centroid = centroid[is_mass, :]
+    area_eids_pids['PSHELL'].extend(
+        (eid, elem.pid_ref.pid) for eid, elem, is_massi in zip(eids, elements, is_mass_list)
+        if is_massi)
+    areas['PSHELL'].extend(area)
+    nsm_centroids_area['PSHELL'].extend(centroid)
+    #nsm = property_nsms[nsm_id]['PSHELL'][pid] + element_nsms[nsm_id][eid]
+    #m = area * (mpa + nsm)
+    m = area * np.array(mpa_list, dtype='float64')
+    mass = _increment_inertia_subset(
+        eids, element_ids, centroid, reference_point, m, mass, cg, inertia)
     return mass
 
+def _get_shell_mass_per_area_nsm(elem: Element,
+                                 skip_properties: set[str]) -> Optional[float]:
+    """
+    Gets the mass per area of a shell for ``mass_properties_nsm``
+
+    Returns
+    -------
+    mpa : float / None
+        the mass per area; None if the property is skipped (e.g., PLPLANE)
+
+    """
+    prop = elem.pid_ref
+    if prop.type == 'PSHELL':
+        tflag = elem.tflag
+        ti = prop.Thickness()
+        tscales = elem.get_thickness_scale()
+        if tflag == 0:
+            # absolute
+            thicknesses = [ti if tscale is None else tscale for tscale in tscales]
+        elif tflag == 1:
+            # relative
+            thicknesses = [ti if tscale is None else tscale * ti for tscale in tscales]
+        else:  # pragma: no cover
+            raise RuntimeError('tflag=%r' % tflag)
+        assert sum(thicknesses) > 0., 'thicknesses=%s' % thicknesses
+        t = sum(thicknesses) / len(thicknesses)
+
+        # m/A = rho * A * t + nsm
+        #mass_per_area = elem.nsm + rho * elem.t
+        mpa = prop.nsm + prop.Rho() * t
+        #mpa = elem.pid_ref.MassPerArea()
+    elif prop.type in ['PCOMP', 'PCOMPG']:
+        # works for PCOMP
+        # F:\Program Files\Siemens\NXNastran\nxn10p1\nxn10p1\nast\tpl\cqr3compbuck.dat
+        mpa = prop.get_mass_per_area()
+    elif prop.type in skip_properties:
+        mpa = None
+    else:
+        raise NotImplementedError(prop.type)
+    return mpa
+
+def _get_group_geometry(model: BDF, xyz: dict[int, np.ndarray],
+                        eids: np.ndarray,
+                        group: str) -> tuple[list[Element], np.ndarray, np.ndarray]:
+    """
+    Gets the elements and the area/volume/length and centroid of a group
+    of elements (see ``_get_measure_centroid``)
+    """
+    nnodes = MASS_GROUP_NNODES[group]
+    elements = [model.elements[eid] for eid in eids]
+    nids = np.array([elem.node_ids[:nnodes] for elem in elements],
+                    dtype='int64').reshape(len(elements), nnodes)
+    unids, inverse = np.unique(nids, return_inverse=True)
+    xyz_unique = np.array([xyz[nid] for nid in unids.tolist()],
+                          dtype='float64').reshape(len(unids), 3)
+    measure, centroid = _get_measure_centroid(
+        group, xyz_unique[inverse.reshape(nids.shape), :])
+    return elements, measure, centroid
+
+def _increment_inertia_subset(eids: np.ndarray, element_ids: set[int],
+                              centroids: np.ndarray, reference_point: np.ndarray,
+                              masses: np.ndarray, mass: float,
+                              cg: np.ndarray, inertia: np.ndarray) -> float:
+    """``_increment_inertia_array`` for the elements in element_ids"""
+    is_used = np.array([eid in element_ids for eid in eids.tolist()], dtype='bool')
+    return _increment_inertia_array(
+        centroids[is_used, :], reference_point, masses[is_used], mass, cg, inertia)
+
 def _get_cshear_mass(model: BDF,
                      xyz: dict[int, np.ndarray],
                      element_ids_set: set[int],
@@ -1510,15 +1784,14 @@ def _combine_prop_weighted_area_length_simple(model: BDF,
         if debug:
             model.log.debug('dividing by %s=%s' % (word, area_sum))
 
-    for eid, areai, centroid in zip(eids, area, centroids):
-        #area_sum += areai
-        m = nsm_value * areai
-        if debug:  # pragma: no cover
+    masses = nsm_value * area
+    if debug:  # pragma: no cover
+        for eid, areai, m in zip(eids, area, masses):
             model.log.debug('  eid=%s %si=%s nsm_value=%s mass=%s %s=%s' % (
                 eid, word, areai, nsm_value, m, word, areai))
-        #elem = model.elements[eid]
-        #assert np.allclose(m, elem.Mass()), elem.get_stats()
-        mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+    #elem = model.elements[eid]
+    #assert np.allclose(m, elem.Mass()), elem.get_stats()
+    mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     if debug:  # pragma: no cover
         model.log.debug('mass = %s' % mass)
     return mass
@@ -1556,14 +1829,13 @@ def _combine_prop_weighted_area_length(
         centroids = nsm_centroidsi[ipid, :]
 
         area2 = area / area_sum
-        for areai, centroid in zip(area2, centroids):
-            #print('  areai=%s area_sum=%s nsm_value=%s' % (areai*area_sum, area_sum, nsm_value))
-            m = nsm_value * areai
-            if debug:  # pragma: no cover
+        masses = nsm_value * area2
+        if debug:  # pragma: no cover
+            for areai, m in zip(area2, masses):
                 model.log.debug('  %si=%s %s_sum=%s nsm_value=%s mass=%s' % (
                     word, areai*area_sum, word, area_sum, nsm_value, m))
-            #assert np.allclose(m, elem.Mass()), elem.get_stats()
-            mass = _increment_inertia(centroid, reference_point, m, mass, cg, I)
+        #assert np.allclose(m, elem.Mass()), elem.get_stats()
+        mass = _increment_inertia_array(centroids, reference_point, masses, mass, cg, I)
     return mass
 
 def _apply_nsm(model: BDF, nsm_id: int,
@@ -2037,12 +2309,8 @@ def _nsm1_element(model: BDF, nsm: NSM1,
         #area_sum_str = ''
         area_length_actual2 = area_length_actual
 
-    for eid, area_lengthi, centroid in zip(eids_actual, area_length_actual2, nsm_centroid):
-        massi = nsm_value * area_lengthi
-        #if debug:  # pragma: no cover
-            #print('  eid=%s %si=%s %snsm_value=%s mass=%s' % (
-                #eid, word, area_lengthi, area_sum_str, nsm_value, massi))
-        mass = _increment_inertia(centroid, reference_point, massi, mass, cg, I)
+    masses = nsm_value * area_length_actual2
+    mass = _increment_inertia_array(nsm_centroid, reference_point, masses, mass, cg, I)
     return mass
 
 def _get_sym_axis(model, sym_axis):
@@ -2,11 +2,11 @@
 Defines:
  - pierce_shell_model(bdf_filename, xyz_points, tol=1.0)
 """
-from itertools import count
+import warnings
 from typing import Optional, Union, Any
 import numpy as np
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+from pyNastran.bdf.mesh_utils.ray_cast import ShellRayCaster
 
 
 def quad_intersection(orig: np.ndarray, direction: np.ndarray,
@@ -84,6 +84,9 @@ def pierce_shell_model(bdf_filename: Union[BDF, str], xyz_points: Any,
     Pierces a shell model with a <0., 0., 1.> vector.  In other words,
     models are pierced in the xy plane.
 
+    The elements are found with a ``ShellRayCaster``, so use that
+    directly for rays in other directions.
+
     Parameters
     ----------
     bdf_filename : str / BDF()
@@ -91,8 +94,8 @@ def pierce_shell_model(bdf_filename: Union[BDF, str], xyz_points: Any,
     xyz_points : (npoints, 3) float ndarray
         the xyz_points to pierce
     tol : float; default=1.0
-        the pierce tolerance
-        pick a value that is ~3x the max local element edge length
+        deprecated and unused; the elements were previously found by a
+        search of the element centroids within tol
 
     Returns
     -------
@@ -109,126 +112,39 @@ def pierce_shell_model(bdf_filename: Union[BDF, str], xyz_points: Any,
         None : invalid pierce
 
     """
-    xyz_points = np.asarray(xyz_points)
+    if tol != 1.0:
+        warnings.warn('pierce_shell_model: tol is deprecated and unused; '
+                      'the pierced elements are found exactly', DeprecationWarning)
+    xyz_points = np.asarray(xyz_points, dtype='float64')
     assert xyz_points.shape[1] == 3, xyz_points.shape
-    xy_points = xyz_points[:, :2].copy()
-    assert xy_points.shape[1] == 2, xy_points.shape
 
     if isinstance(bdf_filename, BDF):
         model = bdf_filename
     else:
         model = read_bdf(bdf_filename)
 
-    eids = []
-    centroids = []
-    etypes_to_skip = [
-        'CHEXA', 'CPENTA', 'CTETRA', 'CPYRAM',
-        'CBUSH', 'CBUSH1D', 'CBUSH2D',
-        'CBEAM', 'CROD', 'CONROD',
-        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
-        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-    ]
-    for eid, elem in model.elements.items():
-        if elem.type in ['CQUAD4', 'CTRIA3']:
-            centroid = elem.Centroid()
-        elif elem.type in etypes_to_skip:
-            continue
-        else:
-            print(elem.type)
-            #raise NotImplementedError(elem)
-            continue
-        eids.append(eid)
-        centroids.append(centroid)
-    eids = np.array(eids, dtype='int32')
-    assert len(eids) > 0, 'eids=%s\n' % eids
-    centroids_xy = np.array(centroids, dtype='float64')[:, :2]
-
-    #print('centroids:\n%s\n' % str(centroids_xy))
-    assert centroids_xy.shape[1] == 2, centroids_xy.shape
-
-
-    msg = 'which is required by pierce_shell_model'
-    kdt = _get_tree(centroids_xy, msg=msg)
-    results = kdt.query_ball_point(xy_points, tol)
-    nresults = len(results)
-    iresults = np.arange(nresults)
-    #print(results)
-    #print(iresults)
-
-    nan3 = np.full(3, np.nan, dtype='float64') # was None
-    direction = np.array([0., 0., 1.])
-    ipoints = []
-    eids_pierce = []
-    xyz_pierces_max = []
-    node_ids = []
-    for i, xyz_point, eidsi in zip(count(), xyz_points, results):
-        model.log.debug('eidsi = [%s]' % ', '.join([str(eidii).rstrip('L') for eidii in eidsi]))
-        if not eidsi:
-            ipoints.append(i)
-            eids_pierce.append(None)
-            xyz_pierces_max.append(nan3)
-            node_ids.append(None)
-            model.log.warning('skipping %s because it failed tolerancing (tol=%s)' % (xyz_point, tol))
-            continue
-
-        model.log.debug('xyz_point = %s' % xyz_point)
-        eidsi2 = eids[eidsi]
-        eids_newi = []
-        piercesi = []
-        zpiercesi = []
-        for eid in eidsi2:
-            elem = model.elements[eid]
-            if elem.type == 'CQUAD4':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                v3 = elem.nodes_ref[3].get_position()
-                xyz_pierce = quad_intersection(xyz_point, direction, v0, v1, v2, v3)
-            elif elem.type == 'CTRIA3':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                xyz_pierce = triangle_intersection(xyz_point, direction, v0, v1, v2)
-            else:
-                raise NotImplementedError(elem)
-
-            if xyz_pierce is None:
-                #model.log.warning('failed to pierce eid=%s' % eid)
-                continue
-
-            zpierce = xyz_pierce[2]
-            model.log.debug('  eid=%s xyz_pierce=%s zpierce=%s' % (eid, xyz_pierce, zpierce))
-            eids_newi.append(eid)
-            piercesi.append(xyz_pierce)
-            zpiercesi.append(zpierce)
-
-        if len(zpiercesi) == 0:
-            ipoints.append(i)
-            eids_pierce.append(None)
-            xyz_pierces_max.append(nan3)
-            node_ids.append(None)
-            model.log.warning('skipping %s because no pierces found (tol=%s)' % (xyz_point, tol))
-            continue
-
-        #print('zpiercesi = %s' % zpiercesi)
-        zpiercesi_max = max(zpiercesi)
-        ipierce_max = zpiercesi.index(zpiercesi_max)
-        eid_max = eids_newi[ipierce_max]
-        xyz_piercei_max = piercesi[ipierce_max]
-        model.log.debug('i=%s xyz_point=%s xyz_piercei_max=%s zpiercesi=%s zmax=%s eid_max=%s' % (
-            i, xyz_point, xyz_piercei_max,
-            zpiercesi, zpiercesi_max, eid_max))
-
-        ipoints.append(i)
-        eids_pierce.append(eid_max)
-        xyz_pierces_max.append(xyz_piercei_max)
-        #print(model.elements[eid_max])
-        node_ids.append(model.elements[eid_max].node_ids)
-
-    xyz_pierces_max = np.array(xyz_pierces_max)
-    model.log.debug('ipoints=%s' % ipoints)
-    model.log.info('eids_pierce=%s' % eids_pierce)
-    model.log.info('xyz_pierces_max:\n%s' % xyz_pierces_max)
-    model.log.info('node_ids=%s' % node_ids)
-
+    caster = ShellRayCaster.from_model(model)
+
+    # cast down from above the model, so the first hit has the largest z
+    zmax = np.nanmax(caster.tri_xyz[:, :, 2])
+    origins = xyz_points.copy()
+    origins[:, 2] = zmax + 1.0
+    direction = np.array([0., 0., -1.])
+    eids, xyz_pierces_max, unused_weights, node_ids_array = caster.intersect(
+        origins, direction)
+
+    is_pierced = eids >= 0
+    npoints = len(eids)
+    nmissed = npoints - is_pierced.sum()
+    if nmissed:
+        model.log.warning(f'{nmissed} of {npoints} points failed to pierce; '
+                          f'xyz_points[imissed]=\n{xyz_points[~is_pierced]}')
+
+    eids_pierce = [eid if is_piercedi else None
+                   for eid, is_piercedi in zip(eids.tolist(), is_pierced.tolist())]
+    node_ids = [[nid for nid in nids if nid != 0] if is_piercedi else None
+                for nids, is_piercedi in zip(node_ids_array.tolist(), is_pierced.tolist())]
+    model.log.debug('eids_pierce=%s' % eids_pierce)
+    model.log.debug('xyz_pierces_max:\n%s' % xyz_pierces_max)
+    model.log.debug('node_ids=%s' % node_ids)
     return eids_pierce, xyz_pierces_max, node_ids
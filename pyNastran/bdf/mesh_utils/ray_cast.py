@@ -0,0 +1,464 @@
+"""
+defines:
+ - caster = ShellRayCaster.from_model(model, element_ids=None, leaf_size=4)
+ - eids, xyz, weights, node_ids = caster.intersect(origins, directions)
+ - eids, xyz, weights, node_ids = ray_cast_shells(model, origins, directions)
+
+Casts many rays of arbitrary direction at the shell elements of a model
+(e.g., to map CFD pressures or point loads onto an FE skin).
+
+The shells are split into triangles (quads are split along the 1-3
+diagonal), which are stored in a bounding volume hierarchy (BVH).  The
+BVH is a complete binary tree over the sorted triangles, where each box
+is split at the median of its longest axis, so it's built with numpy.
+The rays are traversed through the tree one level at a time, so each
+level is one vectorized box test for all the (ray, box) pairs of a batch
+of rays.
+
+Example
+-------
+>>> caster = ShellRayCaster.from_model(model)
+>>> eids, xyz, weights, node_ids = caster.intersect(origins, directions)
+>>> # the force at the hit point mapped to the element nodes
+>>> node_forces = weights[:, :, np.newaxis] * forces[:, np.newaxis, :]
+
+"""
+from __future__ import annotations
+from typing import Optional, Union, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.mesh_utils.element_connectivity import get_element_node_arrays
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+TRI_ELEMENTS = {'CTRIA3', 'CTRIAR', 'CTRIA6'}
+QUAD_ELEMENTS = {'CQUAD4', 'CQUADR', 'CQUAD8', 'CQUAD'}
+
+#: the corner nodes of the triangles of a quad (see ``quad_intersection``)
+_QUAD_TRIS = np.array([[0, 1, 2], [0, 2, 3]])
+
+
+class ShellRayCaster:
+    """
+    Intersects rays with a set of triangles (e.g., the shells of a model)
+    """
+    def __init__(self, tri_xyz: np.ndarray, tri_eids: np.ndarray,
+                 tri_node_ids: np.ndarray, tri_inodes: np.ndarray,
+                 leaf_size: int=4):
+        """
+        Builds the BVH
+
+        Parameters
+        ----------
+        tri_xyz : (ntri, 3, 3) float ndarray
+            the xyz of the corners of the triangles
+        tri_eids : (ntri, ) int ndarray
+            the element id of each triangle
+        tri_node_ids : (ntri, 4) int ndarray
+            the corner node ids of the element of each triangle;
+            0 is a blank node (e.g., a CTRIA3)
+        tri_inodes : (ntri, 3) int ndarray
+            the corners of the triangle in tri_node_ids
+            (e.g., [0, 2, 3] for the 2nd triangle of a quad)
+        leaf_size : int; default=4
+            the max number of triangles in a leaf of the BVH
+
+        """
+        tri_xyz = np.asarray(tri_xyz, dtype='float64')
+        ntri = tri_xyz.shape[0]
+        assert ntri > 0, 'ntriangles=0'
+        assert tri_xyz.shape == (ntri, 3, 3), tri_xyz.shape
+        assert leaf_size > 0, leaf_size
+
+        isort = _median_split_order(tri_xyz.mean(axis=1), leaf_size)
+        self.tri_xyz = tri_xyz[isort]
+        self.tri_eids = np.asarray(tri_eids)[isort]
+        self.tri_node_ids = np.asarray(tri_node_ids)[isort]
+        self.tri_inodes = np.asarray(tri_inodes)[isort]
+        self.leaf_size = leaf_size
+        self.boxes = _build_bvh(self.tri_xyz, leaf_size)
+
+        # the (3, ntri) corner/edges for _ray_triangle_intersection
+        self._v0 = np.ascontiguousarray(self.tri_xyz[:, 0, :].T)
+        self._e1 = np.ascontiguousarray((self.tri_xyz[:, 1, :] - self.tri_xyz[:, 0, :]).T)
+        self._e2 = np.ascontiguousarray((self.tri_xyz[:, 2, :] - self.tri_xyz[:, 0, :]).T)
+        self._scale = np.linalg.norm(self._e1, axis=0) * np.linalg.norm(self._e2, axis=0)
+
+    @classmethod
+    def from_model(cls, model: BDF, element_ids: Optional[list[int]]=None,
+                   leaf_size: int=4) -> ShellRayCaster:
+        """
+        Builds the BVH from the shells of a model
+
+        Parameters
+        ----------
+        model : BDF()
+            the model; doesn't need to be cross-referenced
+        element_ids : list[int]; default=None -> all elements
+            a subset of elements to consider
+        leaf_size : int; default=4
+            the max number of triangles in a leaf of the BVH
+
+        The corner nodes of the CTRIA3/CTRIAR/CTRIA6/CQUAD4/CQUADR/CQUAD8/CQUAD
+        elements are used, so the mid-side nodes are ignored.
+
+        """
+        log = model.log
+        out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int64')
+        nid_cp_cd, xyz_cid0 = out[:2]
+        all_nids = nid_cp_cd[:, 0]
+        nall_nids = len(all_nids)
+
+        groups = get_element_node_arrays(model, TRI_ELEMENTS | QUAD_ELEMENTS,
+                                         element_ids=element_ids)
+        tri_xyz_list = []
+        tri_eids_list = []
+        tri_node_ids_list = []
+        tri_inodes_list = []
+        for (card_class, unused_nnodes), (eids, unused_positions, nids) in groups.items():
+            if card_class.type in TRI_ELEMENTS:
+                ncorners = 3
+                itris = _QUAD_TRIS[:1]
+            else:
+                ncorners = 4
+                itris = _QUAD_TRIS
+            corner_nids = nids[:, :ncorners]
+            inids = np.searchsorted(all_nids, corner_nids)
+            inids[inids == nall_nids] = 0
+            is_valid = np.all(all_nids[inids] == corner_nids, axis=1) if nall_nids else (
+                np.zeros(len(eids), dtype='bool'))
+            if not np.all(is_valid):
+                log.warning(f'skipping {card_class.type} eids={eids[~is_valid].tolist()} '
+                            'because they reference missing nodes')
+                eids = eids[is_valid]
+                corner_nids = corner_nids[is_valid, :]
+                inids = inids[is_valid, :]
+
+            node_ids = np.zeros((len(eids), 4), dtype='int64')
+            node_ids[:, :ncorners] = corner_nids
+            for itri in itris:
+                tri_xyz_list.append(xyz_cid0[inids[:, itri], :])
+                tri_eids_list.append(eids)
+                tri_node_ids_list.append(node_ids)
+                tri_inodes_list.append(np.tile(itri, (len(eids), 1)))
+
+        if len(tri_xyz_list) == 0:
+            raise RuntimeError('no shell elements were found, which are '
+                               'required by ShellRayCaster')
+        return cls(np.vstack(tri_xyz_list), np.hstack(tri_eids_list),
+                   np.vstack(tri_node_ids_list), np.vstack(tri_inodes_list),
+                   leaf_size=leaf_size)
+
+    def intersect(self, origins: np.ndarray, directions: np.ndarray,
+                  tmin: float=0.0, tmax: float=np.inf,
+                  batch_size: int=100_000) -> tuple[np.ndarray, np.ndarray,
+                                                    np.ndarray, np.ndarray]:
+        """
+        Finds the closest triangle hit by each ray
+
+        Parameters
+        ----------
+        origins : (nrays, 3) float ndarray
+            the starting points of the rays
+        directions : (nrays, 3) / (3, ) float ndarray
+            the directions of the rays; doesn't need to be normalized
+        tmin / tmax : float; default=0.0 / inf
+            the range of the ray parameter t, where the hit point is
+            ``origin + t * direction``; use tmin=-inf to consider a line
+            instead of a ray
+        batch_size : int; default=100_000
+            the number of rays that are traversed at once, which limits
+            the memory use
+
+        Returns
+        -------
+        eids : (nrays, ) int ndarray
+            the element id; -1 is a miss
+        xyz : (nrays, 3) float ndarray
+            the hit point; nan is a miss
+        weights : (nrays, 4) float ndarray
+            the barycentric coordinates of the hit point in terms of the
+            element corner nodes (e.g., the shape functions); the 4th
+            column is 0.0 for triangles; 0.0 is a miss
+        node_ids : (nrays, 4) int ndarray
+            the element corner node ids; 0 is a blank node or a miss
+
+        If there are multiple hits, the one with the smallest abs(t) is used.
+
+        """
+        origins = np.atleast_2d(np.asarray(origins, dtype='float64'))
+        nrays = origins.shape[0]
+        directions = np.asarray(directions, dtype='float64')
+        if directions.ndim == 1:
+            directions = np.tile(directions, (nrays, 1))
+        assert origins.shape == (nrays, 3), origins.shape
+        assert directions.shape == (nrays, 3), directions.shape
+
+        itri = np.full(nrays, -1, dtype='int64')
+        xyz = np.full((nrays, 3), np.nan, dtype='float64')
+        weights = np.zeros((nrays, 4), dtype='float64')
+        for i0 in range(0, nrays, batch_size):
+            i1 = min(i0 + batch_size, nrays)
+            itrii, xyzi, bary = self._intersect_batch(
+                origins[i0:i1, :], directions[i0:i1, :], tmin, tmax)
+            ihit = np.flatnonzero(itrii >= 0)
+            itrii = itrii[ihit]
+            ihit += i0
+            itri[ihit] = itrii
+            xyz[ihit, :] = xyzi
+
+            # scatter the barycentric coordinates to the element nodes
+            inodes = self.tri_inodes[itrii]
+            ihit2 = np.repeat(ihit, 3)
+            weights[ihit2, inodes.ravel()] = bary.ravel()
+
+        is_hit = itri >= 0
+        eids = np.full(nrays, -1, dtype=self.tri_eids.dtype)
+        eids[is_hit] = self.tri_eids[itri[is_hit]]
+        node_ids = np.zeros((nrays, 4), dtype=self.tri_node_ids.dtype)
+        node_ids[is_hit, :] = self.tri_node_ids[itri[is_hit]]
+        return eids, xyz, weights, node_ids
+
+    def _intersect_batch(self, origins: np.ndarray, directions: np.ndarray,
+                         tmin: float, tmax: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Intersects a batch of rays
+
+        Returns
+        -------
+        itri : (nrays, ) int ndarray
+            the index of the hit triangle; -1 is a miss
+        xyz : (nhits, 3) float ndarray
+            the hit points
+        bary : (nhits, 3) float ndarray
+            the barycentric coordinates of the hits for the triangle corners
+
+        """
+        nrays = origins.shape[0]
+        origins_t = np.ascontiguousarray(origins.T)
+        directions_t = np.ascontiguousarray(directions.T)
+        with np.errstate(divide='ignore'):
+            inv_directions_t = 1.0 / directions_t
+
+        # traverse the tree one level at a time; iray stays sorted
+        iray = np.arange(nrays)
+        ibox = np.zeros(nrays, dtype='int64')
+        nlevels = len(self.boxes)
+        for ilevel, (box_min, box_max) in enumerate(self.boxes):
+            is_hit = _ray_box_intersection(
+                origins_t[:, iray], inv_directions_t[:, iray],
+                box_min[:, ibox], box_max[:, ibox], tmin, tmax)
+            iray = iray[is_hit]
+            ibox = ibox[is_hit]
+            if ilevel < nlevels - 1:
+                iray = np.repeat(iray, 2)
+                ibox = np.repeat(2 * ibox, 2)
+                ibox[1::2] += 1
+
+        # expand the leaves to their triangles
+        ntri = self.tri_xyz.shape[0]
+        istart = ibox * self.leaf_size
+        counts = np.clip(ntri - istart, 0, self.leaf_size)
+        iray = np.repeat(iray, counts)
+        offsets = np.arange(len(iray)) - np.repeat(np.cumsum(counts) - counts, counts)
+        itri = np.repeat(istart, counts) + offsets
+
+        t, u, v, is_hit = _ray_triangle_intersection(
+            origins_t[:, iray], directions_t[:, iray],
+            self._v0[:, itri], self._e1[:, itri], self._e2[:, itri], self._scale[itri],
+            tmin, tmax)
+        ihit = np.flatnonzero(is_hit)
+        iray = iray[ihit]
+
+        # the closest hit of each ray
+        itri_out = np.full(nrays, -1, dtype='int64')
+        if len(iray) == 0:
+            return itri_out, np.zeros((0, 3)), np.zeros((0, 3))
+        tabs = np.abs(t[ihit])
+        igroup = np.flatnonzero(np.diff(iray, prepend=-1))
+        tabs_min = np.minimum.reduceat(tabs, igroup)
+        is_min = tabs == np.repeat(tabs_min, np.diff(np.append(igroup, len(iray))))
+        imin = np.flatnonzero(is_min)
+        imin = imin[np.diff(iray[imin], prepend=-1) != 0]
+
+        iray = iray[imin]
+        ihit = ihit[imin]
+        itri_out[iray] = itri[ihit]
+        t = t[ihit]
+        u = u[ihit]
+        v = v[ihit]
+        xyz = origins[iray, :] + t[:, np.newaxis] * directions[iray, :]
+        bary = np.column_stack([1.0 - u - v, u, v])
+        return itri_out, xyz, bary
+
+
+def _median_split_order(centroids: np.ndarray, leaf_size: int) -> np.ndarray:
+    """
+    Sorts the triangles, so each box of the complete binary tree
+    (see ``_build_bvh``) is split at the median of its longest axis
+
+    The boxes of a level are split at once by sorting on a
+    (box, coordinate of the longest axis of the box) key.
+    """
+    ntri = centroids.shape[0]
+    nlevels = _get_nlevels(ntri, leaf_size)
+    isort = np.arange(ntri)
+    irow = np.arange(ntri)
+    for ilevel in range(nlevels - 1):
+        # the number of triangles in a box of the level
+        nbox = leaf_size * 2 ** (nlevels - 1 - ilevel)
+        ibox = irow // nbox
+        xyz = centroids[isort, :]
+        istart = np.arange(0, ntri, nbox)
+        xyz_min = np.minimum.reduceat(xyz, istart, axis=0)
+        dxyz = np.maximum.reduceat(xyz, istart, axis=0) - xyz_min
+        iaxis = dxyz.argmax(axis=1)
+        dmax = dxyz[np.arange(len(istart)), iaxis]
+        dmax[dmax == 0.] = 1.
+
+        # the box id + the coordinate in the box scaled to [0, 1), which
+        # is faster than lexsort
+        iaxis = iaxis[ibox]
+        key = ibox + 0.999 * (xyz[irow, iaxis] - xyz_min[ibox, iaxis]) / dmax[ibox]
+        isort = isort[np.argsort(key)]
+    return isort
+
+
+def _get_nlevels(ntri: int, leaf_size: int) -> int:
+    """gets the number of levels of the complete binary tree"""
+    nleaves = (ntri + leaf_size - 1) // leaf_size
+    return int(np.ceil(np.log2(nleaves))) + 1 if nleaves > 1 else 1
+
+
+def _build_bvh(tri_xyz: np.ndarray, leaf_size: int) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Builds a complete binary tree of boxes over the sorted triangles
+
+    Returns
+    -------
+    boxes : list[(box_min, box_max)]
+        the boxes of each level from the root (1 box) to the leaves
+        (2**(nlevels-1) boxes); box_min/box_max are (3, nboxes) float
+        ndarrays; the unused leaves are nan, so they're never hit
+
+    """
+    ntri = tri_xyz.shape[0]
+    nleaves = (ntri + leaf_size - 1) // leaf_size
+    nlevels = _get_nlevels(ntri, leaf_size)
+    nleaves_all = 2 ** (nlevels - 1)
+
+    # pad the boxes a bit, so flat triangles (e.g., in the xy plane)
+    # and rays on the edges of a box are hit
+    tri_min = tri_xyz.min(axis=1)
+    tri_max = tri_xyz.max(axis=1)
+    tol = 1e-9 * max(float(np.abs(tri_max - tri_min).max()), 1.0)
+    istart = np.arange(0, ntri, leaf_size)
+    leaf_min = np.full((nleaves_all, 3), np.nan)
+    leaf_max = np.full((nleaves_all, 3), np.nan)
+    leaf_min[:nleaves, :] = np.minimum.reduceat(tri_min, istart, axis=0) - tol
+    leaf_max[:nleaves, :] = np.maximum.reduceat(tri_max, istart, axis=0) + tol
+
+    box_min = leaf_min.T
+    box_max = leaf_max.T
+    boxes = [(box_min, box_max)]
+    for unused_ilevel in range(nlevels - 1):
+        # fmin/fmax ignore the nan boxes
+        box_min = np.fmin(box_min[:, 0::2], box_min[:, 1::2])
+        box_max = np.fmax(box_max[:, 0::2], box_max[:, 1::2])
+        boxes.append((box_min, box_max))
+    boxes.reverse()
+    return boxes
+
+
+def _ray_box_intersection(origins: np.ndarray, inv_directions: np.ndarray,
+                          box_min: np.ndarray, box_max: np.ndarray,
+                          tmin: float, tmax: float) -> np.ndarray:
+    """
+    Vectorized slab test; the arrays are (3, n), so each axis is
+    contiguous; nan boxes are missed
+    """
+    tnear = np.full(origins.shape[1], tmin)
+    tfar = np.full(origins.shape[1], tmax)
+    with np.errstate(invalid='ignore'):
+        for i in range(3):
+            t1 = (box_min[i] - origins[i]) * inv_directions[i]
+            t2 = (box_max[i] - origins[i]) * inv_directions[i]
+            # fmin/fmax handle 0*inf=nan for rays on a box face
+            tnear = np.fmax(tnear, np.fmin(t1, t2))
+            tfar = np.fmin(tfar, np.fmax(t1, t2))
+        # nan boxes are nan for every axis
+        return (tnear <= tfar) & ~np.isnan(box_min[0])
+
+
+def _ray_triangle_intersection(origins: np.ndarray, directions: np.ndarray,
+                               v0: np.ndarray, e1: np.ndarray, e2: np.ndarray,
+                               scale: np.ndarray, tmin: float, tmax: float,
+                               tol: float=1e-10) -> tuple[np.ndarray, np.ndarray,
+                                                          np.ndarray, np.ndarray]:
+    """
+    Vectorized Moller-Trumbore intersection (see ``triangle_intersection``)
+
+    Parameters
+    ----------
+    origins, directions : (3, n) float ndarray
+        the rays
+    v0 : (3, n) float ndarray
+        the first corner of the triangles
+    e1, e2 : (3, n) float ndarray
+        the edges from v0 to the 2nd/3rd corners
+    scale : (n, ) float ndarray
+        |e1| * |e2|, which is used to check for parallel rays
+
+    Returns
+    -------
+    t : (n, ) float ndarray
+        the ray parameter of the hit point
+    u, v : (n, ) float ndarray
+        the barycentric coordinates of the hit point for the 2nd/3rd corners
+    is_hit : (n, ) bool ndarray
+        is the triangle hit
+
+    """
+    dx, dy, dz = directions
+    pvec = _cross(dx, dy, dz, *e2)
+    det = e1[0] * pvec[0] + e1[1] * pvec[1] + e1[2] * pvec[2]
+
+    # the ray is parallel to the plane
+    dnorm = np.sqrt(dx * dx + dy * dy + dz * dz)
+    is_valid = np.abs(det) > 1e-12 * scale * dnorm
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_det = np.where(is_valid, 1.0 / det, 0.0)
+    tvec = origins - v0
+    u = (tvec[0] * pvec[0] + tvec[1] * pvec[1] + tvec[2] * pvec[2]) * inv_det
+    qvec = _cross(*tvec, *e1)
+    v = (dx * qvec[0] + dy * qvec[1] + dz * qvec[2]) * inv_det
+    t = (e2[0] * qvec[0] + e2[1] * qvec[1] + e2[2] * qvec[2]) * inv_det
+    is_hit = (is_valid & (u >= -tol) & (v >= -tol) & (u + v <= 1.0 + tol) &
+              (t >= tmin) & (t <= tmax))
+    return t, u, v, is_hit
+
+
+def _cross(ax: np.ndarray, ay: np.ndarray, az: np.ndarray,
+           bx: np.ndarray, by: np.ndarray, bz: np.ndarray) -> tuple[np.ndarray, ...]:
+    """the cross product of the columns of 2 vectors"""
+    return (ay * bz - az * by,
+            az * bx - ax * bz,
+            ax * by - ay * bx)
+
+
+def ray_cast_shells(model: BDF, origins: np.ndarray,
+                    directions: Union[np.ndarray, list[float]],
+                    element_ids: Optional[list[int]]=None,
+                    tmin: float=0.0, tmax: float=np.inf,
+                    batch_size: int=100_000) -> tuple[np.ndarray, np.ndarray,
+                                                      np.ndarray, np.ndarray]:
+    """
+    Intersects rays with the shells of a model
+    (see ``ShellRayCaster.intersect``)
+
+    Use ``ShellRayCaster.from_model`` to reuse the BVH.
+    """
+    caster = ShellRayCaster.from_model(model, element_ids=element_ids)
+    return caster.intersect(origins, directions, tmin=tmin, tmax=tmax,
+                            batch_size=batch_size)
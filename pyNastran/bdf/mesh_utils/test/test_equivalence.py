@@ -457,6 +457,72 @@ class TestEquiv(unittest.TestCase):
         model2 = read_bdf(bdf_filename_out, debug=None)
         assert len(model2.nodes) == 3, model2.nodes
 
+    def test_eq_pairs(self):
+        """method='pairs' merges chains of nodes and supports chunked trees"""
+        log = SimpleLogger(level='warning')
+        # 1-2-3 is a chain (1 and 3 aren't within tol)
+        xyzs = [
+            [0., 0., 0.],
+            [0., 0., 0.5],
+            [0., 0., 1.0],
+            [1., 0., 0.],
+            [1., 0., 0.],
+            [2., 0., 0.],
+        ]
+        for chunk_size in [None, 1, 2, 100]:
+            model = BDF(debug=False, log=log)
+            for nid, xyz in zip([1, 2, 3, 10, 11, 20], xyzs):
+                model.add_grid(nid, xyz)
+            model.add_conrod(1, 1, [3, 11], A=1.0)
+            model.add_conrod(2, 1, [2, 20], A=1.0)
+            model.add_mat1(1, 3.0e7, None, 0.3)
+
+            bdf_filename_out = DIRNAME / 'eq_pairs.bdf'
+            bdf_equivalence_nodes(model, bdf_filename_out, 0.6,
+                                  renumber_nodes=False, xref=True,
+                                  node_set=None, crash_on_collapse=False,
+                                  log=log, debug=False, method='pairs',
+                                  chunk_size=chunk_size)
+            model2 = save_check_nodes(bdf_filename_out, log, nnodes=3)
+            assert list(sorted(model2.nodes)) == [1, 10, 20], model2.nodes
+            assert model2.elements[1].node_ids == [1, 10], model2.elements[1]
+            assert model2.elements[2].node_ids == [1, 20], model2.elements[2]
+
+        model = BDF(debug=False, log=log)
+        for nid, xyz in zip([1, 2, 3, 10, 11, 20], xyzs):
+            model.add_grid(nid, xyz)
+        bdf_equivalence_nodes(model, bdf_filename_out, 0.6,
+                              xref=True, node_set=[[1, 2], [3, 10, 11]],
+                              log=log, debug=False, method='pairs')
+        model2 = save_check_nodes(bdf_filename_out, log, nnodes=4)
+        assert list(sorted(model2.nodes)) == [1, 3, 10, 20], model2.nodes
+
+    def test_eq_pairs_compact(self):
+        """method='pairs' renumbers the array-backed elements"""
+        log = SimpleLogger(level='warning')
+        model = BDF(debug=False, log=log)
+        model.use_compact_storage = True
+        bdf_filename = DIRNAME / 'eq_pairs_compact.bdf'
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.,0.,0.\n'
+                'GRID,2,,1.,0.,0.\n'
+                'GRID,3,,1.,1.,0.\n'
+                'GRID,4,,1.,1.,0.\n'
+                'GRID,5,,0.,1.,0.\n'
+                'CTRIA3,1,1,1,2,3\n'
+                'CTRIA3,2,1,1,4,5\n'
+                'PSHELL,1,1,0.1\n'
+                'MAT1,1,3.0,, 0.3\n'
+                'ENDDATA\n')
+        model.read_bdf(bdf_filename, xref=False)
+        os.remove(bdf_filename)
+        bdf_equivalence_nodes(model, None, 0.01, xref=False,
+                              log=log, debug=False, method='pairs')
+        assert model.elements[2].nodes == [1, 3, 5], model.elements[2].nodes
+
 def save_check_nodes(bdf_filename, log, nnodes, skip_cards=None):
     model = BDF(log=log, debug=False)
     model.disable_cards(skip_cards)
@@ -4,7 +4,7 @@ import os
 import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
-from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties, mass_properties_groups
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
@@ -163,5 +163,51 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_properties_groups(self):
+        """tests the array-based mass properties of multiple subsets/reference points"""
+        model = BDF(debug=False, log=None)
+        bdfname = os.path.join(mesh_utils_path, 'test_mass.dat')
+        model.read_bdf(bdfname, xref=False)
+        model.add_conm2(100, 2, 2.0, X=[0.1, 0.2, 0.3], I=[1., 0.1, 2., 0.2, 0.3, 3.])
+        model.cross_reference()
+
+        # the element methods
+        eids = list(model.elements.keys())
+        groups = [([eid], None) for eid in eids]
+        mass, cg, inertia = mass_properties_groups(model, groups, scale=1.0)
+        for eid, massi, cgi in zip(eids, mass, cg):
+            elem = model.elements[eid]
+            assert np.allclose(massi, elem.Mass()), 'eid=%s mass=%s' % (eid, massi)
+            if massi:
+                assert np.allclose(cgi, elem.Centroid()), 'eid=%s cg=%s' % (eid, cgi)
+
+        groups = [
+            (None, None),
+            (eids[:3], None),
+            (eids[3:], [100]),
+            (None, [100]),
+        ]
+        reference_points = [None, [1., 2., 3.], 11]
+        for inertia_reference in ['cg', 'ref']:
+            mass, cg, inertia = mass_properties_groups(
+                model, groups, reference_points, inertia_reference=inertia_reference)
+            assert mass.shape == (4, ), mass.shape
+            assert cg.shape == (4, 3), cg.shape
+            assert inertia.shape == (4, 3, 6), inertia.shape
+            for igroup, (element_ids, mass_ids) in enumerate(groups):
+                for iref, reference_point in enumerate(reference_points):
+                    mass_expected, cg_expected, inertia_expected = mass_properties(
+                        model, element_ids=element_ids, mass_ids=mass_ids,
+                        reference_point=reference_point, inertia_reference=inertia_reference)
+                    assert np.allclose(mass[igroup], mass_expected)
+                    assert np.allclose(cg[igroup], cg_expected)
+                    assert np.allclose(inertia[igroup, iref], inertia_expected)
+
+        # the CONM2 inertia about its cg
+        mass, cg, inertia = mass_properties_groups(model, [(None, [100])], scale=1.0)
+        assert np.allclose(mass, [2.0])
+        assert np.allclose(cg, [[1.1, 0.2, 0.3]])
+        assert np.allclose(inertia, [[[1., 2., 3., -0.1, -0.2, -0.3]]]), inertia
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -14,7 +14,8 @@ from pyNastran.bdf.mesh_utils.export_mcids import export_mcids
 from pyNastran.bdf.mesh_utils.split_cbars_by_pin_flag import split_cbars_by_pin_flag
 from pyNastran.bdf.mesh_utils.split_elements import split_line_elements
 from pyNastran.bdf.mesh_utils.pierce_shells import (
-    pierce_shell_model) #, quad_intersection, triangle_intersection)
+    pierce_shell_model, quad_intersection, triangle_intersection)
+from pyNastran.bdf.mesh_utils.ray_cast import ShellRayCaster, ray_cast_shells
 from pyNastran.bdf.mesh_utils.mirror_mesh import (
     write_bdf_symmetric, bdf_mirror, bdf_mirror_plane)
 from pyNastran.bdf.mesh_utils.mass_properties import (
@@ -25,7 +26,10 @@ from pyNastran.bdf.mesh_utils.utils import cmd_line, CMD_MAPS
 from pyNastran.bdf.mesh_utils.find_closest_nodes import find_closest_nodes
 from pyNastran.bdf.mesh_utils.find_coplanar_elements import find_coplanar_triangles
 from pyNastran.bdf.mesh_utils.force_to_pressure import force_to_pressure
-from pyNastran.bdf.mesh_utils.free_edges import free_edges, non_paired_edges
+from pyNastran.bdf.mesh_utils.free_edges import free_edges, non_paired_edges, get_edge_arrays
+from pyNastran.bdf.mesh_utils.free_faces import get_face_arrays, get_solid_skin_faces
+from pyNastran.bdf.mesh_utils.extract_bodies import extract_bodies, get_bodies
+from pyNastran.bdf.bdf_interface.compact_storage import set_compact_storage
 from pyNastran.bdf.mesh_utils.get_oml import get_oml_eids
 from pyNastran.bdf.mesh_utils.breakdowns import (
     get_mass_breakdown, get_area_breakdown, get_length_breakdown,
@@ -105,6 +109,16 @@ class TestMeshUtilsCmdLine(unittest.TestCase):
         assert edges1 == [(1, 2), (2, 3),         (3, 4), (1, 4), (3, 5), (1, 5)], edges1
         assert edges2 == [(1, 2), (2, 3), (1, 3), (3, 4), (1, 4), (3, 5), (1, 5)], edges2
 
+        # a duplicate element id counts once
+        edges1 = free_edges(model, eids=[3, 1, 3], maps=None)
+        assert edges1 == [(3, 5), (1, 5), (1, 2), (2, 3)], edges1
+        maps = model._get_maps(consider_1d=False, consider_2d=True, consider_3d=False)
+        assert free_edges(model, maps=maps) == free_edges(model)
+
+        edges, edge_eids = get_edge_arrays(model)
+        self.assertEqual(edges.shape, (9, 2))
+        self.assertEqual(edge_eids.tolist(), [1, 1, 1, 2, 2, 2, 3, 3, 3])
+
         bdf_filename = TEST_DIR / 'test_free_edges.bdf'
         model.write_bdf(bdf_filename)
         args = ['bdf', 'collapse_quads', str(bdf_filename), '--punch', '--size', '16']
@@ -137,6 +151,79 @@ class TestMeshUtilsCmdLine(unittest.TestCase):
         cmd_line(argv=['bdf', 'free_faces', bdf_filename, skin_filename], quiet=True)
         os.remove(skin_filename)
 
+    def test_get_bodies(self):
+        """two plates that are connected by an RBE2 and an MPC"""
+        log = SimpleLogger(level='warning')
+        model = BDF(log=log)
+        for nid in range(1, 13):
+            model.add_grid(nid, [float(nid), 0., 0.])
+        model.add_cquad4(10, 1, [1, 2, 3, 4])
+        model.add_ctria3(11, 1, [3, 4, 5])
+        model.add_cquad4(20, 1, [6, 7, 8, 9])
+        model.add_celas1(30, 1, [10, 0], [1, 0])
+        model.add_conm2(40, 11, 1.0)
+        model.add_rbe2(50, 9, '123456', [12])
+        model.add_mpc(100, [5, 6], [1, 1], [1., -1.])
+
+        body_eids = extract_bodies(model)
+        self.assertEqual(len(body_eids), 3)
+        self.assertEqual(body_eids[0][0].tolist(), [10, 11])
+        self.assertEqual(body_eids[1][0].tolist(), [20])
+        self.assertEqual(body_eids[1][1].tolist(), [50])
+        self.assertEqual(body_eids[2][0].tolist(), [30])
+
+        bodies = get_bodies(model)
+        self.assertEqual(len(bodies), 4)
+        self.assertEqual(bodies[0]['nids'].tolist(), [1, 2, 3, 4, 5])
+        self.assertEqual(bodies[1]['nids'].tolist(), [6, 7, 8, 9, 12])
+        self.assertEqual(bodies[2]['nids'].tolist(), [10])
+        self.assertEqual(bodies[3]['mass_eids'].tolist(), [40])
+        self.assertEqual(bodies[3]['eids'].tolist(), [])
+
+        bodies = get_bodies(model, consider_masses=False, consider_mpcs=True)
+        self.assertEqual(len(bodies), 2)
+        self.assertEqual(bodies[0]['eids'].tolist(), [10, 11, 20])
+        self.assertEqual(bodies[0]['rigid_eids'].tolist(), [50])
+        self.assertEqual(len(get_bodies(model, consider_mpcs=True, mpc_id=100)), 3)
+
+        set_compact_storage(model)
+        bodies2 = get_bodies(model, consider_masses=False, consider_mpcs=True)
+        self.assertEqual(bodies2[0]['nids'].tolist(), bodies[0]['nids'].tolist())
+
+    def test_solid_skin_faces(self):
+        """CHEXA8s and a CHEXA20 without midside nodes"""
+        log = SimpleLogger(level='warning')
+        model = BDF(log=log)
+        for k in range(4):
+            for nid, (x, y) in enumerate([(0., 0.), (1., 0.), (1., 1.), (0., 1.)]):
+                model.add_grid(4 * k + nid + 1, [x, y, float(k)])
+        model.add_chexa(1, 1, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_chexa(2, 1, [5, 6, 7, 8, 9, 10, 11, 12])
+        model.add_chexa(3, 1, [9, 10, 11, 12, 13, 14, 15, 16] + [None] * 12)
+        model.add_ctetra(4, 1, [13, 14, 15, 16])
+
+        eid_set, face_map = get_solid_skin_faces(model)
+        self.assertEqual(len(eid_set), 18)
+        self.assertEqual(eid_set[(1, 2, 3, 4)], [1])
+        self.assertEqual(face_map[(1, 2, 3, 4)], [1, 2, 3, 4])
+        self.assertEqual(eid_set[(13, 14, 15, 16)], [3])
+        self.assertEqual(face_map[(5, 6, 7, 8)], [5, 6, 7, 8])
+        assert (5, 6, 7, 8) not in eid_set
+        assert (9, 10, 11, 12) not in eid_set
+        self.assertEqual(list(eid_set)[:2], [(1, 2, 3, 4), (1, 2, 5, 6)])
+
+        faces, sorted_faces, face_eids = get_face_arrays(model, element_ids=[2, 3])
+        self.assertEqual(faces.shape, (12, 8))
+        self.assertEqual(face_eids.tolist(), [2] * 6 + [3] * 6)
+        self.assertEqual(faces[6].tolist(), [9, 10, 11, 12, 0, 0, 0, 0])
+        self.assertEqual(sorted_faces[6].tolist(), [0, 0, 0, 0, 9, 10, 11, 12])
+
+        # the compact storage is skinned without creating the cards
+        set_compact_storage(model)
+        eid_set2, face_map2 = get_solid_skin_faces(model)
+        self.assertEqual(list(eid_set2.items()), list(eid_set.items()))
+        self.assertEqual(list(face_map2.items()), list(face_map.items()))
+
     def test_exit(self):
         """tests totally failing to run"""
         with self.assertRaises(SystemExit):
@@ -993,7 +1080,97 @@ class TestMeshUtils(unittest.TestCase):
             [0.4, 0.6, 0.],
             [-1., -1, 0.],
         ]
-        pierce_shell_model(model, xyz_points)
+        eids, xyz_pierces, node_ids = pierce_shell_model(model, xyz_points)
+        assert eids == [2, None], eids
+        assert np.allclose(xyz_pierces[0], [0.4, 0.6, 1.]), xyz_pierces
+        assert np.isnan(xyz_pierces[1]).all(), xyz_pierces
+        assert node_ids == [[5, 6, 7, 8], None], node_ids
+
+        with self.assertWarns(DeprecationWarning):
+            eids, xyz_pierces, node_ids = pierce_shell_model(model, xyz_points, tol=0.1)
+        assert eids == [2, None], eids
+
+    def test_ray_cast_shells(self):
+        """tests ShellRayCaster with rays in arbitrary directions"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        # a 10x10 quad plate in the xy plane at z=0 and a tri plate at x=5
+        nx = 11
+        nid = 1
+        for j in range(nx):
+            for i in range(nx):
+                model.add_grid(nid, [float(i), float(j), 0.])
+                nid += 1
+        eid = 1
+        for j in range(nx - 1):
+            for i in range(nx - 1):
+                n1 = j * nx + i + 1
+                model.add_cquad4(eid, 1, [n1, n1 + 1, n1 + nx + 1, n1 + nx])
+                eid += 1
+        model.add_grid(1001, [5., 0., -5.])
+        model.add_grid(1002, [5., 10., -5.])
+        model.add_grid(1003, [5., 0., 5.])
+        model.add_ctria3(1001, 1, [1001, 1002, 1003])
+
+        caster = ShellRayCaster.from_model(model, leaf_size=2)
+        origins = np.array([
+            [0.25, 0.5, 1.0],   # -z; hits eid=1
+            [2.5, 2.5, -1.0],   # +z; hits eid=23
+            [0.0, 1.0, -2.0],   # +x; hits the tri
+            [20., 20., 1.0],    # -z; misses
+            [0.25, 0.5, -1.0],  # -z; misses (t < 0)
+        ])
+        directions = np.array([
+            [0., 0., -2.],
+            [0., 0., 1.],
+            [1., 0., 0.],
+            [0., 0., -1.],
+            [0., 0., -1.],
+        ])
+        eids, xyz, weights, node_ids = caster.intersect(origins, directions, batch_size=2)
+        assert eids.tolist() == [1, 23, 1001, -1, -1], eids
+        assert np.allclose(xyz[:3], [[0.25, 0.5, 0.], [2.5, 2.5, 0.], [5., 1., -2.]]), xyz
+        assert np.isnan(xyz[3:]).all(), xyz
+        assert node_ids[0].tolist() == [1, 2, 13, 12], node_ids
+        assert node_ids[2].tolist() == [1001, 1002, 1003, 0], node_ids
+
+        # the weights interpolate the hit point from the nodes
+        xyz_nodes = np.array([[model.nodes[nid].xyz if nid else [0., 0., 0.]
+                               for nid in nids] for nids in node_ids[:3]])
+        xyz_interp = np.einsum('ij,ijk->ik', weights[:3], xyz_nodes)
+        assert np.allclose(xyz_interp, xyz[:3]), xyz_interp
+        assert np.allclose(weights[:3].sum(axis=1), 1.), weights
+        assert np.allclose(weights[3:], 0.), weights
+
+        # a line hits the closest point in either direction
+        eids, xyz, weights, node_ids = caster.intersect(
+            origins[4:], directions[4:], tmin=-np.inf)
+        assert eids.tolist() == [1], eids
+
+        # a brute force check
+        rng = np.random.default_rng(0)
+        origins = rng.uniform(-1., 11., size=(200, 3))
+        directions = rng.normal(size=(200, 3))
+        eids, xyz, weights, node_ids = ray_cast_shells(model, origins, directions)
+        for origin, direction, eid, xyzi in zip(origins, directions, eids, xyz):
+            tmin = np.inf
+            eid_expected = -1
+            for eidi, elem in model.elements.items():
+                xyzs = [model.nodes[nid].xyz for nid in elem.nodes]
+                if len(xyzs) == 4:
+                    xyz_pierce = quad_intersection(origin, direction, *xyzs)
+                else:
+                    xyz_pierce = triangle_intersection(origin, direction, *xyzs)
+                if xyz_pierce is None:
+                    continue
+                t = (xyz_pierce - origin).dot(direction) / direction.dot(direction)
+                if 0. <= t < tmin:
+                    tmin = t
+                    eid_expected = eidi
+            if eid_expected == -1:
+                assert eid == -1, (origin, direction, eid)
+            else:
+                assert np.allclose(xyzi, origin + tmin * direction), (origin, direction, eid)
 
     #def test_intersect(self):
         #p0 = np.array([0,0,0], 'd')
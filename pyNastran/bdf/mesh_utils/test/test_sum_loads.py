@@ -7,7 +7,8 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_loadcases)
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -477,6 +478,35 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(F2_expected, F1), 'loadcase_id=%s F_expected=%s F1=%s' % (loadcase_id, F2_expected, F1))
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
+        forces, moments = sum_forces_moments_loadcases(model, p0, [1, 2])
+        assert np.allclose(forces, [F1_expected, F2_expected]), forces
+        assert np.allclose(moments, 0.), moments
+
+    def test_loads_sum_loadcases(self):
+        """tests that the array summation matches sum_forces_moments"""
+        p0 = array([1., 2., 3.])
+        bdf_filenames = [
+            os.path.join(model_path, 'plate', 'plate.bdf'),
+            os.path.join(model_path, 'unit', 'pload4', 'ctria3.bdf'),
+            os.path.join(model_path, 'unit', 'pload4', 'chexa.bdf'),
+            os.path.join(model_path, 'unit', 'pload4', 'pload1.bdf'),
+            os.path.join(model_path, 'other', 'randvar2.bdf'),
+        ]
+        for bdf_filename in bdf_filenames:
+            model = BDF(log=None, debug=None)
+            model.read_bdf(bdf_filename)
+            loadcase_ids = sorted(set(model.loads) | set(model.load_combinations))
+            forces, moments = sum_forces_moments_loadcases(model, p0, loadcase_ids)
+            self.assertEqual(forces.shape, (len(loadcase_ids), 3))
+            for loadcase_id, force, moment in zip(loadcase_ids, forces, moments):
+                F1, M1 = sum_forces_moments(model, p0, loadcase_id)
+                assert np.allclose(F1, force), 'loadcase_id=%s F1=%s force=%s' % (loadcase_id, F1, force)
+                assert np.allclose(M1, moment), 'loadcase_id=%s M1=%s moment=%s' % (loadcase_id, M1, moment)
+
+        forces, moments = sum_forces_moments_loadcases(model, p0, [])
+        self.assertEqual(forces.shape, (0, 3))
+        self.assertEqual(moments.shape, (0, 3))
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,4 +1,5 @@
 from pyNastran.bdf.test.test_field_writer import Testfield_writer_8
+from pyNastran.bdf.test.test_field_writer_8_array import TestFieldWriter8Array
 from pyNastran.bdf.test.test_bdf_unit_tests import TestBDFUnit
 from pyNastran.bdf.bdf_interface.dev.test_mass import TestMassGeneration
 
@@ -18,6 +19,11 @@ from pyNastran.bdf.bdf_interface.test.test_assign_type import TestAssignType
 from pyNastran.bdf.bdf_interface.test.test_bdf_interface import TestBDFInterface
 from pyNastran.bdf.bdf_interface.test.test_dev_utils import DevUtils
 from pyNastran.bdf.bdf_interface.test.test_case_control_deck import CaseControlTest
+from pyNastran.bdf.bdf_interface.test.test_bulk_tokenizer import TestBulkTokenizer
+from pyNastran.bdf.bdf_interface.test.test_bdf_parallel import TestBDFParallel
+from pyNastran.bdf.bdf_interface.test.test_model_cache import TestModelCache
+from pyNastran.bdf.bdf_interface.test.test_incremental_read import TestIncrementalRead
+from pyNastran.bdf.bdf_interface.test.test_compact_storage import TestCompactStorage
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,146 @@
+"""
+compares the memory and read time of the standard card storage and the
+compact (array-backed) storage (``BDF.use_compact_storage``)
+
+A block of CHEXA8s with a skin of CQUAD4s is written.  The memory is the
+size of model.nodes/model.elements measured by tracemalloc (the memory
+that is freed when the model is deleted).  The models from both storages
+are checked to be the same.
+
+Usage
+-----
+python benchmark_bdf_compact_storage.py [--nx NX]
+"""
+from __future__ import annotations
+import os
+import gc
+import time
+import argparse
+import tempfile
+import tracemalloc
+from typing import Any
+
+from pyNastran.bdf.bdf import BDF
+
+
+def write_block_bdf(bdf_filename: str, nx: int) -> tuple[int, int]:
+    """
+    Writes an nx by nx by nx block of CHEXA8s with CQUAD4s on the
+    z=0 face
+
+    Returns
+    -------
+    nnodes, nelements : int, int
+        the number of GRIDs and elements
+    """
+    n1 = nx + 1
+    with open(bdf_filename, 'w') as bdf_file:
+        for k in range(n1):
+            for j in range(n1):
+                lines = [f'GRID    {1 + i + n1 * (j + n1 * k):8d}        '
+                         f'{i / nx:8.5f}{j / nx:8.5f}{k / nx:8.5f}\n' for i in range(n1)]
+                bdf_file.write(''.join(lines))
+
+        eid = 1
+        for k in range(nx):
+            for j in range(nx):
+                lines = []
+                for i in range(nx):
+                    nid = 1 + i + n1 * (j + n1 * k)
+                    nids = [nid, nid + 1, nid + n1 + 1, nid + n1]
+                    nids += [nidi + n1 * n1 for nidi in nids]
+                    lines.append(('CHEXA   %8d       1' + '%8d' * 6 + '\n        %8d%8d\n') % (
+                        eid, *nids))
+                    eid += 1
+                bdf_file.write(''.join(lines))
+
+        for j in range(nx):
+            for i in range(nx):
+                nid = 1 + i + n1 * j
+                bdf_file.write('CQUAD4  %8d       2%8d%8d%8d%8d\n' % (
+                    eid, nid, nid + 1, nid + n1 + 1, nid + n1))
+                eid += 1
+        bdf_file.write('PSOLID         1       1\n'
+                       'PSHELL         2       1      .1\n'
+                       'MAT1           1    3.+7              .3\n'
+                       'ENDDATA\n')
+    return n1 ** 3, eid - 1
+
+
+def _read(bdf_filename: str, use_compact_storage: bool) -> tuple[float, BDF]:
+    """the read time (sec) and the model"""
+    gc.collect()
+    model = BDF(debug=None)
+    model.use_compact_storage = use_compact_storage
+    t0 = time.perf_counter()
+    model.read_bdf(bdf_filename, xref=True, validate=False, punch=True)
+    return time.perf_counter() - t0, model
+
+
+def _get_memory(bdf_filename: str, use_compact_storage: bool) -> int:
+    """
+    Gets the memory of model.nodes/model.elements, which is the memory
+    that is freed when they're deleted
+    """
+    tracemalloc.start()
+    unused_dt, model = _read(bdf_filename, use_compact_storage)
+    nodes, elements = model.nodes, model.elements
+    model.nodes = {}
+    model.elements = {}
+    model.uncross_reference()
+    gc.collect()
+    memory1 = tracemalloc.get_traced_memory()[0]
+    del nodes, elements
+    gc.collect()
+    memory2 = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory1 - memory2
+
+
+def _summarize(model: BDF) -> tuple[Any, ...]:
+    """gets the summary of a model that should be the same"""
+    node = model.nodes[max(model.nodes)]
+    elem = model.elements[max(model.elements)]
+    return (len(model.nodes), len(model.elements), tuple(node.get_position()),
+            elem.node_ids, round(elem.Area(), 12))
+
+
+def run_benchmark(nx: int=40) -> dict[str, Any]:
+    """
+    Reads the block with the standard and compact storage
+
+    Returns
+    -------
+    results : dict[str, float]
+        the read times (sec) and memory (bytes) for standard/compact
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as dirname:
+        bdf_filename = os.path.join(dirname, 'block.bdf')
+        nnodes, nelements = write_block_bdf(bdf_filename, nx)
+        print(f'nnodes={nnodes} nelements={nelements}')
+        print(f'{"":<10s} {"read (s)":>10s} {"memory (MB)":>12s} {"bytes/card":>10s}')
+        summaries = []
+        for name, use_compact_storage in [('standard', False), ('compact', True)]:
+            dt, model = _read(bdf_filename, use_compact_storage)
+            summaries.append(_summarize(model))
+            del model
+            nbytes = _get_memory(bdf_filename, use_compact_storage)
+            results[f'{name}_time'] = dt
+            results[f'{name}_memory'] = nbytes
+            print(f'{name:<10s} {dt:10.3f} {nbytes / 1024**2:12.1f} '
+                  f'{nbytes / (nnodes + nelements):10.0f}')
+    assert summaries[0] == summaries[1], summaries
+    return results
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nx', type=int, default=40,
+                        help='the number of elements along a side (default=40)')
+    args = parser.parse_args()
+    run_benchmark(nx=args.nx)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,123 @@
+"""
+compares the read time of the standard bulk data parser and the vectorized
+tokenizer (``BDF.use_fast_tokenizer``)
+
+A flat plate of CQUAD4s (with a FORCE/PLOAD4 on each node/element) is
+written in small field, large field, and free field format.  The models
+from both parsers are checked to be the same.
+
+Usage
+-----
+python benchmark_bdf_tokenizer.py [--nx NX] [--nrepeat NREPEAT]
+"""
+from __future__ import annotations
+import os
+import time
+import argparse
+import tempfile
+from io import StringIO
+from typing import Any
+
+from pyNastran.bdf.bdf import BDF
+
+
+def write_plate_bdf(bdf_filename: str, nx: int, size: int=8,
+                    is_free_field: bool=False) -> int:
+    """
+    Writes an nx by nx CQUAD4 plate
+
+    Returns
+    -------
+    ncards : int
+        the number of cards
+    """
+    model = BDF(debug=None)
+    nid = 1
+    for j in range(nx + 1):
+        for i in range(nx + 1):
+            model.add_grid(nid, [i / nx, j / nx, 0.])
+            model.add_force(1, nid, 1.0, [0., 0., 1.])
+            nid += 1
+    eid = 1
+    for j in range(nx):
+        for i in range(nx):
+            n1 = j * (nx + 1) + i + 1
+            model.add_cquad4(eid, 1, [n1, n1 + 1, n1 + nx + 2, n1 + nx + 1])
+            model.add_pload4(1, [eid], [0.1, None, None, None])
+            eid += 1
+    model.add_pshell(1, mid1=1, t=0.1)
+    model.add_mat1(1, 3.0e7, None, 0.3)
+    model.write_bdf(bdf_filename, size=size, enddata=True, write_header=False)
+
+    if is_free_field:
+        with open(bdf_filename, 'r') as bdf_file:
+            lines = bdf_file.readlines()
+        with open(bdf_filename, 'w') as bdf_file:
+            for line in lines:
+                fields = [line[i:i+8].strip() for i in range(0, 72, 8)]
+                bdf_file.write(','.join(fields).rstrip(',') + '\n')
+    return 2 * (nx + 1) ** 2 + 2 * nx ** 2 + 2
+
+
+def _time_read(bdf_filename: str, use_fast_tokenizer: bool,
+               nrepeat: int) -> tuple[float, BDF]:
+    """the fastest of nrepeat reads"""
+    times = []
+    for unused_i in range(nrepeat):
+        model = BDF(debug=None)
+        model.use_fast_tokenizer = use_fast_tokenizer
+        t0 = time.perf_counter()
+        model.read_bdf(bdf_filename, xref=False, validate=False, punch=True)
+        times.append(time.perf_counter() - t0)
+    return min(times), model
+
+
+def _write_bdf(model: BDF) -> str:
+    """writes the model to a string"""
+    bdf_file = StringIO()
+    model.write_bdf(bdf_file, close=False)
+    return bdf_file.getvalue()
+
+
+def run_benchmark(nx: int=100, nrepeat: int=3) -> dict[str, Any]:
+    """
+    Reads the plate in each format with the standard parser and the
+    vectorized tokenizer
+
+    Returns
+    -------
+    results : dict[str, float]
+        the read times (sec) for {format}_standard/{format}_fast
+    """
+    results = {}
+    print(f'{"":<8s} {"ncards":>8s} {"standard (s)":>12s} {"fast (s)":>10s} {"speedup":>8s}')
+    with tempfile.TemporaryDirectory() as dirname:
+        for format_name, size, is_free_field in [('small', 8, False),
+                                                 ('large', 16, False),
+                                                 ('free', 8, True)]:
+            bdf_filename = os.path.join(dirname, f'plate_{format_name}.bdf')
+            ncards = write_plate_bdf(bdf_filename, nx, size=size, is_free_field=is_free_field)
+            dt_standard, model_standard = _time_read(bdf_filename, False, nrepeat)
+            dt_fast, model_fast = _time_read(bdf_filename, True, nrepeat)
+            assert _write_bdf(model_standard) == _write_bdf(model_fast), format_name
+            assert model_standard.card_count == model_fast.card_count, format_name
+
+            results[f'{format_name}_standard'] = dt_standard
+            results[f'{format_name}_fast'] = dt_fast
+            print(f'{format_name:<8s} {ncards:8d} {dt_standard:12.3f} {dt_fast:10.3f} '
+                  f'{dt_standard / dt_fast:8.2f}')
+    return results
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nx', type=int, default=200,
+                        help='the number of elements along a side (default=200)')
+    parser.add_argument('--nrepeat', type=int, default=3,
+                        help='the number of reads (default=3)')
+    args = parser.parse_args()
+    run_benchmark(nx=args.nx, nrepeat=args.nrepeat)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -47,7 +47,7 @@ from pyNastran.bdf.mesh_utils.mpc_dependency import (
     get_mpc_node_ids, get_mpc_node_ids_c1,
     get_dependent_nid_to_components, get_mpcs)
 from pyNastran.bdf.mesh_utils.loads import (
-    sum_forces_moments, sum_forces_moments_elements,
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_loadcases,
     get_static_force_vector_from_subcase_id)
 from pyNastran.bdf.mesh_utils.skin_solid_elements import write_skin_solid_faces
 from pyNastran.bdf.mesh_utils.export_caero_mesh import export_caero_mesh
@@ -1745,6 +1745,11 @@ def _check_case_parameters(subcase: Subcase,
                 cid=cid_new, include_grav=False)
             assert np.allclose(force, force2), 'force=%s force2=%s' % (force, force2)
             assert np.allclose(moment, moment2), 'moment=%s moment2=%s' % (moment, moment2)
+            forces3, moments3 = sum_forces_moments_loadcases(
+                fem, p0, [loadcase_id],
+                cid=cid_new, include_grav=False)
+            assert np.allclose(force, forces3[0]), 'force=%s force3=%s' % (force, forces3[0])
+            assert np.allclose(moment, moments3[0]), 'moment=%s moment3=%s' % (moment, moments3[0])
             print('  isubcase=%i F=%s M=%s%s' % (isubcase, force, moment, cid_msg))
         allowed_sols = [
             1, 5, 24, 38, 61, 64, 66, 100, 101, 103, 105, 106, 107,
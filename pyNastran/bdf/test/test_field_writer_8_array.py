@@ -0,0 +1,90 @@
+"""tests the vectorized 8 character field writer"""
+# pylint: disable=W0212
+import unittest
+from io import StringIO
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.field_writer_8 import print_float_8
+from pyNastran.bdf.field_writer_8_array import print_float_8_array, print_int_8_array
+
+
+class TestFieldWriter8Array(unittest.TestCase):
+    """tests the vectorized 8 character field writer"""
+
+    def test_float_8_array(self):
+        """the fields are the same as print_float_8"""
+        rng = np.random.default_rng(42)
+        exponents = rng.uniform(-12., 12., 20000)
+        values = np.sign(rng.uniform(-1., 1., 20000)) * 10. ** exponents
+        rounded = np.hstack([np.round(values[:2500], ndecimals) for ndecimals in range(8)])
+        edge_cases = np.array([
+            0., -0., 1., -1., 0.001, 0.00099999, -0.01, -0.0099999, 999999.4, 999999.5,
+            -99999.4, -99999.5, 0.5, 2.5, 1.25, 0.000125, 1e-8, -1e-8, 12345678.,
+            1e20, -1e20, 47.77267, -.723476, 125000., 0.1, 0.2, 0.3, np.nan,
+            np.float32(0.1), np.float32(-1.7)])
+        values = np.hstack([values, rounded, edge_cases])
+
+        fields = print_float_8_array(values)
+        expected = [print_float_8(value) for value in values]
+        self.assertEqual(fields.tolist(), expected)
+
+    def test_int_8_array(self):
+        """the fields are the same as '%8d'"""
+        values = np.array([0, 1, -1, 9, 10, -10, 1234567, -1234567, 12345678, -12345678,
+                           99999999, 123456789])
+        fields = print_int_8_array(values)
+        expected = ['%8d' % value if len('%8d' % value) == 8 else '********'
+                    for value in values]
+        self.assertEqual(fields.tolist(), expected)
+
+    def test_write_mesh_8(self):
+        """the GRIDs/elements are the same as write_card"""
+        model = BDF(log=SimpleLogger(level='error'))
+        model.add_grid(1, [0., 0., 0.], comment='grid 1')
+        model.add_grid(2, [1., 0., 0.], cp=1)
+        model.add_grid(3, [1., 1.e-9, 0.], cd=1)
+        model.add_grid(4, [0., 1., -123456.7])
+        model.add_grid(5, [0.1, 0.2, 0.3], ps='123')
+        model.add_grid(123456789, [1.5, 2.5, 3.5])
+        for nid in range(6, 10):
+            model.add_grid(nid, [nid, 2. * nid, 1. / nid])
+        model.add_cord2r(1, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+
+        model.add_cquad4(1, 1, [1, 2, 3, 4], comment='quad')
+        model.add_cquad4(2, 1, [1, 2, 3, 4], theta_mcid=1)
+        model.add_cquad4(3, 1, [1, 2, 3, 4], T1=1.0, T2=1.0, T3=1.0, T4=1.0)
+        model.add_cquad4(4, 1, [1, 2, 3, 4], zoffset=0.1)
+        model.add_cquad4(5, 1, [1, 2, 3, 4], theta_mcid=0)
+        model.add_ctria3(6, 1, [1, 2, 3])
+        model.add_ctria3(7, 1, [1, 2, 3], T1=2.0)
+        model.add_ctetra(8, 2, [1, 2, 3, 6])
+        model.add_cpenta(9, 2, [1, 2, 3, 6, 7, 8])
+        model.add_chexa(10, 2, [1, 2, 3, 4, 6, 7, 8, 9])
+        model.add_chexa(11, 2, [1, 2, 3, 4, 6, 7, 8, 9, 1, 2, 3, 4, 6, 7, 8, 9, 1, 2, 3, 4])
+        model.add_conrod(12, 1, [1, 2])
+        model.add_ctria3(123456789, 1, [1, 2, 3])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_psolid(2, 1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+
+        for xref in [False, True]:
+            if xref:
+                model.cross_reference()
+            bdf_file = StringIO()
+            model._write_grids(bdf_file, is_long_ids=False)
+            expected = '$NODES\n' + ''.join(
+                node.write_card(8) for unused_nid, node in sorted(model.nodes.items()))
+            self.assertEqual(bdf_file.getvalue(), expected)
+
+            bdf_file = StringIO()
+            model._write_elements(bdf_file, is_long_ids=False)
+            expected = '$ELEMENTS\n' + ''.join(
+                elem.write_card(8) for unused_eid, elem in sorted(model.elements.items()))
+            self.assertEqual(bdf_file.getvalue(), expected)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
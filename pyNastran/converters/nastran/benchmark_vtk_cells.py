@@ -0,0 +1,195 @@
+"""
+compares the time to create the VTK cells of a generated shell/solid
+model using:
+ - legacy: a vtkTriangle/vtkQuad/... per element and grid.InsertNextCell
+ - bulk:   VtkCellBuilder (one SetCells call)
+
+Optionally (--full), the full Nastran geometry load (nastran_to_vtk) of
+the generated model is also timed.
+
+Usage
+-----
+python benchmark_vtk_cells.py [--nelements N ...] [--nrepeat NREPEAT] [--full]
+"""
+from __future__ import annotations
+import os
+import time
+import argparse
+import tempfile
+from typing import Any
+
+import numpy as np
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.gui.vtk_interface import (
+    vtkTriangle, vtkQuad, vtkHexahedron, vtkUnstructuredGrid)
+from pyNastran.gui.utils.vtk.vtk_utils import VtkCellBuilder
+
+#: the default model sizes (number of elements)
+NELEMENTS = [10_000, 100_000, 1_000_000]
+
+
+def generate_cells(nelements: int) -> tuple[int, list[tuple[int, np.ndarray]]]:
+    """
+    Creates a plate of quads/trias with a layer of hexas underneath it, so
+    there are a mix of cell types.  The cell types alternate by row like
+    a sorted Nastran model.
+
+    Returns
+    -------
+    npoints : int
+        the number of points
+    cells : list[(cell_type, point_ids), ...]
+        the cells in element id order
+
+    """
+    # each (i, j) cell is a quad (or 2 trias) on top of a hexa
+    ncells_per_box = 2.5
+    nx = max(int(np.sqrt(nelements / ncells_per_box)), 1)
+    ny = nx
+    nnodes_x = nx + 1
+    nnodes_layer = nnodes_x * (ny + 1)
+
+    cells = []
+    for j in range(ny):
+        for i in range(nx):
+            n1 = j * nnodes_x + i
+            n2 = n1 + 1
+            n3 = n2 + nnodes_x
+            n4 = n1 + nnodes_x
+            if j % 2 == 0:
+                cells.append((9, [n1, n2, n3, n4]))
+            else:
+                cells.append((5, [n1, n2, n3]))
+                cells.append((5, [n1, n3, n4]))
+        for i in range(nx):
+            n1 = j * nnodes_x + i
+            n2 = n1 + 1
+            n3 = n2 + nnodes_x
+            n4 = n1 + nnodes_x
+            cells.append((12, [n1, n2, n3, n4,
+                               n1 + nnodes_layer, n2 + nnodes_layer,
+                               n3 + nnodes_layer, n4 + nnodes_layer]))
+    npoints = 2 * nnodes_layer
+    return npoints, cells
+
+
+def generate_model(nelements: int) -> BDF:
+    """creates a BDF with the cells of ``generate_cells``"""
+    npoints, cells = generate_cells(nelements)
+    model = BDF(debug=None)
+    nnodes_layer = npoints // 2
+    nnodes_x = int(np.sqrt(nnodes_layer))
+    for nid in range(npoints):
+        ilayer, inode = divmod(nid, nnodes_layer)
+        j, i = divmod(inode, nnodes_x)
+        model.add_grid(nid + 1, [float(i), float(j), -float(ilayer)])
+    model.add_pshell(1, mid1=1, t=0.1)
+    model.add_psolid(2, 1)
+    model.add_mat1(1, 3.0e7, None, 0.3)
+    for eid, (cell_type, point_ids) in enumerate(cells, start=1):
+        nids = [nid + 1 for nid in point_ids]
+        if cell_type == 9:
+            model.add_cquad4(eid, 1, nids)
+        elif cell_type == 5:
+            model.add_ctria3(eid, 1, nids)
+        else:
+            model.add_chexa(eid, 2, nids)
+    return model
+
+
+def build_cells_legacy(cells: list[tuple[int, list[int]]]) -> vtkUnstructuredGrid:
+    """creates a vtk object per element and calls InsertNextCell"""
+    grid = vtkUnstructuredGrid()
+    grid.Allocate(len(cells), 1000)
+    vtk_classes = {5: vtkTriangle, 9: vtkQuad, 12: vtkHexahedron}
+    for cell_type, point_ids in cells:
+        elem = vtk_classes[cell_type]()
+        vtk_point_ids = elem.GetPointIds()
+        for i, point_id in enumerate(point_ids):
+            vtk_point_ids.SetId(i, point_id)
+        grid.InsertNextCell(elem.GetCellType(), vtk_point_ids)
+    return grid
+
+
+def build_cells_bulk(cells: list[tuple[int, list[int]]]) -> vtkUnstructuredGrid:
+    """creates all the cells in one SetCells call"""
+    grid = vtkUnstructuredGrid()
+    builder = VtkCellBuilder()
+    for cell_type, point_ids in cells:
+        builder.add(cell_type, point_ids)
+    builder.build(grid)
+    return grid
+
+
+def _time_it(func, *args, nrepeat: int=3) -> float:
+    """gets the best time of nrepeat calls"""
+    times = []
+    for unused_i in range(nrepeat):
+        t0 = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def _time_nastran_to_vtk(nelements: int) -> float:
+    """times the full geometry load of a generated model"""
+    from pyNastran.converters.nastran.nastran_to_vtk import nastran_to_vtk
+    model = generate_model(nelements)
+    with tempfile.TemporaryDirectory() as dirname:
+        vtu_filename = os.path.join(dirname, 'model.vtu')
+        t0 = time.perf_counter()
+        nastran_to_vtk(model, '', vtu_filename, log_level='error', compression_level=0)
+        dt = time.perf_counter() - t0
+    return dt
+
+
+def run_benchmark(nelements_list: list[int], nrepeat: int=3,
+                  full: bool=False) -> list[dict[str, Any]]:
+    """
+    Creates the cells of each generated model with the legacy and bulk
+    methods
+
+    Returns
+    -------
+    results : list[dict[str, Any]]
+        the nelements and the legacy/bulk (and full) times (sec)
+
+    """
+    results = []
+    msg = f'{"nelements":>10s} {"legacy (s)":>10s} {"bulk (s)":>10s} {"speedup":>8s}'
+    if full:
+        msg += f' {"nastran_to_vtk (s)":>18s}'
+    print(msg)
+    for nelements in nelements_list:
+        unused_npoints, cells = generate_cells(nelements)
+        dt_legacy = _time_it(build_cells_legacy, cells, nrepeat=nrepeat)
+        dt_bulk = _time_it(build_cells_bulk, cells, nrepeat=nrepeat)
+        result = {
+            'nelements': len(cells),
+            'legacy': dt_legacy,
+            'bulk': dt_bulk,
+        }
+        msg = f'{len(cells):10d} {dt_legacy:10.3f} {dt_bulk:10.3f} {dt_legacy / dt_bulk:8.1f}'
+        if full:
+            result['nastran_to_vtk'] = dt_full = _time_nastran_to_vtk(nelements)
+            msg += f' {dt_full:18.3f}'
+        print(msg)
+        results.append(result)
+    return results
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--nelements', type=int, nargs='+', default=NELEMENTS,
+                        help=f'the approximate model sizes (default={NELEMENTS})')
+    parser.add_argument('--nrepeat', type=int, default=3,
+                        help='the number of times to build the cells (default=3)')
+    parser.add_argument('--full', action='store_true',
+                        help='also time nastran_to_vtk on the generated model')
+    args = parser.parse_args()
+    run_benchmark(args.nelements, nrepeat=args.nrepeat, full=args.full)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -5,15 +5,7 @@ from typing import Any, Union, Optional, cast, TYPE_CHECKING
 import numpy as np
 from numpy.linalg import norm
 
-from pyNastran.gui.vtk_interface import (
-    vtkVertex, vtkLine,
-    vtkTriangle, vtkQuad, vtkTetra, vtkWedge, vtkHexahedron,
-    vtkQuadraticTriangle, vtkQuadraticQuad, vtkQuadraticTetra,
-    vtkQuadraticWedge, vtkQuadraticHexahedron,
-    vtkPyramid, vtkQuadraticPyramid,
-    vtkQuadraticEdge, vtkBiQuadraticQuad,
-    vtkUnstructuredGrid,
-)
+from pyNastran.gui.vtk_interface import vtkQuad, vtkUnstructuredGrid
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.femutils.nan import (
@@ -59,7 +51,8 @@ from .utils import (
 
 # gui
 from pyNastran.gui.utils.vtk.vtk_utils import (
-    numpy_to_vtk_points, create_vtk_cells_of_constant_element_type)
+    numpy_to_vtk_points, create_vtk_cells_of_constant_element_type,
+    VtkCellBuilder)
 from pyNastran.gui.qt_files.colors import (
     RED_FLOAT, BLUE_FLOAT)
 from pyNastran.gui.gui_objects.gui_result import GuiResult, NormalResult
@@ -226,6 +219,9 @@ def map_elements1_quality_helper(self,
     grid = self.gui.grid
     self._build_plotels(model)
 
+    # the cells are created in a single call after the loop
+    cells = VtkCellBuilder()
+
     #print("map_elements...")
     for (eid, element) in sorted(elements.items()):
         eid_map[eid] = i
@@ -260,7 +256,6 @@ def map_elements1_quality_helper(self,
                 mcid, theta = get_shell_material_coord(element)
                 material_coord[i] = mcid
                 material_theta[i] = theta
-            elem = vtkTriangle()
             node_ids = element.node_ids
             pid = element.Pid()
             eid_to_nid_map[eid] = node_ids
@@ -273,12 +268,7 @@ def map_elements1_quality_helper(self,
             out = tri_quality(p1, p2, p3)
             (areai, max_skew, aspect_ratio,
              min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
-
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(5, [n1, n2, n3])  # vtkTriangle
         elif isinstance(element, (CTRIA6, CPLSTN6, CTRIAX)):
             # the CTRIAX is a standard 6-noded element
             if isinstance(element, CTRIA6):
@@ -288,17 +278,6 @@ def map_elements1_quality_helper(self,
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
-            if None not in node_ids:
-                elem = vtkQuadraticTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(3, nid_map[node_ids[3]])
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                eid_to_nid_map[eid] = node_ids
-            else:
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-                eid_to_nid_map[eid] = node_ids[:3]
 
             n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
             p1 = xyz_cid0[n1, :]
@@ -307,10 +286,13 @@ def map_elements1_quality_helper(self,
             out = tri_quality(p1, p2, p3)
             (areai, max_skew, aspect_ratio,
              min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            if None not in node_ids:
+                eid_to_nid_map[eid] = node_ids
+                cells.add(22, [n1, n2, n3] +  # vtkQuadraticTriangle
+                          [nid_map[nid] for nid in node_ids[3:6]])
+            else:
+                eid_to_nid_map[eid] = node_ids[:3]
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
         elif isinstance(element, (CTRIAX6, CTRSHL)):
             # the CTRIAX6 is not a standard second-order triangle
             #
@@ -328,16 +310,6 @@ def map_elements1_quality_helper(self,
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
 
-            if None not in node_ids:
-                elem = vtkQuadraticTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(3, nid_map[node_ids[1]])
-                point_ids.SetId(4, nid_map[node_ids[3]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-            else:
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-
             n1 = nid_map[node_ids[0]]
             n2 = nid_map[node_ids[2]]
             n3 = nid_map[node_ids[4]]
@@ -347,11 +319,13 @@ def map_elements1_quality_helper(self,
             out = tri_quality(p1, p2, p3)
             (areai, max_skew, aspect_ratio,
              min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
             eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4]]
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            if None not in node_ids:
+                cells.add(22, [n1, n2, n3,  # vtkQuadraticTriangle
+                               nid_map[node_ids[1]], nid_map[node_ids[3]],
+                               nid_map[node_ids[5]]])
+            else:
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
 
         elif isinstance(element, (CQUAD4, CSHEAR, CQUADR, CPLSTN4, CQUADX4, CQUAD1)):
             if isinstance(element, (CQUAD4, CQUADR, CQUAD1)):
@@ -378,14 +352,7 @@ def map_elements1_quality_helper(self,
             out = quad_quality(element, p1, p2, p3, p4)
             (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
              min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
-
-            elem = vtkQuad()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(9, point_ids)
+            cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, (CQUAD8, CPLSTN8, CQUADX8)):
             if isinstance(element, CQUAD8):
@@ -405,22 +372,12 @@ def map_elements1_quality_helper(self,
             (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
              min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
             if None not in node_ids:
-                elem = vtkQuadraticQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(23, [n1, n2, n3, n4] +  # vtkQuadraticQuad
+                          [nid_map[nid] for nid in node_ids[4:8]])
             else:
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, (CQUAD, CQUADX)):
             # CQUAD, CQUADX are 9 noded quads
@@ -441,36 +398,19 @@ def map_elements1_quality_helper(self,
             (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
              min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
             if None not in node_ids:
-                elem = vtkBiQuadraticQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(28, [n1, n2, n3, n4] +  # vtkBiQuadraticQuad
+                          [nid_map[nid] for nid in node_ids[4:9]])
             else:
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, CTETRA4):
-            elem = vtkTetra()
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:4]
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            grid.InsertNextCell(10, point_ids)
+            cells.add(10, [nid_map[nid] for nid in node_ids[:4]])  # vtkTetra
             #elem_nid_map = {nid:nid_map[nid] for nid in node_ids[:4]}
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _ctetra_faces, node_ids[:4], nid_map, xyz_cid0)
@@ -480,41 +420,20 @@ def map_elements1_quality_helper(self,
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
             if None not in node_ids:
-                elem = vtkQuadraticTetra()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(24, [nid_map[nid] for nid in node_ids])  # vtkQuadraticTetra
             else:
-                elem = vtkTetra()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(10, [nid_map[nid] for nid in node_ids[:4]])  # vtkTetra
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _ctetra_faces, node_ids[:4], nid_map, xyz_cid0)
 
         elif isinstance(element, CPENTA6):
-            elem = vtkWedge()
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:6]
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            grid.InsertNextCell(13, point_ids)
+            cells.add(13, [nid_map[nid] for nid in node_ids[:6]])  # vtkWedge
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _cpenta_faces, node_ids[:6], nid_map, xyz_cid0)
 
@@ -523,29 +442,11 @@ def map_elements1_quality_helper(self,
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
             if None not in node_ids:
-                elem = vtkQuadraticWedge()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-                point_ids.SetId(12, nid_map[node_ids[12]])
-                point_ids.SetId(13, nid_map[node_ids[13]])
-                point_ids.SetId(14, nid_map[node_ids[14]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(26, [nid_map[nid] for nid in node_ids])  # vtkQuadraticWedge
             else:
-                elem = vtkWedge()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:6]
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(13, [nid_map[nid] for nid in node_ids[:6]])  # vtkWedge
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _cpenta_faces, node_ids[:6], nid_map, xyz_cid0)
 
@@ -554,17 +455,7 @@ def map_elements1_quality_helper(self,
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:8]
-            elem = vtkHexahedron()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(12, point_ids)
+            cells.add(12, [nid_map[nid] for nid in node_ids[:8]])  # vtkHexahedron
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _chexa_faces, node_ids[:8], nid_map, xyz_cid0)
 
@@ -572,39 +463,7 @@ def map_elements1_quality_helper(self,
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
-            if None not in node_ids:
-                elem = vtkQuadraticHexahedron()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-
-                # these two blocks are flipped
-                point_ids.SetId(12, nid_map[node_ids[16]])
-                point_ids.SetId(13, nid_map[node_ids[17]])
-                point_ids.SetId(14, nid_map[node_ids[18]])
-                point_ids.SetId(15, nid_map[node_ids[19]])
-
-                point_ids.SetId(16, nid_map[node_ids[12]])
-                point_ids.SetId(17, nid_map[node_ids[13]])
-                point_ids.SetId(18, nid_map[node_ids[14]])
-                point_ids.SetId(19, nid_map[node_ids[15]])
-                eid_to_nid_map[eid] = node_ids
-            else:
-                elem = vtkHexahedron()
-                point_ids = elem.GetPointIds()
-                eid_to_nid_map[eid] = node_ids[:8]
-
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            _add_hexa20_cell(cells, eid, node_ids, nid_map, eid_to_nid_map)
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _chexa_faces, node_ids[:8], nid_map, xyz_cid0)
 
@@ -613,15 +472,7 @@ def map_elements1_quality_helper(self,
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:5]
-            elem = vtkPyramid()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            # etype = 14
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(14, [nid_map[nid] for nid in node_ids[:5]])  # vtkPyramid
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _cpyram_faces, node_ids[:5], nid_map, xyz_cid0)
         elif isinstance(element, CPYRAM13):
@@ -629,31 +480,12 @@ def map_elements1_quality_helper(self,
             pid = element.Pid()
             if None not in node_ids:
                 #print(' node_ids =', node_ids)
-                elem = vtkQuadraticPyramid()
-                point_ids = elem.GetPointIds()
-                # etype = 27
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-                point_ids.SetId(12, nid_map[node_ids[12]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(27, [nid_map[nid] for nid in node_ids[:13]])  # vtkQuadraticPyramid
             else:
-                elem = vtkPyramid()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:5]
+                cells.add(14, [nid_map[nid] for nid in node_ids[:5]])  # vtkPyramid
             #print('*node_ids =', node_ids[:5])
-
-
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
             min_thetai, max_thetai, dideal_thetai, min_edge_lengthi = get_min_max_theta(
                 _cpyram_faces, node_ids[:5], nid_map, xyz_cid0)
 
@@ -694,9 +526,7 @@ def map_elements1_quality_helper(self,
                 #c = nid_map[nid]
 
                 #if 1:
-                elem = vtkVertex()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, j)
+                cells.add(1, [j])  # vtkVertex
                 #else:
                     #elem = vtkSphere()
                     #elem = vtkSphereSource()
@@ -707,17 +537,13 @@ def map_elements1_quality_helper(self,
                 # 2 points
                 #d = norm(element.nodes[0].get_position() - element.nodes[1].get_position())
                 eid_to_nid_map[eid] = node_ids
-                elem = vtkLine()
-                point_ids = elem.GetPointIds()
                 try:
-                    point_ids.SetId(0, nid_map[node_ids[0]])
-                    point_ids.SetId(1, nid_map[node_ids[1]])
+                    n1, n2 = nid_map[node_ids[0]], nid_map[node_ids[1]]
                 except KeyError:
                     print("node_ids =", node_ids)
                     print(str(element))
                     continue
-
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(3, [n1, n2])  # vtkLine
 
         elif etype in ('CBAR', 'CBEAM', 'CROD', 'CONROD', 'CTUBE'):
             if etype == 'CONROD':
@@ -750,7 +576,6 @@ def map_elements1_quality_helper(self,
             xyz2 = xyz_cid0[n2, :]
             min_edge_lengthi = norm(xyz2 - xyz1)
             eid_to_nid_map[eid] = node_ids
-            elem = vtkLine()
             try:
                 n1, n2 = [nid_map[nid] for nid in node_ids]
             except KeyError:  # pragma: no cover
@@ -758,10 +583,7 @@ def map_elements1_quality_helper(self,
                 print(str(element))
                 print('nid_map = %s' % nid_map)
                 raise
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(3, [n1, n2])  # vtkLine
 
         elif etype == 'CBEND':
             pid = element.Pid()
@@ -782,12 +604,8 @@ def map_elements1_quality_helper(self,
                     g0, element.x, element)
                 raise NotImplementedError(msg)
             # only supports g0 as an integer
-            elem = vtkQuadraticEdge()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[g0])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(21, [nid_map[node_ids[0]], nid_map[node_ids[1]],  # vtkQuadraticEdge
+                           nid_map[g0]])
 
         elif etype == 'CHBDYG':
             node_ids = element.node_ids
@@ -807,33 +625,12 @@ def map_elements1_quality_helper(self,
                 (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
                  min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
                 if element.surface_type == 'AREA4' or None in node_ids:
-                    elem = vtkQuad()
-                    point_ids = elem.GetPointIds()
+                    cells.add(9, [n1, n2, n3, n4])  # vtkQuad
                 else:
-                    elem = vtkQuadraticQuad()
-                    point_ids = elem.GetPointIds()
-                    point_ids.SetId(4, nid_map[node_ids[4]])
-                    point_ids.SetId(5, nid_map[node_ids[5]])
-                    point_ids.SetId(6, nid_map[node_ids[6]])
-                    point_ids.SetId(7, nid_map[node_ids[7]])
-
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
-                point_ids.SetId(3, n4)
-                grid.InsertNextCell(elem.GetCellType(), point_ids)
+                    cells.add(23, [n1, n2, n3, n4] +  # vtkQuadraticQuad
+                              [nid_map[nid] for nid in node_ids[4:8]])
             elif element.surface_type in ['AREA3', 'AREA6']:
                 eid_to_nid_map[eid] = node_ids[:3]
-                if element.Type == 'AREA3' or None in node_ids:
-                    elem = vtkTriangle()
-                    point_ids = elem.GetPointIds()
-                else:
-                    elem = vtkQuadraticTriangle()
-                    point_ids = elem.GetPointIds()
-                    point_ids.SetId(3, nid_map[node_ids[3]])
-                    point_ids.SetId(4, nid_map[node_ids[4]])
-                    point_ids.SetId(5, nid_map[node_ids[5]])
-
                 n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
                 p1 = xyz_cid0[n1, :]
                 p2 = xyz_cid0[n2, :]
@@ -841,10 +638,11 @@ def map_elements1_quality_helper(self,
                 out = tri_quality(p1, p2, p3)
                 (areai, max_skew, aspect_ratio,
                  min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
-                grid.InsertNextCell(elem.GetCellType(), point_ids)
+                if element.Type == 'AREA3' or None in node_ids:
+                    cells.add(5, [n1, n2, n3])  # vtkTriangle
+                else:
+                    cells.add(22, [n1, n2, n3] +  # vtkQuadraticTriangle
+                              [nid_map[nid] for nid in node_ids[3:6]])
             else:
                 #print('removing\n%s' % (element))
                 log.warning('removing eid=%s; %s' % (eid, element.type))
@@ -861,10 +659,7 @@ def map_elements1_quality_helper(self,
                 n1, n2 = [nid_map[nid] for nid in node_ids[:2]]
                 p1 = xyz_cid0[n1, :]
                 p2 = xyz_cid0[n2, :]
-                elem = vtkLine()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
+                cells.add(3, [n1, n2])  # vtkLine
             else:
                 msg = 'element_solid:\n%s' % (str(element_solid))
                 msg += 'mapped_inids = %s\n' % mapped_inids
@@ -872,7 +667,6 @@ def map_elements1_quality_helper(self,
                 msg += 'nodes = %s\n' % nodes
                 #msg += 'side_nodes = %s\n' % side_nodes
                 raise NotImplementedError(msg)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
 
         elif etype == 'CHBDYE':
             #|   1    |  2  |   3  |  4   |   5    |    6   |    7    |    8    |
@@ -901,10 +695,7 @@ def map_elements1_quality_helper(self,
                 #n1, n2 = [nid_map[nid] for nid in node_ids[:2]]
                 #p1 = xyz_cid0[n1, :]
                 #p2 = xyz_cid0[n2, :]
-                #elem = vtkLine()
-                #point_ids = elem.GetPointIds()
-                #point_ids.SetId(0, n1)
-                #point_ids.SetId(1, n2)
+                #cells.add(3, [n1, n2])  # vtkLine
             if len(side_inids) == 3:
                 n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
                 p1 = xyz_cid0[n1, :]
@@ -913,12 +704,7 @@ def map_elements1_quality_helper(self,
                 out = tri_quality(p1, p2, p3)
                 (areai, max_skew, aspect_ratio,
                  min_thetai, max_thetai, dideal_thetai, min_edge_lengthi) = out
-
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
             elif len(side_inids) == 4:
                 n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
                 p1 = xyz_cid0[n1, :]
@@ -928,13 +714,7 @@ def map_elements1_quality_helper(self,
                 out = quad_quality(element, p1, p2, p3, p4)
                 (areai, taper_ratioi, area_ratioi, max_skew, aspect_ratio,
                  min_thetai, max_thetai, dideal_thetai, min_edge_lengthi, max_warp) = out
-
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
-                point_ids.SetId(3, n4)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
             else:
                 msg = 'element_solid:\n%s' % (str(element_solid))
                 msg += 'mapped_inids = %s\n' % mapped_inids
@@ -942,7 +722,6 @@ def map_elements1_quality_helper(self,
                 msg += 'nodes = %s\n' % nodes
                 #msg += 'side_nodes = %s\n' % side_nodes
                 raise NotImplementedError(msg)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
 
         elif etype == 'GENEL':
             genel_nids = []
@@ -954,7 +733,6 @@ def map_elements1_quality_helper(self,
             node_ids = node_ids[:2]
             del genel_nids
 
-            elem = vtkLine()
             try:
                 n1, n2 = [nid_map[nid] for nid in node_ids]
             except KeyError:  # pragma: no cover
@@ -962,10 +740,7 @@ def map_elements1_quality_helper(self,
                 print(str(element))
                 print('nid_map = %s' % nid_map)
                 raise
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(3, [n1, n2])  # vtkLine
 
             #areai = np.nan
             pid = 0
@@ -1019,6 +794,7 @@ def map_elements1_quality_helper(self,
         i += 1
     #assert len(self.eid_map) > 0, self.eid_map
     #print('mapped elements')
+    cells.build(grid)
 
     nelements = i
     self.gui.nelements = nelements
@@ -1148,13 +924,15 @@ def map_elements1_no_quality_helper(self,
         #(0, 6, 5, 4), # (1, 7, 6, 5),
     #)
     line_type = 3 # vtkLine().GetCellType()
-
     nid_to_pid_map = defaultdict(list)
     pid = 0
 
     log = self.log
     grid = self.gui.grid
 
+    # the cells are created in a single call after the loop
+    cells = VtkCellBuilder()
+
     #print("map_elements...")
     eid_to_nid_map = self.eid_to_nid_map
     eid_map = self.gui.eid_map
@@ -1179,7 +957,6 @@ def map_elements1_no_quality_helper(self,
                 mcid, theta = get_shell_material_coord(element)
                 material_coord[i] = mcid
                 material_theta[i] = theta
-            elem = vtkTriangle()
             node_ids = element.node_ids
             pid = element.Pid()
             eid_to_nid_map[eid] = node_ids
@@ -1189,12 +966,7 @@ def map_elements1_no_quality_helper(self,
             #p1 = xyz_cid0[n1, :]
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
-
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(5, [n1, n2, n3])  # vtkTriangle
         elif isinstance(element, (CTRIA6, CPLSTN6, CPLSTS6, CTRIAX)):
             # the CTRIAX is a standard 6-noded element
             if isinstance(element, CTRIA6):
@@ -1204,26 +976,18 @@ def map_elements1_no_quality_helper(self,
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
-            if None not in node_ids:
-                elem = vtkQuadraticTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(3, nid_map[node_ids[3]])
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                eid_to_nid_map[eid] = node_ids
-            else:
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-                eid_to_nid_map[eid] = node_ids[:3]
 
             n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
             #p1 = xyz_cid0[n1, :]
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            if None not in node_ids:
+                eid_to_nid_map[eid] = node_ids
+                cells.add(22, [n1, n2, n3] +  # vtkQuadraticTriangle
+                          [nid_map[nid] for nid in node_ids[3:6]])
+            else:
+                eid_to_nid_map[eid] = node_ids[:3]
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
         elif isinstance(element, CTRIAX6):
             # the CTRIAX6 is not a standard second-order triangle
             #
@@ -1241,29 +1005,21 @@ def map_elements1_no_quality_helper(self,
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
 
-            if None not in node_ids:
-                elem = vtkQuadraticTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(3, nid_map[node_ids[1]])
-                point_ids.SetId(4, nid_map[node_ids[3]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4],
-                                       node_ids[1], node_ids[3], node_ids[5]]
-            else:
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-                eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4]]
-
             n1 = nid_map[node_ids[0]]
             n2 = nid_map[node_ids[2]]
             n3 = nid_map[node_ids[4]]
             #p1 = xyz_cid0[n1, :]
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            if None not in node_ids:
+                eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4],
+                                       node_ids[1], node_ids[3], node_ids[5]]
+                cells.add(22, [n1, n2, n3,  # vtkQuadraticTriangle
+                               nid_map[node_ids[1]], nid_map[node_ids[3]],
+                               nid_map[node_ids[5]]])
+            else:
+                eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4]]
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
 
         elif isinstance(element, CTRSHL):  # nastran95
             # the CTRIAX6 is not a standard second-order triangle
@@ -1281,15 +1037,6 @@ def map_elements1_no_quality_helper(self,
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
-            if None not in node_ids and 0:
-                elem = vtkQuadraticTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(3, nid_map[node_ids[1]])
-                point_ids.SetId(4, nid_map[node_ids[3]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-            else:
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
 
             n1 = nid_map[node_ids[0]]
             n2 = nid_map[node_ids[2]]
@@ -1297,12 +1044,10 @@ def map_elements1_no_quality_helper(self,
             #p1 = xyz_cid0[n1, :]
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
             eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4]]
 
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            # the midside nodes are not used
+            cells.add(5, [n1, n2, n3])  # vtkTriangle
 
         elif isinstance(element, (CQUAD4, CSHEAR, CQUADR, CPLSTN4, CPLSTS4, CQUADX4, CQUAD1)):
             if isinstance(element, (CQUAD4, CQUADR, CQUAD1)):
@@ -1326,14 +1071,7 @@ def map_elements1_no_quality_helper(self,
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
             #p4 = xyz_cid0[n4, :]
-
-            elem = vtkQuad()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(9, point_ids)
+            cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, (CQUAD8, CPLSTN8, CPLSTS8, CQUADX8)):
             if isinstance(element, CQUAD8):
@@ -1350,22 +1088,12 @@ def map_elements1_no_quality_helper(self,
             #p3 = xyz_cid0[n3, :]
             #p4 = xyz_cid0[n4, :]
             if None not in node_ids:
-                elem = vtkQuadraticQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(23, [n1, n2, n3, n4] +  # vtkQuadraticQuad
+                          [nid_map[nid] for nid in node_ids[4:8]])
             else:
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, (CQUAD, CQUADX)):
             # CQUAD, CQUADX are 9 noded quads
@@ -1383,36 +1111,19 @@ def map_elements1_no_quality_helper(self,
             #p3 = xyz_cid0[n3, :]
             #p4 = xyz_cid0[n4, :]
             if None not in node_ids:
-                elem = vtkBiQuadraticQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(28, [n1, n2, n3, n4] +  # vtkBiQuadraticQuad
+                          [nid_map[nid] for nid in node_ids[4:9]])
             else:
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, CTETRA4):
-            elem = vtkTetra()
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:4]
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            grid.InsertNextCell(10, point_ids)
+            cells.add(10, [nid_map[nid] for nid in node_ids[:4]])  # vtkTetra
             #elem_nid_map = {nid:nid_map[nid] for nid in node_ids[:4]}
 
         elif isinstance(element, CTETRA10):
@@ -1420,177 +1131,60 @@ def map_elements1_no_quality_helper(self,
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
             if None not in node_ids:
-                elem = vtkQuadraticTetra()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(24, [nid_map[nid] for nid in node_ids])  # vtkQuadraticTetra
             else:
-                elem = vtkTetra()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(10, [nid_map[nid] for nid in node_ids[:4]])  # vtkTetra
 
         elif isinstance(element, CPENTA6):
-            elem = vtkWedge()
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:6]
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            grid.InsertNextCell(13, point_ids)
+            cells.add(13, [nid_map[nid] for nid in node_ids[:6]])  # vtkWedge
 
         elif isinstance(element, CPENTA15):
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
             if None not in node_ids:
-                elem = vtkQuadraticWedge()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-                point_ids.SetId(12, nid_map[node_ids[12]])
-                point_ids.SetId(13, nid_map[node_ids[13]])
-                point_ids.SetId(14, nid_map[node_ids[14]])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(26, [nid_map[nid] for nid in node_ids])  # vtkQuadraticWedge
             else:
-                elem = vtkWedge()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:6]
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(13, [nid_map[nid] for nid in node_ids[:6]])  # vtkWedge
 
         elif isinstance(element, (CHEXA8, CIHEX1)):
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:8]
-            elem = vtkHexahedron()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(12, point_ids)
+            cells.add(12, [nid_map[nid] for nid in node_ids[:8]])  # vtkHexahedron
 
         elif isinstance(element, (CHEXA20, CIHEX2)):
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
-            if None not in node_ids:
-                elem = vtkQuadraticHexahedron()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-
-                # these two blocks are flipped
-                point_ids.SetId(12, nid_map[node_ids[16]])
-                point_ids.SetId(13, nid_map[node_ids[17]])
-                point_ids.SetId(14, nid_map[node_ids[18]])
-                point_ids.SetId(15, nid_map[node_ids[19]])
-
-                point_ids.SetId(16, nid_map[node_ids[12]])
-                point_ids.SetId(17, nid_map[node_ids[13]])
-                point_ids.SetId(18, nid_map[node_ids[14]])
-                point_ids.SetId(19, nid_map[node_ids[15]])
-                eid_to_nid_map[eid] = node_ids
-            else:
-                elem = vtkHexahedron()
-                eid_to_nid_map[eid] = node_ids[:8]
-
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            _add_hexa20_cell(cells, eid, node_ids, nid_map, eid_to_nid_map)
 
         elif isinstance(element, CPYRAM5):
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:5]
-            elem = vtkPyramid()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            # etype = 14
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(14, [nid_map[nid] for nid in node_ids[:5]])  # vtkPyramid
         elif isinstance(element, CPYRAM13):
             node_ids = element.node_ids
             pid = element.Pid()
             if None not in node_ids:
-                elem = vtkQuadraticPyramid()
-                point_ids = elem.GetPointIds()
-                #etype = 27
-                _nids = [nid_map[node_ids[i]] for i in range(13)]
-                point_ids.SetId(0, _nids[0])
-                point_ids.SetId(1, _nids[1])
-                point_ids.SetId(2, _nids[2])
-                point_ids.SetId(3, _nids[3])
-                point_ids.SetId(4, _nids[4])
-
-                point_ids.SetId(5, _nids[5])
-                point_ids.SetId(6, _nids[6])
-                point_ids.SetId(7, _nids[7])
-                point_ids.SetId(8, _nids[8])
-
-                point_ids.SetId(9, _nids[9])
-                point_ids.SetId(10, _nids[10])
-                point_ids.SetId(11, _nids[11])
-                point_ids.SetId(12, _nids[12])
                 eid_to_nid_map[eid] = node_ids
+                cells.add(27, [nid_map[nid] for nid in node_ids[:13]])  # vtkQuadraticPyramid
             else:
-                elem = vtkPyramid()
-                point_ids = elem.GetPointIds()
                 eid_to_nid_map[eid] = node_ids[:5]
-                point_ids.SetId(0, nid_map[node_ids[0]])
-                point_ids.SetId(1, nid_map[node_ids[1]])
-                point_ids.SetId(2, nid_map[node_ids[2]])
-                point_ids.SetId(3, nid_map[node_ids[3]])
-                point_ids.SetId(4, nid_map[node_ids[4]])
+                cells.add(14, [nid_map[nid] for nid in node_ids[:5]])  # vtkPyramid
             #print('*node_ids =', node_ids[:5])
 
-
-            #if min(node_ids) > 0:
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
-
         elif etype in {'CBUSH', 'CBUSH1D', 'CFAST',
                        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
                        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
@@ -1629,30 +1223,24 @@ def map_elements1_no_quality_helper(self,
 
                 #if 1:
                 #print(str(element))
-                elem = vtkVertex()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, j)
+                cells.add(1, [j])  # vtkVertex
                 #else:
                     #elem = vtkSphere()
                     #elem = vtkSphereSource()
                     #if d == 0.:
                     #d = sphere_size
                     #elem.SetRadius(sphere_size)
-                grid.InsertNextCell(elem.GetCellType(), point_ids)
             else:
                 # 2 points
                 #d = norm(element.nodes[0].get_position() - element.nodes[1].get_position())
                 eid_to_nid_map[eid] = node_ids
-                elem = vtkLine()
-                point_ids = elem.GetPointIds()
                 try:
-                    point_ids.SetId(0, nid_map[node_ids[0]])
-                    point_ids.SetId(1, nid_map[node_ids[1]])
+                    n1, n2 = nid_map[node_ids[0]], nid_map[node_ids[1]]
                 except KeyError:
                     print("node_ids =", node_ids)
                     print(str(element))
                     continue
-                grid.InsertNextCell(line_type, point_ids)
+                cells.add(line_type, [n1, n2])
 
         elif etype in ('CBAR', 'CBEAM', 'CROD', 'CONROD', 'CTUBE'):
             if etype == 'CONROD':
@@ -1674,7 +1262,6 @@ def map_elements1_no_quality_helper(self,
             #xyz1 = xyz_cid0[n1, :]
             #xyz2 = xyz_cid0[n2, :]
             eid_to_nid_map[eid] = node_ids
-            elem = vtkLine()
             try:
                 n1, n2 = [nid_map[nid] for nid in node_ids]
             except KeyError:  # pragma: no cover
@@ -1682,10 +1269,7 @@ def map_elements1_no_quality_helper(self,
                 print(str(element))
                 print('nid_map = %s' % nid_map)
                 raise
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            grid.InsertNextCell(line_type, point_ids)
+            cells.add(line_type, [n1, n2])
 
         elif etype == 'CBEND':
             pid = element.Pid()
@@ -1705,15 +1289,10 @@ def map_elements1_no_quality_helper(self,
                         g0, element.x, element)
                     raise NotImplementedError(msg)
                 # only supports g0 as an integer
-                elem = vtkQuadraticEdge()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(2, nid_map[g0])
+                cells.add(21, [nid_map[node_ids[0]], nid_map[node_ids[1]],  # vtkQuadraticEdge
+                               nid_map[g0]])
             else:
-                elem = vtkLine()
-                point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(line_type, [nid_map[node_ids[0]], nid_map[node_ids[1]]])
 
         elif etype == 'CHBDYG':
             node_ids = element.node_ids
@@ -1730,41 +1309,21 @@ def map_elements1_no_quality_helper(self,
                 #p3 = xyz_cid0[n3, :]
                 #p4 = xyz_cid0[n4, :]
                 if element.surface_type == 'AREA4' or None in node_ids:
-                    elem = vtkQuad()
-                    point_ids = elem.GetPointIds()
+                    cells.add(9, [n1, n2, n3, n4])  # vtkQuad
                 else:
-                    elem = vtkQuadraticQuad()
-                    point_ids = elem.GetPointIds()
-                    point_ids.SetId(4, nid_map[node_ids[4]])
-                    point_ids.SetId(5, nid_map[node_ids[5]])
-                    point_ids.SetId(6, nid_map[node_ids[6]])
-                    point_ids.SetId(7, nid_map[node_ids[7]])
-
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
-                point_ids.SetId(3, n4)
-                grid.InsertNextCell(elem.GetCellType(), point_ids)
+                    cells.add(23, [n1, n2, n3, n4] +  # vtkQuadraticQuad
+                              [nid_map[nid] for nid in node_ids[4:8]])
             elif element.surface_type in ['AREA3', 'AREA6']:
                 eid_to_nid_map[eid] = node_ids[:3]
-                if element.surface_type == 'AREA3' or None in node_ids:
-                    elem = vtkTriangle()
-                    point_ids = elem.GetPointIds()
-                else:
-                    elem = vtkQuadraticTriangle()
-                    point_ids = elem.GetPointIds()
-                    point_ids.SetId(3, nid_map[node_ids[3]])
-                    point_ids.SetId(4, nid_map[node_ids[4]])
-                    point_ids.SetId(5, nid_map[node_ids[5]])
-
                 n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
                 #p1 = xyz_cid0[n1, :]
                 #p2 = xyz_cid0[n2, :]
                 #p3 = xyz_cid0[n3, :]
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
-                grid.InsertNextCell(elem.GetCellType(), point_ids)
+                if element.surface_type == 'AREA3' or None in node_ids:
+                    cells.add(5, [n1, n2, n3])  # vtkTriangle
+                else:
+                    cells.add(22, [n1, n2, n3] +  # vtkQuadraticTriangle
+                              [nid_map[nid] for nid in node_ids[3:6]])
             else:
                 #print('removing\n%s' % (element))
                 self.log.warning('removing eid=%s; %s' % (eid, element.type))
@@ -1798,25 +1357,14 @@ def map_elements1_no_quality_helper(self,
                 #p1 = xyz_cid0[n1, :]
                 #p2 = xyz_cid0[n2, :]
                 #p3 = xyz_cid0[n3, :]
-
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
             elif len(side_inids) == 4:
                 n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids[:4]]
                 #p1 = xyz_cid0[n1, :]
                 #p2 = xyz_cid0[n2, :]
                 #p3 = xyz_cid0[n3, :]
                 #p4 = xyz_cid0[n4, :]
-
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, n1)
-                point_ids.SetId(1, n2)
-                point_ids.SetId(2, n3)
-                point_ids.SetId(3, n4)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
             else:
                 msg = 'element_solid:\n%s' % (str(element_solid))
                 msg += 'mapped_inids = %s\n' % mapped_inids
@@ -1824,68 +1372,22 @@ def map_elements1_no_quality_helper(self,
                 msg += 'nodes = %s\n' % nodes
                 #msg += 'side_nodes = %s\n' % side_nodes
                 raise NotImplementedError(msg)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
         elif etype == 'GENEL':
             node_ids = element.node_ids
             pid = 0
-            elem = vtkLine()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
+            #cells.add(line_type, [nid_map[node_ids[0]], nid_map[node_ids[1]]])
         elif isinstance(element, CHEXA1):
             node_ids = element.node_ids
             pid = 0
             #mid = element.Mid()
             _set_nid_to_pid_map(nid_to_pid_map, pid, node_ids)
             eid_to_nid_map[eid] = node_ids[:8]
-            elem = vtkHexahedron()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(12, point_ids)
+            cells.add(12, [nid_map[nid] for nid in node_ids[:8]])  # vtkHexahedron
         elif isinstance(element, CHEXA2):
             node_ids = element.node_ids
             pid = 0
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
-            if None not in node_ids:
-                elem = vtkQuadraticHexahedron()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-
-                # these two blocks are flipped
-                point_ids.SetId(12, nid_map[node_ids[16]])
-                point_ids.SetId(13, nid_map[node_ids[17]])
-                point_ids.SetId(14, nid_map[node_ids[18]])
-                point_ids.SetId(15, nid_map[node_ids[19]])
-
-                point_ids.SetId(16, nid_map[node_ids[12]])
-                point_ids.SetId(17, nid_map[node_ids[13]])
-                point_ids.SetId(18, nid_map[node_ids[14]])
-                point_ids.SetId(19, nid_map[node_ids[15]])
-                eid_to_nid_map[eid] = node_ids
-            else:
-                elem = vtkHexahedron()
-                point_ids = elem.GetPointIds()
-                eid_to_nid_map[eid] = node_ids[:8]
-
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            _add_hexa20_cell(cells, eid, node_ids, nid_map, eid_to_nid_map)
         else:
             log.warning('removing\n%s' % (element))
             log.warning('removing eid=%s; %s' % (eid, element.type))
@@ -1910,6 +1412,7 @@ def map_elements1_no_quality_helper(self,
         i += 1
     #assert len(self.eid_map) > 0, self.eid_map
     #print('mapped elements')
+    cells.build(grid)
 
     nelements = i
     #print('nelements=%s pids=%s' % (nelements, list(pids)))
@@ -1945,6 +1448,9 @@ def create_ugrid_from_elements(gui: MainWindow,
     nid_to_pid_map = defaultdict(list)
     pid = 0
 
+    # the cells are created in a single call after the loop
+    cells = VtkCellBuilder()
+
     #print("map_elements...")
     #eid_to_nid_map = self.eid_to_nid_map
     #eid_map = self.gui.eid_map
@@ -1965,7 +1471,6 @@ def create_ugrid_from_elements(gui: MainWindow,
         pid = np.nan
 
         if isinstance(element, (CTRIA3, CTRIAR, CTRAX3, CPLSTN3, CPLSTS3)):
-            elem = vtkTriangle()
             node_ids = element.node_ids
             pid = element.Pid()
             #eid_to_nid_map[eid] = node_ids
@@ -1975,37 +1480,22 @@ def create_ugrid_from_elements(gui: MainWindow,
             #p1 = xyz_cid0[n1, :]
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
-
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(5, [n1, n2, n3])  # vtkTriangle
         elif isinstance(element, (CTRIA6, CPLSTN6, CPLSTS6, CTRIAX)):
             # the CTRIAX is a standard 6-noded element
             node_ids = element.node_ids
             pid = element.Pid()
             _set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
-            if None not in node_ids:
-                elem = vtkQuadraticTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(3, nid_map[node_ids[3]])
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                #eid_to_nid_map[eid] = node_ids
-            else:
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-                #eid_to_nid_map[eid] = node_ids[:3]
 
             n1, n2, n3 = [nid_map[nid] for nid in node_ids[:3]]
             #p1 = xyz_cid0[n1, :]
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            if None not in node_ids:
+                cells.add(22, [n1, n2, n3] +  # vtkQuadraticTriangle
+                          [nid_map[nid] for nid in node_ids[3:6]])
+            else:
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
         elif isinstance(element, CTRIAX6):
             # the CTRIAX6 is not a standard second-order triangle
             #
@@ -2023,29 +1513,18 @@ def create_ugrid_from_elements(gui: MainWindow,
             #pid = element.Pid()
             #_set_nid_to_pid_map_or_blank(nid_to_pid_map, pid, node_ids)
 
-            if None not in node_ids:
-                elem = vtkQuadraticTriangle()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(3, nid_map[node_ids[1]])
-                point_ids.SetId(4, nid_map[node_ids[3]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                #eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4],
-                                       #node_ids[1], node_ids[3], node_ids[5]]
-            else:
-                elem = vtkTriangle()
-                point_ids = elem.GetPointIds()
-                #eid_to_nid_map[eid] = [node_ids[0], node_ids[2], node_ids[4]]
-
             n1 = nid_map[node_ids[0]]
             n2 = nid_map[node_ids[2]]
             n3 = nid_map[node_ids[4]]
             #p1 = xyz_cid0[n1, :]
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            if None not in node_ids:
+                cells.add(22, [n1, n2, n3,  # vtkQuadraticTriangle
+                               nid_map[node_ids[1]], nid_map[node_ids[3]],
+                               nid_map[node_ids[5]]])
+            else:
+                cells.add(5, [n1, n2, n3])  # vtkTriangle
         elif isinstance(element, (CQUAD4, CSHEAR, CQUADR, CPLSTN4, CPLSTS4, CQUADX4, CQUAD1)):
             node_ids = element.node_ids
             #eid_to_nid_map[eid] = node_ids
@@ -2062,14 +1541,7 @@ def create_ugrid_from_elements(gui: MainWindow,
             #p2 = xyz_cid0[n2, :]
             #p3 = xyz_cid0[n3, :]
             #p4 = xyz_cid0[n4, :]
-
-            elem = vtkQuad()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(9, point_ids)
+            cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, (CQUAD8, CPLSTN8, CPLSTS8, CQUADX8)):
             node_ids = element.node_ids
@@ -2082,22 +1554,10 @@ def create_ugrid_from_elements(gui: MainWindow,
             #p3 = xyz_cid0[n3, :]
             #p4 = xyz_cid0[n4, :]
             if None not in node_ids:
-                elem = vtkQuadraticQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                #eid_to_nid_map[eid] = node_ids
+                cells.add(23, [n1, n2, n3, n4] +  # vtkQuadraticQuad
+                          [nid_map[nid] for nid in node_ids[4:8]])
             else:
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
-                #eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, (CQUAD, CQUADX)):
             # CQUAD, CQUADX are 9 noded quads
@@ -2109,198 +1569,57 @@ def create_ugrid_from_elements(gui: MainWindow,
             #p3 = xyz_cid0[n3, :]
             #p4 = xyz_cid0[n4, :]
             if None not in node_ids:
-                elem = vtkBiQuadraticQuad()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                #eid_to_nid_map[eid] = node_ids
+                cells.add(28, [n1, n2, n3, n4] +  # vtkBiQuadraticQuad
+                          [nid_map[nid] for nid in node_ids[4:9]])
             else:
-                elem = vtkQuad()
-                point_ids = elem.GetPointIds()
-                #eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            point_ids.SetId(2, n3)
-            point_ids.SetId(3, n4)
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(9, [n1, n2, n3, n4])  # vtkQuad
 
         elif isinstance(element, CTETRA4):
-            elem = vtkTetra()
             node_ids = element.node_ids
             #eid_to_nid_map[eid] = node_ids[:4]
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            grid.InsertNextCell(10, point_ids)
+            cells.add(10, [nid_map[nid] for nid in node_ids[:4]])  # vtkTetra
             #elem_nid_map = {nid:nid_map[nid] for nid in node_ids[:4]}
 
         elif isinstance(element, CTETRA10):
             node_ids = element.node_ids
             if None not in node_ids:
-                elem = vtkQuadraticTetra()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(4, nid_map[node_ids[4]])
-                point_ids.SetId(5, nid_map[node_ids[5]])
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                #eid_to_nid_map[eid] = node_ids
+                cells.add(24, [nid_map[nid] for nid in node_ids])  # vtkQuadraticTetra
             else:
-                elem = vtkTetra()
-                point_ids = elem.GetPointIds()
-                #eid_to_nid_map[eid] = node_ids[:4]
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(10, [nid_map[nid] for nid in node_ids[:4]])  # vtkTetra
 
         elif isinstance(element, CPENTA6):
-            elem = vtkWedge()
             node_ids = element.node_ids
             #eid_to_nid_map[eid] = node_ids[:6]
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            grid.InsertNextCell(13, point_ids)
+            cells.add(13, [nid_map[nid] for nid in node_ids[:6]])  # vtkWedge
 
         elif isinstance(element, CPENTA15):
             node_ids = element.node_ids
             if None not in node_ids:
-                elem = vtkQuadraticWedge()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(6, nid_map[node_ids[6]])
-                point_ids.SetId(7, nid_map[node_ids[7]])
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-                point_ids.SetId(12, nid_map[node_ids[12]])
-                point_ids.SetId(13, nid_map[node_ids[13]])
-                point_ids.SetId(14, nid_map[node_ids[14]])
-                #eid_to_nid_map[eid] = node_ids
+                cells.add(26, [nid_map[nid] for nid in node_ids])  # vtkQuadraticWedge
             else:
-                elem = vtkWedge()
-                point_ids = elem.GetPointIds()
-                #eid_to_nid_map[eid] = node_ids[:6]
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+                cells.add(13, [nid_map[nid] for nid in node_ids[:6]])  # vtkWedge
 
         elif isinstance(element, CHEXA8):
             node_ids = element.node_ids
             #eid_to_nid_map[eid] = node_ids[:8]
-            elem = vtkHexahedron()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(12, point_ids)
+            cells.add(12, [nid_map[nid] for nid in node_ids[:8]])  # vtkHexahedron
 
         elif isinstance(element, CHEXA20):
             node_ids = element.node_ids
-            if None not in node_ids:
-                elem = vtkQuadraticHexahedron()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(8, nid_map[node_ids[8]])
-                point_ids.SetId(9, nid_map[node_ids[9]])
-                point_ids.SetId(10, nid_map[node_ids[10]])
-                point_ids.SetId(11, nid_map[node_ids[11]])
-
-                # these two blocks are flipped
-                point_ids.SetId(12, nid_map[node_ids[16]])
-                point_ids.SetId(13, nid_map[node_ids[17]])
-                point_ids.SetId(14, nid_map[node_ids[18]])
-                point_ids.SetId(15, nid_map[node_ids[19]])
-
-                point_ids.SetId(16, nid_map[node_ids[12]])
-                point_ids.SetId(17, nid_map[node_ids[13]])
-                point_ids.SetId(18, nid_map[node_ids[14]])
-                point_ids.SetId(19, nid_map[node_ids[15]])
-                #eid_to_nid_map[eid] = node_ids
-            else:
-                elem = vtkHexahedron()
-                #eid_to_nid_map[eid] = node_ids[:8]
-
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            point_ids.SetId(5, nid_map[node_ids[5]])
-            point_ids.SetId(6, nid_map[node_ids[6]])
-            point_ids.SetId(7, nid_map[node_ids[7]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            _add_hexa20_cell(cells, eid, node_ids, nid_map, {})
 
         elif isinstance(element, CPYRAM5):
             node_ids = element.node_ids
             #eid_to_nid_map[eid] = node_ids[:5]
-            elem = vtkPyramid()
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            point_ids.SetId(2, nid_map[node_ids[2]])
-            point_ids.SetId(3, nid_map[node_ids[3]])
-            point_ids.SetId(4, nid_map[node_ids[4]])
-            # etype = 14
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(14, [nid_map[nid] for nid in node_ids[:5]])  # vtkPyramid
         elif isinstance(element, CPYRAM13):
             node_ids = element.node_ids
             if None not in node_ids:
-                elem = vtkQuadraticPyramid()
-                point_ids = elem.GetPointIds()
-                #etype = 27
-                _nids = [nid_map[node_ids[i]] for i in range(13)]
-                point_ids.SetId(0, _nids[0])
-                point_ids.SetId(1, _nids[1])
-                point_ids.SetId(2, _nids[2])
-                point_ids.SetId(3, _nids[3])
-                point_ids.SetId(4, _nids[4])
-
-                point_ids.SetId(5, _nids[5])
-                point_ids.SetId(6, _nids[6])
-                point_ids.SetId(7, _nids[7])
-                point_ids.SetId(8, _nids[8])
-
-                point_ids.SetId(9, _nids[9])
-                point_ids.SetId(10, _nids[10])
-                point_ids.SetId(11, _nids[11])
-                point_ids.SetId(12, _nids[12])
-                #eid_to_nid_map[eid] = node_ids
+                cells.add(27, [nid_map[nid] for nid in node_ids[:13]])  # vtkQuadraticPyramid
             else:
-                elem = vtkPyramid()
-                point_ids = elem.GetPointIds()
-                #eid_to_nid_map[eid] = node_ids[:5]
-                point_ids.SetId(0, nid_map[node_ids[0]])
-                point_ids.SetId(1, nid_map[node_ids[1]])
-                point_ids.SetId(2, nid_map[node_ids[2]])
-                point_ids.SetId(3, nid_map[node_ids[3]])
-                point_ids.SetId(4, nid_map[node_ids[4]])
+                cells.add(14, [nid_map[nid] for nid in node_ids[:5]])  # vtkPyramid
             #print('*node_ids =', node_ids[:5])
 
-            #if min(node_ids) > 0:
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
-
         elif etype in {'CBUSH', 'CBUSH1D', 'CFAST',
                        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
                        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
@@ -2326,34 +1645,26 @@ def create_ugrid_from_elements(gui: MainWindow,
                     log.warning('removing CELASx eid=%i -> SPOINT %i' % (eid, nid))
                     continue
 
-                #c = nid_map[nid]
-
                 #if 1:
                 #print(str(element))
-                elem = vtkVertex()
-                point_ids = elem.GetPointIds()
-                point_ids.SetId(0, j)
+                cells.add(1, [nid_map[nid]])  # vtkVertex
                 #else:
                     #elem = vtkSphere()
                     #elem = vtkSphereSource()
                     #if d == 0.:
                     #d = sphere_size
                     #elem.SetRadius(sphere_size)
-                grid.InsertNextCell(elem.GetCellType(), point_ids)
             else:
                 # 2 points
                 #d = norm(element.nodes[0].get_position() - element.nodes[1].get_position())
                 #eid_to_nid_map[eid] = node_ids
-                elem = vtkLine()
-                point_ids = elem.GetPointIds()
                 try:
-                    point_ids.SetId(0, nid_map[node_ids[0]])
-                    point_ids.SetId(1, nid_map[node_ids[1]])
+                    n1, n2 = nid_map[node_ids[0]], nid_map[node_ids[1]]
                 except KeyError:
                     print("node_ids =", node_ids)
                     print(str(element))
                     continue
-                grid.InsertNextCell(line_type, point_ids)
+                cells.add(line_type, [n1, n2])
 
         elif etype in ('CBAR', 'CBEAM', 'CROD', 'CONROD', 'CTUBE'):
             node_ids = element.node_ids
@@ -2363,7 +1674,6 @@ def create_ugrid_from_elements(gui: MainWindow,
             #xyz1 = xyz_cid0[n1, :]
             #xyz2 = xyz_cid0[n2, :]
             #eid_to_nid_map[eid] = node_ids
-            elem = vtkLine()
             try:
                 n1, n2 = [nid_map[nid] for nid in node_ids]
             except KeyError:  # pragma: no cover
@@ -2371,10 +1681,7 @@ def create_ugrid_from_elements(gui: MainWindow,
                 print(str(element))
                 print('nid_map = %s' % nid_map)
                 raise
-            point_ids = elem.GetPointIds()
-            point_ids.SetId(0, n1)
-            point_ids.SetId(1, n2)
-            grid.InsertNextCell(line_type, point_ids)
+            cells.add(line_type, [n1, n2])
 
         elif etype == 'CBEND':
             node_ids = element.node_ids
@@ -2384,10 +1691,7 @@ def create_ugrid_from_elements(gui: MainWindow,
             #xyz1 = xyz_cid0[n1, :]
             #xyz2 = xyz_cid0[n2, :]
             #eid_to_nid_map[eid] = node_ids
-
-            point_ids.SetId(0, nid_map[node_ids[0]])
-            point_ids.SetId(1, nid_map[node_ids[1]])
-            grid.InsertNextCell(elem.GetCellType(), point_ids)
+            cells.add(line_type, [nid_map[node_ids[0]], nid_map[node_ids[1]]])
         else:
             log.warning('removing\n%s' % (element))
             log.warning('removing eid=%s; %s' % (eid, element.type))
@@ -2402,6 +1706,7 @@ def create_ugrid_from_elements(gui: MainWindow,
         i += 1
     #assert len(self.eid_map) > 0, self.eid_map
     #print('mapped elements')
+    cells.build(grid)
 
     #nelements = i
     #print('nelements=%s pids=%s' % (nelements, list(pids)))
@@ -2968,6 +2273,21 @@ def _set_nid_to_pid_map_or_blank(nid_to_pid_map: dict[int, list[int]],
         if nid is not None:
             nid_to_pid_map[nid].append(pid)
 
+def _add_hexa20_cell(cells: VtkCellBuilder,
+                     eid: int,
+                     node_ids: list[Optional[int]],
+                     nid_map: dict[int, int],
+                     eid_to_nid_map: dict[int, list[int]]) -> None:
+    """adds a CHEXA20 as a vtkQuadraticHexahedron or a vtkHexahedron"""
+    if None not in node_ids:
+        # the last two blocks of midside nodes are flipped
+        vtk_node_ids = node_ids[:12] + node_ids[16:20] + node_ids[12:16]
+        cells.add(25, [nid_map[nid] for nid in vtk_node_ids])  # vtkQuadraticHexahedron
+        eid_to_nid_map[eid] = node_ids
+    else:
+        cells.add(12, [nid_map[nid] for nid in node_ids[:8]])  # vtkHexahedron
+        eid_to_nid_map[eid] = node_ids[:8]
+
 def get_caero_control_surface_grid(grid,
                                    box_id_to_caero_element_map,
                                    caero_points,
@@ -58,3 +58,145 @@ def nodal_average(nodal_combine_func: Callable[[np.ndarray], np.ndarray],
         inidi = nid_to_inid_map[nid]
         data2[inidi] = collapsed_value
     return data2
+
+
+class NodalGrouping:
+    """
+    Groups the element-node rows of a result by node id.
+
+    The rows are sorted by node once, so a nodal combine is a single
+    ``ufunc.reduceat`` over the sorted data instead of a Python loop
+    over the nodes.  The grouping only depends on the element-node
+    array, so it's reused across components, layers and time steps.
+    """
+    def __init__(self, node_ids: np.ndarray):
+        """
+        Parameters
+        ----------
+        node_ids : (nelement_node, ) int ndarray
+            the node id of each data row (e.g., element_node[:, 1])
+
+        """
+        node_ids = np.asarray(node_ids)
+        nrows = len(node_ids)
+        self.nrows = nrows
+
+        #: the rows sorted by node id
+        self.isort = np.argsort(node_ids, kind='stable')
+        sorted_node_ids = node_ids[self.isort]
+
+        is_first = np.ones(nrows, dtype='bool')
+        is_first[1:] = sorted_node_ids[1:] != sorted_node_ids[:-1]
+
+        #: the first sorted row of each node
+        self.istart = np.flatnonzero(is_first)
+
+        #: the unique node ids (same as np.unique(node_ids))
+        self.nids = sorted_node_ids[self.istart]
+
+        #: the number of rows for each node
+        self.counts = np.diff(np.append(self.istart, nrows))
+
+    @property
+    def nnode(self) -> int:
+        return len(self.nids)
+
+    def sort(self, data: np.ndarray) -> np.ndarray:
+        """sorts the (nelement_node, ) data by node"""
+        assert len(data) == self.nrows, (len(data), self.nrows)
+        return data[self.isort]
+
+    def __repr__(self) -> str:
+        return f'NodalGrouping(nrows={self.nrows}, nnode={self.nnode})'
+
+
+def _grouped_max(grouping: NodalGrouping, data: np.ndarray) -> np.ndarray:
+    # fmax ignores nan unless all the values are nan (like nanmax)
+    return np.fmax.reduceat(grouping.sort(data), grouping.istart)
+
+def _grouped_min(grouping: NodalGrouping, data: np.ndarray) -> np.ndarray:
+    return np.fmin.reduceat(grouping.sort(data), grouping.istart)
+
+def _grouped_abs_max(grouping: NodalGrouping, data: np.ndarray) -> np.ndarray:
+    sorted_data = grouping.sort(data)
+    mini = np.fmin.reduceat(sorted_data, grouping.istart)
+    maxi = np.fmax.reduceat(sorted_data, grouping.istart)
+    return np.where(np.abs(mini) > np.abs(maxi), mini, maxi)
+
+def _grouped_difference(grouping: NodalGrouping, data: np.ndarray) -> np.ndarray:
+    sorted_data = grouping.sort(data)
+    mini = np.fmin.reduceat(sorted_data, grouping.istart)
+    maxi = np.fmax.reduceat(sorted_data, grouping.istart)
+    return maxi - mini
+
+def _grouped_nanmean(grouping: NodalGrouping,
+                     sorted_data: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns
+    -------
+    mean : (nnode, ) float64 ndarray
+        the mean (nan for an all nan node)
+    nvalid : (nnode, ) int ndarray
+        the number of non-nan values for each node
+    is_valid : (nelement_node, ) bool ndarray
+        the non-nan flag of the sorted data
+
+    """
+    is_valid = ~np.isnan(sorted_data)
+    nvalid = np.add.reduceat(is_valid.astype('int64'), grouping.istart)
+    # sum in float64 to not lose precision on nodes with lots of elements
+    total = np.add.reduceat(np.where(is_valid, sorted_data, 0.), grouping.istart,
+                            dtype='float64')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = total / nvalid
+    return mean, nvalid, is_valid
+
+def _grouped_mean(grouping: NodalGrouping, data: np.ndarray) -> np.ndarray:
+    mean, unused_nvalid, unused_is_valid = _grouped_nanmean(grouping, grouping.sort(data))
+    return mean
+
+def _grouped_std(grouping: NodalGrouping, data: np.ndarray) -> np.ndarray:
+    sorted_data = grouping.sort(data)
+    mean, nvalid, is_valid = _grouped_nanmean(grouping, sorted_data)
+    # two pass, so we don't need to worry about cancellation
+    deviation = np.where(is_valid, sorted_data - np.repeat(mean, grouping.counts), 0.)
+    sum_squares = np.add.reduceat(deviation ** 2, grouping.istart, dtype='float64')
+    with np.errstate(invalid='ignore', divide='ignore'):
+        std = np.sqrt(sum_squares / nvalid)
+    return std
+
+grouped_nodal_combine_map: dict[str, Callable[[NodalGrouping, np.ndarray], np.ndarray]] = {
+    'Absolute Max': _grouped_abs_max,
+    'Mean': _grouped_mean,
+    'Max': _grouped_max,
+    'Min': _grouped_min,
+    'Difference': _grouped_difference,
+    'Std. Dev.': _grouped_std,
+}
+
+def grouped_nodal_average(nodal_combine: str,
+                          grouping: NodalGrouping,
+                          data: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of ``nodal_average``
+
+    Parameters
+    ----------
+    nodal_combine : str
+        a key of nodal_combine_map (e.g., 'Mean')
+    grouping : NodalGrouping
+        the grouping of the element-node rows
+    data : (nelement_node, ) float ndarray
+        the element-node data
+
+    Returns
+    -------
+    data2 : (nnode, ) float ndarray
+        the combined data in grouping.nids order
+
+    """
+    if grouping.nrows == 0:
+        return np.full(0, np.nan, dtype=data.dtype)
+    combine_func = grouped_nodal_combine_map[nodal_combine]
+    data2 = combine_func(grouping, data).astype(data.dtype, copy=False)
+    return data2
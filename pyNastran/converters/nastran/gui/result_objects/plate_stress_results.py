@@ -8,7 +8,7 @@ from pyNastran.femutils.utils import abs_nan_min_max, safe_nanstd
 
 from .vector_results import VectorResultsCommon, filter_ids
 from .stress_reduction import von_mises_2d, max_shear
-from .nodal_averaging import nodal_average, nodal_combine_map, derivation_map
+from .nodal_averaging import NodalGrouping, grouped_nodal_average, derivation_map
 
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.bdf.bdf import BDF
@@ -192,6 +192,10 @@ class PlateStrainStressResults2(VectorResultsCommon):
         self.element_node = element_node
         self.node_data = node_data
 
+        # the element_node rows grouped by node; built on the first
+        # corner result and reused for the other results/times
+        self._nodal_grouping: Optional[NodalGrouping] = None
+
         assert len(np.unique(self.centroid_eids)) == len(self.centroid_eids)
 
         common_eids = np.intersect1d(self.centroid_eids, element_id)
@@ -556,15 +560,11 @@ class PlateStrainStressResults2(VectorResultsCommon):
                           ilayer: np.ndarray) -> np.ndarray:
         #(ntime, neidsi_nnode, nlayer, nresult) = node_data.shape
         node_data = self.node_data
-        element_node = self.element_node
 
         # make sure we never have an issue with these
-        nodal_combine_func = nodal_combine_map[self.nodal_combine]
         derivation_func = derivation_map[self.min_max_method]
-
-        nids = np.unique(element_node[:, 1])
-        nnode = len(nids)
-        nid_to_inid_map = {nid: i for i, nid in enumerate(nids)}
+        grouping = self._get_nodal_grouping()
+        nnode = grouping.nnode
 
         #ioxx = 1
         #ioyy = 2
@@ -606,18 +606,21 @@ class PlateStrainStressResults2(VectorResultsCommon):
         else:
             # 2 layers
             derived_data = derivation_func(data, axis=0)
-        element_node2 = element_node[::2, :]
 
         # ----------------------------------------------------------------------
         ## nodal combine step
         # time to nodal average
-        data2 = nodal_average(
-            nodal_combine_func,
-            element_node2, derived_data,
-            nids, nid_to_inid_map)
+        data2 = grouped_nodal_average(self.nodal_combine, grouping, derived_data)
         assert len(data2) == nnode, (len(data2), nnode)
         return data2
 
+    def _get_nodal_grouping(self) -> NodalGrouping:
+        """groups the (bottom layer) element_node rows by node"""
+        if self._nodal_grouping is None:
+            element_node2 = self.element_node[::2, :]
+            self._nodal_grouping = NodalGrouping(element_node2[:, 1])
+        return self._nodal_grouping
+
     def _get_centroid_result(self, itime: int,
                              iresult: int | str,
                              ilayer: np.ndarray) -> np.ndarray:
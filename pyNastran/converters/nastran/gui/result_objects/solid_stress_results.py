@@ -5,7 +5,7 @@ from typing import Union, Optional, Any, TYPE_CHECKING
 
 from pyNastran.utils.mathematics import get_abs_max
 #from pyNastran.femutils.utils import abs_nan_min_max # , pivot_table,  # abs_min_max
-from .nodal_averaging import nodal_average, nodal_combine_map
+from .nodal_averaging import NodalGrouping, grouped_nodal_average
 #from pyNastran.bdf.utils import write_patran_syntax_dict
 
 from .vector_results import VectorResultsCommon, filter_ids
@@ -125,6 +125,10 @@ class SolidStrainStressResults2(VectorResultsCommon):
         self.element_node = element_node
         self.node_data = node_data
 
+        # the element_node rows grouped by node; built on the first
+        # corner result and reused for the other results/times
+        self._nodal_grouping: Optional[NodalGrouping] = None
+
         #common_eids = np.intersect1d(self.centroid_eids, element_id)
         #if len(common_eids) == 0:
             #raise IndexError('no solid elements found...')
@@ -454,16 +458,7 @@ class SolidStrainStressResults2(VectorResultsCommon):
         ## TODO: consider implementing Average/Derive
         # ----------------------------------------------------------
         # setup
-        nodal_combine_func = nodal_combine_map[self.nodal_combine]
-
-        element_node = self.element_node
-        nids = np.unique(element_node[:, 1])
-        #ids = np.arange(len(unode_id))
-
-        #inid = self.inode   # this is the global mapper
-        #inid = np.searchsorted(unode_id, nids)
-        #nid_to_inid_map = {nid: inidi for nid, inidi in zip(nids, inid)}
-        nid_to_inid_map = {nid: i for i, nid in enumerate(nids)}
+        grouping = self._get_nodal_grouping()
 
         ## Derive/Average
         node_data = self.node_data
@@ -489,12 +484,15 @@ class SolidStrainStressResults2(VectorResultsCommon):
         else:  # pragma: no cover
             raise NotImplementedError(iresult)
 
-        data = nodal_average(
-            nodal_combine_func,
-            element_node, datai,
-            nids, nid_to_inid_map)
+        data = grouped_nodal_average(self.nodal_combine, grouping, datai)
         return data
 
+    def _get_nodal_grouping(self) -> NodalGrouping:
+        """groups the element_node rows by node"""
+        if self._nodal_grouping is None:
+            self._nodal_grouping = NodalGrouping(self.element_node[:, 1])
+        return self._nodal_grouping
+
     #def _get_complex_data(self, itime: int) -> np.ndarray:
         #return self._get_real_data(itime)
 
@@ -1,6 +1,7 @@
 """tests the Nastran converters"""
 import os
 import unittest
+import warnings
 import numpy as np
 from pathlib import Path
 from cpylog import SimpleLogger
@@ -30,6 +31,8 @@ from pyNastran.converters.nastran.gui.result_objects.force_results import ForceR
 from pyNastran.converters.nastran.gui.result_objects.displacement_results import DisplacementResults2
 from pyNastran.converters.nastran.gui.result_objects.plate_stress_results import PlateStrainStressResults2, DERIVATION_METHODS as shell_derivation_methods
 from pyNastran.converters.nastran.gui.result_objects.solid_stress_results import SolidStrainStressResults2
+from pyNastran.converters.nastran.gui.result_objects.nodal_averaging import (
+    NodalGrouping, nodal_average, grouped_nodal_average, nodal_combine_map)
 
 
 PKG_PATH = pyNastran.__path__[0]
@@ -173,6 +176,37 @@ class TestNastranGUIObjects(unittest.TestCase):
         force_obj.get_arrow_scale(itime, res_name)
         force_obj.set_arrow_scale(itime, res_name, 4.0)
 
+    def test_nodal_average(self):
+        """the grouped nodal average is the same as the per-node version"""
+        rng = np.random.default_rng(42)
+        nelements = 200
+        nids = np.arange(1, 51) * 10
+        element_node = np.column_stack([
+            np.repeat(np.arange(1, nelements + 1), 4),
+            rng.choice(nids, size=4 * nelements),
+        ])
+        data = rng.standard_normal(len(element_node)).astype('float32')
+        data[::7] = np.nan
+
+        # a node where all the values are nan
+        inan = element_node[:, 1] == element_node[0, 1]
+        data[inan] = np.nan
+
+        grouping = NodalGrouping(element_node[:, 1])
+        unids = np.unique(element_node[:, 1])
+        assert np.array_equal(grouping.nids, unids)
+        nid_to_inid_map = {nid: i for i, nid in enumerate(unids)}
+        for nodal_combine, nodal_combine_func in nodal_combine_map.items():
+            with np.errstate(invalid='ignore'), warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                expected = nodal_average(nodal_combine_func, element_node, data,
+                                         unids, nid_to_inid_map)
+            actual = grouped_nodal_average(nodal_combine, grouping, data)
+            assert actual.dtype == data.dtype, nodal_combine
+            inid_nan = nid_to_inid_map[element_node[0, 1]]
+            assert np.isnan(actual[inid_nan]), (nodal_combine, actual[inid_nan])
+            assert np.allclose(actual, expected, equal_nan=True, atol=1e-6), nodal_combine
+
     def test_plate_wingbox(self):
         dirname = MODEL_PATH / 'wingbox'
         bdf_filename = dirname / 'wingbox_stitched_together-000.bdf'
@@ -249,6 +283,11 @@ class TestNastranGUIObjects(unittest.TestCase):
                            min_max_method=method,
                            nodal_combine_method=method)
             obj.get_fringe_result(itime, res_name)
+        # the node grouping is reused for the other methods/results
+        grouping = obj._nodal_grouping
+        assert grouping is not None
+        obj.get_fringe_result(itime, (itime, 3, 'header'))
+        assert obj._nodal_grouping is grouping
 
         obj.set_sidebar_args(
              itime, res_name,
@@ -294,6 +294,41 @@ MODEL_PATH = PKG_PATH / '..' / 'models'
 
 class TestNastranGUI(unittest.TestCase):
 
+    def test_vtk_cell_builder(self):
+        """the bulk cells are the same as the InsertNextCell cells"""
+        from vtkmodules.vtkCommonCore import vtkIdList
+        from pyNastran.gui.vtk_interface import vtkUnstructuredGrid
+        from pyNastran.gui.utils.vtk.vtk_utils import VtkCellBuilder
+        cells_to_add = [
+            (5, [0, 1, 2]),          # vtkTriangle
+            (9, [0, 1, 2, 3]),       # vtkQuad
+            (3, [4, 5]),             # vtkLine
+            (5, [2, 3, 4]),          # vtkTriangle
+            (10, [0, 1, 2, 5]),      # vtkTetra
+            (1, [6]),                # vtkVertex
+            (22, [0, 1, 2, 3, 4, 5]),  # vtkQuadraticTriangle
+        ]
+        grid1 = vtkUnstructuredGrid()
+        grid1.Allocate(len(cells_to_add), 1000)
+        for cell_type, point_ids in cells_to_add:
+            id_list = vtkIdList()
+            for point_id in point_ids:
+                id_list.InsertNextId(point_id)
+            grid1.InsertNextCell(cell_type, id_list)
+
+        grid2 = vtkUnstructuredGrid()
+        cells = VtkCellBuilder()
+        for cell_type, point_ids in cells_to_add:
+            cells.add(cell_type, point_ids)
+        cells.build(grid2)
+
+        assert grid1.GetNumberOfCells() == grid2.GetNumberOfCells() == len(cells_to_add)
+        for icell, (cell_type, point_ids) in enumerate(cells_to_add):
+            cell = grid2.GetCell(icell)
+            assert grid1.GetCellType(icell) == cell.GetCellType() == cell_type
+            point_ids2 = [cell.GetPointId(i) for i in range(cell.GetNumberOfPoints())]
+            assert point_ids2 == point_ids, (icell, point_ids2, point_ids)
+
     def test_settings(self):
         from qtpy import QtCore
         settings = QtCore.QSettings()
@@ -1,3 +1,4 @@
+from typing import Any, Union
 import numpy as np
 from pyNastran.utils import object_attributes
 
@@ -125,6 +126,112 @@ def write_imag_floats_13e(vals: list[float], is_mag_phase: bool) -> list[str]:
     return vals2
 
 
+def format_array(fmt: str, values: np.ndarray) -> np.ndarray:
+    """
+    Formats an array of values with one %-format call
+
+    Returns
+    -------
+    strings : (n, ) object ndarray
+        [fmt % value for value in values.ravel()]
+
+    """
+    values = np.asarray(values).ravel()
+    nvalues = len(values)
+    strings = np.empty(nvalues, dtype='object')
+    if nvalues:
+        # fmt can't write a newline, so the values are split on it
+        strings[:] = (((fmt + '\n') * nvalues) % tuple(values.tolist())).split('\n')[:-1]
+    return strings
+
+
+def _replace_strings(strings: np.ndarray, old: tuple[str, ...], new: str) -> np.ndarray:
+    """replaces the strings that are in old"""
+    is_old = np.zeros(len(strings), dtype='bool')
+    for old_str in old:
+        is_old |= (strings == old_str)
+    strings[is_old] = new
+    return strings
+
+
+def write_floats_13e_array(values: np.ndarray) -> np.ndarray:
+    """writes an array of Nastran formatted 13.6 floats (see ``write_floats_13e``)"""
+    strings = format_array('%13.6E', values)
+    return _replace_strings(strings, (' 0.000000E+00', '-0.000000E+00'), ' 0.0')
+
+
+def write_floats_13e_long_array(values: np.ndarray) -> np.ndarray:
+    """writes an array of Nastran formatted 13.6 floats (see ``write_floats_13e_long``)"""
+    return format_array('%13.6E', values)
+
+
+def write_floats_12e_array(values: np.ndarray) -> np.ndarray:
+    """writes an array of Nastran formatted 12.5 floats (see ``write_floats_12e``)"""
+    strings = format_array('%12.5E', values)
+    return _replace_strings(strings, (' 0.00000E+00', '-0.00000E+00'), ' 0.0')
+
+
+def write_imag_floats_13e_array(values: np.ndarray, is_mag_phase: bool) -> np.ndarray:
+    """
+    Writes an array of complex values (see ``write_imag_floats_13e``)
+
+    Parameters
+    ----------
+    values : (n, m) complex ndarray
+        the values of n rows
+
+    Returns
+    -------
+    strings : (n, 2*m) object ndarray
+        the m real/magnitude strings and then the m imaginary/phase strings
+
+    """
+    nrows, ncols = values.shape
+    if is_mag_phase:
+        # hypot matches abs(value) of a complex scalar; np.abs may be off by 1 ulp
+        real = write_floats_13e_array(np.hypot(values.real, values.imag))
+        phase = np.angle(values, deg=True)
+        phase = np.where(phase >= 0.0, phase, phase + 360.)
+        imag = _replace_strings(format_array('%-13.4f', phase), ('0.0000       ', ), '   0.0')
+    else:
+        real = write_floats_13e_array(values.real)
+        imag = write_floats_13e_array(values.imag)
+    return np.hstack([real.reshape(nrows, ncols), imag.reshape(nrows, ncols)])
+
+
+def write_rows(row_fmt: Union[str, np.ndarray], columns: list[Any], nrows: int) -> str:
+    """
+    Writes rows with one %-format call
+
+    Parameters
+    ----------
+    row_fmt : str / (nrows, ) object ndarray
+        str : the format of a row (e.g., '%14i %6s     %-13s\n')
+        ndarray : the format of each row; every format must use the
+                  same number of fields ('%.0s' skips a field)
+    columns : list[(nrows, ) ndarray / scalar]
+        the values of each field; a scalar is used for all the rows
+    nrows : int
+        the number of rows
+
+    Returns
+    -------
+    rows : str
+        ''.join(row_fmt % row for row in zip(*columns))
+
+    """
+    cells = np.empty((nrows, len(columns)), dtype='object')
+    for icolumn, column in enumerate(columns):
+        if isinstance(column, np.ndarray) and column.dtype != 'object':
+            column = column.tolist()
+        cells[:, icolumn] = column
+    if isinstance(row_fmt, str):
+        fmt = row_fmt * nrows
+    else:
+        fmt = ''.join(row_fmt.tolist())
+    return fmt % tuple(cells.ravel().tolist())
+
+
 def write_floats_8p4f(vals: list[float]) -> list[str]:
     """writes an 8.4F formatted number"""
     vals2 = []
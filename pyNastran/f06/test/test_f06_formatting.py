@@ -1,8 +1,11 @@
 import unittest
+import numpy as np
 from pyNastran.f06.f06_formatting import (
     write_floats_8p4f, write_floats_8p1e,
-    write_floats_10e, write_floats_12e,
-    write_imag_floats_13e)
+    write_floats_10e, write_floats_12e, write_floats_13e,
+    write_imag_floats_13e,
+    write_floats_12e_array, write_floats_13e_array,
+    write_imag_floats_13e_array, write_rows)
 from pyNastran.f06.f06_writer import (
     make_end, sorted_bulk_data_header, make_f06_header, make_stamp)
 
@@ -165,6 +168,36 @@ class TestF06Formatting(unittest.TestCase):
                          msg='\nimag %s+%sj:\nactual  =%r len(actual)=%i\nexpected=%r len(expected)=%i' % (
             val.real, val.imag, actual_imag, len(actual_imag), actual_imag, len(expected_imag)))
 
+    def test_write_floats_array(self):
+        """the array writers match the scalar writers"""
+        values = np.array([0., -0., 1e-50, 1e30, -1.2345678e-5, 3.14159, np.nan, 1.],
+                          dtype='float32')
+        self.assertEqual(write_floats_13e_array(values).tolist(),
+                         write_floats_13e(values))
+        self.assertEqual(write_floats_12e_array(values).tolist(),
+                         write_floats_12e(values))
+
+        cvalues = np.array([[0., 1+1j, -2.5-0.1j],
+                            [1e-8j, -3.0, 0.5+0.25j]], dtype='complex64')
+        for is_mag_phase in [True, False]:
+            strings = write_imag_floats_13e_array(cvalues, is_mag_phase)
+            assert strings.shape == (2, 6), strings.shape
+            for row, crow in zip(strings, cvalues):
+                expected = write_imag_floats_13e(crow, is_mag_phase)
+                self.assertEqual(row.tolist(), expected)
+
+    def test_write_rows(self):
+        """tests write_rows"""
+        nids = np.array([1, 20])
+        strings = write_floats_13e_array(np.array([0., 2.]))
+        msg = write_rows('%4i %s %s %-13s\n', [nids, 'G', 'x', strings], 2)
+        assert msg == '   1 G x  0.0         \n  20 G x  2.000000E+00\n', repr(msg)
+
+        row_fmts = np.array(['%4i%.0s\n', '%4s%s\n'], dtype='object')
+        msg = write_rows(row_fmts, [np.array([1, 'a'], dtype='object'), 'b'], 2)
+        assert msg == '   1\n   ab\n', repr(msg)
+        assert write_rows('%i\n', [np.zeros(0, dtype='int32')], 0) == ''
+
     def test_make_end(self):
         """miscellaneous F06 tester"""
         make_end(end_flag=True, options=None)
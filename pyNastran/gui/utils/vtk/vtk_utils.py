@@ -1,6 +1,7 @@
 """
 defines:
  - create_vtk_cells_of_constant_element_type(grid, elements, etype)
+ - VtkCellBuilder()
 
 """
 from __future__ import annotations
@@ -316,6 +317,101 @@ def create_vtk_cells_of_constant_element_types(grid: vtkUnstructuredGrid,
 
     grid.SetCells(vtk_cell_types, vtk_cell_offsets, vtk_cells)
 
+
+class VtkCellBuilder:
+    """
+    Collects cells of mixed VTK types and creates them all in a single
+    ``vtkUnstructuredGrid.SetCells`` call.
+
+    This replaces:
+        elem = vtkQuad()
+        point_ids = elem.GetPointIds()
+        point_ids.SetId(0, n1)
+        ...
+        grid.InsertNextCell(elem.GetCellType(), point_ids)
+
+    with:
+        cells.add(9, [n1, n2, n3, n4])
+        ...
+        cells.build(grid)
+
+    The cells are grouped by type, but are created in the order they
+    were added, so the cell ids are the same as with ``InsertNextCell``.
+
+    """
+    def __init__(self):
+        self.ncells = 0
+        # cell_type: [icell, ...]
+        self._icells = defaultdict(list)
+        # cell_type: [point_ids, ...]
+        self._point_ids = defaultdict(list)
+
+    def add(self, cell_type: int, point_ids: list[int]) -> None:
+        """adds a cell (e.g., 5/vtkTriangle) and returns nothing"""
+        self._icells[cell_type].append(self.ncells)
+        self._point_ids[cell_type].append(point_ids)
+        self.ncells += 1
+
+    def get_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gets the arrays that define the cells
+
+        Returns
+        -------
+        cell_types : (ncells, ) uint8 ndarray
+            the VTK cell types
+        cell_offsets : (ncells, ) int ndarray
+            the location of each cell in cells
+        cells : (ncells + nconnectivity, ) int ndarray
+            the VTK connectivity array in the form:
+            [nnodes0, n00, n01, ..., nnodes1, n10, n11, ...]
+
+        """
+        ncells = self.ncells
+        dtype = get_numpy_idtype_for_vtk()
+        cell_types = np.zeros(ncells, dtype='uint8')
+        nnodes = np.zeros(ncells, dtype=dtype)
+
+        groups = []
+        for cell_type, icells in self._icells.items():
+            icells = np.array(icells, dtype='int64')
+            point_ids = np.array(self._point_ids[cell_type], dtype=dtype)
+            assert point_ids.ndim == 2, f'cell_type={cell_type} has a variable number of points'
+            cell_types[icells] = cell_type
+            nnodes[icells] = point_ids.shape[1]
+            groups.append((icells, point_ids))
+
+        # each cell takes (nnodes + 1) slots
+        cell_offsets = np.zeros(ncells, dtype=dtype)
+        if ncells > 1:
+            np.cumsum(nnodes[:-1] + 1, out=cell_offsets[1:])
+        cells = np.zeros(ncells + nnodes.sum(), dtype=dtype)
+        for icells, point_ids in groups:
+            nnodes_per_cell = point_ids.shape[1]
+            offsets = cell_offsets[icells]
+            cells[offsets] = nnodes_per_cell
+            islot = offsets[:, np.newaxis] + np.arange(1, nnodes_per_cell + 1)
+            cells[islot] = point_ids
+        return cell_types, cell_offsets, cells
+
+    def build(self, grid: vtkUnstructuredGrid) -> None:
+        """creates the cells on the grid"""
+        if self.ncells == 0:
+            return
+        cell_types, cell_offsets, cells = self.get_arrays()
+
+        vtk_cells = vtkCellArray()
+        cells_id_type = numpy_to_vtkIdTypeArray(cells, deep=1)
+        vtk_cells.SetCells(self.ncells, cells_id_type)
+
+        vtk_cell_types = numpy_to_vtk(
+            cell_types, deep=1,
+            array_type=vtkUnsignedCharArray().GetDataType())
+        vtk_cell_offsets = numpy_to_vtk(cell_offsets, deep=1,
+                                        array_type=VTK_ID_TYPE)
+        grid.SetCells(vtk_cell_types, vtk_cell_offsets, vtk_cells)
+
+
 def create_unstructured_point_grid(points: vtkPoints,
                                    npoints: int) -> vtkUnstructuredGrid:
     """creates a point grid"""
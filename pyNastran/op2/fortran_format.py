@@ -9,6 +9,7 @@ from pyNastran.utils import object_attributes
 from pyNastran.utils.numpy_utils import integer_types
 #from pyNastran.op2.errors import FortranMarkerError, SortCodeError
 from pyNastran.op2.errors import EmptyRecordError
+from pyNastran.op2.op2_interface.utils import grow_obj
 
 from pyNastran.op2.tables.oef_forces.oef import OEF
 from pyNastran.op2.tables.oef_forces.oefpk import OEFPK
@@ -38,6 +39,10 @@ from pyNastran.op2.tables.ogpwg import OGPWG
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2 import OP2
 
+#: these tables are always fully parsed during the array sizing step
+#: PVT/PVTS - we want to know what the PARAM cards are,
+#:            so we can determine the NXVER
+FULLY_PARSED_TABLES = {b'R1TABRG', b'ONRGY1', b'PVT', b'PVT0', b'PVTS'}
 
 class Op2Tables:
     def __init__(self, op2: OP2):
@@ -87,6 +92,20 @@ class FortranFormat:
         self._nastran_format = None
         self._data_factor = 1
 
+        #: read the result tables in a single pass with growable arrays
+        self._single_pass = False
+        #: the result objects that were grown during a single pass read
+        self._grown_objs = []
+        #: the (table_name, file position, table_count) of the non-result tables to
+        #: fill at the end of a single pass read
+        self._deferred_tables = []
+
+        #: the OP2Index that's filled while reading (see ``OP2.index_op2``)
+        self._op2_index = None
+        #: the (file offset, count) of the tables to read instead of the full file
+        #: (see ``OP2.index_op2``)
+        self._table_offsets = None
+
         #: stores if the user entered [] for isubcases
         self.is_all_subcases = True
         self.valid_subcases = []
@@ -141,10 +160,14 @@ class FortranFormat:
         op2_reader = self.op2_reader  # type: OP2Reader
         #datai = b''
         n = 0
-        if self.read_mode == 2:
+        if self._single_pass:
+            data, ndata = op2_reader._read_record_ndata(view=True)
+            n = self._read_record_single_pass(table4_parser, data, ndata, record_len)
+
+        elif self.read_mode == 2:
             self.ntotal = 0
 
-            data, ndata = op2_reader._read_record_ndata()
+            data, ndata = op2_reader._read_record_ndata(view=True)
             n = table4_parser(data, ndata)
             assert isinstance(n, integer_types), self.table_name
 
@@ -156,10 +179,7 @@ class FortranFormat:
             #n = op2_reader._skip_record()
             #n = table4_parser(datai, 300000)
             #self.show(100, types='ifs', endian=None, force=False)
-            if self.table_name in {b'R1TABRG', b'ONRGY1', b'PVT', b'PVT0', b'PVTS'}:
-                # these tables are always fully parsed
-                # PVT/PVTS - we want to know what the PARAM cards are,
-                #            so we can determine the NXVER
+            if self.table_name in FULLY_PARSED_TABLES:
                 data, ndata = op2_reader._read_record_ndata()
             else:
                 try:
@@ -192,6 +212,77 @@ class FortranFormat:
         self._cleanup_data_members()
         return n
 
+    def _read_record_single_pass(self, table4_parser, data: bytes, ndata: int,
+                                 record_len: int) -> int:
+        """
+        Parses a record for both read modes, so the record is only read
+        and decoded once.
+
+        The array sizing step (read_mode=1) updates the counters of the
+        result object, which is then grown (instead of preallocated) before
+        the array filling step (read_mode=2) decodes the data.
+
+        Parameters
+        ----------
+        table4_parser : function
+            the parser function for table 4
+        data : bytes
+            the record
+        ndata : int
+            the length of the record
+        record_len : int
+            the length of the record block
+
+        Returns
+        -------
+        n : int
+            the number of bytes that have been read
+
+        """
+        # some parsers delete the table3 attributes (e.g., ogs) when
+        # they're done, so we put them back for the filling step
+        attrs = dict(self.__dict__)
+
+        self.read_mode = 1
+        data1 = data if self.table_name in FULLY_PARSED_TABLES else None
+        n = table4_parser(data1, ndata)
+        if not isinstance(n, integer_types):
+            msg = 'n is not an integer; table_name=%s n=%s table4_parser=%s' % (
+                self.table_name, n, table4_parser)
+            raise TypeError(msg)
+        self._init_vector_counter(record_len)
+        for name, value in attrs.items():
+            if name not in self.__dict__:
+                setattr(self, name, value)
+
+        self.read_mode = 2
+        obj = self.obj
+        if (obj is not None and hasattr(obj, '_reset_indices') and
+                hasattr(obj, 'ntimes') and hasattr(obj, 'build')):
+            if '_growth' not in obj.__dict__:
+                self._grown_objs.append(obj)
+            grow_obj(obj)
+
+        self.ntotal = 0
+        n = table4_parser(data, ndata)
+        assert isinstance(n, integer_types), self.table_name
+        self._reset_vector_counter()
+        return n
+
+    def _parse_record_both_modes(self, table4_parser, data: bytes, ndata: int) -> int:
+        """
+        Calls a parser for both read modes on the same record for single
+        pass reading of tables that don't use a vectorized counter.
+        """
+        attrs = dict(self.__dict__)
+        self.read_mode = 1
+        table4_parser(data, ndata)
+        for name, value in attrs.items():
+            if name not in self.__dict__:
+                setattr(self, name, value)
+        self.read_mode = 2
+        return table4_parser(data, ndata)
+
     def _reset_vector_counter(self) -> None:
         """
         if reading the data
@@ -22,10 +22,11 @@ Defines the main OP2 class.  Defines:
 
 """
 from __future__ import annotations
+import os
 import sys
 from collections import defaultdict
 from pickle import load, dump, dumps
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Iterator, Optional, Any, TYPE_CHECKING
 
 import numpy as np
 
@@ -42,6 +43,10 @@ from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.types import NastranKey
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.utils import trim_obj
+from pyNastran.op2.op2_interface.op2_index import OP2Index, LazyResults, build_op2_index
+from pyNastran.op2.op2_interface.op2_stream import ResultChunk, iter_results
+from pyNastran.op2.op2_interface.op2_parallel import read_op2_parallel
 from pyNastran.op2.op2_interface.transforms import (
     transform_displacement_to_global, transform_gpforce_to_globali)
 from pyNastran.utils import check_path
@@ -58,7 +63,8 @@ class OP2(OP2_Scalar, OP2Writer):
                  debug: Optional[bool]=True,
                  log: Any=None,
                  debug_file: Optional[str]=None,
-                 mode: Optional[str]=None) -> None:
+                 mode: Optional[str]=None,
+                 use_mmap: bool=False) -> None:
         """
         Initializes the OP2 object
 
@@ -76,6 +82,10 @@ class OP2(OP2_Scalar, OP2Writer):
             sets the filename that will be written to
         mode : str; default=None -> 'msc'
             {msc, nx}
+        use_mmap : bool; default=False
+            memory map the op2, so the result tables are decoded without
+            copying the records; falls back to reading the file if it
+            can't be mapped
 
         """
         # Nastran closes the file properly 99.9% of the time, but when working
@@ -100,6 +110,10 @@ class OP2(OP2_Scalar, OP2Writer):
         self.is_interlaced = True
         assert make_geom is False, make_geom
         OP2_Scalar.__init__(self, debug=debug, log=log, debug_file=debug_file)
+        self.use_mmap = use_mmap
+
+        #: the results that are loaded on demand (see ``index_op2``)
+        self.lazy_results = None
         self.ask = False
         self.post = None
         self.table_count = defaultdict(int)
@@ -547,7 +561,9 @@ class OP2(OP2_Scalar, OP2Writer):
                  combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 single_pass: bool=False,
+                 nworkers: int=1) -> None:
         """
         Starts the OP2 file reading
 
@@ -569,6 +585,16 @@ class OP2(OP2_Scalar, OP2Writer):
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        single_pass : bool; default=False
+            False : read the op2 twice; the first pass sizes the arrays
+                    and the second pass fills them
+            True : read the op2 once; the result arrays are grown as
+                   the records are read and trimmed at the end
+                   (not supported with load_as_h5)
+        nworkers : int; default=1
+            the number of processes used to decode the result tables;
+            the subcases of the result tables are read independently
+            and combined in file order (see ``read_op2_parallel``)
 
         """
         if op2_filename:
@@ -587,14 +613,32 @@ class OP2(OP2_Scalar, OP2Writer):
         assert self.ask in [True, False], self.ask
         self.is_vectorized = True
         self.log.debug(f'combine={combine}')
-        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
-        self.read_mode = 1
-        self._close_op2 = False
 
         load_as_h5 = False
         if hasattr(self, 'load_as_h5'):
             load_as_h5 = self.load_as_h5
 
+        if nworkers > 1:
+            if single_pass or load_as_h5:
+                raise NotImplementedError('nworkers > 1 does not support single_pass/load_as_h5')
+            is_read = read_op2_parallel(self, op2_filename, nworkers,
+                                        combine=combine, encoding=encoding)
+            if is_read:
+                if build_dataframe:
+                    self.build_dataframe()
+                return
+
+        if single_pass:
+            if load_as_h5:
+                raise NotImplementedError('single_pass=True does not support load_as_h5')
+            op2_reader = self.op2_reader
+            self._read_op2_single_pass(op2_filename, mode)
+            self._finalize_op2(op2_reader, combine, build_dataframe)
+            return
+
+        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
+        self.read_mode = 1
+        self._close_op2 = False
         try:
             # get GUI object names, build objects, but don't read data
             table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
@@ -615,6 +659,119 @@ class OP2(OP2_Scalar, OP2Writer):
         except Exception:
             OP2_Scalar.close_op2(self, force=True)
             raise
+        self._finalize_op2(op2_reader, combine, build_dataframe)
+
+    def _read_op2_single_pass(self, op2_filename: Optional[str], mode: Optional[str]) -> None:
+        """
+        Reads the op2 with one pass over the file.  The result arrays are
+        grown as records are read (see ``grow_obj``), so each record is
+        only read and decoded once.
+        """
+        self.log.debug('-------- reading op2 with a single pass (array growing) --------')
+        self.read_mode = 1
+        self._close_op2 = True
+        self._single_pass = True
+        self._grown_objs = []
+        self._deferred_tables = []
+        try:
+            self.table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename, mode=mode)
+        except FileNotFoundError:
+            raise
+        except Exception:
+            OP2_Scalar.close_op2(self, force=True)
+            raise
+        finally:
+            self._single_pass = False
+
+        for obj in self._grown_objs:
+            trim_obj(obj)
+        self._grown_objs = []
+        self.read_mode = 2
+
+    def index_op2(self, op2_filename: str,
+                  index_filename: Optional[str]=None) -> OP2Index:
+        """
+        Indexes the tables/subtables of the op2 without reading the result
+        data, so the results can be loaded on demand with ``lazy_results``.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2 to index
+        index_filename : str; default=None
+            the sidecar file to save the index to; if the file exists and
+            is for the current op2, the index is loaded instead
+
+        Returns
+        -------
+        index : OP2Index
+            the table names, subtable attributes (e.g., isubcase,
+            element_type) and file offsets
+
+        Example
+        -------
+        >>> model = OP2()
+        >>> model.index_op2(op2_filename, index_filename='model.op2.index')
+        >>> disp = model.lazy_results['displacements'][1][1]
+
+        """
+        check_path(op2_filename, name='op2_filename')
+        index = None
+        if index_filename is not None and os.path.exists(index_filename):
+            index = OP2Index.load(index_filename)
+            if not index.is_valid(op2_filename):
+                self.log.info(f'index_filename={index_filename!r} is out of date')
+                index = None
+
+        if index is None:
+            index = build_op2_index(self, op2_filename, mode=self.mode)
+            if index_filename is not None:
+                index.save(index_filename)
+        self.op2_filename = op2_filename
+        self.lazy_results = LazyResults(self, index)
+        return index
+
+    def iter_results(self, op2_filename: str,
+                     result_types: Optional[list[str]]=None,
+                     chunk_size: int=1) -> Iterator[ResultChunk]:
+        """
+        Reads the results of an op2 in chunks, so results that don't fit
+        in memory may be post-processed.  The result objects are not stored
+        on the model.
+
+        Parameters
+        ----------
+        op2_filename : str
+            the op2 to read
+        result_types : list[str]; default=None -> all
+            the results to stream (e.g., ['displacements', 'stress.cquad4_stress'])
+        chunk_size : int; default=1
+            the number of time steps (SORT1) or nodes/elements (SORT2)
+            per chunk
+
+        Yields
+        ------
+        chunk : ResultChunk
+            the result_name, isubcase, times, ids, data, and headers
+            of a block of a result
+
+        Example
+        -------
+        >>> model = OP2()
+        >>> model.set_subcases([1])
+        >>> for chunk in model.iter_results(op2_filename, ['stress.cquad4_stress'],
+        ...                                 chunk_size=100):
+        ...     von_mises = chunk.data[:, :, -1].max(axis=0)
+
+        See ``get_envelopes`` for the min/max envelopes of the results
+
+        """
+        check_path(op2_filename, name='op2_filename')
+        yield from iter_results(self, op2_filename, result_types=result_types,
+                                chunk_size=chunk_size)
+
+    def _finalize_op2(self, op2_reader, combine: bool, build_dataframe: bool) -> None:
+        """internal method to cleanup the results after reading"""
         self._finalize()
         op2_reader._create_objects_from_matrices()
         if build_dataframe:
@@ -737,7 +894,12 @@ class OP2(OP2_Scalar, OP2Writer):
                     self.log.error(f'build_dataframe is broken for {class_name}')
                     raise
 
-    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True) -> None:
+    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True,
+                           subcases: Optional[list[int]]=None,
+                           result_names: Optional[list[str]]=None,
+                           itimes: Optional[np.ndarray]=None,
+                           node_ids: Optional[np.ndarray]=None,
+                           element_ids: Optional[np.ndarray]=None) -> None:
         """
         Loads an h5 file into an OP2 object
 
@@ -747,6 +909,16 @@ class OP2(OP2_Scalar, OP2Writer):
             the path to the an hdf5 file
         combine : bool; default=True
             runs the combine routine
+        subcases : list[int]; default=None -> all
+            the subcases to load
+        result_names : list[str]; default=None -> all
+            the results to load (e.g., ['displacements', 'stress.cquad4_stress'])
+        itimes : (n, ) int ndarray; default=None -> all
+            the time/mode/frequency indices to load
+        node_ids : (n, ) int ndarray; default=None -> all
+            the nodes to load for nodal results (e.g., displacements)
+        element_ids : (n, ) int ndarray; default=None -> all
+            the elements to load for element results (e.g., stress)
 
         """
         check_path(hdf5_filename, 'hdf5_filename')
@@ -757,10 +929,12 @@ class OP2(OP2_Scalar, OP2Writer):
         self.log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
         debug = False
         with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug,
+                                    subcases=subcases, result_names=result_names,
+                                    itimes=itimes, node_ids=node_ids, element_ids=element_ids)
         self.combine_results(combine=combine)
 
-    def load_hdf5_file(self, h5_file: H5File, combine: bool=True) -> None:
+    def load_hdf5_file(self, h5_file: H5File, combine: bool=True, **kwargs) -> None:
         """
         Loads an h5 file object into an OP2 object
 
@@ -770,27 +944,45 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py file object
         combine : bool; default=True
             runs the combine routine
+        kwargs : dict
+            the filters (see ``load_hdf5_filename``)
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
         #self.op2_filename = hdf5_filename
         #self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug, **kwargs)
         self.combine_results(combine=combine)
 
-    def export_hdf5_filename(self, hdf5_filename: str) -> None:
+    def export_hdf5_filename(self, hdf5_filename: str,
+                             compression: Optional[str]=None,
+                             compression_opts: Optional[int]=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the path to the hdf5 file
+        compression : str; default=None
+            None : contiguous (uncompressed) datasets
+            'gzip', 'lzf' : chunked and compressed arrays; the result
+            data is chunked along (time, entity)
+        compression_opts : int; default=None
+            the compression level (e.g., 0-9 for 'gzip')
+
         TODO: doesn't support:
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_filename
-        export_op2_to_hdf5_filename(hdf5_filename, self)
+        export_op2_to_hdf5_filename(hdf5_filename, self, compression=compression,
+                                    compression_opts=compression_opts)
 
-    def export_hdf5_file(self, hdf5_file: H5File, exporter=None) -> None:
+    def export_hdf5_file(self, hdf5_file: H5File, exporter=None,
+                         compression: Optional[str]=None,
+                         compression_opts: Optional[int]=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
@@ -800,6 +992,10 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py object
         exporter : HDF5Exporter; default=None
             unused
+        compression : str; default=None
+            None, 'gzip', 'lzf' (see ``export_hdf5_filename``)
+        compression_opts : int; default=None
+            the compression level (e.g., 0-9 for 'gzip')
 
         TODO: doesn't support:
           - BucklingEigenvalues
@@ -807,7 +1003,8 @@ class OP2(OP2_Scalar, OP2Writer):
         """
         ## type (file, Any) -> None
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
-        export_op2_to_hdf5_file(hdf5_file, self)
+        export_op2_to_hdf5_file(hdf5_file, self, compression=compression,
+                                compression_opts=compression_opts)
 
     def combine_results(self, combine: bool=True) -> None:
         """
@@ -1353,7 +1550,10 @@ def read_op2(op2_filename: Optional[str]=None,
              build_dataframe: Optional[bool]=False,
              skip_undefined_matrices: bool=True,
              mode: Optional[str]=None,
-             encoding: Optional[str]=None) -> OP2:
+             encoding: Optional[str]=None,
+             single_pass: bool=False,
+             use_mmap: bool=False,
+             nworkers: int=1) -> OP2:
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -1391,6 +1591,14 @@ def read_op2(op2_filename: Optional[str]=None,
         {nx, msc, autodesk, optistruct, nasa95}
     encoding : str
         the unicode encoding (default=None; system default)
+    single_pass : bool; default=False
+        read the op2 once and grow the result arrays
+        (see ``OP2.read_op2``)
+    use_mmap : bool; default=False
+        memory map the op2 (see ``OP2.__init__``)
+    nworkers : int; default=1
+        the number of processes used to decode the result tables
+        (see ``OP2.read_op2``)
 
     Returns
     -------
@@ -1414,16 +1622,17 @@ def read_op2(op2_filename: Optional[str]=None,
             validate=True, xref=True,
             build_dataframe=build_dataframe,
             skip_undefined_matrices=skip_undefined_matrices,
-            mode=mode, log=log, debug=debug, encoding=encoding)
+            mode=mode, log=log, debug=debug, encoding=encoding,
+            single_pass=single_pass, use_mmap=use_mmap, nworkers=nworkers)
     else:
-        model = OP2(log=log, debug=debug, mode=mode)
+        model = OP2(log=log, debug=debug, mode=mode, use_mmap=use_mmap)
         model.set_subcases(subcases)
         model.include_exclude_results(exclude_results=exclude_results,
                                       include_results=include_results)
 
         model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                        skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                       encoding=encoding)
+                       encoding=encoding, single_pass=single_pass, nworkers=nworkers)
 
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
@@ -20,6 +20,7 @@ from pyNastran.op2.tables.geom.geom1 import GEOM1
 from pyNastran.op2.tables.geom.geom2 import GEOM2
 from pyNastran.op2.tables.geom.geom3 import GEOM3
 from pyNastran.op2.tables.geom.geom4 import GEOM4
+from pyNastran.op2.tables.geom.geom_arrays import grids_from_arrays, elements_from_arrays
 
 from pyNastran.op2.tables.geom.ept import EPT
 from pyNastran.op2.tables.geom.mpt import MPT
@@ -47,7 +48,11 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
                   build_dataframe: bool=False, skip_undefined_matrices: bool=True,
                   mode: str='msc', log: SimpleLogger=None, debug: bool=True,
                   debug_file: Optional[str]=None,
-                  encoding: Optional[str]=None):
+                  encoding: Optional[str]=None,
+                  single_pass: bool=False,
+                  use_mmap: bool=False,
+                  nworkers: int=1,
+                  lazy_geom: bool=False):
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -81,6 +86,19 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    single_pass : bool; default=False
+        read the op2 once and grow the result arrays
+        (see ``OP2.read_op2``)
+    use_mmap : bool; default=False
+        memory map the op2 (see ``OP2.__init__``)
+    nworkers : int; default=1
+        the number of processes used to decode the result tables
+        (see ``OP2.read_op2``)
+    lazy_geom : bool; default=False
+        store the GRID/CQUAD4/CQUADR/CTRIA3/CTETRA/CPENTA/CHEXA cards as
+        arrays in ``model.geom_arrays`` instead of creating the card
+        objects (see ``OP2Geom.build_geom_objects``); the model isn't
+        validated/cross-referenced
 
     Returns
     -------
@@ -93,14 +111,18 @@ def read_op2_geom(op2_filename: Optional[Union[str, PurePath]]=None,
                does not have so many methods
 
     """
-    model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode)
+    model = OP2Geom(log=log, debug=debug, debug_file=debug_file, mode=mode,
+                    use_mmap=use_mmap)
     model.set_subcases(subcases)
     model.include_exclude_results(exclude_results=exclude_results,
                                   include_results=include_results)
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, single_pass=single_pass, nworkers=nworkers,
+                   lazy_geom=lazy_geom)
+    if lazy_geom:
+        return model
     if validate:
         model.validate()
     if xref:
@@ -113,7 +135,8 @@ class OP2GeomCommon(OP2, GeomCommon):
     def __init__(self, make_geom: bool=True,
                  debug: bool=False, log: Any=None,
                  debug_file: Optional[str]=None,
-                 mode: Optional[str]=None):
+                 mode: Optional[str]=None,
+                 use_mmap: bool=False):
         """
         Initializes the OP2 object
 
@@ -130,6 +153,8 @@ class OP2GeomCommon(OP2, GeomCommon):
             sets the filename that will be written to
         mode : str; default=None -> 'msc'
             {msc, nx}
+        use_mmap : bool; default=False
+            memory map the op2 (see ``OP2.__init__``)
 
         """
         #self.big_properties = {}
@@ -148,9 +173,18 @@ class OP2GeomCommon(OP2, GeomCommon):
         self.reader_dynamic = DYNAMICS(self)
         self.reader_axic = AXIC(self)
 
-        OP2.__init__(self, debug=debug, log=log, debug_file=debug_file, mode=mode)
+        OP2.__init__(self, debug=debug, log=log, debug_file=debug_file, mode=mode,
+                     use_mmap=use_mmap)
         self.make_geom = True
 
+        #: store the high volume cards (e.g., GRID, CQUAD4) as arrays
+        #: instead of card objects (see ``geom_arrays``)
+        self.lazy_geom = False
+
+        #: the card arrays (e.g., geom_arrays['GRID']['xyz']) when
+        #: lazy_geom=True; see ``pyNastran.op2.tables.geom.geom_arrays``
+        self.geom_arrays: dict[str, dict[str, np.ndarray]] = {}
+
         # F:\work\pyNastran\examples\Dropbox\move_tpl\beamp10.op2
         # F:\work\pyNastran\examples\Dropbox\move_tpl\ifsr22r.op2
         # F:\work\pyNastran\examples\Dropbox\move_tpl\ifssh22.op2
@@ -283,7 +317,8 @@ class OP2Geom(BDF, OP2GeomCommon):
     ]
     def __init__(self, make_geom: bool=True,
                  debug: bool=False, log: Any=None,
-                 debug_file: Optional[str]=None, mode: str='msc'):
+                 debug_file: Optional[str]=None, mode: str='msc',
+                 use_mmap: bool=False):
         """
         Initializes the OP2 object
 
@@ -300,11 +335,14 @@ class OP2Geom(BDF, OP2GeomCommon):
             sets the filename that will be written to
         mode : str; default='msc'
             {msc, nx}
+        use_mmap : bool; default=False
+            memory map the op2 (see ``OP2.__init__``)
 
         """
         BDF.__init__(self, debug=debug, log=log)
         OP2GeomCommon.__init__(self, make_geom=make_geom,
-                               debug=debug, log=log, debug_file=debug_file, mode=mode)
+                               debug=debug, log=log, debug_file=debug_file, mode=mode,
+                               use_mmap=use_mmap)
 
     @property
     def is_geometry(self) -> bool:
@@ -313,15 +351,39 @@ class OP2Geom(BDF, OP2GeomCommon):
     def read_op2(self, op2_filename: Optional[Union[str, PurePath]]=None, combine: bool=True,
                  build_dataframe: Optional[bool]=False,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None):
-        """see ``OP2.read_op2``"""
+                 encoding: Optional[str]=None,
+                 single_pass: bool=False,
+                 nworkers: int=1,
+                 lazy_geom: bool=False):
+        """
+        see ``OP2.read_op2``
+
+        lazy_geom : bool; default=False
+            store the high volume cards as arrays (see ``read_op2_geom``)
+        """
+        self.lazy_geom = lazy_geom
         OP2.read_op2(self, op2_filename=op2_filename, combine=combine,
                      build_dataframe=build_dataframe,
                      skip_undefined_matrices=skip_undefined_matrices,
-                     encoding=encoding)
-        if len(self.nodes) == 0:
+                     encoding=encoding, single_pass=single_pass, nworkers=nworkers)
+        if len(self.nodes) == 0 and 'GRID' not in self.geom_arrays:
             self.gpdt_to_nodes()
 
+    def build_geom_objects(self) -> None:
+        """
+        Creates the card objects (e.g., GRID, CQUAD4) from the arrays that
+        were read with ``lazy_geom=True``
+        """
+        for card_name, arrays in self.geom_arrays.items():
+            if card_name == 'GRID':
+                for grid in grids_from_arrays(arrays).values():
+                    self._add_methods._add_node_object(grid)
+                continue
+            for elem in elements_from_arrays(card_name, arrays):
+                self.reader_geom2.add_op2_element(elem)
+        self.geom_arrays = {}
+        self.lazy_geom = False
+
     def gpdt_to_nodes(self):
         """converts the GPDT & EQEXIN tables to node ids"""
         eqexin = self.op2_results.eqexin
@@ -380,7 +442,9 @@ class OP2Geom(BDF, OP2GeomCommon):
             #i += 1
         #return state
 
-    def export_hdf5_file(self, hdf5_file, exporter=None):
+    def export_hdf5_file(self, hdf5_file, exporter=None,
+                         compression: Optional[str]=None,
+                         compression_opts: Optional[int]=None):
         """
         Converts the OP2 objects into hdf5 object
 
@@ -390,6 +454,10 @@ class OP2Geom(BDF, OP2GeomCommon):
             an h5py object
         exporter : HDF5Exporter; default=None
             unused
+        compression : str; default=None
+            None, 'gzip', 'lzf' for the results (see ``OP2.export_hdf5_filename``)
+        compression_opts : int; default=None
+            the compression level (e.g., 0-9 for 'gzip')
 
         TODO: doesn't support:
           - BucklingEigenvalues
@@ -397,7 +465,8 @@ class OP2Geom(BDF, OP2GeomCommon):
         """
         #from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
         #op2_model = self
-        OP2GeomCommon.export_hdf5_file(self, hdf5_file)
+        OP2GeomCommon.export_hdf5_file(self, hdf5_file, compression=compression,
+                                       compression_opts=compression_opts)
         BDF.export_hdf5_file(self, hdf5_file)
 
 
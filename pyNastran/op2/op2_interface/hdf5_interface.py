@@ -4,10 +4,12 @@ defines:
  model = load_op2_from_h5(h5_filename, log=None)
  export_op2_to_hdf5(hdf5_filename, op2_model)
 
- model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None)
+ model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None,
+                           subcases=None, result_names=None,
+                           itimes=None, node_ids=None, element_ids=None)
  model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
- export_op2_to_hdf5_file(hdf5_filename, op2_model)
- export_op2_to_hdf5_file(hdf5_file, op2_model)
+ export_op2_to_hdf5_filename(hdf5_filename, op2_model, compression=None)
+ export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None)
 
 """
 from typing import Union, Optional, Any
@@ -1096,6 +1098,16 @@ del keya
 
 TABLE_OBJ_KEYS = list(TABLE_OBJ_MAP.keys())
 
+# the ids of the rows of an element result's (ntimes, nrows, ncols) data array
+H5_ELEMENT_ID_KEYS = ['element_node', 'element_layer', 'element_cid', 'element']
+
+# arrays that are (nrows, ...) and are sliced like the data array
+H5_ROW_KEYS = {
+    'node_gridtype', 'gridtype_str',
+    'element', 'element_node', 'element_layer', 'element_cid',
+    'element_type', 'element_data_type',
+}
+
 def _load_grid_point_weight(h5_result):
     """Loads a GridPointWeight"""
     #obj = GridPointWeight()
@@ -1160,7 +1172,10 @@ def _load_eigenvalue(h5_result, encoding: str,
     return obj
 
 def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
-                log: SimpleLogger, debug: bool=False):# real_obj, complex_obj
+                log: SimpleLogger, debug: bool=False,
+                itimes: Optional[np.ndarray]=None,
+                node_ids: Optional[np.ndarray]=None,
+                element_ids: Optional[np.ndarray]=None):# real_obj, complex_obj
     """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
@@ -1222,13 +1237,131 @@ def _load_table(result_name, h5_result, objs: tuple[Any], encoding: str,
     if obj.class_name != class_name:
         msg = 'class_name=%r selected; should be %r' % (obj.class_name, class_name)
         raise RuntimeError(msg)
+    selection = _get_h5_selection(h5_result, result_name, itimes, node_ids, element_ids, log)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding, debug=debug)
+                                     encoding, debug=debug, selection=selection)
     return obj
 
 
+def _get_h5_selection(h5_result, result_name: str,
+                      itimes: Optional[np.ndarray],
+                      node_ids: Optional[np.ndarray],
+                      element_ids: Optional[np.ndarray],
+                      log: SimpleLogger) -> Optional[tuple[Any, Any, int, int]]:
+    """
+    Gets the (time, row) hyperslab of the (ntimes, nrows, ncols) 'data'
+    array that will be loaded
+
+    node_ids filter the nodal results (e.g., displacements) and
+    element_ids filter the element results (e.g., stress).  Rows are
+    kept in file order.
+
+    Returns
+    -------
+    selection : (time_index, row_index, ntimes, nrows) / None
+        time_index / row_index : slice / (n, ) int ndarray
+            the selected indices
+        ntimes / nrows : int
+            the full size of the data array
+        None : load everything
+
+    """
+    if itimes is None and node_ids is None and element_ids is None:
+        return None
+    h5_data = h5_result.get('data')
+    if h5_data is None or h5_data.ndim != 3:
+        return None
+    ntimes, nrows = h5_data.shape[:2]
+
+    itime = None
+    if itimes is not None:
+        itime = np.asarray(itimes, dtype='int64').ravel()
+        itime = np.unique(np.where(itime < 0, itime + ntimes, itime))
+        itime = itime[(itime >= 0) & (itime < ntimes)]
+
+    irow = None
+    ids = None
+    if node_ids is not None and 'node_gridtype' in h5_result:
+        ids = h5_result['node_gridtype'][:, 0]
+        requested_ids = node_ids
+    elif element_ids is not None:
+        for key in H5_ELEMENT_ID_KEYS:
+            if key in h5_result and h5_result[key].ndim > 0:
+                # the strain energy element ids are (ntimes, nrows) and
+                # change with time, so they fail the nrows check below
+                h5_ids = h5_result[key]
+                ids = h5_ids[:] if h5_ids.ndim == 1 else h5_ids[:, 0]
+                requested_ids = element_ids
+                break
+
+    if ids is not None:
+        if len(ids) == nrows:
+            irow = np.flatnonzero(np.isin(ids, requested_ids))
+        else:
+            log.warning(f'cannot select ids for {result_name!r}; '
+                        f'nids={len(ids)} != nrows={nrows}; loading all rows')
+
+    if itime is None and irow is None:
+        return None
+    return _to_h5_index(itime), _to_h5_index(irow), ntimes, nrows
+
+def _to_h5_index(index: Optional[np.ndarray]) -> Union[slice, np.ndarray]:
+    """contiguous indices are read as a slice, which is cheaper than a point list"""
+    if index is None:
+        return slice(None)
+    if len(index) == 0:
+        return slice(0, 0)
+    if index[-1] - index[0] + 1 == len(index):
+        return slice(int(index[0]), int(index[-1]) + 1)
+    return index
+
+def _read_h5_slab(h5_dataset, time_index: Union[slice, np.ndarray],
+                  row_index: Union[slice, np.ndarray]) -> np.ndarray:
+    """reads a (time, row, ...) hyperslab"""
+    if isinstance(time_index, np.ndarray) and isinstance(row_index, np.ndarray):
+        # h5py only supports one list of indices per selection, so read
+        # the time range and take the time steps in memory
+        itime0 = time_index[0]
+        slab = h5_dataset[itime0:time_index[-1]+1, row_index]
+        return slab[time_index - itime0]
+    return h5_dataset[time_index, row_index]
+
+def _read_h5_selection(h5_dataset, key: str, str_data_names: list[str],
+                       selection: tuple[Any, Any, int, int]) -> np.ndarray:
+    """reads the part of an h5 dataset that is consistent with the selection"""
+    time_index, row_index, ntimes, nrows = selection
+    shape = h5_dataset.shape
+    is_row_array = key in H5_ROW_KEYS and len(shape) >= 1 and shape[0] == nrows
+    if key == 'data' or (len(shape) >= 2 and shape[:2] == (ntimes, nrows) and
+                         not is_row_array):
+        # (ntimes, nrows, ...) arrays (e.g., the strain energy element ids)
+        return _read_h5_slab(h5_dataset, time_index, row_index)
+    elif key in str_data_names and len(shape) == 1 and shape[0] == ntimes:
+        return h5_dataset[time_index]
+    elif is_row_array:
+        return h5_dataset[row_index]
+    return _cast(h5_dataset)
+
+def _update_selection_counts(obj, selection: tuple[Any, Any, int, int]) -> None:
+    """updates the sizes (e.g., ntimes, nelements) of a partially loaded result"""
+    unused_time_index, unused_row_index, ntimes, nrows = selection
+    ntimes_new, nrows_new = obj.data.shape[:2]
+    for name in ('ntimes', 'itime', 'ntotal', 'itotal', 'nelements', 'ielement', 'nnodes'):
+        value = getattr(obj, name, None)
+        if not isinstance(value, int) or value <= 0:
+            continue
+        is_time = name in {'ntimes', 'itime'}
+        if value == ntimes and (is_time or value != nrows):
+            setattr(obj, name, ntimes_new)
+        elif value == nrows:
+            setattr(obj, name, nrows_new)
+        elif not is_time and nrows % value == 0:
+            # multiple rows per element (e.g., layers, nodes)
+            setattr(obj, name, nrows_new // (nrows // value))
+
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     encoding: str, debug: bool=False):
+                                     encoding: str, debug: bool=False,
+                                     selection: Optional[tuple[Any, Any, int, int]]=None):
     """helper method for ``_load_table``"""
     keys_to_skip = [
         'class_name', 'headers', 'is_real', 'is_complex',
@@ -1241,18 +1374,25 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
     #if result_name == 'eigenvectors':
         #debug = True
     for key in h5_result.keys():
-        if key not in filtered_attrs:
+        if key not in filtered_attrs and key not in H5_ROW_KEYS:
+            # the node/element ids aren't defined until the object is built
             continue
         elif result_name == 'grid_point_forces' and key in ['element_name']:
             pass
         elif key in str_data_names:
             if debug:  # pragma: no cover
                 print('  *****key={key!r}')
-            datai = _cast_str(h5_result.get(key), encoding)
+            h5_times = h5_result.get(key)
+            if selection is not None and h5_times.ndim == 1:
+                h5_times = _read_h5_selection(h5_times, key, str_data_names, selection)
+            datai = _cast_str(h5_times, encoding)
             setattr(obj, key, datai)
             setattr(obj, '_times', datai)
         elif key not in data_code:
-            datai = _cast(h5_result.get(key))
+            if selection is None:
+                datai = _cast(h5_result.get(key))
+            else:
+                datai = _read_h5_selection(h5_result.get(key), key, str_data_names, selection)
             if debug:  # pragma: no cover
                 print('  **key=%r' % key)
                 if key not in ['data']:
@@ -1268,6 +1408,8 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
                 print(f'key={key!r} datai={datai!r}')
                 raise
             assert not isinstance(datai, bytes), f'key={key!r} data={datai}'
+    if selection is not None:
+        _update_selection_counts(obj, selection)
     return obj
 
 def _get_obj_class(objs: tuple[Any],
@@ -1342,23 +1484,47 @@ def _get_obj_class(objs: tuple[Any],
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2) -> None:
-    """exports an OP2 object to an HDF5 file"""
+def export_op2_to_hdf5_filename(hdf5_filename: str, op2_model: OP2,
+                                compression: Optional[str]=None,
+                                compression_opts: Optional[int]=None) -> None:
+    """
+    exports an OP2 object to an HDF5 file
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the path to the hdf5 file
+    op2_model : OP2()
+        the model to export
+    compression : str; default=None
+        None : contiguous (uncompressed) datasets
+        'gzip', 'lzf' : chunked and compressed arrays; the result data
+        is chunked along (time, entity), so partial reads are cheap
+    compression_opts : int; default=None
+        the compression level (e.g., 0-9 for 'gzip')
+
+    """
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
     try:
         with h5py.File(hdf5_filename, 'w') as hdf5_file:
             op2_model.log.info(f'starting export_op2_to_hdf5_file of {hdf5_filename!r}')
-            export_op2_to_hdf5_file(hdf5_file, op2_model)
+            export_op2_to_hdf5_file(hdf5_file, op2_model, compression=compression,
+                                    compression_opts=compression_opts)
     except OSError:
         op2_model.log.error(f'failed to export {hdf5_filename!r}')
         raise
 
-def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2) -> None:
+def export_op2_to_hdf5_file(hdf5_file, op2_model: OP2,
+                            compression: Optional[str]=None,
+                            compression_opts: Optional[int]=None) -> None:
     """exports an OP2 object to an HDF5 file object"""
     assert not isinstance(hdf5_file, str), hdf5_file
+    assert compression in {None, 'gzip', 'lzf'}, f'compression={compression!r}'
     create_info_group(hdf5_file, op2_model)
-    export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    export_matrices(hdf5_file, op2_model, compression=compression,
+                    compression_opts=compression_opts)
+    _export_subcases(hdf5_file, op2_model, compression=compression,
+                     compression_opts=compression_opts)
 
 def create_info_group(hdf5_file, op2_model: OP2) -> None:
     """creates the info HDF5 group"""
@@ -1369,21 +1535,26 @@ def create_info_group(hdf5_file, op2_model: OP2) -> None:
     #info_group.create_dataset('is_nx', data=self.is_nx)
     #info_group.create_dataset('nastran_version', data=self.is_nx)
 
-def export_matrices(hdf5_file, op2_model: OP2) -> None:
+def export_matrices(hdf5_file, op2_model: OP2,
+                    compression: Optional[str]=None,
+                    compression_opts: Optional[int]=None) -> None:
     """exports the matrices to HDF5"""
     if len(op2_model.matrices):
         matrix_group = hdf5_file.create_group('matrices')
         for key, matrix in sorted(op2_model.matrices.items()):
             matrixi_group = matrix_group.create_group(key.encode('latin-1'))
             if hasattr(matrix, 'export_to_hdf5'):
-                matrix.export_to_hdf5(matrixi_group, op2_model.log)
+                matrix.export_to_hdf5(matrixi_group, op2_model.log, compression=compression,
+                                      compression_opts=compression_opts)
             else:
                 msg = 'HDF5: key=%r type=%s cannot be exported' % (key, str(type(matrix)))
                 op2_model.log.warning(msg)
                 raise NotImplementedError(msg)
                 #continue
 
-def _export_subcases(hdf5_file, op2_model):
+def _export_subcases(hdf5_file, op2_model: OP2,
+                     compression: Optional[str]=None,
+                     compression_opts: Optional[int]=None) -> None:
     """exports the subcases to HDF5"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
@@ -1421,28 +1592,71 @@ def _export_subcases(hdf5_file, op2_model):
             #result_name = result_type + ':' + class_name
             result_name = result_type
             result_group = subcase_group.create_group(result_name)
-            obj.export_to_hdf5(result_group, op2_model.log)
+            obj.export_to_hdf5(result_group, op2_model.log, compression=compression,
+                               compression_opts=compression_opts)
 
-def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
-    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log)
+def load_op2_from_hdf5(hdf5_filename, combine=True, log=None, **kwargs):
+    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log, **kwargs)
 
 def load_op2_from_hdf5_filename(hdf5_filename: str, combine: bool=True,
-                                log: Optional[SimpleLogger]=None):
-    """loads an hdf5 file into an OP2 object"""
+                                log: Optional[SimpleLogger]=None,
+                                subcases: Optional[list[int]]=None,
+                                result_names: Optional[list[str]]=None,
+                                itimes: Optional[np.ndarray]=None,
+                                node_ids: Optional[np.ndarray]=None,
+                                element_ids: Optional[np.ndarray]=None):
+    """
+    loads an hdf5 file into an OP2 object
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the path to the an hdf5 file
+    combine : bool; default=True
+        runs the combine routine
+    log : SimpleLogger; default=None
+        a logger object
+    subcases : list[int]; default=None -> all
+        the subcases to load
+    result_names : list[str]; default=None -> all
+        the results to load (e.g., ['displacements', 'stress.cquad4_stress'])
+    itimes : (n, ) int ndarray; default=None -> all
+        the time/mode/frequency indices to load
+    node_ids : (n, ) int ndarray; default=None -> all
+        the nodes to load for nodal results (e.g., displacements)
+    element_ids : (n, ) int ndarray; default=None -> all
+        the elements to load for element results (e.g., stress)
+
+    Only the selected hyperslab of each result is read, so loading
+    a time history of one element doesn't read the rest of the model.
+
+    """
     check_path(hdf5_filename, 'hdf5_filename')
     model = OP2(log=log)
     model.op2_filename = hdf5_filename
 
+    log = model.log
     log.info(f'hdf5_op2_filename = {hdf5_filename!r}')
     debug = False
     with h5py.File(hdf5_filename, 'r') as h5_file:
-        load_op2_from_hdf5_file(model, h5_file, log, debug=debug)
+        load_op2_from_hdf5_file(model, h5_file, log, debug=debug,
+                                subcases=subcases, result_names=result_names,
+                                itimes=itimes, node_ids=node_ids, element_ids=element_ids)
     model.combine_results(combine=combine)
     return model
 
 def load_op2_from_hdf5_file(model: OP2, h5_file,
-                            log: SimpleLogger, debug=False):
-    """loads an h5 file object into an OP2 object"""
+                            log: SimpleLogger, debug=False,
+                            subcases: Optional[list[int]]=None,
+                            result_names: Optional[list[str]]=None,
+                            itimes: Optional[np.ndarray]=None,
+                            node_ids: Optional[np.ndarray]=None,
+                            element_ids: Optional[np.ndarray]=None):
+    """
+    loads an h5 file object into an OP2 object
+
+    See ``load_op2_from_hdf5_filename`` for the filtering arguments.
+    """
     encoding = 'latin1'
     for key in h5_file.keys():
         if key.startswith('Subcase'):
@@ -1450,6 +1664,8 @@ def load_op2_from_hdf5_file(model: OP2, h5_file,
             #log.debug('subcase:')
             for result_name in h5_subcase.keys():
                 assert isinstance(result_name, str), f'result_name={result_name}; type={type(result_name)}'
+                if result_names is not None and result_name not in result_names:
+                    continue
 
                 if result_name in ['eigenvalues', 'eigenvalues_fluid']:
                     #log.warning('    skipping %r...' % result_name)
@@ -1474,9 +1690,12 @@ def load_op2_from_hdf5_file(model: OP2, h5_file,
                     if objs is None:
                         log.warning(f'  skipping {result_name}...')
                         continue
+                    if subcases is not None and _cast(h5_result.get('isubcase')) not in subcases:
+                        continue
                     assert isinstance(objs, tuple), f'check that {result_name!r} is tuple in the above dictionary'
                     obj = _load_table(result_name, h5_result, objs,
-                                      encoding, log=log, debug=debug)
+                                      encoding, log=log, debug=debug,
+                                      itimes=itimes, node_ids=node_ids, element_ids=element_ids)
                     if obj is None:
                         continue
 
@@ -0,0 +1,77 @@
+"""
+Defines a read-only, memory mapped file object for the OP2 reader, so the
+records of large tables can be decoded without copying the data.
+"""
+from __future__ import annotations
+import io
+import mmap
+from typing import BinaryIO, Union, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+
+
+class MmapFile:
+    """
+    File object interface (read/seek/tell/close) for a memory mapped file.
+
+    ``read`` returns a copy of the data (like a file object), while
+    ``read_view`` returns a memoryview into the mapped file.
+    """
+    def __init__(self, file_obj: BinaryIO, mmap_obj: mmap.mmap):
+        self._file = file_obj
+        self._mmap = mmap_obj
+        self._view = memoryview(mmap_obj)
+        self.name = getattr(file_obj, 'name', None)
+
+    def read(self, n: int=-1) -> bytes:
+        """reads n bytes"""
+        return self._mmap.read(n)
+
+    def read_view(self, n: int) -> memoryview:
+        """reads n bytes without copying the data"""
+        i = self._mmap.tell()
+        data = self._view[i:i+n]
+        self._mmap.seek(i + len(data))
+        return data
+
+    def seek(self, n: int, whence: int=0) -> int:
+        """moves to position n"""
+        self._mmap.seek(n, whence)
+        return self._mmap.tell()
+
+    def tell(self) -> int:
+        """gets the current position"""
+        return self._mmap.tell()
+
+    def close(self) -> None:
+        """
+        Closes the file.
+
+        The map is left for the garbage collector if an array still
+        references it (e.g., np.frombuffer on a record).
+        """
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+
+def open_mmap(file_obj: BinaryIO, log: SimpleLogger) -> Union[MmapFile, BinaryIO]:
+    """
+    Memory maps an open file.
+
+    The file object is returned if it can't be mapped (e.g., a stream or
+    an empty file).
+    """
+    try:
+        if not file_obj.seekable():
+            raise io.UnsupportedOperation('file is not seekable')
+        mmap_obj = mmap.mmap(file_obj.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError) as error:
+        # io.UnsupportedOperation is an OSError/ValueError
+        log.warning(f'cannot memory map the op2; using the file object ({error})')
+        return file_obj
+    mmap_obj.seek(file_obj.tell())
+    return MmapFile(file_obj, mmap_obj)
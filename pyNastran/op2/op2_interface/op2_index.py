@@ -0,0 +1,286 @@
+"""
+Defines an index of the tables/subtables in an OP2, which allows results
+to be loaded on demand.
+
+Example
+-------
+>>> model = OP2()
+>>> model.index_op2(op2_filename, index_filename='model.op2.index')
+>>> disp = model.lazy_results['displacements'][1][1]
+"""
+from __future__ import annotations
+import os
+import sys
+import json
+from typing import Any, Optional, TYPE_CHECKING
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+OP2_INDEX_VERSION = 1
+
+#: the table3 (-3) attributes that are saved for each subtable
+INDEX_ATTRIBUTES = ('isubcase', 'analysis_code', 'table_code', 'element_type')
+
+
+class OP2Index:
+    """
+    Stores the file offsets of the tables and the -3/-4 subtables of an OP2
+
+    Attributes
+    ----------
+    tables : list[(table_name, n, count)]
+        the table name, the file offset of the start of the table, and
+        the design cycle counter (``_count``) at the start of the table
+    subtables : list[dict]
+        the table index (into tables), the offsets of the -3 (n3)
+        and -4 (n4) records, the INDEX_ATTRIBUTES, and the result_name
+        (e.g., 'displacements', 'stress.cquad4_stress')
+
+    """
+    def __init__(self, op2_filename: str, mode: str='msc'):
+        self.op2_filename = os.path.abspath(op2_filename)
+        self.mode = mode
+        stat = os.stat(op2_filename)
+        self.file_size = stat.st_size
+        self.mtime = stat.st_mtime
+        self.tables: list[tuple[bytes, int, int]] = []
+        self.subtables: list[dict[str, Any]] = []
+
+        # the result objects created during the index pass; used to find
+        # the result_name of each subtable
+        self._objs = []
+        self._table3 = {'n3': None}
+
+    def add_table(self, table_name: bytes, n: int, count: int) -> None:
+        """adds a table that starts at file offset n"""
+        self.tables.append((table_name, n, count))
+
+    def set_table3(self, op2: OP2, n3: int) -> None:
+        """saves the attributes of a -3 record at file offset n3"""
+        table3 = {'n3': n3}
+        for name in INDEX_ATTRIBUTES:
+            table3[name] = getattr(op2, name, None)
+        self._table3 = table3
+
+    def add_subtable(self, op2: OP2, n4: int) -> None:
+        """adds a -3/-4 subtable pair after the -4 record at offset n4 is parsed"""
+        subtable = {
+            'itable': len(self.tables) - 1,
+            'n4': n4,
+            'result_name': None,
+        }
+        subtable.update(self._table3)
+        self.subtables.append(subtable)
+        self._objs.append(op2.obj)
+
+    def set_result_names(self, op2: OP2) -> None:
+        """maps the objects created by the index pass to their result names"""
+        obj_to_result_name = {}
+        for result_name in op2.get_table_types():
+            try:
+                storage_obj = op2.get_result(result_name)
+            except AttributeError:
+                continue
+            if not isinstance(storage_obj, dict):
+                continue
+            for obj in storage_obj.values():
+                obj_to_result_name[id(obj)] = result_name
+
+        for subtable, obj in zip(self.subtables, self._objs):
+            if obj is not None:
+                subtable['result_name'] = obj_to_result_name.get(id(obj))
+        self._objs = []
+
+    @property
+    def result_names(self) -> list[str]:
+        """the results in the OP2"""
+        return sorted({subtable['result_name'] for subtable in self.subtables
+                       if subtable['result_name'] is not None})
+
+    def get_subcases(self, result_name: str) -> list[int]:
+        """the subcases of a result"""
+        return sorted({subtable['isubcase'] for subtable in self.subtables
+                       if subtable['result_name'] == result_name})
+
+    def get_table_offsets(self, result_name: str, isubcase: int) -> list[tuple[int, int]]:
+        """the (file offset, count) of the tables with a result for a subcase"""
+        itables = {subtable['itable'] for subtable in self.subtables
+                   if subtable['result_name'] == result_name and
+                   subtable['isubcase'] == isubcase}
+        return [self.tables[itable][1:] for itable in sorted(itables)]
+
+    def is_valid(self, op2_filename: str) -> bool:
+        """is the index for the current version of the OP2?"""
+        stat = os.stat(op2_filename)
+        return (os.path.abspath(op2_filename) == self.op2_filename and
+                stat.st_size == self.file_size and
+                stat.st_mtime == self.mtime)
+
+    def save(self, index_filename: str) -> None:
+        """saves the index as a json file"""
+        data = {
+            'version': OP2_INDEX_VERSION,
+            'op2_filename': self.op2_filename,
+            'mode': self.mode,
+            'file_size': self.file_size,
+            'mtime': self.mtime,
+            'tables': [(table_name.decode('latin1'), n, count)
+                       for table_name, n, count in self.tables],
+            'subtable_fields': list(self.subtables[0]) if self.subtables else [],
+        }
+        fields = data['subtable_fields']
+        data['subtables'] = [[subtable[name] for name in fields]
+                             for subtable in self.subtables]
+        with open(index_filename, 'w') as index_file:
+            json.dump(data, index_file)
+
+    @classmethod
+    def load(cls, index_filename: str) -> OP2Index:
+        """loads an index that was written by ``save``"""
+        with open(index_filename, 'r') as index_file:
+            data = json.load(index_file)
+        if data['version'] != OP2_INDEX_VERSION:
+            raise RuntimeError(f'index_filename={index_filename!r} has version={data["version"]}; '
+                               f'expected {OP2_INDEX_VERSION}')
+        index = cls.__new__(cls)
+        index.op2_filename = data['op2_filename']
+        index.mode = data['mode']
+        index.file_size = data['file_size']
+        index.mtime = data['mtime']
+        index.tables = [(table_name.encode('latin1'), n, count)
+                        for table_name, n, count in data['tables']]
+        fields = data['subtable_fields']
+        index.subtables = [dict(zip(fields, values)) for values in data['subtables']]
+        index._objs = []
+        return index
+
+    def __repr__(self) -> str:
+        return (f'OP2Index(op2_filename={self.op2_filename!r}, ntables={len(self.tables)}, '
+                f'nsubtables={len(self.subtables)})')
+
+
+class LazyResults:
+    """
+    Loads the results of an indexed OP2 on first access
+
+    >>> disp = model.lazy_results['displacements'][1][1]
+    """
+    def __init__(self, model: OP2, index: OP2Index):
+        self.model = model
+        self.index = index
+        self._results = {}
+
+    def keys(self) -> list[str]:
+        """the result names"""
+        return self.index.result_names
+
+    def __contains__(self, result_name: str) -> bool:
+        return result_name in self.keys()
+
+    def __getitem__(self, result_name: str) -> LazyResult:
+        if result_name not in self._results:
+            if result_name not in self:
+                raise KeyError(f'result_name={result_name!r} is not in the op2; '
+                               f'allowed={self.keys()}')
+            self._results[result_name] = LazyResult(self, result_name)
+        return self._results[result_name]
+
+    def __repr__(self) -> str:
+        return f'LazyResults(result_names={self.keys()})'
+
+
+class LazyResult:
+    """
+    Loads a single result type of an indexed OP2 by subcase
+
+    The subcase is a dict of {key: result}, where the key is the key in the
+    model's result dict (e.g., isubcase).
+    """
+    def __init__(self, lazy_results: LazyResults, result_name: str):
+        self.lazy_results = lazy_results
+        self.result_name = result_name
+        self._loaded = {}
+
+    def keys(self) -> list[int]:
+        """the subcases"""
+        return self.lazy_results.index.get_subcases(self.result_name)
+
+    def __contains__(self, isubcase: int) -> bool:
+        return isubcase in self.keys()
+
+    def __getitem__(self, isubcase: int) -> dict[Any, Any]:
+        if isubcase not in self._loaded:
+            if isubcase not in self:
+                raise KeyError(f'isubcase={isubcase} is not in {self.result_name!r}; '
+                               f'allowed={self.keys()}')
+            self._loaded[isubcase] = self._load(isubcase)
+        return self._loaded[isubcase]
+
+    def _load(self, isubcase: int) -> dict[Any, Any]:
+        """
+        Reads the tables with the result for the subcase.  The other
+        subcases/results in those tables are skipped by the reader.
+
+        Returns
+        -------
+        results : dict[key] = result
+            the results of the subcase
+        """
+        model = self.lazy_results.model
+        index = self.lazy_results.index
+        table_offsets = index.get_table_offsets(self.result_name, isubcase)
+
+        model2 = _read_op2_tables(model, index, table_offsets, self.result_name, isubcase)
+        storage_obj2 = model2.get_result(self.result_name)
+        results = {key: obj for key, obj in storage_obj2.items()
+                   if _get_isubcase(key) == isubcase}
+
+        # the result is also accessible from the model
+        model.get_result(self.result_name).update(results)
+        return results
+
+    def __repr__(self) -> str:
+        return f'LazyResult(result_name={self.result_name!r}, subcases={self.keys()})'
+
+
+def _get_isubcase(key: Any) -> int:
+    """the key is isubcase for combine=True or the result code"""
+    if isinstance(key, tuple):
+        return key[0]
+    return key
+
+
+def _read_op2_tables(model: OP2, index: OP2Index, table_offsets: list[int],
+                     result_name: str, isubcase: int) -> OP2:
+    """reads a subset of the tables of an indexed OP2"""
+    from pyNastran.op2.op2 import OP2
+    model2 = OP2(log=model.log, debug=None, mode=index.mode,
+                 use_mmap=model.use_mmap)
+    model2.set_subcases([isubcase])
+    model2.include_exclude_results(include_results=[result_name])
+    model2._table_offsets = table_offsets
+    model2.read_op2(index.op2_filename, combine=True, build_dataframe=False)
+    return model2
+
+
+def build_op2_index(model: OP2, op2_filename: str, mode: Optional[str]=None) -> OP2Index:
+    """
+    Runs the array sizing step (read_mode=1) of the OP2 reader, which reads
+    the -3 records and skips the data of the -4 records, while saving the
+    table/subtable offsets.
+    """
+    from pyNastran.op2.op2 import OP2
+    from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+    model1 = OP2(log=model.log, debug=None, mode=mode, use_mmap=model.use_mmap)
+    model1._op2_index = OP2Index(op2_filename)
+    model1.read_mode = 1
+    model1._close_op2 = True
+    model1.is_vectorized = True
+    model1.encoding = sys.getdefaultencoding()
+    model1.skip_undefined_matrices = True
+    OP2_Scalar.read_op2(model1, op2_filename=op2_filename, mode=mode)
+
+    index = model1._op2_index
+    index.mode = model1._nastran_format
+    index.set_result_names(model1)
+    return index
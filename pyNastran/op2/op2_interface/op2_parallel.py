@@ -0,0 +1,373 @@
+"""
+Defines reading an OP2 with a pool of processes.
+
+The table/subtable offsets are found with an ``OP2Index`` (one pass over
+the record headers).  The result tables are split into independent work
+units (a subcase of a set of tables), which are decoded by the workers.
+The other tables (e.g., geometry, matrices, eigenvalues) are read by the
+main process.
+
+The large arrays of the result objects (e.g., data) are sent back to the
+main process in shared memory blocks (see ``SharedArray``) rather than
+being pickled through the pool's pipes.  The rest of the object is pickled.
+
+Example
+-------
+>>> model = read_op2(op2_filename, nworkers=8)
+"""
+from __future__ import annotations
+import os
+import pickle
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Any, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.op2.op2_interface.op2_index import OP2Index, build_op2_index, _get_isubcase
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+#: the smaller arrays are pickled with the result objects
+MIN_SHARED_NBYTES = 65536
+
+
+class SharedArray:
+    """
+    Stands in for an array of a result object, which is copied to a shared
+    memory block by the worker, so the array isn't pickled.
+
+    The block is owned by the main process, which frees it with ``load``
+    or ``unlink``.
+    """
+    def __init__(self, array: np.ndarray):
+        array = np.ascontiguousarray(array)
+        shm = shared_memory.SharedMemory(create=True, size=array.nbytes)
+        np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+        self.name = shm.name
+        self.shape = array.shape
+        self.dtype = array.dtype
+        shm.close()
+
+        # the block would be unlinked when the worker's resource tracker exits
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, 'shared_memory')
+
+    def load(self) -> np.ndarray:
+        """copies the array from the block and frees the block"""
+        shm = shared_memory.SharedMemory(name=self.name)
+        try:
+            array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+        return array
+
+    def unlink(self) -> None:
+        """frees the block without loading the array"""
+        try:
+            shm = shared_memory.SharedMemory(name=self.name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+
+    def __repr__(self) -> str:
+        return f'SharedArray(name={self.name!r}, shape={self.shape}, dtype={self.dtype})'
+
+
+def _share_arrays(obj: Any, min_nbytes: int) -> None:
+    """
+    Replaces the arrays of a result object with a ``SharedArray``.
+
+    The arrays are pickled on Windows, where a block is freed when the
+    worker closes it, and if the block can't be created (e.g., /dev/shm
+    is full).
+    """
+    if os.name == 'nt' or not hasattr(obj, '__dict__'):
+        return
+    for name, value in list(vars(obj).items()):
+        if (isinstance(value, np.ndarray) and not value.dtype.hasobject and
+                value.nbytes >= max(min_nbytes, 1)):
+            try:
+                setattr(obj, name, SharedArray(value))
+            except OSError:
+                return
+
+
+def _load_arrays(obj: Any) -> None:
+    """restores the arrays of a result object (see ``_share_arrays``)"""
+    if not hasattr(obj, '__dict__'):
+        return
+    for name, value in list(vars(obj).items()):
+        if isinstance(value, SharedArray):
+            setattr(obj, name, value.load())
+
+
+def _unlink_arrays(unit_results: dict[int, list]) -> None:
+    """frees the shared memory blocks of the results that weren't loaded"""
+    for results, *unused_out in unit_results.values():
+        for resultsi in results.values():
+            for obj in resultsi.values():
+                for value in getattr(obj, '__dict__', {}).values():
+                    if isinstance(value, SharedArray):
+                        value.unlink()
+
+
+class WorkUnit:
+    """
+    A subcase of the result tables, which may be read independently of
+    the rest of the op2.
+
+    All the tables of a subcase are in the same unit, so the result objects
+    (e.g., a transient result that spans multiple tables) and the subcase
+    keys that are used by ``combine_results`` are never split across
+    processes.
+    """
+    def __init__(self, isubcase: int):
+        self.isubcase = isubcase
+        self.itables = set()
+        self.result_names = set()
+        self.n0 = None
+        self.nbytes = 0
+
+    def get_table_offsets(self, index: OP2Index) -> list[tuple[int, int]]:
+        """the (file offset, count) of the tables"""
+        return [index.tables[itable][1:] for itable in sorted(self.itables)]
+
+    def __repr__(self) -> str:
+        return (f'WorkUnit(isubcase={self.isubcase}, itables={sorted(self.itables)}, '
+                f'result_names={sorted(self.result_names)}, nbytes={self.nbytes})')
+
+
+def get_work_units(index: OP2Index) -> tuple[list[WorkUnit], list[tuple[int, int]]]:
+    """
+    Splits the tables of an indexed op2 into the work units and the tables
+    that are read by the main process
+
+    Returns
+    -------
+    units : list[WorkUnit]
+        the work units in file order
+    main_table_offsets : list[(n, count)]
+        the tables without result subtables (e.g., geometry, matrices)
+
+    """
+    # the tables with subcase based results (e.g., not PSDF)
+    has_subcase = {}
+    has_result = set()
+    for subtable in index.subtables:
+        itable = subtable['itable']
+        is_subcase = subtable['isubcase'] is not None
+        if has_subcase.setdefault(itable, is_subcase) != is_subcase:
+            # a table with and without subcases; read it serially
+            return [], [table[1:] for table in index.tables]
+        if subtable['result_name'] is not None:
+            has_result.add(itable)
+    is_result_table = [has_subcase.get(itable, False) and itable in has_result
+                       for itable in range(len(index.tables))]
+
+    # the size of a subtable is the distance to the next subtable/table
+    offsets = sorted([n for unused_name, n, unused_count in index.tables] +
+                     [subtable['n3'] for subtable in index.subtables] +
+                     [index.file_size])
+    next_offset = dict(zip(offsets[:-1], offsets[1:]))
+
+    units_by_subcase = {}
+    for subtable in index.subtables:
+        itable = subtable['itable']
+        if not is_result_table[itable]:
+            continue
+        isubcase = subtable['isubcase']
+        unit = units_by_subcase.get(isubcase)
+        if unit is None:
+            unit = units_by_subcase[isubcase] = WorkUnit(isubcase)
+
+        n3 = subtable['n3']
+        unit.itables.add(itable)
+        if subtable['result_name'] is not None:
+            unit.result_names.add(subtable['result_name'])
+        unit.nbytes += next_offset[n3] - n3
+        unit.n0 = n3 if unit.n0 is None else min(unit.n0, n3)
+
+    units = sorted(units_by_subcase.values(), key=lambda unit: unit.n0)
+    main_table_offsets = [table[1:] for itable, table in enumerate(index.tables)
+                          if not is_result_table[itable]]
+    return units, main_table_offsets
+
+
+def _read_work_unit(args: tuple) -> tuple[int, dict[str, dict], dict, dict]:
+    """
+    Reads a work unit in a worker process
+
+    Returns
+    -------
+    iunit : int
+        the work unit id
+    results : dict[result_name] = {key: obj}
+        the result dictionaries that were filled; the large arrays are
+        ``SharedArray``s
+    offsets : dict[result_name] = {key: n3}
+        the file offset of the first subtable of each result object
+        (None for the objects created by combine_results)
+    subcase_key / isubcase_name_map : dict
+        the subcase attributes of the model
+    """
+    from pyNastran.op2.op2 import OP2
+    (iunit, op2_filename, mode, isubcase, table_offsets,
+     saved_results, combine, use_mmap, encoding, min_nbytes) = args
+    model = OP2(debug=None, log=None, mode=mode, use_mmap=use_mmap)
+    model.set_subcases([isubcase])
+    model.set_results(saved_results)
+    model._table_offsets = table_offsets
+    model._op2_index = OP2Index(op2_filename)
+    model.read_op2(op2_filename, combine=combine, build_dataframe=False,
+                   skip_undefined_matrices=True, encoding=encoding)
+
+    first_offset = {}
+    for subtable, obj in zip(model._op2_index.subtables, model._op2_index._objs):
+        if obj is not None:
+            first_offset.setdefault(id(obj), subtable['n3'])
+    model._op2_index = None
+
+    # a few readers don't check the subcase, so the other subcases are dropped
+    results = {}
+    offsets = {}
+    for result_name in model.get_table_types():
+        try:
+            storage_obj = model.get_result(result_name)
+        except AttributeError:
+            continue
+        if not isinstance(storage_obj, dict):
+            continue
+        storage_obj = {key: obj for key, obj in storage_obj.items()
+                       if _get_isubcase(key) == isubcase}
+        if storage_obj:
+            results[result_name] = storage_obj
+            offsets[result_name] = {key: first_offset.get(id(obj))
+                                    for key, obj in storage_obj.items()}
+    for storage_obj in results.values():
+        for obj in storage_obj.values():
+            _share_arrays(obj, min_nbytes)
+    return iunit, results, offsets, dict(model.subcase_key), model.isubcase_name_map
+
+
+def read_op2_parallel(model: OP2, op2_filename: str, nworkers: int,
+                      combine: bool=True, encoding: Optional[str]=None) -> bool:
+    """
+    Reads the result tables of an op2 with a pool of nworkers processes.
+    The non-result tables are read by the calling process.
+
+    Returns
+    -------
+    is_read : bool
+        False if the op2 has no independent result tables or the worker
+        pool failed (e.g., the processes couldn't be started); the op2
+        should be read serially
+    """
+    index = build_op2_index(model, op2_filename, mode=model.mode)
+    units, main_table_offsets = get_work_units(index)
+
+    saved_results = sorted(model._results.saved)
+    units = [unit for unit in units
+             if (model.is_all_subcases or unit.isubcase in model.valid_subcases) and
+             any(model._results.is_saved(result_name) for result_name in unit.result_names)]
+    if len(units) < 2:
+        model.log.debug(f'{len(units)} work units; reading the op2 serially')
+        return False
+    model.log.debug(f'reading {len(units)} work units with nworkers={nworkers}')
+
+    # submit the largest units first, so the pool stays busy
+    args = [(iunit, os.path.abspath(op2_filename), index.mode, unit.isubcase,
+             unit.get_table_offsets(index), saved_results, combine, model.use_mmap,
+             encoding, MIN_SHARED_NBYTES)
+            for iunit, unit in sorted(enumerate(units), key=lambda x: -x[1].nbytes)]
+    nprocesses = min(nworkers, len(units))
+    unit_results = {}
+    try:
+        try:
+            with mp.Pool(nprocesses) as pool:
+                for iunit, *out in pool.imap_unordered(_read_work_unit, args):
+                    unit_results[iunit] = out
+        except (OSError, mp.ProcessError, pickle.PicklingError) as error:
+            # the pool couldn't be started or the results couldn't be sent back;
+            # errors in the readers are raised
+            model.log.warning(f'the worker pool failed ({type(error).__name__}: {error}); '
+                              'reading the op2 serially')
+            return False
+
+        # the non-result tables (and the op2 header)
+        model._table_offsets = main_table_offsets
+        try:
+            model.read_op2(op2_filename, combine=combine, build_dataframe=False,
+                           skip_undefined_matrices=model.skip_undefined_matrices,
+                           encoding=encoding)
+        finally:
+            model._table_offsets = None
+
+        # reassemble the results in file order
+        key_offsets = {}
+        for iunit in range(len(units)):
+            results, offsets, subcase_keyi, isubcase_name_mapi = unit_results[iunit]
+            for result_name, resultsi in results.items():
+                storage_obj = model.get_result(result_name)
+                for key, obj in resultsi.items():
+                    assert key not in storage_obj, f'result_name={result_name!r} key={key}'
+                    _load_arrays(obj)
+                    _restore_nan(obj)
+                    storage_obj[key] = obj
+                    key_offsets[(result_name, key)] = offsets[result_name][key]
+            model.subcase_key.update(subcase_keyi)
+            for isubcase, name in isubcase_name_mapi.items():
+                model.isubcase_name_map.setdefault(isubcase, name)
+    finally:
+        _unlink_arrays(unit_results)
+    _sort_results(model, index, key_offsets)
+    return True
+
+
+def _restore_nan(obj: Any) -> None:
+    """
+    A static result has nonlinear_factor=np.nan, which is checked with
+    ``nonlinear_factor in (None, np.nan)``.  That's an identity check for
+    nan, so the unpickled nan is replaced.
+    """
+    nonlinear_factor = getattr(obj, 'nonlinear_factor', None)
+    if isinstance(nonlinear_factor, float) and np.isnan(nonlinear_factor):
+        obj.nonlinear_factor = np.nan
+        data_code = getattr(obj, 'data_code', None)
+        if isinstance(data_code, dict) and 'nonlinear_factor' in data_code:
+            data_code['nonlinear_factor'] = np.nan
+
+
+def _sort_results(model: OP2, index: OP2Index,
+                  key_offsets: dict[tuple[str, Any], Optional[int]]) -> None:
+    """
+    Sorts the keys of the result dictionaries by the file offset of their
+    first subtable.  The first subtable of the result type and subcase is
+    used for the combined results.
+    """
+    _sort_dict(model.subcase_key, sorted(model.subcase_key.items()))
+    _sort_dict(model.isubcase_name_map, sorted(model.isubcase_name_map.items()))
+    first_offset = {}
+    for subtable in index.subtables:
+        key = (subtable['result_name'], subtable['isubcase'])
+        first_offset.setdefault(key, subtable['n3'])
+
+    def get_offset(result_name: str, key: Any) -> int:
+        offset = key_offsets.get((result_name, key))
+        if offset is None:
+            offset = first_offset.get((result_name, _get_isubcase(key)), -1)
+        return offset
+
+    result_names = {result_name for result_name, unused_key in key_offsets}
+    for result_name in sorted(result_names):
+        storage_obj = model.get_result(result_name)
+        items = sorted(storage_obj.items(), key=lambda item: get_offset(result_name, item[0]))
+        _sort_dict(storage_obj, items)
+
+
+def _sort_dict(dict_obj: dict, items: list[tuple[Any, Any]]) -> None:
+    """reorders a dictionary in place (the type of a defaultdict is kept)"""
+    dict_obj.clear()
+    dict_obj.update(items)
@@ -61,6 +61,7 @@ from pyNastran.op2.result_objects.qualinfo import QualInfo
 from pyNastran.op2.result_objects.op2_results import CSTM
 from pyNastran.op2.op2_interface.msc_tables import MSC_GEOM_TABLES
 from pyNastran.op2.op2_interface.nx_tables import NX_GEOM_TABLES
+from pyNastran.op2.op2_interface.mmap_file import MmapFile
 
 from pyNastran.op2.op2_interface.utils import (
     mapfmt, reshape_bytes_block,
@@ -2711,21 +2712,34 @@ class OP2Reader:
             return self._read_record_ndata4(debug=debug, macro_rewind=macro_rewind)[0]
         return self._read_record_ndata8(debug=debug, macro_rewind=macro_rewind)[0]
 
-    def _read_record_ndata(self, debug: bool=True, macro_rewind: bool=False) -> tuple[bytes, int]:
-        """reads a record and the length of the record"""
+    def _read_record_ndata(self, debug: bool=True, macro_rewind: bool=False,
+                           view: bool=False) -> tuple[bytes, int]:
+        """
+        reads a record and the length of the record
+
+        Parameters
+        ----------
+        view : bool; default=False
+            for a memory mapped op2 (use_mmap=True), a single block record
+            is returned as a memoryview into the file instead of bytes;
+            a multi-block record is always a copy
+
+        """
         if self.size == 4:
-            return self._read_record_ndata4(debug=debug, macro_rewind=macro_rewind)
-        return self._read_record_ndata8(debug=debug, macro_rewind=macro_rewind)
+            return self._read_record_ndata4(debug=debug, macro_rewind=macro_rewind, view=view)
+        return self._read_record_ndata8(debug=debug, macro_rewind=macro_rewind, view=view)
 
-    def _read_record_ndata4(self, debug: bool=True, macro_rewind: bool=False) -> tuple[bytes, int]:
+    def _read_record_ndata4(self, debug: bool=True, macro_rewind: bool=False,
+                            view: bool=False) -> tuple[bytes, int]:
         """reads a record and the length of the record for size=4"""
         op2: OP2 = self.op2
+        view = view and isinstance(op2.f, MmapFile)
         marker0 = self.get_marker1_4(rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [4, %i, 4]; macro_rewind=%s\n' % (
                 marker0, macro_rewind))
         na = op2.n
-        record, nrecord = self._read_block_ndata4()
+        record, nrecord = self._read_block_ndata4(view=view)
 
         if self.is_debug_file and debug:
             msg = 'read_record - record = [%i, recordi, %i]; macro_rewind=%s\n' % (
@@ -2768,14 +2782,16 @@ class OP2Reader:
             record = b''.join(records)
         return record, nrecord
 
-    def _read_record_ndata8(self, debug: bool=True, macro_rewind: bool=False) -> tuple[bytes, int]:
+    def _read_record_ndata8(self, debug: bool=True, macro_rewind: bool=False,
+                            view: bool=False) -> tuple[bytes, int]:
         """reads a record and the length of the record for size=8"""
         op2: OP2 = self.op2
+        view = view and isinstance(op2.f, MmapFile)
         markers0 = self.get_nmarkers8(1, rewind=False, macro_rewind=macro_rewind)
         if self.is_debug_file and debug:
             self.binary_debug.write('read_record - marker = [8, %i, 8]; macro_rewind=%s\n' % (
                 markers0[0], macro_rewind))
-        record, nrecord = self._read_block_ndata8()
+        record, nrecord = self._read_block_ndata8(view=view)
 
         if self.is_debug_file and debug:
             msg = 'read_record - record = [%i, recordi, %i]; macro_rewind=%s\n' % (
@@ -2818,14 +2834,19 @@ class OP2Reader:
 
         return record, nrecord
 
-    def _read_block_ndata4(self) -> tuple[bytes, int]:
+    def _read_block_ndata4(self, view: bool=False) -> tuple[bytes, int]:
         """
         Reads a block following a pattern of:
             [nbytes, data, nbytes]
 
+        Parameters
+        ----------
+        view : bool; default=False
+            return a memoryview (requires a MmapFile)
+
         Returns
         -------
-        data : bytes
+        data : bytes / memoryview
             the data in binary
         ndata : int
             len(data)
@@ -2835,7 +2856,7 @@ class OP2Reader:
         data = op2.f.read(4)
         ndata, = op2.struct_i.unpack(data)
 
-        data_out = op2.f.read(ndata)
+        data_out = op2.f.read_view(ndata) if view else op2.f.read(ndata)
         data = op2.f.read(4)
         op2.n += 8 + ndata
         return data_out, ndata
@@ -2857,14 +2878,19 @@ class OP2Reader:
             return self._read_block_ndata4()
         return self._read_block_ndata8()
 
-    def _read_block_ndata8(self) -> tuple[bytes, int]:
+    def _read_block_ndata8(self, view: bool=False) -> tuple[bytes, int]:
         """
         Reads a block following a pattern of:
             [nbytes, data, nbytes]
 
+        Parameters
+        ----------
+        view : bool; default=False
+            return a memoryview (requires a MmapFile)
+
         Returns
         -------
-        data : bytes
+        data : bytes / memoryview
             the data in binary
         ndata : int
             len(data)
@@ -2874,7 +2900,7 @@ class OP2Reader:
         data = op2.f.read(4)
         ndata, = op2.struct_i.unpack(data)
 
-        data_out = op2.f.read(ndata)
+        data_out = op2.f.read_view(ndata) if view else op2.f.read(ndata)
         data = op2.f.read(4)
         op2.n += 8 + ndata
         return data_out, ndata
@@ -3502,14 +3528,22 @@ class OP2Reader:
             return False
         return True
 
-    def read_results_table(self) -> None:
-        """Reads a results table"""
+    def read_results_table(self, subtables: Optional[list[tuple[int, list[int]]]]=None) -> None:
+        """
+        Reads a results table
+
+        Parameters
+        ----------
+        subtables : list[(n3, n4s)]; default=None -> all
+            the file offsets of the -3/-4 records of the subtables to read
+            (from an ``OP2Index``)
+        """
         if self.size == 4:
-            self.read_results_table4()
+            self.read_results_table4(subtables)
         else:
-            self.read_results_table8()
+            self.read_results_table8(subtables)
 
-    def read_results_table4(self) -> None:
+    def read_results_table4(self, subtables: Optional[list[tuple[int, list[int]]]]=None) -> None:
         """Reads a results table"""
         op2: OP2 = self.op2
         if self.is_debug_file:
@@ -3532,12 +3566,12 @@ class OP2Reader:
         op2.subtable_name = subtable_name
         #try:
         op2._results.log = op2.log
-        self._read_subtables()
+        self._read_subtables(subtables)
         #except Exception:
             #self.log.error('\n' + str(self.op2.code_information()))
             #raise
 
-    def read_results_table8(self) -> None:
+    def read_results_table8(self, subtables: Optional[list[tuple[int, list[int]]]]=None) -> None:
         """Reads a results table"""
         op2: OP2 = self.op2
         if self.is_debug_file:
@@ -3560,7 +3594,7 @@ class OP2Reader:
             subtable_name, is_interlaced_block=is_interlaced_block)
         op2.subtable_name = subtable_name
         try:
-            self._read_subtables()
+            self._read_subtables(subtables)
         except Exception:
             self.log.error('\n' + str(self.op2.code_information()))
             raise
@@ -3688,8 +3722,15 @@ class OP2Reader:
         op2.subtable_name = subtable_name.rstrip()
         self._read_subtables()
 
-    def _read_subtables(self) -> None:
-        """reads a series of subtables"""
+    def _read_subtables(self, subtables: Optional[list[tuple[int, list[int]]]]=None) -> None:
+        """
+        reads a series of subtables
+
+        Parameters
+        ----------
+        subtables : list[(n3, n4s)]; default=None -> all
+            the file offsets of the -3/-4 records of the subtables to read
+        """
         # this parameters is used for numpy streaming
         op2: OP2 = self.op2
         op2._table4_count = 0
@@ -3737,6 +3778,11 @@ class OP2Reader:
             table4_parser = None
             passer = True
 
+        if subtables is not None:
+            self._read_subtables_at_offsets(subtables, table3_parser, table4_parser, passer)
+            op2._finish()
+            return
+
         # we need to check the marker, so we read it and rewind, so we don't
         # screw up our positioning in the file
         markers = self.get_nmarkers(1, rewind=True)
@@ -3829,6 +3875,32 @@ class OP2Reader:
         assert marker == 0, marker
         op2._finish()
 
+    def _read_subtables_at_offsets(self, subtables: list[tuple[int, list[int]]],
+                                   table3_parser: Optional[Callable],
+                                   table4_parser: Optional[Callable],
+                                   passer: bool) -> None:
+        """
+        Reads a subset of the subtables of a table by jumping to the -3/-4
+        records instead of reading the subtables in order.
+
+        Parameters
+        ----------
+        subtables : list[(n3, n4s)]
+            the file offsets of the -3 record and the -4 record(s) of
+            each subtable
+        """
+        op2: OP2 = self.op2
+        for n3, n4s in subtables:
+            op2.isubtable = -3
+            op2.is_start_of_subtable = True
+            self._goto(n3)
+            self._read_subtable_3_4(table3_parser, table4_parser, passer)
+            op2.isubtable = -4
+            for n4 in n4s:
+                op2.is_start_of_subtable = True
+                self._goto(n4)
+                self._read_subtable_3_4(table3_parser, table4_parser, passer)
+
     def _read_subtable_3_4(self,
                            table3_parser: Optional[Callable],
                            table4_parser: Optional[Callable],
@@ -3868,6 +3940,7 @@ class OP2Reader:
         factor = self.factor
         #print('record_len =', record_len)
         table_name = op2.table_name
+        n0 = op2.f.tell()
         if record_len == 584 * factor:  # table3 has a length of 584
             if table_name in oes_nl and hasattr(op2, 'num_wide') and op2.num_wide == 146:
                 data_code_old = deepcopy(op2.data_code)
@@ -3890,6 +3963,9 @@ class OP2Reader:
                         self.binary_debug.write('except SortCodeError!\n')
                     if table_name in oes_nl:
                         update_op2_datacode(op2, data_code_old)
+                        if op2._single_pass:
+                            op2._read_record_single_pass(table4_parser, data, ndata, record_len)
+                            return False
 
                         n = table4_parser(data, ndata)
                         #print(data_code_old)
@@ -3913,6 +3989,8 @@ class OP2Reader:
                         #print('except...')
                         return False
                     raise RuntimeError(op2.code_information())
+                if op2._op2_index is not None:
+                    op2._op2_index.set_table3(op2, n0)
                 #if hasattr(op2, 'isubcase'):
                     #print("code = ", op2._get_code())
         else:
@@ -3930,12 +4008,17 @@ class OP2Reader:
                     # num_wide is the result size and is usually found in
                     # table3, but some B-list tables don't have it
                     unused_n = op2._read_subtable_results(table4_parser, record_len)
+                elif op2._single_pass:
+                    data, ndata = self._read_record_ndata()
+                    unused_n = op2._parse_record_both_modes(table4_parser, data, ndata)
                 else:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
                     if IS_TESTING:
                         self._run_checks(table4_parser)
                 #del n
+                if op2._op2_index is not None:
+                    op2._op2_index.add_subtable(op2, n0)
         return None
 
     def _run_checks(self, table4_parser):
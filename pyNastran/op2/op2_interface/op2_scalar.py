@@ -62,6 +62,7 @@ else:  # pramga: no cover
 from pyNastran import is_release, __version__
 from pyNastran.f06.errors import FatalError
 from pyNastran.op2.errors import EmptyRecordError
+from pyNastran.op2.op2_interface.mmap_file import open_mmap
 from pyNastran.op2.op2_interface.op2_reader import OP2Reader, reshape_bytes_block
 from pyNastran.bdf.cards.params import PARAM
 
@@ -555,6 +556,10 @@ class OP2_Scalar(OP2Common, FortranFormat):
         #: should a MATPOOL "symmetric" matrix be stored as symmetric
         #: it takes double the RAM, but is easier to use
         self.apply_symmetry = True
+
+        #: memory map the op2, so the result records aren't copied
+        #: (see ``OP2.__init__``)
+        self.use_mmap = False
         OP2Common.__init__(self)
 
         FortranFormat.__init__(self)
@@ -2086,6 +2091,8 @@ class OP2_Scalar(OP2Common, FortranFormat):
             #: the OP2 file object
             op2_filename = self.op2_filename
             self.f = open(op2_filename, 'rb')
+            if self.use_mmap:
+                self.f = open_mmap(self.f, self.log)
             #: the endian in bytes
             self._endian = None
             #: the endian in unicode
@@ -2149,9 +2156,15 @@ class OP2_Scalar(OP2Common, FortranFormat):
 
         op2_reader = self.op2_reader
         self.table_count = defaultdict(int)
+        if self._table_offsets is not None:
+            self._read_tables_at_offsets(self._table_offsets, table_names)
+            return
+
         while table_name is not None:
             self.table_count[table_name] += 1
             table_names.append(table_name)
+            if self._op2_index is not None:
+                self._op2_index.add_table(table_name, self.f.tell(), self._count)
 
             if self.is_debug_file:
                 self.binary_debug.write('-' * 80 + '\n')
@@ -2184,57 +2197,158 @@ class OP2_Scalar(OP2Common, FortranFormat):
                 #op2_reader._skip_table(table_name)
             #else:
             #print(table_name, table_name in op2_reader.mapped_tables)
-            if table_name in self.generalized_tables:
-                t0 = self.f.tell()
-                self.generalized_tables[table_name](self)
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in op2_reader.mapped_tables:
-                t0 = self.f.tell()
-                func, unused_desc = op2_reader.mapped_tables[table_name]
-                func()
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in GEOM_TABLES:
-                op2_reader.read_geom_table()  # DIT (agard)
-            elif table_name in MATRIX_TABLES:
-                read_matrix(op2_reader, table_name)
-            elif table_name in RESULT_TABLES:
-                op2_reader.read_results_table()
-            elif self.skip_undefined_matrices:
-                read_matrix(op2_reader, table_name)
-            elif table_name.strip() in self.additional_matrices:
-                read_matrix(op2_reader, table_name)
+            if self._single_pass:
+                self._read_table_single_pass(table_name)
             else:
-                #self.show(1000, types='ifsq')
-                msg = (
-                    f'Invalid Table = {table_name!r}\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)\n'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      Gb'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful '
-                    'for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
-                )
-                raise NotImplementedError(msg)
+                self._read_table(table_name)
 
             table_name = op2_reader._read_table_name(last_table_name=table_name,
                                                      rewind=True, stop_on_failure=False)
 
+        if self._single_pass:
+            self._read_deferred_tables(table_names)
+
+    def _read_tables_at_offsets(self, table_offsets: list[tuple[int, int]],
+                                table_names: list[bytes]) -> None:
+        """
+        Reads the tables that start at a series of file offsets
+        (from an ``OP2Index``) instead of every table in the file.
+
+        Parameters
+        ----------
+        table_offsets : list[(n, count)]
+            the file offset and the design cycle counter of the tables
+        table_names : list[bytes str]
+            the table names that were read
+
+        """
+        op2_reader = self.op2_reader
+        for n, count in table_offsets:
+            self._count = count
+            op2_reader._goto(n)
+            table_name = op2_reader._read_table_name(rewind=True)
+            self.table_count[table_name] += 1
+            table_names.append(table_name)
+            self.table_name = table_name
+            self._read_table(table_name)
+
+    def _read_table(self, table_name: bytes) -> None:
+        """Reads a single geometry/result table"""
+        op2_reader = self.op2_reader
+        if table_name in self.generalized_tables:
+            t0 = self.f.tell()
+            self.generalized_tables[table_name](self)
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in op2_reader.mapped_tables:
+            t0 = self.f.tell()
+            func, unused_desc = op2_reader.mapped_tables[table_name]
+            func()
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in GEOM_TABLES:
+            op2_reader.read_geom_table()  # DIT (agard)
+        elif table_name in MATRIX_TABLES:
+            read_matrix(op2_reader, table_name)
+        elif table_name in RESULT_TABLES:
+            op2_reader.read_results_table()
+        elif self.skip_undefined_matrices:
+            read_matrix(op2_reader, table_name)
+        elif table_name.strip() in self.additional_matrices:
+            read_matrix(op2_reader, table_name)
+        else:
+            #self.show(1000, types='ifsq')
+            msg = (
+                f'Invalid Table = {table_name!r}\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)\n'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      Gb'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful '
+                'for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n'
+            )
+            raise NotImplementedError(msg)
+
+    def _read_table_single_pass(self, table_name: bytes) -> None:
+        """
+        Reads a single geometry/result table with one pass over the file.
+
+        The records of a result table are read once and each one is sized
+        and filled in one step (see ``_read_subtable_results``).  The other
+        tables (e.g., geometry, matrices, PARAMs) are small and have
+        read_mode specific logic, so they're read for both read modes.
+        """
+        op2_reader = self.op2_reader
+        is_result_table = (
+            table_name in RESULT_TABLES and
+            table_name not in self.generalized_tables and
+            table_name not in op2_reader.mapped_tables and
+            table_name not in GEOM_TABLES and
+            table_name not in MATRIX_TABLES)
+
+        # the external superelement tables are skipped in read_mode=1 and
+        # the EXTDB skip isn't reliable, so they're read once in order
+        if is_result_table or table_name in {b'XSOP2DIR', b'EXTDB'}:
+            self.read_mode = 2
+            self._read_table(table_name)
+            return
+
+        # the array filling step is deferred until the end of the file,
+        # so tables that are sized across the file (e.g., HISADD) are
+        # read in the same order as the two pass reader
+        self._deferred_tables.append((table_name, self.f.tell(), dict(self.table_count)))
+        self._single_pass = False
+        try:
+            self.read_mode = 1
+            self._read_table(table_name)
+        finally:
+            self._single_pass = True
+
+    def _read_deferred_tables(self, table_names: list[bytes]) -> None:
+        """
+        Runs the array filling step (read_mode=2) on the non-result tables
+        for single pass reading.
+
+        Parameters
+        ----------
+        table_names : list[bytes str]
+            the tables in the file; some geometry parsers check for
+            repeated tables
+        """
+        op2_reader = self.op2_reader
+        n_end = self.f.tell()
+        table_count = self.table_count
+        self.table_names = table_names
+        self._single_pass = False
+        self.read_mode = 2
+        try:
+            # the table count identifies superelements/external databases,
+            # so it's replayed as well
+            for table_name, n0, table_counti in self._deferred_tables:
+                op2_reader._goto(n0)
+                self.table_name = table_name
+                self.table_count = defaultdict(int, table_counti)
+                self._read_table(table_name)
+        finally:
+            self._single_pass = True
+            self._deferred_tables = []
+            self.table_count = table_count
+        op2_reader._goto(n_end)
+
     def set_additional_generalized_tables_to_read(self, tables: dict[bytes, Any]) -> None:
         """
         Adds methods to call a generalized table.
@@ -0,0 +1,337 @@
+"""
+Defines streaming the results of an OP2 in chunks, so results that are
+larger than memory may be post-processed (e.g., enveloped).
+
+The subtables of the results are found with an ``OP2Index`` and each chunk
+of subtables is decoded into a small result object, which is released
+after the chunk is used.
+
+Example
+-------
+>>> model = OP2()
+>>> for chunk in model.iter_results(op2_filename, ['stress.cquad4_stress'], chunk_size=100):
+...     print(chunk.result_name, chunk.isubcase, chunk.times, chunk.data.shape)
+
+>>> envelopes = get_envelopes(model, op2_filename, ['stress.cquad4_stress'])
+>>> envelope = envelopes[('stress.cquad4_stress', 1)]
+>>> von_mises = envelope.max[:, -1]
+>>> von_mises_time = envelope.max_time[:, -1]
+"""
+from __future__ import annotations
+import sys
+from collections import defaultdict
+from typing import Iterator, Optional, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.op2.op2_interface.op2_index import OP2Index, build_op2_index
+from pyNastran.op2.op2_interface.op2_scalar import RESULT_TABLES, GEOM_TABLES, MATRIX_TABLES
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2 import OP2
+
+#: the node/element id attributes of the result objects
+ID_NAMES = ('node_gridtype', 'element_node', 'element_layer', 'element')
+
+
+class ResultChunk:
+    """
+    A block of a result for a subcase
+
+    Attributes
+    ----------
+    result_name : str
+        the result (e.g., 'displacements', 'stress.cquad4_stress')
+    isubcase : int
+        the subcase id
+    times : (ntimes, ) float ndarray
+        the times/frequencies/modes/load steps (nan for static results)
+    ids : (nids, ) or (nids, 2) int ndarray
+        the node_gridtype, element_node, element_layer, or element array
+        of the result object
+    data : (ntimes, nids, ncols) ndarray
+        the result data
+    headers : list[str]
+        the names of the ncols columns
+    is_sort1 : bool
+        the sort method of the result object
+
+    For a SORT1 result, a chunk has the chunk_size time steps of all the
+    nodes/elements.  For a SORT2 result, a chunk has all the time steps of
+    chunk_size nodes/elements.
+    """
+    def __init__(self, result_name: str, isubcase: int, times: np.ndarray,
+                 ids: np.ndarray, data: np.ndarray, headers: list[str],
+                 is_sort1: bool=True):
+        self.result_name = result_name
+        self.isubcase = isubcase
+        self.times = times
+        self.ids = ids
+        self.data = data
+        self.headers = headers
+        self.is_sort1 = is_sort1
+
+    def __repr__(self) -> str:
+        return (f'ResultChunk(result_name={self.result_name!r}, isubcase={self.isubcase}, '
+                f'ntimes={len(self.times)}, data.shape={self.data.shape})')
+
+
+def get_subtable_chunks(model: OP2, index: OP2Index,
+                        result_types: Optional[list[str]]=None,
+                        chunk_size: int=1) -> list[tuple]:
+    """
+    Groups the subtables of the results into chunks
+
+    Parameters
+    ----------
+    model : OP2
+        the reader; used for the table types and the subcase filter
+    index : OP2Index
+        the table/subtable offsets
+    result_types : list[str]; default=None -> all
+        the results to stream
+    chunk_size : int; default=1
+        the number of subtables per chunk, which is the number of time
+        steps (SORT1) or nodes/elements (SORT2)
+
+    Returns
+    -------
+    chunks : list[(table_name, n, count, result_name, isubcase, subtables)]
+        the table and the (n3, n4s) offsets of the subtables in a chunk;
+        the chunks of a result/subcase are consecutive
+
+    """
+    assert chunk_size >= 1, chunk_size
+    op2_reader = model.op2_reader
+    groups = {}
+    for subtable in index.subtables:
+        result_name = subtable['result_name']
+        isubcase = subtable['isubcase']
+        if result_name is None or isubcase is None:
+            continue
+        if result_types is not None and result_name not in result_types:
+            continue
+        if not model.is_all_subcases and isubcase not in model.valid_subcases:
+            continue
+
+        # the tables with their own readers (e.g., PSDF) aren't streamed
+        table_name, n, count = index.tables[subtable['itable']]
+        if (table_name not in RESULT_TABLES or
+                table_name in op2_reader.mapped_tables or
+                table_name in model.generalized_tables or
+                table_name in GEOM_TABLES or table_name in MATRIX_TABLES):
+            model.log.warning(f'{result_name!r} in table_name={table_name!r} '
+                              'does not support streaming')
+            continue
+        key = (subtable['itable'], result_name, isubcase)
+        n4s = groups.setdefault(key, {}).setdefault(subtable['n3'], [])
+        n4s.append(subtable['n4'])
+
+    chunks = []
+    for (itable, result_name, isubcase), subtables in groups.items():
+        table_name, n, count = index.tables[itable]
+        subtables = list(subtables.items())
+        for i in range(0, len(subtables), chunk_size):
+            chunks.append((table_name, n, count, result_name, isubcase,
+                           subtables[i:i+chunk_size]))
+    return chunks
+
+
+def iter_results(model: OP2, op2_filename: str,
+                 result_types: Optional[list[str]]=None,
+                 chunk_size: int=1) -> Iterator[ResultChunk]:
+    """
+    Reads the results of an op2 in chunks, without loading the full
+    result objects
+
+    Parameters
+    ----------
+    model : OP2
+        the reader; the subcase filter (``set_subcases``) is applied
+    op2_filename : str
+        the op2 to read
+    result_types : list[str]; default=None -> all
+        the results to stream (e.g., ['displacements', 'stress.cquad4_stress'])
+    chunk_size : int; default=1
+        the number of time steps (SORT1) or nodes/elements (SORT2)
+        per chunk
+
+    Yields
+    ------
+    chunk : ResultChunk
+        the ids and data of a block of a result/subcase
+
+    """
+    from pyNastran.op2.op2 import OP2
+    if isinstance(result_types, str):
+        result_types = [result_types]
+    index = build_op2_index(model, op2_filename, mode=model.mode)
+    chunks = get_subtable_chunks(model, index, result_types, chunk_size)
+    if not chunks:
+        return
+
+    model2 = OP2(log=model.log, debug=None, mode=index.mode, use_mmap=model.use_mmap)
+    _open_op2(model2, op2_filename, index.mode)
+    op2_reader = model2.op2_reader
+    try:
+        for table_name, n, count, result_name, isubcase, subtables in chunks:
+            for read_mode in (1, 2):
+                model2.read_mode = read_mode
+                model2._count = count
+                model2.table_name = table_name
+                op2_reader._goto(n)
+                op2_reader.read_results_table(subtables)
+
+            storage_obj = model2.get_result(result_name)
+            for obj in storage_obj.values():
+                chunk = _get_result_chunk(obj, result_name, isubcase)
+                if chunk is not None:
+                    yield chunk
+            storage_obj.clear()
+    finally:
+        model2.close_op2(force=True)
+
+
+def _open_op2(model: OP2, op2_filename: str, mode: str) -> None:
+    """opens the op2 and reads the header (see ``OP2_Scalar.read_op2``)"""
+    model.encoding = sys.getdefaultencoding()
+    model.is_vectorized = True
+    model.skip_undefined_matrices = True
+    model._close_op2 = False
+    model._setup_filenames(op2_filename, force=True)
+    model._create_binary_debug()
+    model._setup_op2()
+    model.op2_reader.read_nastran_version(mode)
+    model.table_mapper = model._get_table_mapper()
+    model.table_count = defaultdict(int)
+
+
+def _get_result_chunk(obj, result_name: str, isubcase: int) -> Optional[ResultChunk]:
+    """gets the arrays of a (chunk-sized) result object"""
+    data = getattr(obj, 'data', None)
+    if not isinstance(data, np.ndarray) or data.ndim != 3:
+        return None
+    # finalize flips a SORT2 object to SORT1
+    is_sort1 = obj.is_sort1
+    if hasattr(obj, 'finalize'):
+        obj.finalize()
+    data = obj.data
+
+    ids = None
+    for name in ID_NAMES:
+        idsi = getattr(obj, name, None)
+        if isinstance(idsi, np.ndarray) and len(idsi) == data.shape[1]:
+            ids = idsi
+            break
+
+    times = np.asarray(obj._times)
+    headers = obj.get_headers() if hasattr(obj, 'get_headers') else []
+    return ResultChunk(result_name, isubcase, times, ids, data, headers,
+                       is_sort1=is_sort1)
+
+
+class Envelope:
+    """
+    The min/max/abs-max of a result over the time steps along with the
+    time of occurrence
+
+    Attributes
+    ----------
+    ids : (nids, ) or (nids, 2) int ndarray
+        the node/element ids
+    min / max / abs_max : (nids, ncols) ndarray
+        the minimum, maximum, and the signed value with the maximum
+        magnitude of each column; complex results use the magnitude
+    min_time / max_time / abs_max_time : (nids, ncols) float ndarray
+        the time/frequency/mode of the first occurrence
+
+    """
+    def __init__(self, result_name: str, isubcase: int, headers: list[str]):
+        self.result_name = result_name
+        self.isubcase = isubcase
+        self.headers = headers
+        self.ids = None
+        self.min = None
+        self.max = None
+        self.abs_max = None
+        self.min_time = None
+        self.max_time = None
+        self.abs_max_time = None
+
+    def add_chunk(self, chunk: ResultChunk) -> None:
+        """updates the envelope with a chunk of time steps"""
+        data = chunk.data
+        if np.iscomplexobj(data):
+            data = np.abs(data)
+        times = np.asarray(chunk.times)
+        imin = data.argmin(axis=0)[np.newaxis, :, :]
+        imax = data.argmax(axis=0)[np.newaxis, :, :]
+        iabs_max = np.abs(data).argmax(axis=0)[np.newaxis, :, :]
+        values = [
+            np.take_along_axis(data, imin, axis=0)[0],
+            np.take_along_axis(data, imax, axis=0)[0],
+            np.take_along_axis(data, iabs_max, axis=0)[0],
+        ]
+        value_times = [times[imin[0]], times[imax[0]], times[iabs_max[0]]]
+
+        if self.ids is None:
+            self.ids = chunk.ids
+            self.min, self.max, self.abs_max = values
+            self.min_time, self.max_time, self.abs_max_time = value_times
+        elif chunk.is_sort1:
+            # the next time steps
+            assert _is_same_ids(self.ids, chunk.ids), f'the ids of {chunk} changed'
+            is_min = values[0] < self.min
+            is_max = values[1] > self.max
+            is_abs_max = np.abs(values[2]) > np.abs(self.abs_max)
+            self.min = np.where(is_min, values[0], self.min)
+            self.max = np.where(is_max, values[1], self.max)
+            self.abs_max = np.where(is_abs_max, values[2], self.abs_max)
+            self.min_time = np.where(is_min, value_times[0], self.min_time)
+            self.max_time = np.where(is_max, value_times[1], self.max_time)
+            self.abs_max_time = np.where(is_abs_max, value_times[2], self.abs_max_time)
+        else:
+            # the next nodes/elements
+            self.ids = np.concatenate([self.ids, chunk.ids])
+            self.min, self.max, self.abs_max = [
+                np.concatenate([old, new]) for old, new in
+                zip([self.min, self.max, self.abs_max], values)]
+            self.min_time, self.max_time, self.abs_max_time = [
+                np.concatenate([old, new]) for old, new in
+                zip([self.min_time, self.max_time, self.abs_max_time], value_times)]
+
+    def __repr__(self) -> str:
+        nids = 0 if self.ids is None else len(self.ids)
+        return (f'Envelope(result_name={self.result_name!r}, isubcase={self.isubcase}, '
+                f'nids={nids}, headers={self.headers})')
+
+
+def _is_same_ids(ids1: Optional[np.ndarray], ids2: Optional[np.ndarray]) -> bool:
+    """are the node/element ids of two chunks the same?"""
+    if ids1 is None or ids2 is None:
+        return ids1 is ids2
+    return ids1.shape == ids2.shape and np.array_equal(ids1, ids2)
+
+
+def get_envelopes(model: OP2, op2_filename: str,
+                  result_types: Optional[list[str]]=None,
+                  chunk_size: int=100) -> dict[tuple[str, int], Envelope]:
+    """
+    Gets the min/max/abs-max envelopes of the results over the time steps
+    by streaming the op2 (see ``iter_results``)
+
+    Returns
+    -------
+    envelopes : dict[(result_name, isubcase)] = Envelope
+        the envelopes
+
+    """
+    envelopes = {}
+    for chunk in iter_results(model, op2_filename, result_types=result_types,
+                              chunk_size=chunk_size):
+        key = (chunk.result_name, chunk.isubcase)
+        envelope = envelopes.get(key)
+        if envelope is None:
+            envelope = envelopes[key] = Envelope(chunk.result_name, chunk.isubcase,
+                                                 chunk.headers)
+        envelope.add_chunk(chunk)
+    return envelopes
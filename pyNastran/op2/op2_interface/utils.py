@@ -112,6 +112,167 @@ def build_obj(obj):
             #raise RuntimeError(str(obj)) from e
         obj.is_built = True
 
+#: the counters that are incremented for each record during the
+#: array sizing step (read_mode=1)
+SIZING_COUNTERS = ('ntimes', 'nelements', 'nnodes', '_nnodes')
+
+#: the counters that track how far the arrays have been filled, which
+#: build() resets
+FILL_COUNTERS = ('itime', 'itotal', 'itotal2', 'ielement')
+
+def grow_obj(obj) -> None:
+    """
+    Grows the vectorized arrays of a result object for single pass reading.
+
+    The array sizing step (read_mode=1) was just run on the current record,
+    so the sizing counters (e.g., ntimes, nelements) have been incremented
+    relative to the values the last build left.  Rather than preallocating
+    the arrays with a separate pass over the file, the arrays are rebuilt
+    with amortized doubling of the number of records, so the data is only
+    copied O(log(nrecords)) times.  The extra capacity is removed by
+    ``trim_obj``.
+    """
+    growth = obj.__dict__.get('_growth')
+    counters = [name for name in SIZING_COUNTERS
+                if isinstance(getattr(obj, name, None), int)]
+    if growth is None:
+        # first record; the counters are the sizing counters
+        growth = {
+            'counts': {name: getattr(obj, name) for name in counters},
+            'ntotal': obj.ntotal,
+        }
+        obj._growth = growth
+        _rebuild_obj(obj, growth, growth['counts']['ntimes'], restore=False)
+        return
+
+    counts = growth['counts']
+    post_build = growth['post_build']
+    for name in counts:
+        counts[name] += getattr(obj, name) - post_build[name]
+    growth['ntotal'] = obj.ntotal
+
+    nrecords = counts['ntimes']
+    is_full = (
+        nrecords > growth['nrecords_alloc'] or
+        obj.ntotal > growth['ntotal_alloc'] or
+        any(_ceil_div(count, nrecords) > growth['per_record'][name]
+            for name, count in counts.items()))
+    if is_full:
+        nrecords_alloc = max(2 * growth['nrecords_alloc'], nrecords)
+        _rebuild_obj(obj, growth, nrecords_alloc, restore=True)
+    else:
+        # undo the sizing step, so the object is in the filling state
+        for name, value in post_build.items():
+            setattr(obj, name, value)
+
+def trim_obj(obj) -> None:
+    """
+    Removes the extra capacity that was added by ``grow_obj``, so the
+    result object is the same as one built with the two pass reader.
+    """
+    growth = obj.__dict__.pop('_growth', None)
+    if growth is None:
+        return
+    nrecords = growth['counts']['ntimes']
+    if growth['nrecords_alloc'] == nrecords:
+        return
+    _rebuild_obj(obj, growth, nrecords, restore=True, trim=True)
+
+def _rebuild_obj(obj, growth: dict[str, Any], nrecords_alloc: int,
+                 restore: bool=True, trim: bool=False) -> None:
+    """
+    Builds the object for nrecords_alloc records and (optionally) copies
+    the previously filled data into the new arrays.
+
+    Parameters
+    ----------
+    obj : ScalarObject
+        the result object
+    growth : dict[str, Any]
+        the sizing state from ``grow_obj``
+    nrecords_alloc : int
+        the number of records to allocate
+    restore : bool; default=True
+        copy the old arrays and filling indices (FILL_COUNTERS)
+        into the rebuilt object
+    trim : bool; default=False
+        slice the old arrays instead of copying them into new arrays
+
+    """
+    counts = growth['counts']
+    nrecords = counts['ntimes']
+
+    # scale the counters, so build() sizes the arrays for nrecords_alloc
+    for name, count in counts.items():
+        if name == 'ntimes':
+            obj.ntimes = nrecords_alloc
+        elif nrecords_alloc == nrecords:
+            setattr(obj, name, count)
+        else:
+            # round up, so a count that isn't a multiple of ntimes
+            # (e.g., strain energy) isn't truncated
+            nscaled = _ceil_div(count, nrecords) * nrecords_alloc
+            assert nscaled % nrecords_alloc == 0 and nscaled >= count, (name, count, nscaled)
+            setattr(obj, name, nscaled)
+    obj.ntotal = growth['ntotal']
+
+    # some builds use the number of record sizes
+    ntotals = obj.__dict__.get('_ntotals')
+    if isinstance(ntotals, list) and 0 < len(ntotals) < nrecords_alloc:
+        obj._ntotals = ntotals + [ntotals[-1]] * (nrecords_alloc - len(ntotals))
+
+    old_indices = {}
+    old_arrays = {}
+    if restore:
+        for name, value in obj.__dict__.items():
+            if isinstance(value, np.ndarray):
+                old_arrays[name] = value
+        for name in FILL_COUNTERS:
+            value = obj.__dict__.get(name)
+            if isinstance(value, int) and not isinstance(value, bool):
+                old_indices[name] = value
+
+    # some builds delete temporary attributes, so put them back
+    deleted_attrs = growth.get('deleted_attrs', {})
+    obj.__dict__.update(deleted_attrs)
+    attrs = dict(obj.__dict__)
+    obj.is_built = False
+    obj.build()
+    obj.is_built = True
+    if isinstance(ntotals, list):
+        obj._ntotals = ntotals
+    for name in deleted_attrs:
+        obj.__dict__.pop(name, None)
+    deleted_attrs.update({name: value for name, value in attrs.items()
+                          if name not in obj.__dict__})
+    growth['deleted_attrs'] = deleted_attrs
+
+    for name, old_array in old_arrays.items():
+        new_array = obj.__dict__.get(name)
+        if not isinstance(new_array, np.ndarray) or new_array.ndim != old_array.ndim:
+            continue
+        islice = tuple(slice(0, min(nold, nnew))
+                       for nold, nnew in zip(old_array.shape, new_array.shape))
+        if trim:
+            if old_array.shape == new_array.shape:
+                new_array = old_array
+            else:
+                new_array = old_array[islice].copy()
+        else:
+            new_array[islice] = old_array[islice]
+        setattr(obj, name, new_array)
+    obj.__dict__.update(old_indices)
+
+    growth['nrecords_alloc'] = nrecords_alloc
+    growth['ntotal_alloc'] = growth['ntotal']
+    growth['per_record'] = {name: _ceil_div(count, nrecords) for name, count in counts.items()}
+    growth['post_build'] = {name: getattr(obj, name) for name in counts}
+    growth['post_build']['ntotal'] = obj.ntotal
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    """integer division that rounds up"""
+    return -(-numerator // denominator)
+
 def apply_mag_phase(floats: Any, is_magnitude_phase: bool,
                     isave_real: list[int], isave_imag: list[int]) -> Any:
     """converts mag/phase data to real/imag"""
@@ -125,6 +286,36 @@ def apply_mag_phase(floats: Any, is_magnitude_phase: bool,
         real_imag = real + 1.j * imag
     return real_imag
 
+def read_sort2_record(op2, obj, data: bytes,
+                      ntimes: int) -> tuple[int, int, int, np.ndarray]:
+    """
+    Reads a SORT2 element record, which is a single element at all the
+    times.  The first column is the time/frequency/mode, which is saved
+    the first time an element is read.
+
+    Returns
+    -------
+    ielement : int
+        the element index (the element counter is obj.itime for SORT2)
+    itotal, itotal2 : int
+        the time slice of obj.data
+    floats : (ntimes, num_wide) float ndarray
+        the record
+
+    """
+    num_wide = op2.num_wide
+    floats = np.frombuffer(data, dtype=op2.fdtype8).reshape(ntimes, num_wide)
+    itotal = obj.itotal
+    itotal2 = itotal + ntimes
+    if obj.itime == 0:
+        if op2._analysis_code_fmt == b'i':
+            ints = np.frombuffer(data, dtype=op2.idtype8).reshape(ntimes, num_wide)
+            obj._times[itotal:itotal2] = ints[:, 0]
+        else:
+            obj._times[itotal:itotal2] = floats[:, 0]
+    obj.itotal = itotal2
+    return obj.itime, itotal, itotal2, floats
+
 def to_mag_phase(real_imag: Any, is_magnitude_phase: bool) -> Any:
     """converts real/imag data to mag/phase"""
     if is_magnitude_phase:
@@ -1,8 +1,8 @@
 """
 Defines methods for the op2 & hdf5 writer
 """
-from struct import Struct, pack
-from typing import BinaryIO, TextIO
+from struct import pack
+from typing import BinaryIO, TextIO, Optional
 
 import numpy as np
 import scipy
@@ -16,6 +16,11 @@ SCIPY_VERSION = int_version('scipy', scipy.__version__)[:2]
 IS_NEW_SCIPY = (SCIPY_VERSION >= [1, 8])
 IS_OLD_SCIPY = not IS_NEW_SCIPY
 
+# the target size of a compressed HDF5 chunk
+HDF5_CHUNK_BYTES = 256 * 1024
+# smaller arrays are written contiguously; chunking costs more than it saves
+HDF5_MIN_COMPRESSION_BYTES = 16 * 1024
+
 
 def set_table3_field(str_fields, ifield: int, value):
     """
@@ -44,7 +49,8 @@ def _write_markers(op2_file: BinaryIO, fascii: TextIO, markers):
     op2_file.write(pack(b'<%ii' % n, *out))
 
 
-def write_table_header(op2_file: BinaryIO, fascii: TextIO, table_name: str):
+def write_table_header(op2_file: BinaryIO, fascii: TextIO, table_name: str,
+                       size: int=4, is_interlaced: bool=True, endian: bytes=b'<'):
     """
     Writes the beginning of an op2 table
 
@@ -54,19 +60,99 @@ def write_table_header(op2_file: BinaryIO, fascii: TextIO, table_name: str):
         the op2 file object
     table_name : str
         the table name to write
+    size : int; default=4
+        4 for a 32-bit OP2, 8 for a 64-bit OP2
+    is_interlaced : bool; default=True
+        how a 64-bit table name is padded (see ``to_size8_bytes``)
+    endian : bytes; default=b'<'
+        the byte order
     """
+    assert len(table_name) == 8, table_name
+    table_name_bytes = table_name.encode('ascii')
+    if size == 8:
+        table_name_bytes = to_size8_bytes(table_name_bytes, is_interlaced)
+    nbytes = len(table_name_bytes)
     table0 = [
         4, 2, 4,
-        8, table_name.encode('ascii'), 8,
+        nbytes, table_name_bytes, nbytes,
         #4, 0, 4,
     ]
-    assert len(table_name) == 8, table_name
-    table0_format = '<4i 8s i'
-    struct_table = Struct(table0_format)
-    op2_file.write(struct_table.pack(*table0))
+    op2_file.write(pack_markers([2], size, endian) +
+                   pack(endian + b'i%dsi' % nbytes, nbytes, table_name_bytes, nbytes))
     fascii.write('write_table_header: %s header0 = %s\n' % (table_name, table0))
 
 
+def pack_markers(markers: list[int], size: int=4, endian: bytes=b'<') -> bytes:
+    """
+    Packs a set of markers
+
+    A 32-bit marker is [4, marker, 4]; a 64-bit marker is [8, marker, 8],
+    where the marker itself is an 8-byte integer, so [-3, 1, 0] is
+    written as [4, -3, 4, 4, 1, 4, 4, 0, 4] in a 32-bit OP2.
+    """
+    nmarkers = len(markers)
+    if size == 4:
+        out = []
+        for marker in markers:
+            out += [4, marker, 4]
+        return pack(endian + b'%di' % (3 * nmarkers), *out)
+    assert size == 8, size
+    out = []
+    for marker in markers:
+        out += [8, marker, 8]
+    return pack(endian + b'iqi' * nmarkers, *out)
+
+
+def to_size8_bytes(value: bytes, is_interlaced: bool=True) -> bytes:
+    """
+    Pads a 32-bit string to the 64-bit format (the inverse of
+    ``reshape_bytes_block``)
+
+    >>> to_size8_bytes(b'ABCDEFGH', is_interlaced=True)
+    b'ABCD    EFGH    '
+    >>> to_size8_bytes(b'ABCDEFGH', is_interlaced=False)
+    b'ABCDEFGH        '
+    """
+    assert len(value) % 4 == 0, value
+    if is_interlaced:
+        return b''.join([value[i:i+4] + b'    ' for i in range(0, len(value), 4)])
+    return value + b' ' * len(value)
+
+
+def get_record_buffer(nrows: int, num_wide: int, size: int=4,
+                      endian: bytes=b'<', nheader: int=0) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Preallocates a data record, so a full record may be written with a
+    single call.
+
+    The record is:
+        [header (nheader bytes), nbytes, data (nrows, num_wide), nbytes]
+
+    where the header holds the table 3 record and the record 4 markers.
+
+    Returns
+    -------
+    buffer : (nbytes_total, ) uint8 ndarray
+        the full record
+    ints : (nrows, num_wide) int32/int64 ndarray
+        the data block as integers
+    floats : (nrows, num_wide) float32/float64 ndarray
+        the data block as floats (same memory as ints)
+
+    """
+    nbytes = nrows * num_wide * size
+    buffer = np.zeros(nheader + nbytes + 8, dtype='uint8')
+    endian_str = endian.decode('latin1')
+    struct_nbytes = np.array([nbytes], dtype=endian_str + 'i4').view('uint8')
+    buffer[nheader:nheader+4] = struct_nbytes
+    buffer[-4:] = struct_nbytes
+
+    block = buffer[nheader+4:nheader+4+nbytes]
+    ints = block.view(endian_str + ('i4' if size == 4 else 'i8')).reshape(nrows, num_wide)
+    floats = block.view(endian_str + ('f4' if size == 4 else 'f8')).reshape(nrows, num_wide)
+    return buffer, ints, floats
+
+
 def to_column_bytes(data_list: list[np.ndarray], dtype_out: str,
                     debug: bool=False) -> np.ndarray:
     """
@@ -124,8 +210,78 @@ def view_dtype(array_obj: np.ndarray, dtype) -> np.ndarray:
         return array_obj.view(dtype)
     return array_obj.astype(dtype)
 
-def export_to_hdf5(self, group, log):
-    """exports the object to HDF5 format"""
+def get_hdf5_chunk_shape(shape: tuple[int, ...], itemsize: int,
+                         chunk_bytes: int=HDF5_CHUNK_BYTES) -> tuple[int, ...]:
+    """
+    Gets an HDF5 chunk shape for a result array
+
+    A (ntimes, nrows, ncols) data array is chunked along (time, entity),
+    so a time history for one node/element and a single time step for
+    the whole model both read a handful of chunks.  The remaining axes
+    are never split.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        the shape of the array
+    itemsize : int
+        the size of one value (e.g., 4 for float32)
+    chunk_bytes : int; default=HDF5_CHUNK_BYTES
+        the target size of a chunk
+
+    """
+    if len(shape) == 1:
+        return (max(1, min(shape[0], chunk_bytes // itemsize)), )
+
+    ntimes, nrows = shape[:2]
+    nbytes_cell = itemsize * int(np.prod(shape[2:], dtype='int64'))
+    ncells = max(1, chunk_bytes // max(1, nbytes_cell))
+    ntimes_chunk = min(ntimes, max(1, int(np.sqrt(ncells))))
+    nrows_chunk = min(nrows, max(1, ncells // ntimes_chunk))
+    if nrows_chunk == nrows:
+        # short entity axis (e.g., a few elements); take more time steps
+        ntimes_chunk = min(ntimes, max(1, ncells // nrows_chunk))
+    return (max(1, ntimes_chunk), max(1, nrows_chunk)) + tuple(shape[2:])
+
+def _get_hdf5_dataset_kwargs(name: str, value, compression: Optional[str],
+                             compression_opts: Optional[int]) -> dict:
+    """gets the chunking/compression arguments for ``create_dataset``"""
+    if compression is None:
+        return {}
+    if not isinstance(value, np.ndarray) or value.ndim == 0 or value.nbytes < HDF5_MIN_COMPRESSION_BYTES:
+        # scalars can't be chunked
+        return {}
+    if value.dtype.kind not in 'biufc':
+        return {'compression': compression, 'compression_opts': compression_opts}
+
+    shape = value.shape
+    if name != 'data':
+        # node/element ids, times, ...
+        shape = (shape[0], )
+    chunks = get_hdf5_chunk_shape(shape, value.dtype.itemsize)
+    chunks = chunks + value.shape[len(chunks):]
+    return {'chunks': chunks, 'shuffle': True,
+            'compression': compression, 'compression_opts': compression_opts}
+
+def export_to_hdf5(self, group, log, compression: Optional[str]=None,
+                   compression_opts: Optional[int]=None):
+    """
+    exports the object to HDF5 format
+
+    Parameters
+    ----------
+    group : h5py.Group
+        the group to write to
+    log : SimpleLogger
+        a logger object
+    compression : str; default=None
+        None : contiguous (uncompressed) datasets
+        'gzip', 'lzf' : chunked and compressed arrays; 'data' is
+        chunked along (time, entity)
+    compression_opts : int; default=None
+        the compression level (e.g., 0-9 for 'gzip')
+
+    """
     #headers = self.get_headers()
 
     # for some reason we can't just not write the properties...
@@ -152,9 +308,9 @@ def export_to_hdf5(self, group, log):
             #
             # https://stackoverflow.com/questions/43390038/storing-scipy-sparse-matrix-as-hdf5
             #g = group.create_group('Mcoo')
-            group.create_dataset('data', data=value.data)
-            group.create_dataset('row', data=value.row)
-            group.create_dataset('col', data=value.col)
+            for namei, valuei in [('data', value.data), ('row', value.row), ('col', value.col)]:
+                kwargs = _get_hdf5_dataset_kwargs(namei, valuei, compression, compression_opts)
+                group.create_dataset(namei, data=valuei, **kwargs)
             group.attrs['shape'] = value.shape
             continue
         #else:  #pragma, no cover
@@ -194,7 +350,8 @@ def export_to_hdf5(self, group, log):
             value = np.asarray(value, dtype='|S'+n)
 
         try:
-            group.create_dataset(name, data=value)
+            kwargs = _get_hdf5_dataset_kwargs(name, value, compression, compression_opts)
+            group.create_dataset(name, data=value, **kwargs)
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
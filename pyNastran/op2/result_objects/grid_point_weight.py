@@ -2,7 +2,7 @@
 from io import StringIO
 from itertools import count
 from struct import pack
-from typing import TextIO, BinaryIO, cast
+from typing import TextIO, BinaryIO, Optional, cast
 import numpy as np
 
 from pyNastran.utils import object_attributes, object_methods
@@ -113,9 +113,12 @@ class GridPointWeight:
         self.approach_code = approach_code
         self.table_code = table_code
 
-    def export_to_hdf5(self, group, log) -> None:
+    def export_to_hdf5(self, group, log,
+                       compression: Optional[str]=None,
+                       compression_opts: Optional[int]=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression,
+                       compression_opts=compression_opts)
 
     def object_attributes(self, mode: str='public', keys_to_skip=None,
                           filter_properties: bool=False) -> list[str]:
@@ -316,7 +319,8 @@ class GridPointWeight:
 
         subtable_name = b'OGPWG'
         if itable == -1:
-            _write_table_header(op2_file, op2_ascii, date, table_name, subtable_name)
+            _write_table_header(op2_file, op2_ascii, date, table_name, subtable_name,
+                                endian=endian)
             itable = -3
 
         #s = Struct(op2_format)
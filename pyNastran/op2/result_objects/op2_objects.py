@@ -3,8 +3,8 @@ from __future__ import annotations
 import copy
 import warnings
 from itertools import count
-from struct import pack
-from typing import Union, TYPE_CHECKING
+from struct import Struct, pack
+from typing import Union, Optional, TYPE_CHECKING
 import numpy as np
 
 from cpylog import SimpleLogger
@@ -14,7 +14,9 @@ from pyNastran.utils.numpy_utils import integer_types
 
 from pyNastran.op2.errors import OverwriteTableError
 from pyNastran.op2.op2_interface.op2_codes import Op2Codes, get_sort_method_from_table_name
-from pyNastran.op2.op2_interface.write_utils import write_table_header, export_to_hdf5
+from pyNastran.op2.op2_interface.utils import mapfmt
+from pyNastran.op2.op2_interface.write_utils import (
+    write_table_header, pack_markers, to_size8_bytes, export_to_hdf5)
 if TYPE_CHECKING:  # pragma: no cover
     import pandas as pd
 Date = tuple[int, int, int]
@@ -225,9 +227,12 @@ class BaseScalarObject(Op2Codes):
         """creates a pandas dataframe"""
         print('build_dataframe is not implemented in %s' % self.__class__.__name__)
 
-    def export_to_hdf5(self, group, log: SimpleLogger) -> None:
+    def export_to_hdf5(self, group, log: SimpleLogger,
+                       compression: Optional[str]=None,
+                       compression_opts: Optional[int]=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression,
+                       compression_opts=compression_opts)
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
                   page_num=1, is_mag_phase=False, is_sort1=True) -> int:
@@ -724,7 +729,9 @@ class ScalarObject(BaseScalarObject):
     def _write_table_header(self, op2_file, fascii,
                             date: tuple[int, int, int],
                             include_date: bool=True,
-                            subtable_name_default: bytes=b'OUG1    ') -> None:
+                            subtable_name_default: bytes=b'OUG1    ',
+                            size: int=4, is_interlaced: bool=True,
+                            endian: bytes=b'<') -> None:
         try:
             subtable_name = self.subtable_name
         except AttributeError:
@@ -733,20 +740,23 @@ class ScalarObject(BaseScalarObject):
             #raise
             pass
         _write_table_header(op2_file, fascii, date, self.table_name, subtable_name,
-                            include_date=include_date)
+                            include_date=include_date, size=size,
+                            is_interlaced=is_interlaced, endian=endian)
 
 def _write_table_header(op2_file, fascii,
                         date: Date,
                         table_name: str,
                         subtable_name: bytes,
-                        include_date: bool=True) -> None:
-    endian = b'<'
+                        include_date: bool=True,
+                        size: int=4, is_interlaced: bool=True,
+                        endian: bytes=b'<') -> None:
     table_name = '%-8s' % table_name # 'BOUGV1  '
     fascii.write(f'{table_name}._write_table_header\n')
     #get_nmarkers- [4, 0, 4]
     #marker = [4, 2, 4]
     #table_header = [8, 'BOUGV1  ', 8]
-    write_table_header(op2_file, fascii, table_name)
+    write_table_header(op2_file, fascii, table_name, size=size,
+                       is_interlaced=is_interlaced, endian=endian)
 
 
     #read_markers -> [4, -1, 4]
@@ -759,17 +769,18 @@ def _write_table_header(op2_file, fascii,
     #data_a = []
     #data_b = [4, -1, 4,]
     data_c = [4, 7, 4,]
-    fmt_header = endian + b'6i'
-    data = data_a + data_c
-    op2_file.write(pack(fmt_header, *data))
+    op2_file.write(pack_markers([-1, 7], size, endian))
 
     #-----------------
-    table1_fmt = endian + b'9i'
     table1 = [
         28,
         102, 0, 0, 0, 512, 0, 0,
         28,
     ]
+    table1_fmt = endian + b'9i'
+    if size == 8:
+        table1_fmt = endian + b'i7qi'
+        table1[0] = table1[-1] = 56
 
     blank = ' ' * len(table_name)
     fascii.write(f'{table_name} header1a_i = {data_a}\n')
@@ -787,40 +798,33 @@ def _write_table_header(op2_file, fascii,
         4, 0, 4,
     ]
     fascii.write('%s header2a = %s\n' % (table_name, data))
-    op2_file.write(pack(endian + b'9i', *data))
+    op2_file.write(pack_markers([-2, 1, 0], size, endian))
 
     month, day, year = date
     dyear = year - 2000
+    subtable_name = b'%-8s' % subtable_name if subtable_name else b''
+    if size == 8:
+        subtable_name = to_size8_bytes(subtable_name, is_interlaced)
+    nsubtable = len(subtable_name)
     if subtable_name and include_date:
-        table2 = [
-            4, 7, 4,
-            28,  # 4i -> 13i
-            # subtable,todays date 3/6/2014, 0, 1  ( year=year-2000)
-            b'%-8s' % subtable_name, month, day, dyear, 0, 1,
-            28,
-        ]
-        table2_format = '4i 8s 6i'
+        # subtable,todays date 3/6/2014, 0, 1  ( year=year-2000)
+        record = [subtable_name, month, day, dyear, 0, 1]
+        record_fmt = b'%ds 5i' % nsubtable
     elif subtable_name:
-        table2 = [
-            4, 2, 4,
-            8,
-            b'%-8s' % subtable_name,
-            8,
-        ]
-        table2_format = '4i 8s i'
+        record = [subtable_name]
+        record_fmt = b'%ds' % nsubtable
     else:
         assert include_date is True, include_date
-        table2 = [
-            4, 7, 4,
-            28,  # 4i -> 13i
-            # todays date 3/6/2014, 0, 1  ( year=year-2000)
-            month, day, dyear, 0, 1,
-            28,
-        ]
-        table2_format = '4i 6i'
+        # todays date 3/6/2014, 0, 1  ( year=year-2000)
+        record = [month, day, dyear, 0, 1]
+        record_fmt = b'5i'
+    record_fmt = mapfmt(record_fmt, size)
+    nbytes = Struct(endian + record_fmt).size
+    table2 = [4, nbytes // size, 4, nbytes] + record + [nbytes]
 
     fascii.write('%s header2b = %s\n' % (table_name, table2))
-    op2_file.write(pack(table2_format, *table2))
+    op2_file.write(pack_markers([nbytes // size], size, endian) +
+                   pack(endian + b'i' + record_fmt + b'i', nbytes, *record, nbytes))
 
 def get_sort_element_sizes(self, debug: bool=False) -> tuple[int, int, int]:
     if self.is_sort1:
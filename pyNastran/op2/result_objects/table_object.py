@@ -24,10 +24,10 @@ these are used by:
 """
 from __future__ import annotations
 import copy
-from struct import Struct, pack
+from struct import pack
 from itertools import count
 import warnings
-from typing import TextIO
+from typing import Optional, TextIO
 
 import numpy as np
 
@@ -37,10 +37,12 @@ from pyNastran.op2.result_objects.op2_objects import (
     NULL_GRIDTYPE, SORT1_TABLES, SORT2_TABLES)
 
 from pyNastran.f06.f06_formatting import (
-    write_floats_13e, write_floats_13e_long,
-    write_imag_floats_13e, write_float_12e)
+    write_floats_13e_array, write_floats_13e_long_array,
+    write_imag_floats_13e_array, write_floats_12e_array, write_rows)
 from pyNastran.op2.errors import SixtyFourBitError
-from pyNastran.op2.op2_interface.write_utils import set_table3_field, view_dtype, view_idtype_as_fdtype
+from pyNastran.op2.op2_interface.write_utils import (
+    set_table3_field, pack_markers, to_size8_bytes, get_record_buffer)
+from pyNastran.op2.op2_interface.utils import mapfmt
 from pyNastran.utils.numpy_utils import integer_types, float_types
 from pyNastran.op2.writer.utils import fix_table3_types
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
@@ -311,6 +313,13 @@ class TableArray(ScalarObject):  # displacement style table
     def get_headers(self) -> list[str]:
         return self._get_headers()
 
+    def _get_sgridtypes(self) -> np.ndarray:
+        """gets the grid types as strings (see ``recast_gridtype_as_string``)"""
+        gridtypes, inverse = np.unique(self.node_gridtype[:, 1], return_inverse=True)
+        sgridtypes = np.array([self.recast_gridtype_as_string(gridtype)
+                               for gridtype in gridtypes.tolist()], dtype='object')
+        return sgridtypes[inverse.ravel()]
+
     def _reset_indices(self) -> None:
         self.itotal = 0
 
@@ -710,30 +719,114 @@ class TableArray(ScalarObject):  # displacement style table
         self.itotal += 1
         #self.itime += 1
 
-    def _write_table_3(self, op2_file, fascii, new_result, itable=-3, itime=0):
-        import inspect
-        frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_table_3: %s\n' % (self.__class__.__name__, call_frame[1][3]))
+    def _write_op2_records(self, op2_file, fascii, itable: int, new_result: bool,
+                           date, endian: bytes=b'<',
+                           size: int=4, is_interlaced: bool=True) -> int:
+        """
+        Writes the table 3/table 4 records of a SORT1 or SORT2 table
+
+        A record is a time step (SORT1) or a node (SORT2).  Each record
+        (table 3, the record 4 markers and the data) is assembled in a
+        single numpy buffer, so it's written with one call.
+
+        Parameters
+        ----------
+        size : int; default=4
+            4 for a 32-bit OP2, 8 for a 64-bit OP2
+        is_interlaced : bool; default=True
+            how the 64-bit table names are padded
+            (True for NX, False for MSC)
+
+        """
+        fascii.write('%s.write_op2\n' % self.__class__.__name__)
+        if itable == -1:
+            self._write_table_header(op2_file, fascii, date, size=size,
+                                     is_interlaced=is_interlaced, endian=endian)
+            itable = -3
+
+        node = self.node_gridtype[:, 0]
+        gridtype = self.node_gridtype[:, 1]
+        nnodes = len(node)
+        assert nnodes >= 1, nnodes
+
+        max_id = node.max()
+        device_code = self.device_code
+        if size == 4 and max_id * 10 + device_code > MAX_32_BIT_INT:
+            raise SixtyFourBitError(f'max id={max_id} requires a 64-bit OP2 (size=8)')
+        nnodes_device = node.astype('int64') * 10 + device_code
 
+        num_wide = self.num_wide_op2
+        ntimes = self.data.shape[0]
+        if self.is_sort1:
+            nrecords = ntimes
+            nrows = nnodes
+        else:
+            nrecords = nnodes
+            nrows = ntimes
+            times = np.asarray(self._times)
+            is_int_time = times.dtype.kind in 'iu'
+        ntotal = nrows * num_wide
+        assert ntotal > 1, ntotal
+        fascii.write('  ntimes = %s\n' % self.ntimes)
+
+        for irecord in range(nrecords):
+            if self.is_sort1:
+                table3 = self._pack_table_3(new_result, itable, itime=irecord,
+                                            size=size, endian=endian)
+            else:
+                table3 = self._pack_table_3(new_result, itable,
+                                            node_id_device=nnodes_device[irecord],
+                                            size=size, endian=endian)
+
+            # record 4
+            itable -= 1
+            record4 = pack_markers([itable, 1, 0, ntotal], size, endian)
+            fascii.write(f'r4 [4, {itable}, 4]\n')
+            fascii.write(f'r4 [4, {size*ntotal:d}, 4]\n')
+
+            header = table3 + record4
+            nheader = len(header)
+            buffer, ints, floats = get_record_buffer(
+                nrows, num_wide, size=size, endian=endian, nheader=nheader)
+            buffer[:nheader] = np.frombuffer(header, dtype='uint8')
+            if self.is_sort1:
+                ints[:, 0] = nnodes_device
+                ints[:, 1] = gridtype
+                self._set_op2_values(floats, self.data[irecord, :, :])
+            else:
+                if is_int_time:
+                    ints[:, 0] = times
+                else:
+                    floats[:, 0] = times
+                ints[:, 1] = gridtype[irecord]
+                self._set_op2_values(floats, self.data[:, irecord, :])
+            op2_file.write(buffer)
+
+            itable -= 1
+            fascii.write('footer = %s\n' % [size * ntotal])
+            new_result = False
+        return itable
+
+    def _write_table_3(self, op2_file, fascii, new_result, itable=-3, itime=0,
+                       size: int=4, endian: bytes=b'<'):
+        fascii.write('%s.write_table_3\n' % self.__class__.__name__)
+        op2_file.write(self._pack_table_3(new_result, itable, itime,
+                                          size=size, endian=endian))
+
+    def _pack_table_3(self, new_result: bool, itable: int=-3, itime: int=0,
+                      node_id_device: Optional[int]=None,
+                      size: int=4, endian: bytes=b'<') -> bytes:
+        """
+        Packs the table 3 markers and the 146 word header record
+
+        For SORT1, field 5 is the time/frequency/mode of itime.
+        For SORT2, field 5 is the node_id_device.
+        """
         if new_result and itable != -3:
-            header = [
-                4, 146, 4,
-            ]
+            markers = [146]
         else:
-            header = [
-                4, itable, 4,
-                4, 1, 4,
-                4, 0, 4,
-                4, 146, 4,
-            ]
-        op2_file.write(pack(b'%ii' % len(header), *header))
-        fascii.write('table_3_header = %s\n' % header)
-        #op2_file.write(pack('12i', *[4, itable, 4,
-                              #4, 1, 4,
-                              #4, 0, 4,
-                              #4, 146, 4,
-                              #]))
+            markers = [itable, 1, 0, 146]
+        header = pack_markers(markers, size, endian)
 
         approach_code = self.approach_code
         table_code = self.table_code
@@ -756,7 +849,17 @@ class TableArray(ScalarObject):  # displacement style table
             ftable3 = set_table3_field(ftable3, 12, b'f') # field 11
 
         #print(self.get_stats())
-        if self.analysis_code == 1:
+        if node_id_device is not None:
+            # SORT2; the times are in the data records
+            table_code = 2000 + table_code
+            field5 = int(node_id_device)
+            if self.analysis_code in {2, 8, 9}:
+                field6 = 0.0
+                ftable3 = set_table3_field(ftable3, 6, b'f') # field 6
+            if self.analysis_code == 9:
+                field7 = 0.0
+                ftable3 = set_table3_field(ftable3, 7, b'f') # field 7
+        elif self.analysis_code == 1:
             #if hasattr(self, 'lsdvmns'):
             field5 = self.lsdvmns[itime]
             #else:
@@ -851,17 +954,24 @@ class TableArray(ScalarObject):  # displacement style table
             else:
                 n += len(val)
         assert n == 584, n
-        data = [584] + table3 + [584]
-        fmt = b'i' + ftable3 + b'i'
 
-        #op2_file.write(pack(fascii, '%s header 3c' % self.table_name, fmt, data))
-        fascii.write('%s header 3c = %s\n' % (self.table_name, data))
+        if size == 8:
+            # 64-bit words and interlaced strings
+            ftable3 = mapfmt(ftable3, size).replace(b'128s', b'256s')
+            table3[-3:] = [to_size8_bytes(value) for value in table3[-3:]]
+        nbytes = 146 * size
+        data = [nbytes] + table3 + [nbytes]
+        fmt = endian + b'i' + ftable3 + b'i'
+        return header + pack(fmt, *data)
 
-        #j = 7
-        #print(ftable3[:j])
-        #print(table3[:j])
-        #pack(ftable3[:j], *table3[:j])
-        op2_file.write(pack(fmt, *data))
+    @property
+    def num_wide_op2(self) -> int:
+        """the number of words per row of an OP2 record"""
+        raise NotImplementedError()
+
+    def _set_op2_values(self, floats: np.ndarray, data: np.ndarray) -> None:
+        """fills the result columns of an OP2 record"""
+        raise NotImplementedError()
 
 
 class RealTableArray(TableArray):
@@ -1060,9 +1170,9 @@ class RealTableArray(TableArray):
         return 'float32'
 
     def write_op2(self, op2_file, fascii, itable: int, new_result,
-                  date, is_mag_phase: bool=False, endian: str='>'):
+                  date, is_mag_phase: bool=False, endian: bytes=b'<',
+                  size: int=4, is_interlaced: bool=True) -> int:
         """writes an OP2"""
-        import inspect
         allowed_tables = [
             'OUGV1', 'BOUGV1',
             'OPHIG', 'BOPHIG',
@@ -1083,88 +1193,27 @@ class RealTableArray(TableArray):
             'OUGF1',
             'OQGCF1', 'OQGGF1',
             'RADCONS', 'RADEATC', 'RADEFFM',
+
+            # SORT2
+            'OUGV2', 'OUXY2', 'OUGF2',
+            'OQP2', 'OQG2', 'OQGV2', 'OPNL2', 'OPG2',
+            'OUGATO2', 'OUGCRM2', 'OUGPSD2',
+            'OVGATO2', 'OVGCRM2', 'OVGPSD2', 'OVGNO2', 'OVGRMS2',
+            'OAGATO2', 'OAGCRM2', 'OAGPSD2', 'OAGNO2', 'OAGRMS2',
+            'OQGCF2', 'OQGGF2',
         ]
         assert self.table_name in allowed_tables, self.table_name
+        return self._write_op2_records(op2_file, fascii, itable, new_result, date,
+                                       endian=endian, size=size,
+                                       is_interlaced=is_interlaced)
 
-        frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
-
-        if itable == -1:
-            self._write_table_header(op2_file, fascii, date)
-            itable = -3
-
-        #print('nonlinear_factor =', self.nonlinear_factor)
-        if not self.is_sort1:
-            raise NotImplementedError('SORT2')
-        #op2_format = endian + b'2i6f'
-
-        node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        nnodes = self.data.shape[1]
-        nnodes_device = self.node_gridtype[:, 0] * 10 + self.device_code
-
-        nnodes = len(node)
-        max_id = node.max()
-        if max_id > MAX_32_BIT_INT:
-            raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
-
-        fdtype = self.data.dtype
-        if self.size == fdtype.itemsize:
-            pass
-        else:
-            warnings.warn(f'downcasting {self.class_name}...this is buggy')
-            #idtype = np.int32(1)
-            fdtype = np.float32(1.0)
-
-        nodedevice_gridtype = np.column_stack([nnodes_device, gridtype])
-        node_gridtype_floats = view_idtype_as_fdtype(nodedevice_gridtype, fdtype)
-
-        #print(node_gridtype_floats)
-        #node_gridtype_floats = nodedevice_gridtype.view(fdtype) # .reshape(nnodes, 2)
-
-        #(2+6) => (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
-        ntotal = nnodes * (2 + 6)
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert nnodes > 1, nnodes
-        assert ntotal > 1, ntotal
-
-        unused_device_code = self.device_code
-        fascii.write('  ntimes = %s\n' % self.ntimes)
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, fascii, new_result, itable, itime)
-
-            # record 4
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4*ntotal]
-            op2_file.write(pack(b'%ii' % len(header), *header))
-            fascii.write('r4 [4, 0, 4]\n')
-            fascii.write(f'r4 [4, {itable}, 4]\n')
-            fascii.write(f'r4 [4, {4*ntotal:d}, 4]\n')
+    @property
+    def num_wide_op2(self) -> int:
+        # (node_id, gridtype, t1, t2, t3, r1, r2, r3)
+        return 8
 
-            datai = view_dtype(self.data[itime, :, :], fdtype)
-            node_gridtype_data = np.hstack([node_gridtype_floats, datai])
-            op2_file.write(node_gridtype_data)
-            assert ntotal == node_gridtype_data.size
-            #print(self.data.shape, ntotal)
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack(b'i', *header))
-            fascii.write('footer = %s\n' % header)
-            new_result = False
-        return itable
+    def _set_op2_values(self, floats: np.ndarray, data: np.ndarray) -> None:
+        floats[:, 2:] = data
 
     def write_csv(self, csv_file: TextIO,
                   is_exponent_format: bool=False,
@@ -1210,23 +1259,16 @@ class RealTableArray(TableArray):
         assert is_sort1 is True, is_sort1
         nid_len = '%d' % len(str(node.max()))
         cd = -1
+        nnodes = len(node)
+        assert is_exponent_format
+        row_fmt = f'{flag}, {isubcase}, %d, %{nid_len}d, %s, %s, %s, %s, %s, %s, {cd}, %d\n'
         for itime in range(self.ntimes):
-            #dt = self._times[itime]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-                #unused_sgridtype = self.recast_gridtype_as_string(gridtypei)
-                assert is_exponent_format
-                if is_exponent_format:
-                    vals2 = write_floats_13e_long([t1i, t2i, t3i, r1i, r2i, r3i])
-                    (t1i, t2i, t3i, r1i, r2i, r3i) = vals2
-
-                csv_file.write(f'{flag}, {isubcase}, {itime}, {node_id:{nid_len}d}, '
-                               f'{t1i}, {t2i}, {t3i}, {r1i}, {r2i}, {r3i}, {cd}, {gridtypei}\n')
+            for i0, i1 in _iter_chunks(nnodes):
+                vals = write_floats_13e_long_array(self.data[itime, i0:i1, :]).reshape(i1 - i0, 6)
+                csv_file.write(write_rows(
+                    row_fmt,
+                    [itime, node[i0:i1]] + [vals[:, i] for i in range(6)] + [gridtype[i0:i1]],
+                    i1 - i0))
         return
 
     def write_frd(self, frd_file: TextIO,
@@ -1530,85 +1572,41 @@ class RealTableArray(TableArray):
         f06_file.write(''.join(header + words))
 
         node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-        t1 = self.data[0, :, 0]
-        t2 = self.data[0, :, 1]
-        t3 = self.data[0, :, 2]
-        r1 = self.data[0, :, 3]
-        r2 = self.data[0, :, 4]
-        r3 = self.data[0, :, 5]
-        for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-            sgridtype = self.recast_gridtype_as_string(gridtypei)
-            vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-            vals2 = write_floats_13e(vals)
-            (dx, dy, dz, rx, ry, rz) = vals2
-            f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                node_id, sgridtype, dx, dy, dz, rx, ry, rz))
+        sgridtypes = self._get_sgridtypes()
+        _write_real_rows(f06_file, node, sgridtypes, self.data[0, :, :],
+                         '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n')
         f06_file.write(page_stamp % page_num)
         return page_num
 
     def _write_sort1_as_sort2(self, f06_file: TextIO, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
-        times = self._times
-
-        for inode, (node_id, gridtypei) in enumerate(zip(nodes, gridtypes)):
-            t1 = self.data[:, inode, 0].ravel()
-            t2 = self.data[:, inode, 1].ravel()
-            t3 = self.data[:, inode, 2].ravel()
-            r1 = self.data[:, inode, 3].ravel()
-            r2 = self.data[:, inode, 4].ravel()
-            r3 = self.data[:, inode, 5].ravel()
+        sgridtypes = self._get_sgridtypes()
+        sdts = write_floats_12e_array(np.asarray(self._times))
 
+        for inode, (node_id, sgridtype) in enumerate(zip(nodes.tolist(), sgridtypes.tolist())):
             header[1] = ' POINT-ID = %10i\n' % node_id
             f06_file.write(''.join(header + words))
-            for dt, t1i, t2i, t3i, r1i, r2i, r3i in zip(times, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        write_float_12e(dt), sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14s %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(sgridtype)
+            _write_real_rows(f06_file, sdts, sgridtype, self.data[:, inode, :],
+                             '%14s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+                             '%14s %6s     %s\n', column0_scalar=node_id)
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
 
     def _write_sort1_as_sort1(self, f06_file: TextIO, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
-        unused_times = self._times
+        sgridtypes = self._get_sgridtypes()
 
         for itime in range(self.ntimes):
             dt = self._times[itime]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
             if isinstance(dt, float_types):
                 header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
             else:
                 header[1] = ' %s = %10i\n' % (self.data_code['name'], dt)
             f06_file.write(''.join(header + words))
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nodes, gridtypes, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        node_id, sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14i %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(f'node_id={node_id} sgridtype={sgridtype} vals={vals2}')
+            _write_real_rows(f06_file, nodes, sgridtypes, self.data[itime, :, :],
+                             '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+                             '%14i %6s     %s\n')
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
@@ -1673,6 +1671,140 @@ class RealTableArray(TableArray):
         assert all(nids[inids] == node_ids), 'nids=%s expected=%s; all=%s'  % (nids[inids], node_ids, nids)
         return self.data[:, inids, i]
 
+#: the number of rows that are formatted at once by the F06/CSV writers
+NROWS_CHUNK = 100_000
+
+#: the grid types that are written with 6 values/1 value
+VECTOR_GRID_TYPES = ('G', 'H', 'L')
+SCALAR_GRID_TYPES = ('S', 'M', 'E')
+
+def _iter_chunks(nrows: int, chunk_size: int=NROWS_CHUNK):
+    """gets the (i0, i1) slices of the rows"""
+    for i0 in range(0, nrows, chunk_size):
+        yield i0, min(i0 + chunk_size, nrows)
+
+
+def _iter_runs(is_scalar: np.ndarray):
+    """gets the (i0, i1, is_scalar) runs of rows with the same is_scalar"""
+    nrows = len(is_scalar)
+    istart = np.flatnonzero(np.diff(is_scalar)) + 1
+    i0s = [0] + istart.tolist()
+    i1s = istart.tolist() + [nrows]
+    for i0, i1 in zip(i0s, i1s):
+        yield i0, i1, bool(is_scalar[i0])
+
+
+def _get_is_scalar(sgridtypes: np.ndarray, column0: np.ndarray,
+                   vals: np.ndarray) -> np.ndarray:
+    """gets the rows with a scalar grid type (e.g., SPOINTs)"""
+    is_scalar = np.isin(sgridtypes, SCALAR_GRID_TYPES)
+    is_valid = is_scalar | np.isin(sgridtypes, VECTOR_GRID_TYPES)
+    if not np.all(is_valid):
+        i = np.flatnonzero(~is_valid)[0]
+        raise NotImplementedError(f'{column0[i]} sgridtype={sgridtypes[i]} vals={vals[i].tolist()}')
+    return is_scalar
+
+
+def _write_real_rows(f06_file: TextIO, column0, sgridtypes, data: np.ndarray,
+                     vector_fmt: str, scalar_fmt: Optional[str]=None,
+                     column0_scalar=None) -> None:
+    """
+    Writes the rows of a real table
+
+    Parameters
+    ----------
+    column0 : (nrows, ) ndarray / scalar
+        the first column (e.g., the node ids)
+    sgridtypes : (nrows, ) str ndarray / str
+        the grid types (e.g., 'G')
+    data : (nrows, 6) float ndarray
+        the values
+    vector_fmt : str
+        the format of a row with 6 values (e.g., a GRID)
+    scalar_fmt : str; default=None
+        the format of a row with 1 value (e.g., an SPOINT)
+        None : use vector_fmt for all the rows
+    column0_scalar : scalar; default=None -> column0
+        the first column for the scalar rows
+
+    """
+    nrows = data.shape[0]
+    if column0_scalar is None:
+        column0_scalar = column0
+    column0 = np.broadcast_to(np.asarray(column0), (nrows, ))
+    column0_scalar = np.broadcast_to(np.asarray(column0_scalar), (nrows, ))
+    sgridtypes = np.broadcast_to(np.asarray(sgridtypes, dtype='object'), (nrows, ))
+    for i0, i1 in _iter_chunks(nrows):
+        vals = write_floats_13e_array(data[i0:i1, :]).reshape(i1 - i0, 6)
+        if scalar_fmt is None:
+            is_scalar = np.zeros(i1 - i0, dtype='bool')
+        else:
+            is_scalar = _get_is_scalar(sgridtypes[i0:i1], column0[i0:i1], vals)
+
+        for j0, j1, is_scalari in _iter_runs(is_scalar):
+            k0 = i0 + j0
+            k1 = i0 + j1
+            if is_scalari:
+                f06_file.write(write_rows(
+                    scalar_fmt,
+                    [column0_scalar[k0:k1], sgridtypes[k0:k1], vals[j0:j1, 0]], j1 - j0))
+            else:
+                f06_file.write(write_rows(
+                    vector_fmt,
+                    [column0[k0:k1], sgridtypes[k0:k1]] + [vals[j0:j1, i] for i in range(6)],
+                    j1 - j0))
+
+
+def _write_complex_rows(f06_file: TextIO, column0, sgridtypes, data: np.ndarray,
+                        is_mag_phase: bool, vector_fmt: str, scalar_fmt: str,
+                        vector_grid_types: tuple[str, ...]) -> None:
+    """
+    Writes the rows of a complex table (see ``_write_real_rows``)
+
+    Parameters
+    ----------
+    data : (nrows, 6) complex ndarray
+        the values
+    vector_fmt : str
+        the format of a row with 6 values; the fields are
+        (column0, sgridtype, 6 real, '', '', 6 imaginary)
+    scalar_fmt : str
+        the format of a row with 1 value; the fields are
+        (column0, sgridtype, real, '', '', imaginary)
+    vector_grid_types : tuple[str, ...]
+        the grid types that are written with vector_fmt
+
+    """
+    nrows = data.shape[0]
+    column0 = np.broadcast_to(np.asarray(column0), (nrows, ))
+    sgridtypes = np.broadcast_to(np.asarray(sgridtypes, dtype='object'), (nrows, ))
+    for i0, i1 in _iter_chunks(nrows):
+        vals = write_imag_floats_13e_array(data[i0:i1, :], is_mag_phase)
+        sgridtypesi = sgridtypes[i0:i1]
+        is_scalar = np.isin(sgridtypesi, SCALAR_GRID_TYPES)
+        is_valid = is_scalar | np.isin(sgridtypesi, vector_grid_types)
+        if not np.all(is_valid):
+            i = np.flatnonzero(~is_valid)[0]
+            raise NotImplementedError(f'{column0[i0 + i]} sgridtype={sgridtypesi[i]} '
+                                      f'vals={vals[i].tolist()}')
+
+        for j0, j1, is_scalari in _iter_runs(is_scalar):
+            k0 = i0 + j0
+            k1 = i0 + j1
+            if is_scalari:
+                f06_file.write(write_rows(
+                    scalar_fmt,
+                    [column0[k0:k1], sgridtypes[k0:k1], vals[j0:j1, 0], '', '', vals[j0:j1, 6]],
+                    j1 - j0))
+            else:
+                f06_file.write(write_rows(
+                    vector_fmt,
+                    [column0[k0:k1], sgridtypes[k0:k1]] +
+                    [vals[j0:j1, i] for i in range(6)] + ['', ''] +
+                    [vals[j0:j1, i] for i in range(6, 12)],
+                    j1 - j0))
+
+
 def set_real_table(cls, data_code, is_sort1, isubcase,
                    node_gridtype, data, times):
 #def set_real_table(cls, data_code, is_sort1, isubcase, times,
@@ -1825,6 +1957,7 @@ class ComplexTableArray(TableArray):
     def write_sort1_as_sort1(self, f06_file, page_num, page_stamp, header, words, is_mag_phase):
         assert self.ntimes == len(self._times), 'ntimes=%s len(self._times)=%s' % (self.ntimes, self._times)
         words_orig = copy.deepcopy(words)
+        sgridtypes = self._get_sgridtypes()
 
         for itime, dt in enumerate(self._times):
             if hasattr(self, 'eigrs'):
@@ -1848,76 +1981,39 @@ class ComplexTableArray(TableArray):
                         raise
 
             node = self.node_gridtype[:, 0]
-            gridtype = self.node_gridtype[:, 1]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
             header[2] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
             f06_file.write(''.join(header + words))
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_imag_floats_13e(vals, is_mag_phase)
-                [dxr, dyr, dzr, rxr, ryr, rzr,
-                 dxi, dyi, dzi, rxi, ryi, rzi] = vals2
-                if sgridtype in ['G', 'H']:
-                    f06_file.write('0 %12i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n'
-                                   '  %12s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n' % (
-                                       node_id, sgridtype, dxr, dyr, dzr, rxr, ryr, rzr,
-                                       '', '', dxi, dyi, dzi, rxi, ryi, rzi))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('0 %12i %6s     %-13s\n'
-                                   '  %12s %6s     %-13s\n' % (node_id, sgridtype, dxr, '', '', dxi))
-                else:  # pragma: no cover
-                    raise NotImplementedError(f'node_id={node_id} sgridtype={sgridtype} vals={vals2}')
+            _write_complex_rows(
+                f06_file, node, sgridtypes, self.data[itime, :, :], is_mag_phase,
+                '0 %12i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n'
+                '  %12s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n',
+                '0 %12i %6s     %-13s\n'
+                '  %12s %6s     %-13s\n', ('G', 'H'))
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
 
     def write_sort1_as_sort2(self, f06_file, page_num, page_stamp, header, words, is_mag_phase):
         node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
+        sgridtypes = self._get_sgridtypes()
 
         times = self._times
+        sdts = write_floats_12e_array(np.asarray(times))
         # print(self.data.shape)
-        for inode, (node_id, gridtypei) in enumerate(zip(node, gridtype)):
+        for inode, (node_id, sgridtype) in enumerate(zip(node.tolist(), sgridtypes.tolist())):
             # TODO: for SORT1 pretending to be SORT2
-            #t1 = self.data[:, inode, 0].ravel()
-            t1 = self.data[:, inode, 0].ravel()
-            t2 = self.data[:, inode, 1].ravel()
-            t3 = self.data[:, inode, 2].ravel()
-            r1 = self.data[:, inode, 3].ravel()
-            r2 = self.data[:, inode, 4].ravel()
-            r3 = self.data[:, inode, 5].ravel()
-            if len(r3) != len(times):
-                raise RuntimeError('len(d)=%s len(times)=%s' % (len(r3), len(times)))
+            data = self.data[:, inode, :]
+            if len(data) != len(times):
+                raise RuntimeError('len(d)=%s len(times)=%s' % (len(data), len(times)))
 
             header[2] = ' POINT-ID = %10i\n' % node_id
             f06_file.write(''.join(header + words))
-            for dt, t1i, t2i, t3i, r1i, r2i, r3i in zip(times, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_imag_floats_13e(vals, is_mag_phase)
-                [dxr, dyr, dzr, rxr, ryr, rzr,
-                 dxi, dyi, dzi, rxi, ryi, rzi] = vals2
-                sdt = write_float_12e(dt)
-                #if not is_all_zeros:
-                if sgridtype == 'G':
-                    f06_file.write('0 %12s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n'
-                                   '  %13s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n' % (
-                                       sdt, sgridtype, dxr, dyr, dzr, rxr, ryr, rzr,
-                                       '', '', dxi, dyi, dzi, rxi, ryi, rzi))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('0 %12s %6s     %-13s\n'
-                                   '  %12s %6s     %-13s\n' % (sdt, sgridtype, dxr, '', '', dxi))
-                else:
-                    msg = 'nid=%s dt=%s type=%s dx=%s dy=%s dz=%s rx=%s ry=%s rz=%s' % (
-                        node_id, dt, sgridtype, t1i, t2i, t3i, r1i, r2i, r3i)
-                    raise NotImplementedError(msg)
+            _write_complex_rows(
+                f06_file, sdts, sgridtype, data, is_mag_phase,
+                '0 %12s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n'
+                '  %13s %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %-s\n',
+                '0 %12s %6s     %-13s\n'
+                '  %12s %6s     %-13s\n', ('G', ))
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
@@ -1967,10 +2063,10 @@ class ComplexTableArray(TableArray):
             #page_num += 1
         #return page_num
 
-    def write_op2(self, op2_file, fascii, itable, new_result,
-                  date, is_mag_phase=False, endian='>'):
+    def write_op2(self, op2_file, fascii, itable: int, new_result,
+                  date, is_mag_phase: bool=False, endian: bytes=b'<',
+                  size: int=4, is_interlaced: bool=True) -> int:
         """writes an OP2"""
-        import inspect
         allowed_tables = [
             'OUGV1', 'BOUGV1',
             'OQG1', 'OQMG1',
@@ -1980,108 +2076,25 @@ class ComplexTableArray(TableArray):
             'OUG1',
             'OUGF1', 'BOUGF1',
             'OAG1', 'OVG1',
+
+            # SORT2
+            'OUGV2', 'OUXY2', 'OUGF2',
+            'OQG2', 'OPG2',
         ]
         assert self.table_name in allowed_tables, self.table_name
+        return self._write_op2_records(op2_file, fascii, itable, new_result, date,
+                                       endian=endian, size=size,
+                                       is_interlaced=is_interlaced)
 
-        frame = inspect.currentframe()
-        call_frame = inspect.getouterframes(frame, 2)
-        fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
-
-        if itable == -1:
-            self._write_table_header(op2_file, fascii, date)
-            itable = -3
-
-        #print('nonlinear_factor =', self.nonlinear_factor)
-        if self.is_sort1:
-            op2_format = endian + b'2i 12f'
-        else:
-            raise NotImplementedError('SORT2')
-        s = Struct(op2_format)
-
-        node = self.node_gridtype[:, 0]
-        max_id = node.max()
-        if max_id > 99999999:
-            raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
-
-        gridtype = self.node_gridtype[:, 1]
-        #format_table4_1 = Struct(self._endian + b'15i')
-        #format_table4_2 = Struct(self._endian + b'3i')
-
-        # table 4 info
-        #ntimes = self.data.shape[0]
-        nnodes = self.data.shape[1]
-        nnodes_device = self.node_gridtype[:, 0] * 10 + self.device_code
-
-        #fdtype = self.data.real.dtype
-        #fdtype = 'float32'  # we don't support complex data yet
-        #nodedevice_gridtype = np.column_stack([nnodes_device, gridtype])
-        #node_gridtype_bytes = nodedevice_gridtype.tobytes()
-        #node_gridtype_floats = np.frombuffer(node_gridtype_bytes,
-                                             #dtype=fdtype).reshape(nnodes, 2)
-
-        #(2+6) => (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
-        ntotal = nnodes * (2 + 12)
-
-        #print('shape = %s' % str(self.data.shape))
-        assert nnodes >= 1, nnodes
-        assert ntotal > 1, ntotal
-
-        unused_device_code = self.device_code
-        fascii.write('  ntimes = %s\n' % self.ntimes)
-
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        for itime in range(self.ntimes):
-            self._write_table_3(op2_file, fascii, new_result, itable, itime)
-
-            # record 4
-            itable -= 1
-            header = [4, itable, 4,
-                      4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4*ntotal]
-            op2_file.write(pack(b'%ii' % len(header), *header))
-            fascii.write('r4 [4, 0, 4]\n')
-            fascii.write(f'r4 [4, {itable}, 4]\n')
-            fascii.write(f'r4 [4, {4*ntotal:d}, 4]\n')
-
-            #datai = self.data[itime, :, :]
-            #node_gridtype_data = np.hstack([
-                #node_gridtype_floats,
-                #datai.real.astype('float32'),
-                #datai.imag.astype('float32'),
-            #])
-            #node_gridtype_data_bytes = node_gridtype_data.tobytes()
-            #op2_file.write(node_gridtype_data_bytes)
-
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nnodes_device, gridtype, t1, t2, t3, r1, r2, r3):
-                data = [node_id, gridtypei,
-                        t1i.real, t2i.real, t3i.real, r1i.real, r2i.real, r3i.real,
-                        t1i.imag, t2i.imag, t3i.imag, r1i.imag, r2i.imag, r3i.imag]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
-
-            itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack(b'i', *header))
-            fascii.write('footer = %s\n' % header)
-            new_result = False
-            #header = [
-                #4, itable, 4,
-                #4, 1, 4,
-                #4, 0, 4,
-            #]
-            #op2_file.write(pack(b'%ii' % len(header), *header))
-            #fascii.write('footer2 = %s\n' % header)
-        return itable
+    @property
+    def num_wide_op2(self) -> int:
+        # (node_id, gridtype, t1r, t2r, t3r, r1r, r2r, r3r,
+        #                     t1i, t2i, t3i, r1i, r2i, r3i)
+        return 14
+
+    def _set_op2_values(self, floats: np.ndarray, data: np.ndarray) -> None:
+        floats[:, 2:8] = data.real
+        floats[:, 8:] = data.imag
 
     #def write_sort2_as_sort2(self, f06_file, page_num, page_stamp, header, words, is_mag_phase):
         #node = self.node_gridtype[:, 0]
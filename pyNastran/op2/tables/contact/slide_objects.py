@@ -73,7 +73,7 @@ class RealSlideDistanceArray(RealTableArray):
         fascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
 
         if itable == -1:
-            self._write_table_header(op2_file, fascii, date)
+            self._write_table_header(op2_file, fascii, date, endian=endian)
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
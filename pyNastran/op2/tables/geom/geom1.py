@@ -21,6 +21,7 @@ from pyNastran.bdf.cards.elements.damper import CVISC
 #from pyNastran.bdf.cards.elements.mass import CMASS2
 from pyNastran.op2.op2_interface.op2_reader import mapfmt, reshape_bytes_block
 from .utils import get_minus1_start_end
+from .geom_arrays import decode_grids, grids_from_arrays, add_geom_arrays
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2_geom import OP2Geom
 
@@ -745,6 +746,10 @@ class GEOM1:
                 n, grids = self._read_grid_11(data, n)
             except Exception:
                 n, grids = self._read_grid_8(data, n)
+        elif op2.lazy_geom:
+            n, arrays = decode_grids(op2, data, n)
+            add_geom_arrays(op2, 'GRID', arrays)
+            return n
         else:
             n, grids = self._read_grid_8(data, n)
 
@@ -757,44 +762,10 @@ class GEOM1:
         op2.card_count['GRID'] = ngrids
         return n
 
-    def _read_grid_8(self, data: bytes, n: int) -> tuple[int, dict[int, GRID]]:  # 21.8 sec, 18.9
+    def _read_grid_8(self, data: bytes, n: int) -> tuple[int, dict[int, GRID]]:
         """(4501,45,1) - the marker for Record 17"""
-        op2: OP2Geom = self.op2
-        structi = Struct(mapfmt(op2._endian + b'ii 3f 3i', op2.size))
-        ntotal = 32 * op2.factor
-        ndatai = len(data) - n
-        nentries = ndatai // ntotal
-        assert nentries > 0, nentries
-        assert ndatai % ntotal == 0, f'ndatai={ndatai} ntotal={ntotal} leftover={ndatai % ntotal}'
-        grids = {}
-        for unused_i in range(nentries):
-            edata = data[n:n + ntotal]
-            out = structi.unpack(edata)
-            (nid, cp, x1, x2, x3, cd, ps, seid) = out
-            if op2.is_debug_file:
-                op2.binary_debug.write('  GRID=%s\n' % str(out))
-            #if nid < 10000000:
-            # cd can be < 0
-            if ps == 0:
-                ps = ''
-            node = GRID(nid, np.array([x1, x2, x3]), cp, cd, ps, seid)
-            #op2._type_to_id_map['GRID'].append(nid)
-            #self.nodes[nid] = node
-            grids[nid] = node
-            #if nid in self.nodes:
-                #self.reject_lines.append(str(node))
-            #else:
-            #self.nodes[nid] = node
-            #self.add_node(node)
-            #else:
-                #op2.log.warning('*nid=%s cp=%s x1=%-5.2f x2=%-5.2f x3=%-5.2f cd=%-2s ps=%s '
-                                 #'seid=%s' % (nid, cp, x1, x2, x3, cd, ps, seid))
-                #node = GRID(nid, np.array([x1, x2, x3]), cp, cd, ps, seid)
-                #self.rejects.append(str(node))
-                #nfailed += 1
-            n += ntotal
-        #op2.increase_card_count('GRID', nentries - nfailed)
-        return n, grids
+        n, arrays = decode_grids(self.op2, data, n)
+        return n, grids_from_arrays(arrays)
 
     def _read_grid_11(self, data: bytes, n: int) -> tuple[int, dict[int, GRID]]:  # 21.8 sec, 18.9
         """(4501,45,1) - the marker for Record 17"""
@@ -24,8 +24,8 @@ from pyNastran.bdf.cards.elements.bars import CBAR, CBEND, CBEAM3
 from pyNastran.bdf.cards.elements.beam import CBEAM
 from pyNastran.bdf.cards.elements.mass import (CONM1, CONM2, CMASS1, CMASS2,
                                                CMASS3, CMASS4)
-from pyNastran.bdf.cards.elements.solid import (CTETRA4, CPYRAM5, CPENTA6, CHEXA8,
-                                                CTETRA10, CPYRAM13, CPENTA15, CHEXA20,
+from pyNastran.bdf.cards.elements.solid import (CTETRA4, CPYRAM5, CHEXA8,
+                                                CPYRAM13, CHEXA20,
                                                 CPENTCZ, CHEXCZ)
 from pyNastran.bdf.cards.thermal.thermal import CHBDYG, CONV, CHBDYP, CHBDYE, CONVM
 from pyNastran.bdf.cards.thermal.radiation import RADBC # , RADM, RADCAV, RADLST, RADMTX, VIEW, VIEW3D
@@ -38,6 +38,9 @@ from pyNastran.op2.op2_interface.op2_reader import mapfmt # , reshape_bytes_bloc
 from pyNastran.op2.tables.geom.geom4 import RBE3
 
 from pyNastran.op2.errors import DoubleCardError, EmptyCardError
+from pyNastran.op2.tables.geom.geom_arrays import (
+    decode_cquad4_nx_56, decode_cquad4_msc_60, decode_ctria3_52, decode_solids,
+    elements_from_arrays, add_geom_arrays)
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2_geom import OP2Geom
 
@@ -2088,33 +2091,23 @@ class GEOM2:
             op2._add_methods._add_element_object(obj)
         #raise RuntimeError('this should be overwritten by the BDF class')
 
+    def _read_solids(self, card_name: str, data: bytes, n: int) -> int:
+        """common method for CTETRA, CPENTA, CHEXA"""
+        op2: OP2Geom = self.op2
+        n, arrays = decode_solids(op2, card_name, data, n)
+        if op2.lazy_geom:
+            add_geom_arrays(op2, card_name, arrays)
+            return n
+        for elem in elements_from_arrays(card_name, arrays):
+            self.add_op2_element(elem)
+        op2.card_count[card_name] = len(arrays['eid'])
+        return n
+
     def read_chexa(self, data: bytes, n: int) -> int:
         """
         CHEXA(7308,73,253) - the marker for Record 45
         """
-        op2: OP2Geom = self.op2
-        s = Struct(mapfmt(op2._endian + b'22i', self.size))
-        ntotal = 88 * self.factor  # 22*4
-        nelements = (len(data) - n) // ntotal
-        for unused_i in range(nelements):
-            edata = data[n:n+ntotal]
-            out = s.unpack(edata)
-            if op2.is_debug_file:
-                op2.binary_debug.write('  CHEXA=%s\n' % str(out))
-            (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
-             g11, g12, g13, g14, g15, g16, g17, g18, g19, g20) = out
-
-            data_in = [eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, ]
-            big_nodes = [g9, g10, g11, g12, g13, g14, g15, g16,
-                         g17, g18, g19, g20]
-            if sum(big_nodes) > 0:
-                elem = CHEXA20.add_op2_data(data_in + big_nodes)
-            else:
-                elem = CHEXA8.add_op2_data(data_in)
-            self.add_op2_element(elem)
-            n += ntotal
-        op2.card_count['CHEXA'] = nelements
-        return n
+        return self._read_solids('CHEXA', data, n)
 
     def read_chexa_cz(self, data: bytes, n: int) -> int:
         """
@@ -2376,6 +2369,9 @@ class GEOM2:
         """
         n, elements = self._read_dual_card_load(
             data, n, nx_read, msc_read)
+        if isinstance(elements, dict):
+            add_geom_arrays(self.op2, card_name, elements)
+            return n
         nelements = len(elements)
         for elem in elements:
             add_method(elem)
@@ -2983,28 +2979,7 @@ class GEOM2:
         CPENT15F(16500,165,9999) - the marker for Record 65
         CPENT6FD(16000,160,9999) - the marker for Record 66
         """
-        op2: OP2Geom = self.op2
-        ntotal = 68 * self.factor  # 17*4
-        s = Struct(mapfmt(op2._endian + b'17i', self.size))
-        nelements = (len(data) - n) // ntotal
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = s.unpack(edata)
-            if op2.is_debug_file:
-                op2.binary_debug.write('  CPENTA=%s\n' % str(out))
-            (eid, pid, g1, g2, g3, g4, g5, g6, g7, g8, g9, g10,
-             g11, g12, g13, g14, g15) = out
-
-            data_in = [eid, pid, g1, g2, g3, g4, g5, g6]
-            big_nodes = [g7, g8, g9, g10, g11, g12, g13, g14, g15]
-            if sum(big_nodes) > 0:
-                elem = CPENTA15.add_op2_data(data_in + big_nodes)
-            else:
-                elem = CPENTA6.add_op2_data(data_in)
-            self.add_op2_element(elem)
-            n += ntotal
-        op2.card_count['CPENTA'] = nelements
-        return n
+        return self._read_solids('CPENTA', data, n)
 
     def read_cpenta_cz(self, data: bytes, n: int) -> int:
         """
@@ -3154,6 +3129,9 @@ class GEOM2:
         n, elements = self._read_double_card_load(
             card_name, card_obj,
             methods, data, n)
+        if isinstance(elements, dict):
+            add_geom_arrays(op2, card_name, elements)
+            return n
 
         nentries = len(elements)
         for elem in elements:
@@ -3320,6 +3298,13 @@ class GEOM2:
         op2.card_count[element.type] = nelements
         return n
 
+    def _shell_arrays_to_elements(self, card_name: str,
+                                  arrays: dict[str, np.ndarray]) -> Union[list[Any], dict[str, np.ndarray]]:
+        """creates the shell elements; the arrays are returned if lazy_geom=True"""
+        if self.op2.lazy_geom:
+            return arrays
+        return elements_from_arrays(card_name, arrays)
+
     def _run_cquad4_msc_60(self, element: CQUAD4, data: bytes, n: int) -> tuple[int, Any]:
         r"""
         buggy MSC 2018.2 version
@@ -3345,75 +3330,8 @@ class GEOM2:
             1003, 20, 20002, 20003, 20103, 20102, 0,    0.0,   0,     0,     -1.0, -1.0, -1.0, -1.0, 42,
             1004, 20, 20100, 20101, 20201, 20200, 0,    0.0,   0,     0,     -1.0, -1.0, -1.0, -1.0, -1)
         """
-        op2: OP2Geom = self.op2
-        elements = []
-        ntotal = 60 * self.factor  # 15*4
-        nelements = (len(data) - n) // ntotal
-        leftover = (len(data) - n) % ntotal
-        assert leftover == 0, leftover
-
-
-        #  TODO: not sure...
-        #   6i is correct
-        #   3f-i zeros as float/int???
-        #   4f correct
-        #   i correct
-        structi = Struct(mapfmt(op2._endian + b'6i 3fi 4f i', self.size))
-        #if op2.is_debug_file:
-            #op2.binary_debug.write('ndata=%s\n' % (nelements * 44))
-
-        if op2.is_debug_file:
-            op2.binary_debug.write(f'  {element.type}=(eid, pid, [n1, n2, n3, n4], theta, zoffs, '
-                                    'unused_blank, [tflag, t1, t2, t3, t4]); theta_mcid\n')
-
-        cids = set(list(self.op2.coords.keys()))
-        check_cids = max(cids) > 0 if len(cids) else False
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            #self.show_data(edata)
-            out = structi.unpack(edata)
-            # theta, zoffs, blank, tflag, t1, t2, t3, t4
-            (eid, pid, n1, n2, n3, n4,
-             theta, zoffs, blank, tflag,
-             t1, t2, t3, t4,
-             minus1_mcid) = out
-            assert blank == 0.0
-            assert isinstance(tflag, int), tflag
-            #minus1 = out[-1]
-            #eid, pid, n1, n2, n3, n4, theta, a, b, c, t1, t2, t3, t4, minus1 = out
-            #print(eid, pid)
-            theta_mcid = theta
-            if minus1_mcid != -1:
-                theta_mcid = minus1_mcid
-                assert theta == 0., theta
-                if check_cids:
-                    assert minus1_mcid in cids, minus1_mcid
-            msg = (
-                f'eid={eid} pid={pid} nodes=({n1}, {n2}, {n3}, {n4}) '
-                f'theta={theta} zoffs={zoffs} blank={blank} '
-                f'tflag={tflag} t1-t4=({t1}, {t2}, {t3}, {t4}) '
-                f'minus1_mcid={minus1_mcid} -> theta_mcid={theta_mcid}')
-            #print(msg)
-            #assert theta == 0, msg
-            assert zoffs == 0, msg
-            assert blank == 0, msg
-            assert tflag == 0, msg
-
-            if op2.is_debug_file:
-                op2.binary_debug.write(
-                    f'  {element.type}=({eid}, {pid}, [{n1}, {n2}, {n3}, {n4}], '
-                    f'{theta}, {zoffs}, {blank}, [{tflag}, {t1}, {t2}, {t3}, {t4})]; {theta_mcid}\n')
-
-            data_init = [
-                eid, pid, n1, n2, n3, n4, theta_mcid, zoffs,
-                tflag, t1, t2, t3, t4]
-            elem = element.add_op2_data(data_init)
-            elements.append(elem)
-            n += ntotal
-        #if stop:
-            #raise RuntimeError('theta is too large...make the quad wrong')
-        #op2.card_count[element.type] = nelements
-        return n, elements
+        n, arrays = decode_cquad4_msc_60(self.op2, element.type, data, n)
+        return n, self._shell_arrays_to_elements(element.type, arrays)
 
     def _run_cquad4_nx_56(self, element: Union[CQUAD4, CQUADR],
                           data: bytes, n: int) -> tuple[int, Any]:
@@ -3427,48 +3345,8 @@ class GEOM2:
             3, 1, 3, 4, 10, 9, 0, 0, 0, 0, -1.0, -1.0, -1.0, -1.0
         )
         """
-        op2: OP2Geom = self.op2
-        elements = []
-        ntotal = 56 * self.factor  # 14*4
-        nelements = (len(data) - n) // ntotal
-        leftover = (len(data) - n) % ntotal
-        assert leftover == 0, leftover
-        s = Struct(mapfmt(op2._endian + b'6i ff ii 4f', self.size))
-        if op2.is_debug_file:
-            op2.binary_debug.write('ndata=%s\n' % (nelements * 44))
-
-        if op2.is_debug_file:
-            op2.binary_debug.write(f'  {element.type}=(eid, pid, [n1, n2, n3, n4], theta, zoffs, '
-                                    'unused_blank, [tflag, t1, t2, t3, t4]); theta_mcid\n')
-
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = s.unpack(edata)
-            (eid, pid, n1, n2, n3, n4, theta, zoffs, unused_blank, tflag,
-             t1, t2, t3, t4) = out
-            theta_mcid = convert_theta_to_mcid(theta)
-            if op2.is_debug_file:
-                op2.binary_debug.write(
-                    f'  {element.type}=({eid}, {pid}, [{n1}, {n2}, {n3}, {n4}], '
-                    f'{theta}, {zoffs}, {unused_blank}, [{tflag}, {t1}, {t2}, {t3}, {t4})]; {theta_mcid}\n')
-
-            #print('eid=%s pid=%s n1=%s n2=%s n3=%s n4=%s theta=%s zoffs=%s '
-                  #'blank=%s tflag=%s t1=%s t2=%s t3=%s t4=%s' % (
-                      #eid, pid, n1, n2, n3, n4, theta, zoffs,
-                      #blank, tflag, t1, t2, t3, t4))
-
-            data_init = [
-                eid, pid, n1, n2, n3, n4, theta_mcid, zoffs,
-                tflag, t1, t2, t3, t4]
-            elem = element.add_op2_data(data_init)
-            #op2.add_op2_element(elem)
-            elements.append(elem)
-            n += ntotal
-        #if stop:
-            #raise RuntimeError('theta is too large...make the quad wrong')
-        #op2.card_count[element.type] = nelements
-        #self.to_nx()  # not really an nx specific thing...
-        return n, elements
+        n, arrays = decode_cquad4_nx_56(self.op2, element.type, data, n)
+        return n, self._shell_arrays_to_elements(element.type, arrays)
 
 # CQUAD4FD
 
@@ -4125,33 +4003,7 @@ class GEOM2:
         CTETR10F(16600,166,9999) - the marker for Record 90
         CTETR4FD(16100,161,9999) - the marker for Record 91
         """
-        op2: OP2Geom = self.op2
-        ntotal = 48 * self.factor  # 12*4
-        s = Struct(mapfmt(op2._endian + b'12i', self.size))
-        nelements = (len(data) - n) // ntotal
-        for unused_i in range(nelements):
-            edata = data[n:n + ntotal]
-            out = s.unpack(edata)
-            if op2.is_debug_file:
-                op2.binary_debug.write('  CTETRA=%s\n' % str(out))
-            (eid, pid, n1, n2, n3, n4, n5, n6, n7, n8, n9, n10) = out
-
-            data_in = [eid, pid, n1, n2, n3, n4]
-            big_nodes = [n5, n6, n7, n8, n9, n10]
-            if sum(big_nodes) > 0:
-                elem = CTETRA10.add_op2_data(data_in + big_nodes)
-            else:
-                elem = CTETRA4.add_op2_data(data_in)
-            try:
-                elem.validate()
-                str(elem)
-            except Exception:
-                print(data_in, big_nodes)
-                raise
-            self.add_op2_element(elem)
-            n += ntotal
-        op2.card_count['CTETRA'] = nelements
-        return n
+        return self._read_solids('CTETRA', data, n)
 
 # CTQUAD - 92
 # CTTRIA - 93
@@ -4176,29 +4028,8 @@ class GEOM2:
         CTRIA3(5959,59,282) - the marker for Record 94
 
         """
-        op2: OP2Geom = self.op2
-        ntotal = 52 * self.factor  # 13*4
-        s = Struct(mapfmt(op2._endian + b'5iff3i3f', self.size))
-        nelements = (len(data) - n)// ntotal
-        elements = []
-        for unused_i in range(nelements):
-            edata = data[n:n+ntotal]
-            out = s.unpack(edata)
-            #print('eid=%s pid=%s n1=%s n2=%s n3=%s theta=%s zoffs=%s '
-                  #'blank1=%s blank2=%s tflag=%s t1=%s t2=%s t3=%s' % (
-                      #eid, pid, n1, n2, n3, theta, zoffs,
-                      #blank1, blank2, tflag, t1, t2, t3))
-            (eid, pid, n1, n2, n3, theta, zoffs, unused_blank1,
-             unused_blank2, tflag, t1, t2, t3) = out
-            if op2.is_debug_file:
-                op2.binary_debug.write('  CTRIA3=%s\n' % str(out))
-
-            theta_mcid = convert_theta_to_mcid(theta)
-            data_in = [eid, pid, n1, n2, n3, theta_mcid, zoffs, tflag, t1, t2, t3]
-            elem = CTRIA3.add_op2_data(data_in)
-            elements.append(elem)
-            n += ntotal
-        return n, elements
+        n, arrays = decode_ctria3_52(self.op2, 'CTRIA3', data, n)
+        return n, self._shell_arrays_to_elements('CTRIA3', arrays)
 
     def _read_ctria3_56(self, card_obj, data: bytes, n: int) -> int:
         r"""
@@ -0,0 +1,298 @@
+"""
+Defines decoding the high volume geometry records of the GEOM1/GEOM2
+tables (GRID, CQUAD4, CQUADR, CTRIA3, CHEXA, CPENTA, CTETRA) into column
+arrays.
+
+A record is viewed as an (nrows, nwords) integer/float array with
+``np.frombuffer``, so there is no per card unpacking.  The card objects
+are created from the arrays (e.g., ``grids_from_arrays``), or when
+``OP2Geom.lazy_geom = True``, the arrays are stored in
+``OP2Geom.geom_arrays`` and the card objects are created when
+``OP2Geom.build_geom_objects()`` is called.
+
+The arrays of a card are:
+ - GRID: nid, cp, xyz, cd, ps, seid
+ - shells: eid, pid, nodes, theta, mcid, zoffset, tflag, thickness
+     - mcid=-1 if theta is used
+ - solids: eid, pid, nodes
+     - all the nodes of the record (e.g., 20 for a CHEXA); the midside
+       nodes are 0 for a CHEXA8
+
+Example
+-------
+>>> model = read_op2_geom(op2_filename, lazy_geom=True, xref=False)
+>>> nids = model.geom_arrays['GRID']['nid']
+>>> xyz = model.geom_arrays['GRID']['xyz']
+>>> model.build_geom_objects()
+>>> model.cross_reference()
+"""
+from __future__ import annotations
+from typing import Any, TYPE_CHECKING
+import numpy as np
+
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CTRIA3, CQUAD4, CQUADR
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CPENTA15, CHEXA8, CHEXA20)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.op2.op2_geom import OP2Geom
+
+SHELL_CLASSES = {
+    'CQUAD4': CQUAD4,
+    'CQUADR': CQUADR,
+    'CTRIA3': CTRIA3,
+}
+
+#: card_name: (nwords, ncorner_nodes, linear_class, quadratic_class)
+SOLID_CLASSES = {
+    'CTETRA': (12, 4, CTETRA4, CTETRA10),
+    'CPENTA': (17, 6, CPENTA6, CPENTA15),
+    'CHEXA': (22, 8, CHEXA8, CHEXA20),
+}
+
+
+def _get_rows(op2: OP2Geom, data: bytes, n: int,
+              nwords: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Views the record as (nrows, nwords) int/float arrays
+
+    The word size (4/8 bytes) is the size of the op2.
+    """
+    size = 4 * op2.factor
+    ntotal = nwords * size
+    ndatai = len(data) - n
+    assert ndatai % ntotal == 0, f'ndatai={ndatai} ntotal={ntotal} leftover={ndatai % ntotal}'
+    nrows = ndatai // ntotal
+    endian = op2._endian.decode('latin1')
+    ints = np.frombuffer(data, dtype=f'{endian}i{size}', offset=n).reshape(nrows, nwords)
+    floats = np.frombuffer(data, dtype=f'{endian}f{size}', offset=n).reshape(nrows, nwords)
+    return ints, floats
+
+
+def _write_debug_rows(op2: OP2Geom, card_name: str, ints: np.ndarray,
+                      floats: np.ndarray, ifloats: list[int]) -> None:
+    """writes the records of a card to the binary debug file"""
+    is_float = np.zeros(ints.shape[1], dtype='bool')
+    is_float[ifloats] = True
+    for intsi, floatsi in zip(ints.tolist(), floats.tolist()):
+        out = tuple(floati if is_floati else inti
+                    for inti, floati, is_floati in zip(intsi, floatsi, is_float))
+        op2.binary_debug.write(f'  {card_name}={out}\n')
+
+
+def decode_grids(op2: OP2Geom, data: bytes, n: int) -> tuple[int, dict[str, np.ndarray]]:
+    """
+    Decodes the GRID record (4501,45,1)
+
+    (nid, cp, x1, x2, x3, cd, ps, seid)
+    """
+    ints, floats = _get_rows(op2, data, n, 8)
+    assert len(ints) > 0, len(ints)
+    if op2.is_debug_file:
+        _write_debug_rows(op2, 'GRID', ints, floats, [2, 3, 4])
+    arrays = {
+        'nid': ints[:, 0].copy(),
+        'cp': ints[:, 1].copy(),
+        'xyz': floats[:, 2:5].astype('float64'),
+        'cd': ints[:, 5].copy(),
+        'ps': ints[:, 6].copy(),
+        'seid': ints[:, 7].copy(),
+    }
+    return len(data), arrays
+
+
+def _theta_to_mcid(theta: np.ndarray) -> np.ndarray:
+    """
+    The vectorized ``convert_theta_to_mcid``
+
+    The material coordinate system is stored as theta = 512 * (mcid + 1).
+
+    Returns
+    -------
+    mcid : (n, ) int ndarray
+        the material coordinate system; -1 if theta is an angle
+    """
+    mcid = np.full(len(theta), -1, dtype='int64')
+    is_mcid = theta > 511.
+    if is_mcid.any():
+        cid_float = theta[is_mcid].astype('float64') / 512. - 1
+        cid = cid_float.astype('int64')
+        assert np.allclose(cid, cid_float), f'theta={theta[is_mcid]} cid={cid} cid_float={cid_float}'
+        mcid[is_mcid] = cid
+    return mcid
+
+
+def _shell_arrays(ints: np.ndarray, floats: np.ndarray, nnodes: int,
+                  theta: np.ndarray, mcid: np.ndarray, zoffset: np.ndarray,
+                  tflag: np.ndarray, thickness: np.ndarray) -> dict[str, np.ndarray]:
+    """packs the shell arrays"""
+    return {
+        'eid': ints[:, 0].copy(),
+        'pid': ints[:, 1].copy(),
+        'nodes': ints[:, 2:2+nnodes].copy(),
+        'theta': np.where(mcid == -1, theta, 0.).astype(floats.dtype),
+        'mcid': mcid,
+        'zoffset': zoffset.copy(),
+        'tflag': tflag.copy(),
+        'thickness': thickness.copy(),
+    }
+
+
+def decode_cquad4_nx_56(op2: OP2Geom, card_name: str, data: bytes,
+                        n: int) -> tuple[int, dict[str, np.ndarray]]:
+    """
+    Decodes the 14 word CQUAD4/CQUADR record
+
+    (eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag, t1, t2, t3, t4)
+    """
+    ints, floats = _get_rows(op2, data, n, 14)
+    if op2.is_debug_file:
+        _write_debug_rows(op2, card_name, ints, floats, [6, 7, 10, 11, 12, 13])
+    theta = floats[:, 6]
+    arrays = _shell_arrays(ints, floats, 4, theta, _theta_to_mcid(theta),
+                           floats[:, 7], ints[:, 9], floats[:, 10:14])
+    return len(data), arrays
+
+
+def decode_cquad4_msc_60(op2: OP2Geom, card_name: str, data: bytes,
+                         n: int) -> tuple[int, dict[str, np.ndarray]]:
+    """
+    Decodes the 15 word (MSC 2018.2) CQUAD4/CQUADR record
+
+    (eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag, t1, t2, t3, t4, minus1_mcid)
+    """
+    ints, floats = _get_rows(op2, data, n, 15)
+    if op2.is_debug_file:
+        _write_debug_rows(op2, card_name, ints, floats, [6, 7, 8, 10, 11, 12, 13])
+    theta = floats[:, 6]
+    zoffset = floats[:, 7]
+    tflag = ints[:, 9]
+    mcid = ints[:, 14].astype('int64')
+    assert np.all(floats[:, 8] == 0.), floats[:, 8]
+    assert np.all(zoffset == 0.), zoffset
+    assert np.all(tflag == 0), tflag
+
+    is_mcid = mcid != -1
+    assert np.all(theta[is_mcid] == 0.), theta[is_mcid]
+    cids = list(op2.coords.keys())
+    if len(cids) and max(cids) > 0:
+        is_cid = np.isin(mcid[is_mcid], cids)
+        assert is_cid.all(), mcid[is_mcid][~is_cid]
+    arrays = _shell_arrays(ints, floats, 4, theta, mcid,
+                           zoffset, tflag, floats[:, 10:14])
+    return len(data), arrays
+
+
+def decode_ctria3_52(op2: OP2Geom, card_name: str, data: bytes,
+                     n: int) -> tuple[int, dict[str, np.ndarray]]:
+    """
+    Decodes the 13 word CTRIA3 record
+
+    (eid, pid, n1, n2, n3, theta, zoffs, blank1, blank2, tflag, t1, t2, t3)
+    """
+    ints, floats = _get_rows(op2, data, n, 13)
+    if op2.is_debug_file:
+        _write_debug_rows(op2, card_name, ints, floats, [5, 6, 10, 11, 12])
+    theta = floats[:, 5]
+    arrays = _shell_arrays(ints, floats, 3, theta, _theta_to_mcid(theta),
+                           floats[:, 6], ints[:, 9], floats[:, 10:13])
+    return len(data), arrays
+
+
+def decode_solids(op2: OP2Geom, card_name: str, data: bytes,
+                  n: int) -> tuple[int, dict[str, np.ndarray]]:
+    """
+    Decodes the CTETRA/CPENTA/CHEXA record
+
+    (eid, pid, n1, ..., n10/n15/n20)
+    """
+    nwords = SOLID_CLASSES[card_name][0]
+    ints, floats = _get_rows(op2, data, n, nwords)
+    if op2.is_debug_file:
+        _write_debug_rows(op2, card_name, ints, floats, [])
+    arrays = {
+        'eid': ints[:, 0].copy(),
+        'pid': ints[:, 1].copy(),
+        'nodes': ints[:, 2:].copy(),
+    }
+    return len(data), arrays
+
+
+def grids_from_arrays(arrays: dict[str, np.ndarray]) -> dict[int, GRID]:
+    """creates the GRIDs from the GRID arrays"""
+    grids = {}
+    ints = np.column_stack([arrays['nid'], arrays['cp'], arrays['cd'],
+                            arrays['ps'], arrays['seid']]).tolist()
+    for (nid, cp, cd, ps, seid), xyz in zip(ints, arrays['xyz']):
+        if ps == 0:
+            ps = ''
+        grids[nid] = GRID(nid, xyz.copy(), cp, cd, ps, seid)
+    return grids
+
+
+def shells_from_arrays(card_name: str, arrays: dict[str, np.ndarray]) -> list[Any]:
+    """creates the CQUAD4/CQUADR/CTRIA3s from the shell arrays"""
+    card_class = SHELL_CLASSES[card_name]
+    elements = []
+    rows = zip(
+        arrays['eid'].tolist(), arrays['pid'].tolist(), arrays['nodes'].tolist(),
+        arrays['theta'].tolist(), arrays['mcid'].tolist(), arrays['zoffset'].tolist(),
+        arrays['tflag'].tolist(), arrays['thickness'].tolist())
+    for eid, pid, nodes, theta, mcid, zoffset, tflag, thickness in rows:
+        theta_mcid = theta if mcid == -1 else mcid
+        data_init = [eid, pid] + nodes + [theta_mcid, zoffset, tflag] + thickness
+        elements.append(card_class.add_op2_data(data_init))
+    return elements
+
+
+def solids_from_arrays(card_name: str, arrays: dict[str, np.ndarray]) -> list[Any]:
+    """
+    creates the CTETRA/CPENTA/CHEXAs from the solid arrays
+
+    The linear element (e.g., CHEXA8) is used when the midside nodes are 0.
+    """
+    unused_nwords, ncorners, linear_class, quadratic_class = SOLID_CLASSES[card_name]
+    nodes = arrays['nodes']
+    is_quadratic = (nodes[:, ncorners:].sum(axis=1) > 0).tolist()
+    eid_pid = np.column_stack([arrays['eid'], arrays['pid']]).tolist()
+    elements = []
+    for (eid, pid), nids, is_quadratici in zip(eid_pid, nodes.tolist(), is_quadratic):
+        if is_quadratici:
+            elem = quadratic_class.add_op2_data([eid, pid] + nids)
+        else:
+            elem = linear_class.add_op2_data([eid, pid] + nids[:ncorners])
+        elements.append(elem)
+    return elements
+
+
+def elements_from_arrays(card_name: str, arrays: dict[str, np.ndarray]) -> list[Any]:
+    """creates the element objects from the element arrays"""
+    if card_name in SHELL_CLASSES:
+        return shells_from_arrays(card_name, arrays)
+    return solids_from_arrays(card_name, arrays)
+
+
+def add_geom_arrays(op2: OP2Geom, card_name: str, arrays: dict[str, np.ndarray]) -> None:
+    """
+    Stores the arrays of a card in ``op2.geom_arrays``; the arrays of a
+    repeated record (e.g., a superelement) are appended
+
+    The repeated ids are removed like the object path, which keeps the
+    last GRID (``op2.nodes[nid] = grid``) and the first element
+    (``add_op2_element``).
+    """
+    id_name = 'nid' if card_name == 'GRID' else 'eid'
+    if card_name in op2.geom_arrays:
+        arrays0 = op2.geom_arrays[card_name]
+        arrays = {key: np.concatenate([arrays0[key], value]) for key, value in arrays.items()}
+        ids = arrays[id_name]
+        if card_name == 'GRID':
+            unused_ids, ireversed = np.unique(ids[::-1], return_index=True)
+            irows = len(ids) - 1 - ireversed
+        else:
+            unused_ids, irows = np.unique(ids, return_index=True)
+        if len(irows) < len(ids):
+            irows.sort()
+            arrays = {key: value[irows] for key, value in arrays.items()}
+    op2.geom_arrays[card_name] = arrays
+    op2.card_count[card_name] = len(arrays[id_name])
@@ -2,6 +2,7 @@
 import struct
 import unittest
 import numpy as np
+from pyNastran.bdf.cards.elements.solid import CHEXA8, CHEXA20
 from pyNastran.op2.op2_geom import OP2Geom
 from pyNastran.op2.tables.geom.geom4 import read_rbe3s_from_idata_fdata, ints_to_secset1s
 
@@ -247,6 +248,109 @@ class TestOP2GeomUnit(unittest.TestCase):
         op2.table_name = b'GEOM1N'
         op2.reader_geom1._read_grid(data_bytes, 12)
 
+    def test_lazy_geom(self):
+        """the GRID/CQUAD4/CTRIA3/CHEXA arrays create the same cards"""
+        grid_data = (
+            4501, 45, 1,
+            # nid, cp, x1, x2, x3, cd, ps, seid
+            1, 0, 0., 0., 0., 0, 0, 0,
+            2, 0, 1., 0., 0., 0, 123, 0,
+            3, 0, 1., 1., 0., 1, 0, 0,
+            4, 0, 0., 1., 0., 0, 0, 0,
+        )
+        grid_bytes = struct.pack(b'<3i ' + b'2i 3f 3i ' * 4, *grid_data)
+
+        # theta=1024. is mcid=1
+        cquad4_data = (
+            2958, 51, 177,
+            1, 10, 1, 2, 3, 4, 15., 0.1, 0, 0, -1.0, -1.0, -1.0, -1.0,
+            2, 10, 1, 2, 3, 4, 1024., 0., 0, 0, 0.2, 0.2, 0.2, 0.2,
+        )
+        cquad4_bytes = struct.pack(b'<3i ' + b'6i ff ii 4f ' * 2, *cquad4_data)
+        ctria3_data = (
+            5959, 59, 282,
+            3, 10, 1, 2, 3, 0., 0., 0, 0, 0, -1.0, -1.0, -1.0,
+        )
+        ctria3_bytes = struct.pack(b'<3i 5iff3i3f', *ctria3_data)
+        chexa_data = (
+            7308, 73, 253,
+            4, 20, 1, 2, 3, 4, 5, 6, 7, 8) + (0,) * 12 + (
+            5, 20) + tuple(range(1, 21))
+        chexa_bytes = struct.pack(b'<3i 44i', *chexa_data)
+
+        models = []
+        for lazy_geom in [False, True]:
+            op2 = OP2Geom(make_geom=True, debug=False, log=None, debug_file=None, mode='msc')
+            op2._endian = b'<'
+            op2.op2_reader.factor = 1
+            op2.table_name = b'GEOM1'
+            op2.lazy_geom = lazy_geom
+            op2.reader_geom1._read_grid(grid_bytes, 12)
+            op2.reader_geom2.read_cquad4(cquad4_bytes, 12)
+            op2.reader_geom2.read_ctria3(ctria3_bytes, 12)
+            op2.reader_geom2.read_chexa(chexa_bytes, 12)
+            if lazy_geom:
+                assert len(op2.nodes) == 0 and len(op2.elements) == 0
+                self.assertEqual(op2.geom_arrays['GRID']['nid'].tolist(), [1, 2, 3, 4])
+                self.assertEqual(op2.geom_arrays['CQUAD4']['mcid'].tolist(), [-1, 1])
+                self.assertEqual(op2.geom_arrays['CHEXA']['nodes'].shape, (2, 20))
+                op2.build_geom_objects()
+                assert op2.geom_arrays == {}
+            models.append(op2)
+
+        model1, model2 = models
+        self.assertEqual(model1.card_count, model2.card_count)
+        for nid, node in model1.nodes.items():
+            self.assertEqual(node.write_card(), model2.nodes[nid].write_card())
+        for eid, elem in model1.elements.items():
+            self.assertEqual(elem.write_card(), model2.elements[eid].write_card())
+        assert model1.nodes[2].ps == 123, model1.nodes[2].ps
+        assert model1.nodes[1].ps == '', model1.nodes[1].ps
+        assert model1.elements[1].theta_mcid == 15., model1.elements[1].theta_mcid
+        assert model1.elements[2].theta_mcid == 1, model1.elements[2].theta_mcid
+        assert isinstance(model1.elements[4], CHEXA8), model1.elements[4]
+        assert isinstance(model1.elements[5], CHEXA20), model1.elements[5]
+
+    def test_lazy_geom_repeated_records(self):
+        """the ids of a repeated GRID/CQUAD4 record aren't counted twice"""
+        grid_data = (
+            4501, 45, 1,
+            1, 0, 0., 0., 0., 0, 0, 0,
+            2, 0, 1., 0., 0., 0, 0, 0,
+        )
+        grid_bytes = struct.pack(b'<3i ' + b'2i 3f 3i ' * 2, *grid_data)
+        grid_bytes2 = struct.pack(b'<3i 2i 3f 3i', 4501, 45, 1, 2, 0, 5., 0., 0., 0, 0, 0)
+        cquad4_data = (
+            2958, 51, 177,
+            1, 10, 1, 2, 3, 4, 0., 0., 0, 0, -1.0, -1.0, -1.0, -1.0,
+        )
+        cquad4_bytes = struct.pack(b'<3i 6i ff ii 4f', *cquad4_data)
+
+        models = []
+        for lazy_geom in [False, True]:
+            op2 = OP2Geom(make_geom=True, debug=False, log=None, debug_file=None, mode='msc')
+            op2._endian = b'<'
+            op2.op2_reader.factor = 1
+            op2.table_name = b'GEOM1'
+            op2.lazy_geom = lazy_geom
+            for data in [grid_bytes, grid_bytes, grid_bytes2]:
+                op2.reader_geom1._read_grid(data, 12)
+            for unused_i in range(2):
+                op2.reader_geom2.read_cquad4(cquad4_bytes, 12)
+            if lazy_geom:
+                self.assertEqual(op2.geom_arrays['GRID']['nid'].tolist(), [1, 2])
+                self.assertEqual(op2.card_count['GRID'], 2)
+                self.assertEqual(op2.card_count['CQUAD4'], 1)
+                op2.build_geom_objects()
+            models.append(op2)
+
+        model1, model2 = models
+        self.assertEqual(list(model1.nodes), list(model2.nodes))
+        self.assertEqual(list(model1.elements), list(model2.elements))
+        # the last GRID is kept
+        self.assertEqual(model1.nodes[2].xyz[0], 5.)
+        self.assertEqual(model2.nodes[2].xyz[0], 5.)
+
     def test_extrn(self):
         """reads an EXTRN"""
         op2 = OP2Geom(make_geom=True, debug=False, log=None, debug_file=None, mode='msc')
@@ -605,7 +605,7 @@ class RealStrainEnergyArray(BaseElement):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         ntotali = self.num_wide
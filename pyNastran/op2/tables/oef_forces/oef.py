@@ -26,7 +26,8 @@ from pyNastran.op2.op2_interface.function_codes import func1, func7
 from pyNastran.op2.op2_interface.op2_reader import mapfmt
 from pyNastran.op2.tables.utils import get_eid_dt_from_eid_device
 from pyNastran.op2.op2_helper import polar_to_real_imag
-from pyNastran.op2.op2_interface.utils import apply_mag_phase, reshape_bytes_block_strip
+from pyNastran.op2.op2_interface.utils import (
+    apply_mag_phase, reshape_bytes_block_strip, read_sort2_record)
 from pyNastran.op2.op2_interface.msc_tables import MSC_OEF_REAL_MAPPER, MSC_OEF_IMAG_MAPPER
 from pyNastran.op2.op2_interface.nx_tables import NX_OEF_REAL_MAPPER, NX_OEF_IMAG_MAPPER
 from pyNastran.op2.op2_interface.op2_codes import SORT1_TABLES_BYTES, TABLES_BYTES
@@ -1304,6 +1305,13 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                ielement, itotal, itotal2, floats = read_sort2_record(op2, obj, data, nelements)
+                obj.element[ielement] = dt
+                #[axial, torsion]
+                obj.data[itotal:itotal2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_crod_real_3(op2, data, obj,
                                     nelements, ntotal)
@@ -1616,6 +1624,13 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                ielement, itotal, itotal2, floats = read_sort2_record(op2, obj, data, nelements)
+                obj.element[ielement] = dt
+                #(time, force)
+                obj.data[itotal:itotal2, ielement, 0] = floats[:, 1]
             else:
                 n = oef_celas_cdamp_real_2(op2, data, obj,
                                            nelements, ntotal, dt)
@@ -1829,7 +1844,13 @@ class OEF:
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
-            # elif op2.use_vector and is_vectorized and op2.sort_method == 1:
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                ielement, itotal, itotal2, floats = read_sort2_record(op2, obj, data, nelements)
+                obj.element[ielement] = dt
+                #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+                obj.data[itotal:itotal2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cbar_real_9(op2, data, obj, nelements, ntotal)
         elif result_type == 1 and op2.num_wide == 17: # imag
@@ -1967,6 +1988,13 @@ class OEF:
                 obj.data[obj.itime, ielement:ielement2, :] = floats[:, 1:].copy()
                 obj.itotal = ielement2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                ielement, itotal, itotal2, floats = read_sort2_record(op2, obj, data, nelements)
+                obj.element[ielement] = dt
+                #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+                obj.data[itotal:itotal2, ielement, :] = floats[:, 1:]
             else:
                 n = oef_cquad4_33_real_9(op2, data, obj,
                                          nelements, ntotal)
@@ -310,7 +310,7 @@ class ComplexRodForceArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #eids = self.element
@@ -969,7 +969,7 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #eids = self.element
@@ -1559,7 +1559,7 @@ class ComplexPlateForceArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -2024,7 +2024,7 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -2431,7 +2431,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -2838,7 +2838,7 @@ class ComplexCBeamForceArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         eids = self.element_node[:, 0]
@@ -3473,7 +3473,7 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         eids = self.element
@@ -3873,7 +3873,7 @@ class ComplexForceMomentArray(ComplexForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         eids = self.element
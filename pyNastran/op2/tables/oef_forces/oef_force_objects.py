@@ -769,9 +769,10 @@ class RealSpringDamperForceArray(RealForceObject):
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
         #print('dt=%s eid=%s' % (dt, eid))
         itime = self.itotal
+        ielement = self.itime
         self._times[itime] = dt
-        self.element[self.ielement] = eid
-        self.data[itime, self.ielement, :] = [force]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [force]
         self.itotal += 1
 
     def get_stats(self, short: bool=False) -> list[str]:
@@ -907,7 +908,7 @@ class RealSpringDamperForceArray(RealForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #eids = self.element
@@ -1196,9 +1197,10 @@ class RealRodForceArray(RealForceObject):
         assert self.is_sort2, self
         assert isinstance(eid, integer_types) and eid > 0, 'dt=%s eid=%s' % (dt, eid)
         itime = self.itotal
+        ielement = self.itime
         self._times[itime] = dt
-        self.element[self.ielement] = eid
-        self.data[self.itime, self.ielement, :] = [axial, torque]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [axial, torque]
         self.itotal += 1
         #if self.ielement == self.nelements:
             #self.ielement = 0
@@ -1387,7 +1389,7 @@ class RealRodForceArray(RealForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -1919,7 +1921,7 @@ class RealCBeamForceArray(RealForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         eids = self.element_node[:, 0]
@@ -2418,7 +2420,7 @@ class RealCShearForceArray(RealForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -2877,11 +2879,13 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
             ntotal = self.ntotal
             #print("SORT1: ntimes=%s nelements=%s ntotal=%s" % (ntimes, nelements, ntotal))
         else:
-            #ntimes=1 nelements=21 ntotal=105
-            ntimes = self.nelements
+            # each subtable is a single element at all the times
             nelements = self.ntimes
-            ntotal = self.ntotal # // ntimes
-            #raise RuntimeError("SORT2: ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
+            ntimes = self.nelements // nelements
+            ntotal = nelements
+            self.ntimes = ntimes
+            self.nelements = nelements
+            self.ntotal = ntotal
             #print("SORT2: ntimes=%s nelements=%s ntotal=%s" % (ntimes, nelements, ntotal))
         return ntimes, nelements, ntotal
 
@@ -2970,9 +2974,10 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         assert self.is_sort2, self
 
         itime = self.itotal
+        ielement = self.itime
         self._times[itime] = dt
-        self.element[self.itotal] = eid
-        self.data[itime, self.itotal, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [mx, my, mxy, bmx, bmy, bmxy, tx, ty]
         self.itotal += 1
         #raise NotImplementedError('SORT2')
         #if dt not in self.mx:
@@ -3168,7 +3173,7 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if 'CTRIA3' in self.element_name:
@@ -3668,7 +3673,7 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         (unused_elem_name, nnodes, unused_msg_temp) = self.get_f06_header(is_mag_phase)
@@ -3838,7 +3843,7 @@ class RealCBarFastForceArray(RealForceObject):
         else:
             ntimes = self.nelements
             nelements = self.ntimes
-            ntotal = nelements * 2
+            ntotal = nelements
             name = self.analysis_method + 's'
             self._build(ntimes, nelements, ntotal, self._times_dtype)
             setattr(self, name, self._times)
@@ -4014,7 +4019,7 @@ class RealCBarFastForceArray(RealForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -4573,7 +4578,7 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -5625,7 +5630,7 @@ class RealForceMomentArray(RealForceObject):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -27,7 +27,7 @@ import numpy as np
 from pyNastran.op2.op2_interface.op2_codes import SORT1_TABLES_BYTES, TABLES_BYTES
 from pyNastran.op2.op2_interface.utils import (
     mapfmt, mapfmt8,
-    apply_mag_phase, build_obj, reshape_bytes_block_strip
+    apply_mag_phase, build_obj, reshape_bytes_block_strip, read_sort2_record,
 )
 from pyNastran.op2.op2_helper import polar_to_real_imag
 from pyNastran.op2.op2_interface.function_codes import func1, func7
@@ -131,6 +131,11 @@ if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2 import OP2
 NX_TABLES_BYTES = [b'OESVM1', b'OESVM2']
 NASA_TABLES_BYTES = [b'OESC1']
+SORT2_OES_TABLES_BYTES = {b'OES2', b'OES2C', b'OSTR2', b'OSTR2C'}
+#: the element types with a tested real SORT2 reader (read_sort2_record)
+#:  - 1-CROD, 3-CTUBE, 10-CONROD
+#:  - 33-CQUAD4-centroidal, 74-CTRIA3-centroidal
+SORT2_OES_ELEMENT_TYPES = {1, 3, 10, 33, 74}
 
 class OP2Common2:
     def __init__(self, op2: OP2):
@@ -2150,6 +2155,13 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, 0] = floats[:, 1].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                ielement, itotal, itotal2, floats = read_sort2_record(op2, obj, data, nelements)
+                obj.element[ielement] = dt
+                #(time, stress)
+                obj.data[itotal:itotal2, ielement, 0] = floats[:, 1]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     log.debug('vectorize CELASx real SORT%s' % op2.sort_method)
@@ -2225,6 +2237,7 @@ class OES(OP2Common2):
         else:  # pragma: no cover
             raise ValueError(op2.code_information())
 
+        prefix = self._get_sort2_prefix(prefix, postfix)
         if op2.is_stress:
             obj_vector_real = RealRodStressArray
             obj_vector_complex = ComplexRodStressArray
@@ -2267,6 +2280,13 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, :] = floats[:, 1:].copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and op2.sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                ielement, itotal, itotal2, floats = read_sort2_record(op2, obj, data, nelements)
+                obj.element[ielement] = dt
+                #[axial, torsion, SMa, SMt]
+                obj.data[itotal:itotal2, ielement, :] = floats[:, 1:]
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug('vectorize CROD real SORT%s' % op2.sort_method)
@@ -4773,6 +4793,7 @@ class OES(OP2Common2):
         else:  # pragma: no cover
             raise NotImplementedError(op2.code_information())
 
+        prefix = self._get_sort2_prefix(prefix, postfix)
         if op2.is_stress:
             obj_vector_real = RealPlateStressArray
             obj_vector_complex = ComplexPlateStressArray
@@ -4825,6 +4846,10 @@ class OES(OP2Common2):
                 obj.data[obj.itime, itotal:itotal2, :] = floats1.copy()
                 obj.itotal = itotal2
                 obj.ielement = ielement2
+            elif op2.use_vector and is_vectorized and sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                self._oes_plate_real_17_sort2(obj, data, nelements, dt)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize centroidal quad: {op2.element_name}-{op2.element_type} real '
@@ -5159,6 +5184,7 @@ class OES(OP2Common2):
 
         #if prefix == '' and postfix == '':
             #prefix = stress_strain + '.'
+        prefix = self._get_sort2_prefix(prefix, postfix)
 
         element_base, element_name = etype_map[op2.element_type]
         # stress.ctria3_stress
@@ -5226,6 +5252,10 @@ class OES(OP2Common2):
                 obj._times[obj.itime] = dt
                 obj.itotal += nlayers
                 n = nbytes
+            elif op2.use_vector and is_vectorized and sort_method == 2:
+                # nelements is the number of times
+                n = nelements * ntotal
+                self._oes_plate_real_17_sort2(obj, data, nelements, dt)
             else:
                 if is_vectorized and op2.use_vector:  # pragma: no cover
                     op2.log.debug(f'vectorize centroidal tri: {element_name_type} real SORT{sort_method}')
@@ -8127,6 +8157,36 @@ class OES(OP2Common2):
             assert eids.min() > 0, eids.min()
             obj.element[ielement:ielement2] = eids
 
+    def _get_sort2_prefix(self, prefix: str, postfix: str) -> str:
+        """
+        The OES2/OSTR2 tables don't have a prefix, so most of the SORT2
+        results aren't saved.  The real, transient SORT2 element types
+        with a tested reader (SORT2_OES_ELEMENT_TYPES) are saved.  Static
+        SORT2 results aren't supported because the element id is in the
+        time slot.
+        """
+        op2 = self.op2
+        if (prefix == '' and postfix == '' and
+                op2.table_name in SORT2_OES_TABLES_BYTES and
+                op2.element_type in SORT2_OES_ELEMENT_TYPES and
+                op2.result_type == 0 and op2.analysis_code != 1):
+            prefix = 'stress.' if op2.is_stress else 'strain.'
+        return prefix
+
+    def _oes_plate_real_17_sort2(self, obj, data: bytes, ntimes: int, eid: int) -> None:
+        """
+        Reads a SORT2 CQUAD4-33/CTRIA3 record (one element at all the times)
+
+        The upper/lower layers of element ielement are in rows
+        2*ielement and 2*ielement+1.
+        """
+        ielement, itotal, itotal2, floats = read_sort2_record(self.op2, obj, data, ntimes)
+        ilayer = 2 * ielement
+        obj.element_node[ilayer:ilayer+2, 0] = eid
+        #fd, sx, sy, txy, angle, major, minor, max_shear
+        obj.data[itotal:itotal2, ilayer, :] = floats[:, 1:9]
+        obj.data[itotal:itotal2, ilayer+1, :] = floats[:, 9:]
+
 def oes_cgapnl_real_11(op2: OP2, data: bytes,
                        obj: NonlinearGapStressArray,
                        nelements: int, ntotal: int) -> int:
@@ -511,7 +511,7 @@ class RealCompositePlateStrengthRatioArray(OES_Object):
     #    op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
     #
     #    if itable == -1:
-    #        self._write_table_header(op2_file, op2_ascii, date)
+    #        self._write_table_header(op2_file, op2_ascii, date, endian=endian)
     #        itable = -3
     #
     #    #print("nnodes_all =", nnodes_all)
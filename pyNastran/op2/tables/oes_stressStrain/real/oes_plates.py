@@ -13,7 +13,9 @@ from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     oes_real_data_code, get_scode,
     set_static_case, set_modal_case, set_transient_case)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
-from pyNastran.f06.f06_formatting import write_floats_13e, write_floats_13e_long, _eigenvalue_header
+from pyNastran.f06.f06_formatting import (
+    write_floats_13e_long, write_floats_13e_array, write_rows,
+    _eigenvalue_header)
 from pyNastran.op2.errors import SixtyFourBitError
 
 NUM_WIDE_CENTROID = 17
@@ -446,8 +448,9 @@ class RealPlateArray(OES_Object):
         # the monotonic element index (no duplicates)
         ielement = self.itime
 
-        # itime = self.itime
-        itime = self.ielement
+        # the upper/lower layers of a node at all the times are in
+        # a record, so itotal counts the layers read for the element
+        itime = (self.itotal // 2) % ntimes
         #ie_upper = self.ielement
         #ie_lower = self.ielement + 1
         #itotal = self.itotal
@@ -522,10 +525,10 @@ class RealPlateArray(OES_Object):
             print(f'SORT2: itime={itime} -> dt={dt};   ie_upper={ie_upper} -> eid={eid} ({self.element_name})')
             raise
         #print(self.element_node)
-        #self.data[self.itime, ie_upper, :] = [fiber_dist1, oxx1, oyy1, txy1, angle1,
-                                              #major_principal1, minor_principal1, ovm1]
-        #self.data[self.itime, ie_lower, :] = [fiber_dist2, oxx2, oyy2, txy2, angle2,
-                                              #major_principal2, minor_principal2, ovm2]
+        self.data[itime, ie_upper, :] = [fiber_dist1, oxx1, oyy1, txy1, angle1,
+                                         major_principal1, minor_principal1, ovm1]
+        self.data[itime, ie_lower, :] = [fiber_dist2, oxx2, oyy2, txy2, angle2,
+                                         major_principal2, minor_principal2, ovm2]
         self.itotal += 2
         #self.ielement += 1
 
@@ -706,6 +709,8 @@ class RealPlateArray(OES_Object):
 
         #cen_word = 'CEN/%i' % nnodes
         cen_word = cen
+        row_fmts, col0, col1 = _get_plate_f06_rows(self, eids, nids, cen_word)
+        nrows = len(eids)
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -714,46 +719,13 @@ class RealPlateArray(OES_Object):
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
 
             #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            major_principal = self.data[itime, :, 5]
-            minor_principal = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
-
-            is_linear = self.element_type in {33, 74, 227, 228, 83}
-            is_bilinear = self.element_type in {64, 70, 75, 82, 144}
-            for (i, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e(
-                    [fdi, oxxi, oyyi, txyi, major, minor, ovmi])
-                ilayer = i % 2
-                # tria3
-                if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
-                    if ilayer == 0:
-                        f06_file.write('0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:
-                        f06_file.write('   %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-
-                elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        f06_file.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        f06_file.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        f06_file.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                else:  # pragma: no cover
-                    msg = 'element_name=%s self.element_type=%s' % (
-                        self.element_name, self.element_type)
-                    raise NotImplementedError(msg)
+            data = self.data[itime, :, :]
+            fiber_dist, oxx, oyy, txy = write_floats_13e_array(data[:, :4]).reshape(nrows, 4).T
+            major_principal, minor_principal, ovm = write_floats_13e_array(data[:, 5:]).reshape(nrows, 3).T
+            angle = data[:, 4]
+            f06_file.write(write_rows(
+                row_fmts, [col0, col1, fiber_dist, oxx, oyy, txy, angle,
+                           major_principal, minor_principal, ovm], nrows))
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
@@ -801,7 +773,7 @@ class RealPlateArray(OES_Object):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         nnodes, is_bilinear = self.get_nnodes_bilinear()
@@ -966,6 +938,46 @@ class RealPlateStrainArray(RealPlateArray, StrainObject):
         return headers
 
 
+def _get_plate_f06_rows(self, eids: np.ndarray, nids: np.ndarray,
+                        cen_word: str) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the per-row formats and the leading (eid, nid) columns for
+    the plate f06 table.  These only depend on the layer and the node,
+    so they're built once and reused for every time step.
+    """
+    nrows = len(eids)
+    ilayer = np.arange(nrows) % 2
+    is_linear = self.element_type in {33, 74, 227, 228, 83}
+    is_bilinear = self.element_type in {64, 70, 75, 82, 144}
+    blank = np.full(nrows, '', dtype='object')
+    if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
+        # '%.0s' consumes the unused node id column
+        data_fmt = '   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n'
+        fmts = np.array([
+            '0  %6i%.0s' + data_fmt,
+            '   %6s%.0s' + data_fmt,
+        ], dtype='object')
+        irow = ilayer
+        col0 = np.where(ilayer == 0, eids.astype('object'), blank)
+        col1 = blank
+    elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
+        data_fmt = '  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n'
+        fmts = np.array([
+            '0  %8i %8s' + data_fmt,  # CEN
+            '   %8s %8i' + data_fmt,  # corner
+            '   %8s %8s' + data_fmt + '\n',  # layer 2
+        ], dtype='object')
+        is_cen = (nids == 0) & (ilayer == 0)
+        irow = np.where(ilayer == 1, 2, np.where(is_cen, 0, 1))
+        col0 = np.where(irow == 0, eids.astype('object'), blank)
+        col1 = np.where(irow == 0, cen_word, np.where(irow == 1, nids.astype('object'), blank))
+    else:  # pragma: no cover
+        msg = 'element_name=%s self.element_type=%s' % (
+            self.element_name, self.element_type)
+        raise NotImplementedError(msg)
+    return fmts[irow], col0, col1
+
+
 def _get_plate_msg(self):
     von_mises = 'VON MISES' if self.is_von_mises else 'MAX SHEAR'
 
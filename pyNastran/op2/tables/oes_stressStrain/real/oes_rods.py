@@ -2,7 +2,7 @@ from typing import TextIO
 import numpy as np
 from numpy import zeros, searchsorted, allclose
 
-from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.result_objects.op2_objects import get_times_dtype, get_sort_element_sizes
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object, oes_real_data_code,
     set_element_case, set_static_case, set_modal_case,
@@ -157,8 +157,9 @@ class RealRodArray(OES_Object):
         #self.nelements = 0
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
+        ntimes, nelements, unused_ntotal = get_sort_element_sizes(self)
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size, self.analysis_fmt)
-        self.build_data(self.ntimes, self.nelements, dtype, idtype, fdtype)
+        self.build_data(ntimes, nelements, dtype, idtype, fdtype)
 
     def build_data(self, ntimes, nelements, dtype, idtype, fdtype):
         """actually performs the build step"""
@@ -256,6 +257,15 @@ class RealRodArray(OES_Object):
         self.data[self.itime, self.ielement, :] = [axial, SMa, torsion, SMt]
         self.ielement += 1
 
+    def add_sort2(self, dt, eid, axial, SMa, torsion, SMt):
+        assert self.sort_method == 2, self
+        itime = self.itotal
+        ielement = self.itime
+        self._times[itime] = dt
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [axial, SMa, torsion, SMt]
+        self.itotal += 1
+
     def get_stats(self, short: bool=False) -> list[str]:
         if not self.is_built:
             return [
@@ -409,7 +419,7 @@ class RealRodArray(OES_Object):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
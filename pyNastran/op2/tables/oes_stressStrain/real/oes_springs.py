@@ -344,11 +344,11 @@ class RealSpringArray(OES_Object):
     def add_sort2(self, dt, eid, stress):
         assert self.is_sort2, self
         itime = self.itotal
+        ielement = self.itime
         self._times[itime] = dt
-        #if self.itime == 0:
         #print('itime=%s eid=%s' % (self.itime, eid))
-        self.element[self.ielement] = eid
-        self.data[itime, self.ielement, :] = [stress]
+        self.element[ielement] = eid
+        self.data[itime, ielement, :] = [stress]
         self.itotal += 1
 
     def get_stats(self, short: bool=False) -> list[str]:
@@ -496,7 +496,7 @@ class RealSpringArray(OES_Object):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #eids = self.element
@@ -1425,7 +1425,7 @@ class RealGridPointForcesArray(GridPointForces):
 
         if itable == -1:
             self._write_table_header(op2_file, op2_ascii, date, subtable_name_default=b'OGPFB1  ',
-                                     include_date=False)
+                                     include_date=False, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -2056,7 +2056,7 @@ class ComplexGridPointForcesArray(GridPointForces):
         op2_ascii.write(f'{self.__class__.__name__}.write_op2: {call_frame[1][3]}\n')
 
         if itable == -1:
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         # table 4 info
@@ -332,7 +332,7 @@ class GridPointSurfaceArray(ScalarObject):
 
         if itable == -1:
             #print('***************', itable)
-            self._write_table_header(op2_file, op2_ascii, date)
+            self._write_table_header(op2_file, op2_ascii, date, endian=endian)
             itable = -3
 
         #if isinstance(self.nonlinear_factor, float):
@@ -0,0 +1,112 @@
+"""
+compares the read time of the geometry of an OP2 with the card objects
+and with the arrays (``read_op2_geom(..., lazy_geom=True)``)
+
+By default, a block of CHEXA8s with a skin of CQUAD4s is written to a
+geometry OP2.  The nodes/elements from both reads are checked to be the
+same.
+
+Usage
+-----
+python benchmark_op2_geom.py [--nx NX] [op2_filename ...]
+"""
+from __future__ import annotations
+import os
+import gc
+import time
+import argparse
+import tempfile
+from typing import Any
+
+from cpylog import SimpleLogger
+
+from pyNastran.bdf.bdf import read_bdf
+from pyNastran.bdf.test.benchmark_bdf_compact_storage import write_block_bdf
+from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom, bdf_to_op2_geom
+
+
+def write_block_op2(op2_filename: str, nx: int) -> None:
+    """writes an nx by nx by nx block of CHEXA8s to a geometry OP2"""
+    log = SimpleLogger(level='error')
+    bdf_filename = os.path.splitext(op2_filename)[0] + '.bdf'
+    write_block_bdf(bdf_filename, nx)
+    model = read_bdf(bdf_filename, xref=False, validate=False, punch=True, log=log)
+    bdf_to_op2_geom(model).write_op2(op2_filename)
+
+
+def _read(op2_filename: str, lazy_geom: bool) -> tuple[float, float, OP2Geom]:
+    """
+    Reads the geometry
+
+    Returns
+    -------
+    read_time : float
+        the read time (sec)
+    build_time : float
+        the time (sec) to create the card objects with
+        ``build_geom_objects`` (0. if lazy_geom=False)
+    model : OP2Geom
+        the model
+    """
+    gc.collect()
+    t0 = time.perf_counter()
+    model = read_op2_geom(op2_filename, xref=False, build_dataframe=False,
+                          debug=None, log=SimpleLogger(level='error'),
+                          lazy_geom=lazy_geom)
+    t1 = time.perf_counter()
+    if lazy_geom:
+        model.build_geom_objects()
+    return t1 - t0, time.perf_counter() - t1, model
+
+
+def _summarize(model: OP2Geom) -> tuple[Any, ...]:
+    """gets the summary of a model that should be the same"""
+    nid = max(model.nodes)
+    eid = max(model.elements)
+    return (len(model.nodes), len(model.elements),
+            model.nodes[nid].write_card(), model.elements[eid].write_card())
+
+
+def run_benchmark(op2_filenames: list[str]) -> list[tuple[str, dict[str, float]]]:
+    """
+    Reads the geometry of each OP2 with the card objects and the arrays
+
+    Returns
+    -------
+    results : list[(op2_filename, times)]
+        times is {'objects': sec, 'arrays': sec, 'arrays+build': sec}
+    """
+    results = []
+    print(f'{"filename":<40s} {"nnodes":>8s} {"nelements":>9s} {"objects (s)":>11s} '
+          f'{"arrays (s)":>10s} {"arrays+build (s)":>16s}')
+    for op2_filename in op2_filenames:
+        dt_objects, unused_dt, model1 = _read(op2_filename, False)
+        dt_arrays, dt_build, model2 = _read(op2_filename, True)
+        summary = _summarize(model1)
+        assert summary == _summarize(model2), (summary, _summarize(model2))
+        times = {'objects': dt_objects, 'arrays': dt_arrays,
+                 'arrays+build': dt_arrays + dt_build}
+        results.append((op2_filename, times))
+        print(f'{os.path.basename(op2_filename)[-40:]:<40s} {summary[0]:8d} {summary[1]:9d} '
+              f'{dt_objects:11.3f} {dt_arrays:10.3f} {dt_arrays + dt_build:16.3f}')
+    return results
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('op2_filenames', nargs='*',
+                        help='the geometry OP2s (default=a block of CHEXA8s)')
+    parser.add_argument('--nx', type=int, default=40,
+                        help='the number of elements along a side of the block (default=40)')
+    args = parser.parse_args()
+    if args.op2_filenames:
+        run_benchmark(args.op2_filenames)
+        return
+    with tempfile.TemporaryDirectory() as dirname:
+        op2_filename = os.path.join(dirname, f'block_{args.nx}.op2')
+        write_block_op2(op2_filename, args.nx)
+        run_benchmark([op2_filename])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
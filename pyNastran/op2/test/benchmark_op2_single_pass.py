@@ -0,0 +1,101 @@
+"""
+compares the wall time and peak memory of the two pass and single pass
+OP2 readers
+
+Each read is run in a separate process, so the peak memory (max RSS) of
+the reads are independent.  The peak memory is only supported on Linux/Mac.
+
+Usage
+-----
+python benchmark_op2_single_pass.py [folder_or_op2_filename ...]
+"""
+import os
+import sys
+import glob
+import json
+import subprocess
+from typing import Any
+
+import pyNastran
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
+
+_READ_SCRIPT = """
+import sys, json, time
+try:
+    import resource
+except ImportError:  # windows
+    resource = None
+from pyNastran.op2.op2 import read_op2
+op2_filename, single_pass = sys.argv[1], sys.argv[2] == '1'
+t0 = time.perf_counter()
+read_op2(op2_filename, build_dataframe=False, debug=None, log=None,
+         single_pass=single_pass)
+dt = time.perf_counter() - t0
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+if sys.platform == 'darwin':
+    maxrss //= 1024  # bytes -> KB
+print(json.dumps({'time': dt, 'maxrss_kb': maxrss}))
+"""
+
+
+def _read_in_subprocess(op2_filename: str, single_pass: bool) -> dict[str, Any]:
+    """reads an OP2 in a new process and returns the time/peak memory"""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([os.path.dirname(PKG_PATH), env.get('PYTHONPATH', '')])
+    out = subprocess.run(
+        [sys.executable, '-c', _READ_SCRIPT, op2_filename, str(int(single_pass))],
+        env=env, capture_output=True, text=True)
+    if out.returncode != 0:
+        return {}
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def run_benchmark(op2_filenames: list[str]) -> list[tuple[str, dict, dict]]:
+    """
+    Reads each OP2 with both readers
+
+    Returns
+    -------
+    results : list[(op2_filename, two_pass, single_pass)]
+        two_pass/single_pass are {'time': seconds, 'maxrss_kb': KB}
+        and are empty if the read failed
+    """
+    results = []
+    print(f'{"filename":<60s} {"2-pass (s)":>10s} {"1-pass (s)":>10s} '
+          f'{"2-pass (MB)":>11s} {"1-pass (MB)":>11s}')
+    total2 = total1 = 0.
+    for op2_filename in op2_filenames:
+        two_pass = _read_in_subprocess(op2_filename, single_pass=False)
+        single_pass = _read_in_subprocess(op2_filename, single_pass=True)
+        results.append((op2_filename, two_pass, single_pass))
+        if not two_pass or not single_pass:
+            continue
+        total2 += two_pass['time']
+        total1 += single_pass['time']
+        print(f'{os.path.relpath(op2_filename)[-60:]:<60s} '
+              f'{two_pass["time"]:10.3f} {single_pass["time"]:10.3f} '
+              f'{two_pass["maxrss_kb"] / 1024:11.1f} {single_pass["maxrss_kb"] / 1024:11.1f}')
+    print(f'{"total":<60s} {total2:10.3f} {total1:10.3f}')
+    return results
+
+
+def get_op2_filenames(paths: list[str]) -> list[str]:
+    """gets the OP2 files in a series of folders/files"""
+    op2_filenames = []
+    for path in paths:
+        if os.path.isdir(path):
+            op2_filenames.extend(sorted(glob.glob(
+                os.path.join(path, '**', '*.op2'), recursive=True)))
+        else:
+            op2_filenames.append(path)
+    return op2_filenames
+
+
+def main():  # pragma: no cover
+    paths = sys.argv[1:] if len(sys.argv) > 1 else [MODEL_PATH]
+    run_benchmark(get_op2_filenames(paths))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
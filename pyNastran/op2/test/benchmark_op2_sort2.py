@@ -0,0 +1,118 @@
+"""
+compares the read throughput of the SORT1 and SORT2 versions of the same
+transient element results
+
+The SORT2 tables are written from the SORT1 results of an OP2 (the OP2
+writer only supports SORT1), so both files contain the same data.  The
+number of time steps may be scaled up (--ntimes) by tiling the results.
+
+Usage
+-----
+python benchmark_op2_sort2.py [op2_filename] [--ntimes NTIMES] [--nrepeat NREPEAT]
+"""
+from __future__ import annotations
+import os
+import time
+import argparse
+from typing import Any
+
+import numpy as np
+
+import pyNastran
+from pyNastran.op2.op2 import OP2, read_op2
+from pyNastran.op2.test.utils import (
+    write_sort2_op2, get_result_names, SORT2_RESULT_NAMES)
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
+
+#: the default real element results that are benchmarked
+RESULT_NAMES = SORT2_RESULT_NAMES
+
+
+def _tile_times(model: OP2, result_names: list[str], ntimes: int) -> None:
+    """scales the number of time steps of the results"""
+    for result_name in result_names:
+        for obj in model.get_result(result_name).values():
+            nrepeat = -(-ntimes // obj.data.shape[0])
+            obj.data = np.tile(obj.data, (nrepeat, 1, 1))[:ntimes]
+            dt = obj._times[1] - obj._times[0] if len(obj._times) > 1 else 1.
+            obj._times = (np.arange(ntimes) * dt).astype(obj._times.dtype)
+            setattr(obj, obj.data_names[0] + 's', obj._times)
+            obj.ntimes = ntimes
+
+
+def _time_read(op2_filename: str, result_names: list[str],
+               use_vector: bool, nrepeat: int) -> float:
+    """the fastest of nrepeat reads"""
+    times = []
+    for unused_i in range(nrepeat):
+        model = OP2(debug=None, log=None)
+        model.use_vector = use_vector
+        model.include_exclude_results(include_results=result_names)
+        t0 = time.perf_counter()
+        model.read_op2(op2_filename, build_dataframe=False)
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def run_benchmark(op2_filename: str, ntimes: int=0, nrepeat: int=3,
+                  result_names: list[str]=None) -> dict[str, Any]:
+    """
+    Writes the SORT1 and SORT2 versions of the results and reads them with
+    the vectorized and unvectorized readers
+
+    Returns
+    -------
+    results : dict[str, float]
+        the read times (sec) and throughputs (MB/s) for
+        sort1/sort2 and vector/scalar
+    """
+    if result_names is None:
+        result_names = RESULT_NAMES
+    model = read_op2(op2_filename, build_dataframe=False, debug=None, log=None,
+                     include_results=result_names)
+    base = os.path.splitext(op2_filename)[0]
+    sort1_filename = base + '.sort1_benchmark.op2'
+    sort2_filename = base + '.sort2_benchmark.op2'
+
+    result_names = get_result_names(model, result_names)
+    if ntimes:
+        _tile_times(model, result_names, ntimes)
+    write_sort2_op2(model, sort2_filename, result_names)
+    nbytes = sum(obj.data.nbytes
+                 for result_name in result_names
+                 for obj in model.get_result(result_name).values())
+    model.write_op2(sort1_filename, post=-1, endian=b'<', skips=None)
+
+    results = {'nbytes': nbytes}
+    print(f'{op2_filename}: {len(result_names)} results; {nbytes / 1024**2:.1f} MB')
+    print(f'{"":<8s} {"vector (s)":>10s} {"MB/s":>8s} {"scalar (s)":>10s} {"MB/s":>8s}')
+    for sort_name, filename in [('sort1', sort1_filename), ('sort2', sort2_filename)]:
+        msg = f'{sort_name:<8s}'
+        for read_name, use_vector in [('vector', True), ('scalar', False)]:
+            dt = _time_read(filename, result_names, use_vector, nrepeat)
+            throughput = nbytes / 1024**2 / dt
+            results[f'{sort_name}_{read_name}'] = dt
+            results[f'{sort_name}_{read_name}_mb_per_sec'] = throughput
+            msg += f' {dt:10.3f} {throughput:8.1f}'
+        print(msg)
+    os.remove(sort1_filename)
+    os.remove(sort2_filename)
+    return results
+
+
+def main():  # pragma: no cover
+    parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    parser.add_argument('op2_filename', nargs='?',
+                        default=os.path.join(MODEL_PATH, 'elements', 'time_elements.op2'))
+    parser.add_argument('--ntimes', type=int, default=2000,
+                        help='the number of time steps (default=2000)')
+    parser.add_argument('--nrepeat', type=int, default=3,
+                        help='the number of reads (default=3)')
+    args = parser.parse_args()
+    run_benchmark(args.op2_filename, ntimes=args.ntimes, nrepeat=args.nrepeat)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
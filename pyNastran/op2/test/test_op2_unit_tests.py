@@ -1,5 +1,7 @@
 """various OP2 tests"""
 import os
+import io
+import pickle
 import unittest
 from pathlib import Path
 
@@ -28,8 +30,15 @@ import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf, CORD2R
 from pyNastran.op2.op2 import OP2, read_op2, FatalError, FortranMarkerError
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
+from pyNastran.op2.op2_interface.mmap_file import MmapFile, open_mmap
+from pyNastran.op2.op2_interface.op2_index import OP2Index, build_op2_index
+from pyNastran.op2.op2_interface import op2_parallel
+from pyNastran.op2.op2_interface.op2_parallel import get_work_units, SharedArray
+from pyNastran.op2.op2_interface.op2_stream import get_envelopes
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 from pyNastran.op2.test.test_op2 import run_op2, main as test_op2
+from pyNastran.op2.test.utils import (
+    write_sort2_op2, get_result_names, SORT2_RESULT_NAMES)
 
 from pyNastran.bdf.test.test_bdf_unit_tests import Tester
 from pyNastran.bdf.cards.test.utils import save_load_deck
@@ -201,6 +210,249 @@ class TestOP2Unit(Tester):
         assert len(model.spcadds) == 2, model.spcadds
         assert len(model.mpcadds) == 2, model.mpcadds
 
+    def test_op2_single_pass(self):
+        """tests the single pass reader matches the two pass reader"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2',
+            MODEL_PATH / 'sol_101_elements' / 'freq_solid_shell_bar.op2',
+            MODEL_PATH / 'random' / 'random_test_bar_plus_tri.op2',  # SORT2
+        ]
+        for op2_filename in op2_filenames:
+            model1 = read_op2(op2_filename, build_dataframe=False, log=log)
+            model2 = read_op2(op2_filename, build_dataframe=False, log=log,
+                              single_pass=True)
+            assert model1.get_op2_stats() == model2.get_op2_stats()
+            model1.assert_op2_equal(model2, stop_on_failure=True, debug=False)
+
+            # the arrays are trimmed to the final size
+            for result in model2.displacements.values():
+                assert result.data.shape[0] == result.ntimes, result.data.shape
+                assert not hasattr(result, '_growth')
+
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'static_solid_shell_bar.op2'
+        model1 = read_op2_geom(op2_filename, build_dataframe=False, log=log)
+        model2 = read_op2_geom(op2_filename, build_dataframe=False, log=log,
+                               single_pass=True)
+        assert model1.card_count == model2.card_count
+        model1.assert_op2_equal(model2, stop_on_failure=True, debug=False)
+
+    def test_op2_mmap(self):
+        """tests the memory mapped reader matches the file reader"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, build_dataframe=False, log=log)
+        model2 = read_op2(op2_filename, build_dataframe=False, log=log, use_mmap=True)
+        model3 = read_op2(op2_filename, build_dataframe=False, log=log, use_mmap=True,
+                          single_pass=True)
+        model1.assert_op2_equal(model2, stop_on_failure=True, debug=False)
+        model1.assert_op2_equal(model3, stop_on_failure=True, debug=False)
+
+        with open(op2_filename, 'rb') as op2_file:
+            mmap_file = open_mmap(op2_file, log)
+            assert isinstance(mmap_file, MmapFile)
+            data = mmap_file.read(12)
+            mmap_file.seek(0)
+            view = mmap_file.read_view(12)
+            assert isinstance(view, memoryview)
+            assert data == bytes(view)
+            assert mmap_file.tell() == 12
+            del view
+            mmap_file.close()
+
+        # streams can't be mapped
+        with open(op2_filename, 'rb') as op2_file:
+            bytes_file = io.BytesIO(op2_file.read())
+        assert open_mmap(bytes_file, log) is bytes_file
+
+    def test_op2_sort2_vectorized(self):
+        """tests the vectorized SORT2 element readers match the SORT1 results"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'elements' / 'time_elements.op2'
+        sort2_filename = OP2_TEST / 'time_elements.sort2.op2'
+        model1 = read_op2(op2_filename, build_dataframe=False, log=log)
+
+        # random data, so the columns are distinct
+        result_names = get_result_names(model1, SORT2_RESULT_NAMES)
+        for result_name in result_names:
+            for obj in model1.get_result(result_name).values():
+                obj.data[:] = np.random.random(obj.data.shape)
+        write_sort2_op2(model1, sort2_filename, result_names)
+
+        _check_sort2_op2(model1, sort2_filename, result_names, log)
+
+        # a SORT2 chunk is a single element
+        envelopes = get_envelopes(OP2(log=log), sort2_filename, ['stress.crod_stress'],
+                                  chunk_size=1)
+        envelope = envelopes[('stress.crod_stress', 1)]
+        obj = model1.op2_results.stress.crod_stress[1]
+        assert np.array_equal(envelope.ids, obj.element)
+        assert np.allclose(envelope.max, obj.data.max(axis=0))
+        os.remove(sort2_filename)
+
+    def test_op2_sort2_cquad4_33(self):
+        """tests the SORT2 centroidal CQUAD4 strain matches the SORT1 results"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'other' / 'ac10901a.op2'
+        sort2_filename = OP2_TEST / 'ac10901a.sort2.op2'
+        model1 = read_op2(op2_filename, build_dataframe=False, log=log)
+        result_names = ['strain.cquad4_strain']
+        assert model1.op2_results.strain.cquad4_strain[1].element_type == 33
+        write_sort2_op2(model1, sort2_filename, result_names)
+        _check_sort2_op2(model1, sort2_filename, result_names, log)
+        os.remove(sort2_filename)
+
+    def test_op2_sort2_nastran(self):
+        """tests the SORT2 stress/strain written by Nastran match the SORT1 results"""
+        log = get_logger(level='warning')
+
+        # transient OES1 and OES2
+        op2_filename = MODEL_PATH / 'other' / 'tr1091x.op2'
+        model = read_op2(op2_filename, build_dataframe=False, log=log)
+        for result_name in ['stress.ctria3_stress', 'stress.cquad4_stress']:
+            results = model.get_result(result_name)
+            obj1 = results[(1, 6, 1, 0, 0, '', '')]
+            obj2 = results[(1, 6, 2, 0, 0, '', '')]
+            assert np.array_equal(obj1._times, obj2._times), result_name
+            assert np.array_equal(obj1.element_node, obj2.element_node), result_name
+            assert np.allclose(obj1.data, obj2.data), result_name
+
+        # the SORT2 beams/composites don't have a tested reader, so only
+        # the SORT1 results are saved
+        key1 = (1, 6, 1, 0, 0, '', '')
+        assert list(model.op2_results.stress.cbeam_stress) == [key1]
+        model = read_op2(MODEL_PATH / 'other' / 'trncomp12.op2',
+                         build_dataframe=False, log=log)
+        assert list(model.op2_results.stress.cquad8_composite_stress) == [key1]
+
+        # the static SORT2 solids are kept and the static SORT2 plates are skipped
+        op2_filename = MODEL_PATH / 'other' / 'cqrcc128a.op2'
+        f06_filename = OP2_TEST / 'cqrcc128a.test_op2.f06'
+        model = read_op2(op2_filename, build_dataframe=False, log=log)
+        chexa_stress = model.op2_results.stress.chexa_stress
+        obj1 = chexa_stress[(1, 1, 1, 0, 0, '', '')]
+        obj2 = chexa_stress[(1, 1, 2, 0, 0, '', '')]
+        assert np.allclose(obj1.data, obj2.data)
+        for obj in model.op2_results.strain.cquad8_strain.values():
+            assert obj.sort_method == 1, obj.code_information()
+        model.write_f06(f06_filename)
+        os.remove(f06_filename)
+
+    def test_op2_lazy_results(self):
+        """tests the OP2 index and loading results on demand"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        index_filename = OP2_TEST / 'transient_solid_shell_bar.op2.index'
+        if index_filename.exists():
+            os.remove(index_filename)
+
+        model1 = read_op2(op2_filename, build_dataframe=False, log=log)
+        model2 = OP2(log=log)
+        index = model2.index_op2(op2_filename, index_filename=index_filename)
+        assert index_filename.exists()
+        assert len(model2.displacements) == 0
+        assert 'displacements' in model2.lazy_results
+        assert model2.lazy_results['displacements'].keys() == [1]
+
+        disps = model2.lazy_results['displacements'][1]
+        assert list(disps) == [1], disps
+        assert disps is model2.lazy_results['displacements'][1]
+        assert disps[1] is model2.displacements[1]
+        assert len(model2.displacements) == 1
+        assert len(model2.op2_results.stress.cquad4_stress) == 0
+        model1.displacements[1].assert_equal(disps[1])
+
+        stresses = model2.lazy_results['stress.cquad4_stress'][1]
+        assert list(stresses) == [1], stresses
+        assert model1.op2_results.stress.cquad4_stress[1] == stresses[1]
+        with self.assertRaises(KeyError):
+            model2.lazy_results['displacements'][42]
+
+        # the sidecar file is reused
+        index2 = OP2Index.load(index_filename)
+        assert index2.is_valid(op2_filename)
+        assert index2.tables == index.tables
+        assert index2.subtables == index.subtables
+        model3 = OP2(log=log)
+        model3.index_op2(op2_filename, index_filename=index_filename)
+        model1.displacements[1].assert_equal(model3.lazy_results['displacements'][1][1])
+        os.remove(index_filename)
+
+    def test_op2_parallel(self):
+        """tests reading the result tables with a pool of processes"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'elements' / 'loadstep_elements.op2'
+        index = build_op2_index(OP2(log=log), op2_filename)
+        units, main_table_offsets = get_work_units(index)
+        assert len(units) > 1, units
+        assert len(main_table_offsets) > 0
+        assert [unit.n0 for unit in units] == sorted(unit.n0 for unit in units)
+
+        model1 = read_op2(op2_filename, build_dataframe=False, log=log)
+        model2 = read_op2(op2_filename, build_dataframe=False, log=log, nworkers=2)
+        assert model1.get_op2_stats() == model2.get_op2_stats()
+        model1.assert_op2_equal(model2, stop_on_failure=True, debug=False)
+        for result_name in model1.get_table_types():
+            results1 = model1.get_result(result_name)
+            if isinstance(results1, dict):
+                assert list(results1) == list(model2.get_result(result_name)), result_name
+
+        with self.assertRaises(NotImplementedError):
+            read_op2(op2_filename, build_dataframe=False, log=log, nworkers=2,
+                     single_pass=True)
+
+        # all the arrays are sent back in shared memory
+        min_shared_nbytes = op2_parallel.MIN_SHARED_NBYTES
+        op2_parallel.MIN_SHARED_NBYTES = 0
+        try:
+            model3 = read_op2(op2_filename, build_dataframe=False, log=log, nworkers=2)
+        finally:
+            op2_parallel.MIN_SHARED_NBYTES = min_shared_nbytes
+        model1.assert_op2_equal(model3, stop_on_failure=True, debug=False)
+
+        if os.name != 'nt':
+            data = np.arange(12.).reshape(3, 4)[:, :2]
+            shared_array = pickle.loads(pickle.dumps(SharedArray(data)))
+            assert np.array_equal(shared_array.load(), data)
+            with self.assertRaises(FileNotFoundError):
+                shared_array.load()
+            shared_array.unlink()
+
+    def test_op2_iter_results(self):
+        """tests streaming the results in chunks and the envelope reducer"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'sol_101_elements' / 'transient_solid_shell_bar.op2'
+        model1 = read_op2(op2_filename, build_dataframe=False, log=log)
+        result_names = ['displacements', 'stress.cquad4_stress', 'force.cbar_force']
+
+        model2 = OP2(log=log)
+        for chunk_size in [1, 4, 1000]:
+            chunks = list(model2.iter_results(op2_filename, result_names,
+                                              chunk_size=chunk_size))
+            for result_name in result_names:
+                obj = model1.get_result(result_name)[1]
+                chunksi = [chunk for chunk in chunks if chunk.result_name == result_name]
+                assert all(chunk.data.shape[0] <= chunk_size for chunk in chunksi)
+                assert len(chunksi) >= obj.data.shape[0] / chunk_size, result_name
+                assert np.array_equal(np.vstack([chunk.data for chunk in chunksi]), obj.data)
+                assert np.array_equal(np.hstack([chunk.times for chunk in chunksi]), obj._times)
+                assert len(chunksi[0].ids) == obj.data.shape[1]
+        assert len(model2.displacements) == 0
+
+        envelopes = get_envelopes(model2, op2_filename, ['stress.cquad4_stress'], chunk_size=3)
+        envelope = envelopes[('stress.cquad4_stress', 1)]
+        obj = model1.op2_results.stress.cquad4_stress[1]
+        assert np.array_equal(envelope.ids, obj.element_node)
+        assert envelope.headers == obj.get_headers()
+        assert np.array_equal(envelope.max, obj.data.max(axis=0))
+        assert np.array_equal(envelope.min, obj.data.min(axis=0))
+        itime = obj.data.argmax(axis=0)
+        assert np.array_equal(envelope.max_time, obj._times[itime])
+        iabs_max = np.abs(obj.data).argmax(axis=0)
+        abs_max = np.take_along_axis(obj.data, iabs_max[np.newaxis, :, :], axis=0)[0]
+        assert np.array_equal(envelope.abs_max, abs_max)
+        assert np.array_equal(envelope.abs_max_time, obj._times[iabs_max])
+
 
 class TestOP2Functions(unittest.TestCase):
     def test_filter1d(self):
@@ -2664,6 +2916,41 @@ class TestOP2Main(Tester):
             op2b.load_hdf5_filename(hdf5_filename, combine=True)
             op2b.print_subcase_key()
 
+    @unittest.skipIf(not IS_H5PY, "No h5py")
+    def test_op2_hdf5_compression_partial(self):
+        """tests a compressed hdf5 export and loading part of it"""
+        log = get_logger(level='warning')
+        op2_filename = MODEL_PATH / 'elements' / 'time_elements.op2'
+        hdf5_filename = MODEL_PATH / 'elements' / 'time_elements.test_op2_partial.h5'
+        model = read_op2(op2_filename, log=log)
+        model.export_hdf5_filename(hdf5_filename, compression='gzip', compression_opts=4)
+
+        itimes = [0, 3, 4]
+        node_ids = [1, 5, 6]
+        element_ids = [6, 7, 16]
+        model2 = OP2(log=log)
+        model2.load_hdf5_filename(
+            hdf5_filename, subcases=[1],
+            result_names=['displacements', 'stress.cquad4_stress'],
+            itimes=itimes, node_ids=node_ids, element_ids=element_ids)
+        os.remove(hdf5_filename)
+        assert len(model2.spc_forces) == 0
+
+        disp = model.displacements[1]
+        disp2 = model2.displacements[1]
+        inid = np.searchsorted(disp.node_gridtype[:, 0], node_ids)
+        assert np.array_equal(disp2.node_gridtype, disp.node_gridtype[inid, :])
+        assert np.array_equal(disp2.data, disp.data[itimes][:, inid, :])
+        assert np.array_equal(disp2._times, disp._times[itimes])
+        assert disp2.ntimes == 3 and disp2.ntotal == 3, (disp2.ntimes, disp2.ntotal)
+
+        stress = model.op2_results.stress.cquad4_stress[1]
+        stress2 = model2.op2_results.stress.cquad4_stress[1]
+        irow = np.where(np.isin(stress.element_node[:, 0], element_ids))[0]
+        assert len(irow) > 0
+        assert np.array_equal(stress2.element_node, stress.element_node[irow, :])
+        assert np.array_equal(stress2.data, stress.data[itimes][:, irow, :])
+
     def test_op2_solid_shell_bar_01_geom(self):
         """tests reading op2 geometry"""
         log = get_logger(level='warning')
@@ -4032,6 +4319,26 @@ class TestOP2Main(Tester):
                 #build_pandas=True, log=log)
 
 
+def _check_sort2_op2(model1: OP2, sort2_filename: str,
+                     result_names: list[str], log) -> None:
+    """checks the vectorized and unvectorized SORT2 readers match the SORT1 results"""
+    for use_vector in [True, False]:
+        model2 = OP2(log=log)
+        model2.use_vector = use_vector
+        model2.read_op2(sort2_filename, build_dataframe=False)
+        for result_name in result_names:
+            obj1 = model1.get_result(result_name)[1]
+            obj2 = model2.get_result(result_name)[1]
+            msg = f'{result_name} use_vector={use_vector}'
+            assert np.array_equal(obj1._times, obj2._times), msg
+            if hasattr(obj1, 'element_node'):
+                assert np.array_equal(obj1.element_node, obj2.element_node), msg
+            else:
+                assert np.array_equal(obj1.element, obj2.element), msg
+            assert obj1.data.shape == obj2.data.shape, msg
+            assert np.allclose(obj1.data, obj2.data), msg
+
+
 def _verify_ids(bdf, op2: OP2, isubcase=1):
     """helper function for tests"""
     types = ['CQUAD4', 'CTRIA3', 'CHEXA', 'CPENTA', 'CTETRA', 'CROD', 'CONROD', 'CTUBE']
@@ -0,0 +1,119 @@
+"""
+writes SORT2 versions of SORT1 element results for the OP2 tests and
+benchmarks (the OP2 writer only supports SORT1)
+"""
+from __future__ import annotations
+from io import StringIO
+from struct import Struct, pack
+
+import numpy as np
+
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.writer.op2_writer import write_op2_header
+from pyNastran.op2.result_objects.op2_objects import _write_table_header
+
+#: the SORT2 table name of the SORT1 results
+SORT2_TABLES = {
+    'stress.': ('OES2', 5),
+    'strain.': ('OSTR2', 5),
+    'force.': ('OEF2', 4),
+}
+
+#: the real element results that may be written as SORT2
+SORT2_RESULT_NAMES = [
+    'stress.celas1_stress', 'stress.crod_stress', 'stress.conrod_stress',
+    'stress.ctube_stress', 'stress.ctria3_stress',
+    'strain.celas1_strain', 'strain.crod_strain', 'strain.ctria3_strain',
+    'force.celas1_force', 'force.crod_force', 'force.cbar_force',
+    'force.ctria3_force',
+]
+
+
+def _write_sort2_table3(op2_file, itable: int, obj, eid: int,
+                        table_code: int, num_wide: int) -> None:
+    """writes the 584 byte header record of a single element"""
+    if itable == -3:
+        op2_file.write(pack('12i', 4, itable, 4, 4, 1, 4, 4, 0, 4, 4, 146, 4))
+    else:
+        op2_file.write(pack('3i', 4, 146, 4))
+    words = [0] * 50
+    words[0] = obj.approach_code
+    words[1] = 2000 + table_code  # SORT2
+    words[2] = obj.element_type
+    words[3] = obj.isubcase
+    words[4] = eid * 10 + obj.device_code
+    words[8] = obj.format_code
+    words[9] = num_wide
+    words[10] = getattr(obj, 's_code', 0) or 0
+    words[22] = obj.thermal
+    title = b'%-128s' % obj.title.encode('latin1')
+    subtitle = b'%-128s' % obj.subtitle.encode('latin1')
+    label = b'%-128s' % obj.label.encode('latin1')
+    op2_file.write(pack('i50i128s128s128si', 584, *words, title, subtitle, label, 584))
+
+
+def write_sort2_op2(model: OP2, op2_filename: str,
+                    result_names: list[str]) -> list[str]:
+    """
+    Writes real, transient element results as SORT2 tables (one element
+    at all the times per subtable)
+
+    Returns
+    -------
+    result_names : list[str]
+        the results that were written
+    """
+    tables = {}
+    for result_name in get_result_names(model, result_names):
+        for prefix, (table_name, table_code) in SORT2_TABLES.items():
+            if result_name.startswith(prefix):
+                tables.setdefault((table_name, table_code), []).append(result_name)
+
+    written_result_names = []
+    op2_ascii = StringIO()
+    with open(op2_filename, 'wb') as op2_file:
+        write_op2_header(model, op2_file, op2_ascii, Struct('<3i'))
+        for (table_name, table_code), table_result_names in tables.items():
+            _write_table_header(op2_file, op2_ascii, model.date, table_name,
+                                b'%-8s' % table_name.encode('latin1'), include_date=True)
+            itable = -3
+            for result_name in table_result_names:
+                written_result_names.append(result_name)
+                for obj in model.get_result(result_name).values():
+                    ntimes = obj.data.shape[0]
+                    eids = getattr(obj, 'element', None)
+                    if eids is None:
+                        # upper/lower layers of the centroidal plates
+                        eids = obj.element_node[::2, 0]
+                    nelements = len(eids)
+                    values = obj.data.reshape(ntimes, nelements, -1)
+                    num_wide = values.shape[2] + 1
+                    ntotal = ntimes * num_wide
+                    record = np.empty((ntimes, num_wide), dtype='float32')
+                    record[:, 0] = obj._times
+                    for ielement, eid in enumerate(eids):
+                        _write_sort2_table3(op2_file, itable, obj, int(eid), table_code, num_wide)
+                        itable -= 1
+                        op2_file.write(pack('13i', 4, itable, 4, 4, 1, 4, 4, 0, 4,
+                                            4, ntotal, 4, 4 * ntotal))
+                        record[:, 1:] = values[:, ielement, :]
+                        op2_file.write(record.tobytes())
+                        op2_file.write(pack('i', 4 * ntotal))
+                        itable -= 1
+                        op2_file.write(pack('9i', 4, itable, 4, 4, 1, 4, 4, 0, 4))
+            op2_file.write(pack('3i', 4, 0, 4))
+        op2_file.write(pack('3i', 4, 0, 4))
+    return written_result_names
+
+
+def get_result_names(model: OP2, result_names: list[str]) -> list[str]:
+    """the results that are in the model"""
+    existing_result_names = []
+    for result_name in result_names:
+        try:
+            results = model.get_result(result_name)
+        except AttributeError:
+            continue
+        if results:
+            existing_result_names.append(result_name)
+    return existing_result_names
@@ -8,7 +8,7 @@ from cpylog import get_logger2
 
 #import pyNastran
 from pyNastran.op2.op2_interface.op2_f06_common import OP2_F06_Common
-from pyNastran.op2.op2_interface.write_utils import _write_markers
+from pyNastran.op2.op2_interface.write_utils import _write_markers, pack_markers, to_size8_bytes
 #from pyNastran.op2.errors import FatalError
 from .case_writer import write_casecc
 from .geom1_writer import write_geom1
@@ -46,7 +46,8 @@ class OP2Writer(OP2_F06_Common):
                   endian: bytes=b'<',
                   includes: Optional[list[str]]=None,
                   skips: Optional[list[str]]=None,
-                  nastran_format: Optional[str]=None) -> int:
+                  nastran_format: Optional[str]=None,
+                  size: int=4) -> int:
         """
         Writes an OP2 file based on the data we have stored in the object
 
@@ -57,13 +58,20 @@ class OP2Writer(OP2_F06_Common):
         post : int; default=-1
             the PARAM,POST flag
         endian : bytes; default='<'
-            little endian is strongly recommended
+            only little endian is supported; many of the element result
+            writers pack their markers in the native byte order
         includes : list[str]; default=None
             list of results to include; exclusive with skips; default for both includes/skips=None -> all included
         skips : list[str]; default=None
             list of results to skip; exclusive with includes
         nastran_format : str; default=None -> 'msc'
             supported formats: ['msc', 'nx', 'optistruct']
+        size : int; default=4
+            4 for a 32-bit OP2, 8 for a 64-bit OP2 (ids above 2^31).
+            A 64-bit OP2 only supports the displacement-style tables
+            (e.g., displacements, spc_forces); the geometry is skipped
+            and the other results raise a NotImplementedError (see
+            includes/skips)
         #is_mag_phase : bool; default=False
             #should complex data be written using Magnitude/Phase
             #instead of Real/Imaginary (default=False; Real/Imag)
@@ -73,6 +81,8 @@ class OP2Writer(OP2_F06_Common):
         if nastran_format is None:
             nastran_format = self._nastran_format
         assert nastran_format in {'msc', 'nx', 'optistruct'}, nastran_format
+        assert size in {4, 8}, size
+        assert endian == b'<', f'only little endian is supported; endian={endian!r}'
         skips = _set_skips(self, includes, skips)
 
         #print('writing %s' % op2_outname)
@@ -95,7 +105,7 @@ class OP2Writer(OP2_F06_Common):
                 op2_file, fop2_ascii, self,
                 skips,
                 post=post, endian=endian,
-                nastran_format=nastran_format)
+                nastran_format=nastran_format, size=size)
         except Exception:  # NotImplementedError
             if close:
                 op2_file.close()
@@ -157,13 +167,17 @@ def _set_skips(model: OP2Writer, includes: Optional[list[str]], skips: Optional[
 def _write_op2(op2_file, fop2_ascii, obj: OP2,
                skips: set[str],
                post: int=-1, endian: bytes=b'<',
-               nastran_format: str='nx') -> tuple[int, list[str]]:
+               nastran_format: str='nx', size: int=4) -> tuple[int, list[str]]:
     """actually writes the op2"""
     date = obj.date
     #op2_ascii.write('writing [3, 7, 0] header\n')
 
     struct_3i = Struct(endian + b'3i')
-    write_op2_header(obj, op2_file, fop2_ascii, struct_3i, post=post, endian=endian)
+    write_op2_header(obj, op2_file, fop2_ascii, struct_3i, post=post, endian=endian,
+                     size=size)
+    if size == 8:
+        skips = skips | {'GEOM1', 'GEOM2', 'GEOM3', 'GEOM4', 'EPT', 'MPT',
+                         'EDT', 'EDOM', 'DIT', 'grid_point_weight'}
     #if 'CASECC' not in skips:
         #write_casecc(op2_file, fop2_ascii, obj, endian=endian, nastran_format=nastran_format)
     obj.log.debug(f'nastran_format={nastran_format}')
@@ -197,20 +211,22 @@ def _write_op2(op2_file, fop2_ascii, obj: OP2,
     # nastran puts the tables in order of the Case Control deck,
     # but we're lazy so we just hardcode the order
 
-    case_count, table_names = _write_result_tables(obj, op2_file, fop2_ascii, struct_3i, endian, skips)
+    case_count, table_names = _write_result_tables(obj, op2_file, fop2_ascii, struct_3i, endian, skips,
+                                                   size=size)
     return case_count, table_names
 
 def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                          struct_3i,
-                         endian, skips: set[str]) -> tuple[int, list[str]]:
+                         endian, skips: set[str],
+                         size: int=4) -> tuple[int, list[str]]:
     """writes the op2 result tables"""
     table_names_found = []
     date = obj.date
     log = obj.log
     res_categories2 = defaultdict(list)
     table_order = [
-        'OUGV1', 'BOUGV1',
-        'OUGF1', 'OUG1F', 'BOUGF1',
+        'OUGV1', 'BOUGV1', 'OUGV2',
+        'OUGF1', 'OUG1F', 'BOUGF1', 'OUGF2',
         'TOUGV1', 'OTEMP1', 'OUG1S',
 
         'OAG1', 'OVG1', 'OUG1', 'OUGV1PAT',
@@ -221,15 +237,15 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
         'OUXY1', 'OUXY2', 'OPHSA',
 
         # spc/mpc forces
-        'OQG1',
-        'OQGV1',
-        'OQP1',
+        'OQG1', 'OQG2',
+        'OQGV1', 'OQGV2',
+        'OQP1', 'OQP2',
         'OQMG1',
         # contact/glue forces
-        'OQGCF1', 'OQGGF1',
+        'OQGCF1', 'OQGGF1', 'OQGCF2', 'OQGGF2',
         'OBC1',
         # load vectors
-        'OPG1', 'BOPG1', 'OPGV1', 'OPNL1',
+        'OPG1', 'BOPG1', 'OPGV1', 'OPNL1', 'OPG2', 'OPNL2',
 
         # ---------------
         # random displacement-style tables
@@ -359,9 +375,8 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
     ]
 
     footer = [4, 0, 4]
-    footer_bytes = struct_3i.pack(*footer)
-
-    struct_9i = Struct(endian + b'9i')
+    footer_bytes = pack_markers([0], size, endian)
+    is_interlaced = obj.is_nx
     for table_name in pretables + table_order:
         if table_name not in res_categories2:
             # no LAMA table in a static run
@@ -380,6 +395,11 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                 #print(element_name)
 
             #print(result.class_name)
+            if size == 8 and not hasattr(result, '_write_op2_records'):
+                raise NotImplementedError(
+                    f'  *op2 - {result.__class__.__name__}{element_name} can\'t be written '
+                    'with size=8; only the displacement-style tables (e.g., displacements, '
+                    'spc_forces) support size=8 (see includes/skips)')
             if hasattr(result, 'write_op2'):
                 if result.table_name not in table_names_found:
                     table_names_found.append(result.table_name)
@@ -398,8 +418,13 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
                     #print(' %-6s - %s - isubcase=%s%s; itable=%s %s' % (
                         #table_name, result.__class__.__name__,
                         #isubcase, element_name, itable, new_result))
-                    itable = result.write_op2(op2_file, fop2_ascii, itable, new_result,
-                                              date, is_mag_phase=False, endian=endian)
+                    if size == 8:
+                        itable = result.write_op2(op2_file, fop2_ascii, itable, new_result,
+                                                  date, is_mag_phase=False, endian=endian,
+                                                  size=size, is_interlaced=is_interlaced)
+                    else:
+                        itable = result.write_op2(op2_file, fop2_ascii, itable, new_result,
+                                                  date, is_mag_phase=False, endian=endian)
                 except Exception:
                     print(f' {result.__class__.__name__} - isubcase={isubcase}{element_name}')
                     raise
@@ -421,7 +446,7 @@ def _write_result_tables(obj: OP2, op2_file, fop2_ascii,
             ]
             #print('writing itable=%s' % itable)
             assert itable is not None, '%s itable is None' % result.__class__.__name__
-            op2_file.write(struct_9i.pack(*header))
+            op2_file.write(pack_markers([itable, 1, 0], size, endian))
             fop2_ascii.write('footer2 = %s\n' % header)
             new_result = False
 
@@ -459,7 +484,7 @@ def _fix_subcase_id(key: Union[int, tuple[Any]], res: Any) -> None:
 
 def write_op2_header(model: OP2, op2_file, fop2_ascii,
                      struct_3i: Struct,
-                     post: int=-1, endian: bytes=b'<'):
+                     post: int=-1, endian: bytes=b'<', size: int=4):
     """writes the op2 header"""
     is_nx = model.is_nx
     is_msc = model.is_msc
@@ -471,8 +496,26 @@ def write_op2_header(model: OP2, op2_file, fop2_ascii,
 
     if post == -1:
     #_write_markers(op2_file, op2_ascii, [3, 0, 7])
-        op2_file.write(struct_3i.pack(*[4, 3, 4,]))
         tape_code = b'NASTRAN FORT TAPE ID CODE - '
+        if size == 8:
+            # the date is always written and the strings are interlaced
+            if is_nx:
+                nastran_version = b'NX2019.2'
+            elif is_msc or is_optistruct:
+                nastran_version = b'XXXXXXXX'
+            else:
+                raise NotImplementedError(model._nastran_format)
+            day, month, year = model.date
+            op2_file.write(pack_markers([3], size, endian) +
+                           pack(endian + b'i3qi', 24, day, month, year - 2000, 24) +
+                           pack_markers([7], size, endian) +
+                           pack(endian + b'i56si', 56, to_size8_bytes(tape_code), 56) +
+                           pack_markers([2], size, endian) +
+                           pack(endian + b'i16si', 16, to_size8_bytes(nastran_version), 16) +
+                           pack_markers([-1, 0], size, endian))
+            return
+
+        op2_file.write(struct_3i.pack(*[4, 3, 4,]))
         if is_nx:
             op2_file.write(pack(endian + b'7i 28s i', *[4, 1, 4,
                                                         4, 7, 4,
@@ -496,6 +539,7 @@ def write_op2_header(model: OP2, op2_file, fop2_ascii,
         op2_file.write(pack(endian + b'6i', *[4, -1, 4,
                                               4, 0, 4,]))
     elif post == -2:
+        assert size == 4, size
         _write_markers(op2_file, fop2_ascii, [2, 4])
     else:
         raise RuntimeError(f'post = {post:d}; use -1 or -2')
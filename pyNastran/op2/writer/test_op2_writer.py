@@ -1,5 +1,8 @@
 import unittest
 import os
+from io import BytesIO
+from struct import unpack
+import numpy as np
 from cpylog import SimpleLogger
 
 import pyNastran
@@ -7,7 +10,10 @@ import pyNastran
 #from pyNastran.op2.op2 import FatalError
 #from pyNastran.op2.op2_interface.op2_common import get_scode_word
 from pyNastran.op2.op2_geom import read_op2_geom
-from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2 import OP2, read_op2
+from pyNastran.op2.errors import SixtyFourBitError
+from pyNastran.op2.result_objects.op2_objects import _write_table_header
+from pyNastran.op2.writer.op2_writer import TrashWriter
 #from pyNastran.op2.test.test_op2 import run_op2
 #from pyNastran.op2.writer.op2_writer import OP2Writer
 
@@ -315,6 +321,71 @@ class TestOP2Writer(unittest.TestCase):
                              stop_on_failure=True, debug=False)
         os.remove(op2_filename_debug_out)
 
+    def test_write_64_bit(self):
+        """tests 64-bit op2 writing with ids that don't fit in an int32"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'other')
+        op2_filename = os.path.join(folder, 'sdr11se_s2dclg.op2')
+        op2_filename_out = os.path.join(folder, 'sdr11se_s2dclg_out.op2')
+
+        op2 = read_op2(op2_filename, include_results='displacements', debug=None, log=log)
+        with self.assertRaises(SixtyFourBitError):
+            op2.write_op2(op2_filename_out, includes=['displacements'])
+        with self.assertRaises(AssertionError):
+            op2.write_op2(op2_filename_out, includes=['displacements'], endian=b'>')
+
+        op2.write_op2(op2_filename_out, includes=['displacements'], size=8)
+        op2b = read_op2(op2_filename_out, debug=None, log=log)
+        for key, disp in op2.displacements.items():
+            dispb = op2b.displacements[key]
+            assert dispb.size == 8, dispb.size
+            assert np.array_equal(disp.node_gridtype, dispb.node_gridtype)
+            assert np.allclose(disp._times, dispb._times)
+            assert np.allclose(disp.data, dispb.data)
+
+        # the other results aren't supported
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'time_elements.op2')
+        op2 = read_op2(op2_filename, include_results=['displacements', 'stress'],
+                       debug=None, log=log)
+        with self.assertRaises(NotImplementedError):
+            op2.write_op2(op2_filename_out, size=8)
+        os.remove(op2_filename_out)
+
+    def test_write_sort2(self):
+        """tests SORT2 op2 writing for 32-bit and 64-bit files"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'elements')
+        op2_filename = os.path.join(folder, 'time_elements.op2')
+        op2_filename_out = os.path.join(folder, 'time_elements_sort2_out.op2')
+
+        for size in [4, 8]:
+            op2 = read_op2(op2_filename, include_results='displacements', debug=None, log=log)
+            disp = op2.displacements[1]
+            disp.table_name = 'OUGV2'
+            disp.tCode = 2000 + disp.table_code
+            disp.sort_code = 2
+            disp.sort_bits[1] = 1
+            disp.sort_method = 2
+            assert disp.is_sort2
+
+            op2.write_op2(op2_filename_out, includes=['displacements'], size=size)
+            op2b = read_op2(op2_filename_out, debug=None, log=log)
+            dispb = op2b.displacements[1]
+            assert np.array_equal(disp.node_gridtype, dispb.node_gridtype)
+            assert np.allclose(disp._times, dispb._times)
+            assert np.allclose(disp.data, dispb.data)
+        os.remove(op2_filename_out)
+
+    def test_write_table_header_endian(self):
+        """tests the table header is written in the requested byte order"""
+        for endian in [b'<', b'>']:
+            op2_file = BytesIO()
+            _write_table_header(op2_file, TrashWriter(), (3, 6, 2014), 'OUGV1',
+                                b'OUG1', endian=endian)
+            data = op2_file.getvalue()
+            assert unpack(endian + b'3i', data[:12]) == (4, 2, 4), data[:12]
+            assert unpack(endian + b'i8si', data[12:28]) == (8, b'OUGV1   ', 8), data[12:28]
+
     def test_thermal_1(self):
         """tests basic op2 thermal writing"""
         log = SimpleLogger(level='info', encoding='utf-8')
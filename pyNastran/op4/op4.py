@@ -13,6 +13,7 @@ from cpylog import get_logger2, SimpleLogger
 from pyNastran.utils import is_binary_file as file_is_binary, PathLike, PurePath
 from pyNastran.utils.mathematics import print_matrix #, print_annotated_matrix
 from pyNastran.op2.result_objects.matrix import Matrix
+from pyNastran.op4.op4_binary import is_fast_binary_op4, read_op4_binary_fast
 
 
 class OP4:
@@ -31,13 +32,21 @@ class OP4:
         self._new = False
         self.large = False
 
+        #: read the 32-bit binary OP4s with bulk column decoding
+        #: (see ``read_op4_binary_fast``)
+        self.use_fast_binary = True
+
     def read_op4(self, op4_filename: Optional[PathLike]=None,
                  matrix_names: Optional[list[str]]=None,
-                 precision: str='default') -> dict[str, Matrix]:
+                 precision: str='default',
+                 sparse_type: str='coo',
+                 lazy: bool=False) -> dict[str, Matrix]:
         """See ``read_op4``"""
         if precision not in {'default', 'single', 'double'}:
             msg = "precision=%r and must be 'single', 'double', or 'default'" % precision
             raise ValueError(msg)
+        if sparse_type not in {'coo', 'csc', 'csr'}:
+            raise ValueError(f'sparse_type={sparse_type!r}; supports=[coo, csc, csr]')
 
         if op4_filename is None:
             from pyNastran.utils.gui_io import load_file_dialog
@@ -57,10 +66,14 @@ class OP4:
 
         if file_is_binary(op4_filename):
             matrices = self.read_op4_binary(
-                op4_filename, matrix_names, precision)
+                op4_filename, matrix_names, precision,
+                sparse_type=sparse_type, lazy=lazy)
         else:
             matrices = self.read_op4_ascii(
                 op4_filename, matrix_names, precision)
+            if sparse_type != 'coo':
+                for matrix in matrices.values():
+                    _to_sparse_type(matrix, sparse_type)
         return matrices
 
 #--------------------------------------------------------------------------
@@ -605,14 +618,30 @@ class OP4:
     def read_op4_binary(self, op4_filename: PathLike,
                         matrix_names: Optional[list[str]]=None,
                         precision: str='default',
-                       use_matrix_class=False):
-        """matrix_names must be a list or None, but basically the same"""
+                        use_matrix_class=False,
+                        sparse_type: str='coo',
+                        lazy: bool=False):
+        """
+        matrix_names must be a list or None, but basically the same
+
+        The 32-bit OP4s are read with bulk column decoding
+        (see ``use_fast_binary``), which supports sparse_type/lazy.
+        """
         self.n = 0
         matrices: dict[str, Matrix] = {}
         name = 'dummyName'
 
         with open(op4_filename, mode='rb') as op4:
             self._endian = self._determine_endian(op4)
+
+        if self.use_fast_binary and not self.debug and is_fast_binary_op4(op4_filename, self.large):
+            for name, amat in read_op4_binary_fast(
+                    op4_filename, self._endian, matrix_names=matrix_names,
+                    sparse_type=sparse_type, lazy=lazy, log=self.log):
+                _save_matrix(matrices, name, amat)
+            return matrices
+
+        with open(op4_filename, mode='rb') as op4:
             while name is not None:
                 # checks for the end of the file
                 assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
@@ -626,6 +655,7 @@ class OP4:
                 (name, amat) = self._read_matrix_binary(op4, precision, matrix_names)
                 #print(print_matrix(amat.matrix))
                 if is_saved_matrix(name, matrix_names):
+                    _to_sparse_type(amat, sparse_type)
                     _save_matrix(matrices, name, amat)
 
                 #print("not op4.closed = ",not op4.closed,form,name)
@@ -1452,6 +1482,11 @@ def _save_matrix(matrices, name: str, amat: Matrix) -> None:
         # typical case
         matrices[name] = amat
 
+def _to_sparse_type(amat: Matrix, sparse_type: str) -> None:
+    """converts a coo_matrix to the sparse_type"""
+    if sparse_type != 'coo' and isinstance(amat.data, coo_matrix):
+        amat.data = amat.data.asformat(sparse_type)
+
 def _get_start_end_row(A: np.ndarray, nrows: int) -> tuple[Optional[int], Optional[int]]:
     """Find the starting and ending points of the matrix"""
     istart = None
@@ -1997,7 +2032,9 @@ def is_saved_matrix(name: str, matrix_names: Optional[list[str]]) -> bool:
 def read_op4(op4_filename: Optional[PathLike]=None,
              matrix_names: Optional[list[str]]=None,
              precision: str='default',
-             debug: bool=False, log=None) -> dict[str, Matrix]:
+             debug: bool=False, log=None,
+             sparse_type: str='coo',
+             lazy: bool=False) -> dict[str, Matrix]:
     """
     Reads a NASTRAN OUTPUT4 file, and stores the
     matrices as the output arguments.  The number of
@@ -2025,6 +2062,10 @@ def read_op4(op4_filename: Optional[PathLike]=None,
        >>> matrices = op4.read_op4(op4_filename, matrix_names='A')
        >>> MatrixA = matrices['A']
 
+       # or read the sparse matrices as csc_matrix when they're used
+       >>> matrices = op4.read_op4(op4_filename, sparse_type='csc', lazy=True)
+       >>> MatrixA = matrices['A'].data
+
        # get all the matrices, but select the file using a file dialog
        >>> matrices = op4.read_op4()
        >>>
@@ -2038,6 +2079,11 @@ def read_op4(op4_filename: Optional[PathLike]=None,
     precision : str; {'default', 'single', 'double'}
         specifies if the matrices are in single or double precsion
         which means the format will be whatever the file is in
+    sparse_type : str; {'coo', 'csc', 'csr'}; default='coo'
+        the type of the sparse matrices
+    lazy : bool; default=False
+        binary OP4s only; the matrices are read when their data is
+        first accessed (matrix.data), so the file stays memory mapped
 
     Returns
     -------
@@ -2079,7 +2125,8 @@ def read_op4(op4_filename: Optional[PathLike]=None,
     """
     op4 = OP4(log=log, debug=debug)
     matrices = op4.read_op4(
-        op4_filename, matrix_names, precision)
+        op4_filename, matrix_names, precision,
+        sparse_type=sparse_type, lazy=lazy)
     return matrices
 
 def write_op4(op4_filename: Optional[PathLike],
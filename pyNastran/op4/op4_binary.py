@@ -0,0 +1,313 @@
+"""
+Defines reading binary OP4 files with bulk column decoding.
+
+The file is memory mapped and the column records of each matrix are
+walked once to find the strings (the runs of values) of each column.
+The values of a matrix are then sliced out of the file in one pass and
+the dense/sparse matrix is assembled directly from the index arrays
+(e.g., the indices/indptr of a csc_matrix), so there is no per value
+unpacking.
+
+A matrix is made up of Fortran records:
+ - the header: (ncols, nrows, form, matrix_type, name)
+ - a record per (non-null) column: (icol, irow, nwords, data)
+     - dense: irow is the first row; data are the values
+     - sparse: irow=0; data are strings of (header, values)
+         - small: header=IS, where IS = (L + 1) * 65536 + irow
+         - big:   header=(L + 1, irow)
+ - the last record: icol=ncols+1
+
+Example
+-------
+>>> matrices = read_op4(op4_filename, sparse_type='csc')
+
+# only read KAAX when it's accessed
+>>> matrices = read_op4(op4_filename, lazy=True)
+>>> kaax = matrices['KAAX'].data
+"""
+from __future__ import annotations
+import sys
+from typing import Callable, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+import scipy.sparse  # type: ignore
+
+from pyNastran.op2.result_objects.matrix import Matrix
+if TYPE_CHECKING:  # pragma: no cover
+    from cpylog import SimpleLogger
+
+#: matrix_type: (nwords_per_value, value format)
+_MATRIX_TYPES = {
+    1: (1, 'f4'),
+    2: (2, 'f8'),
+    3: (2, 'c8'),
+    4: (4, 'c16'),
+}
+_NATIVE_ENDIAN = '<' if sys.byteorder == 'little' else '>'
+
+
+class LazyMatrix(Matrix):
+    """
+    A Matrix that's read from the OP4 when the data is first accessed
+    (see ``read_op4(..., lazy=True)``)
+    """
+    def __init__(self, name: str, form: int, loader: Callable[[], Any]):
+        super().__init__(name, form)
+        self._loader = loader
+
+    @property
+    def data(self):
+        """the matrix; read on the first call"""
+        if self._loader is not None:
+            self._data = self._loader()
+            self._loader = None
+        return self._data
+
+    @data.setter
+    def data(self, data) -> None:
+        self._data = data
+        self._loader = None
+
+
+def is_fast_binary_op4(op4_filename: str, large: bool) -> bool:
+    """
+    Can the OP4 be read by ``read_op4_binary_fast``?
+
+    The 64-bit (large) OP4s are read by the standard reader.
+    """
+    if large:
+        return False
+    with open(op4_filename, 'rb') as op4:
+        op4.seek(0, 2)
+        nbytes = op4.tell()
+    return nbytes > 0 and nbytes % 4 == 0
+
+
+def read_op4_binary_fast(op4_filename: str, endian: str,
+                         matrix_names: Optional[list[str]]=None,
+                         sparse_type: str='coo',
+                         lazy: bool=False,
+                         log: Optional[SimpleLogger]=None) -> list[tuple[str, Matrix]]:
+    """
+    Reads a 32-bit binary OP4
+
+    Parameters
+    ----------
+    op4_filename : str
+        the binary OP4
+    endian : str
+        the endian of the file ('<', '>')
+    matrix_names : list[str]; default=None -> all
+        the matrices to read; the other matrices are skipped
+        without being decoded
+    sparse_type : str; default='coo'
+        the type of the sparse matrices ('coo', 'csc', 'csr')
+    lazy : bool; default=False
+        read the matrices when the data is accessed (see ``LazyMatrix``);
+        the file stays memory mapped until the matrices are read
+
+    Returns
+    -------
+    matrices : list[(name, Matrix)]
+        the matrices in the order of the file; a name may be repeated
+        (e.g., the QHH)
+
+    """
+    if sparse_type not in {'coo', 'csc', 'csr'}:
+        raise ValueError(f'sparse_type={sparse_type!r}; supports=[coo, csc, csr]')
+    raw = np.memmap(op4_filename, dtype='uint8', mode='r')
+    words = raw.view(endian + 'i4')
+    if endian != _NATIVE_ENDIAN:
+        words = words.astype('int32')
+
+    # memoryview indexing returns ints, which is faster than the numpy
+    # scalars for walking the records
+    iwords = memoryview(words)
+    nwords_total = len(iwords)
+
+    matrices = []
+    iword = 0
+    while iword < nwords_total:
+        header = _read_matrix_header(raw, iwords, iword, op4_filename)
+        name, form = header[0], header[3]
+        irecords, iword = _scan_columns(iwords, iword + 8, header[1])
+        if matrix_names is not None and name not in matrix_names:
+            if log is not None:
+                log.debug(f'skipping {name}')
+            continue
+
+        args = (raw, iwords, endian, header, irecords, sparse_type)
+        if lazy:
+            matrix = LazyMatrix(name, form, _loader(*args))
+        else:
+            matrix = Matrix(name, form, data=_read_matrix(*args))
+        matrices.append((name, matrix))
+    return matrices
+
+
+def _loader(*args) -> Callable[[], Any]:
+    """binds the arguments of _read_matrix"""
+    def load():
+        return _read_matrix(*args)
+    return load
+
+
+def _read_matrix_header(raw: np.ndarray, iwords: memoryview, iword: int,
+                        op4_filename: str) -> tuple[str, int, int, int, int]:
+    """
+    Reads the matrix header record
+
+    Returns
+    -------
+    (name, ncols, nrows, form, matrix_type) : (str, int, int, int, int)
+        nrows is negative for a BIGMAT matrix
+    """
+    record_length = iwords[iword]
+    if record_length != 24:
+        msg = 'record_length=%s filename=%r' % (record_length, op4_filename)
+        raise NotImplementedError(msg)
+    ncols, nrows, form, matrix_type = iwords[iword+1:iword+5].tolist()
+    ibyte = 4 * (iword + 5)
+    name = raw[ibyte:ibyte+8].tobytes().strip().decode('ascii')
+    if matrix_type not in _MATRIX_TYPES:
+        raise TypeError(f'matrix_type={matrix_type}')
+    return name, ncols, nrows, form, matrix_type
+
+
+def _scan_columns(iwords: memoryview, iword: int, ncols: int) -> tuple[list[int], int]:
+    """
+    Walks the column records of a matrix
+
+    Returns
+    -------
+    irecords : list[int]
+        the word index of the column records
+    iword : int
+        the word index of the next matrix
+    """
+    irecords = []
+    while True:
+        record_length = iwords[iword]
+        icol = iwords[iword+1]
+        if icol > ncols:
+            # the last record
+            return irecords, iword + record_length // 4 + 2
+        irecords.append(iword)
+        iword += record_length // 4 + 2
+
+
+def _read_matrix(raw: np.ndarray, iwords: memoryview, endian: str,
+                 header: tuple[str, int, int, int, int],
+                 irecords: list[int], sparse_type: str) -> Any:
+    """
+    Reads a dense/sparse matrix from the column records
+
+    Returns
+    -------
+    data : np.ndarray / sparse matrix
+        sparse matrices are the ``sparse_type``
+    """
+    unused_name, ncols, nrows, unused_form, matrix_type = header
+    is_big_mat = nrows < 0 or nrows > 65535
+    nrows = abs(nrows)
+    nwords_per_value, value_format = _MATRIX_TYPES[matrix_type]
+    dtype = np.dtype(value_format)
+
+    # a matrix is sparse when irow=0 (a null matrix is dense)
+    is_sparse = len(irecords) > 0 and iwords[irecords[0]+2] == 0
+    if is_sparse:
+        icols, irows, istarts, nwords = _get_sparse_strings(iwords, irecords, is_big_mat)
+    else:
+        icols, irows, istarts, nwords = _get_dense_strings(iwords, irecords)
+
+    # the value words are sliced out of the file in one pass
+    ivalue_words = _ranges(istarts, nwords)
+    data = raw.view('uint32')[ivalue_words].view(endian + value_format).astype(dtype)
+
+    nvalues = nwords // nwords_per_value
+    rows = _ranges(irows - 1, nvalues)
+    if not is_sparse:
+        matrix = np.zeros((nrows, ncols), dtype=dtype)
+        matrix[rows, np.repeat(icols - 1, nvalues)] = data
+        return matrix
+
+    shape = (nrows, ncols)
+    if np.all(np.diff(icols) >= 0):
+        # the columns are in order, so we can build the csc_matrix directly
+        indptr = np.zeros(ncols + 1, dtype='int64')
+        np.add.at(indptr, icols, nvalues)
+        indptr = np.cumsum(indptr)
+        matrix = scipy.sparse.csc_matrix((data, rows, indptr), shape=shape, dtype=dtype)
+        if sparse_type == 'coo':
+            return matrix.tocoo()
+        return matrix.asformat(sparse_type)
+
+    matrix = scipy.sparse.coo_matrix(
+        (data, (rows, np.repeat(icols - 1, nvalues))), shape=shape, dtype=dtype)
+    return matrix.asformat(sparse_type)
+
+
+def _get_dense_strings(iwords: memoryview,
+                       irecords: list[int]) -> tuple[np.ndarray, ...]:
+    """a dense column record is a single string: (icol, irow, nwords, values)"""
+    icols = []
+    irows = []
+    nwords = []
+    for irecord in irecords:
+        icol, irow, nwordsi = iwords[irecord+1:irecord+4].tolist()
+        icols.append(icol)
+        irows.append(irow)
+        nwords.append(nwordsi)
+    istarts = np.array(irecords, dtype='int64') + 4
+    return (np.array(icols, dtype='int64'), np.array(irows, dtype='int64'),
+            istarts, np.array(nwords, dtype='int64'))
+
+
+def _get_sparse_strings(iwords: memoryview, irecords: list[int],
+                        is_big_mat: bool) -> tuple[np.ndarray, ...]:
+    """
+    Walks the strings of the sparse column records
+
+    Returns
+    -------
+    icols, irows, istarts, nwords : (nstrings, ) int ndarray
+        the 1-based column/first row of each string, and the word
+        index/number of words of the values
+    """
+    icols = []
+    irows = []
+    istarts = []
+    nwords = []
+    for irecord in irecords:
+        icol = iwords[irecord+1]
+        iword = irecord + 4
+        iend = iword + iwords[irecord+3]
+        while iword < iend:
+            if is_big_mat:
+                nwordsi = iwords[iword] - 1
+                irow = iwords[iword+1]
+                iword += 2
+            else:
+                string_header = iwords[iword]
+                nwordsi = string_header // 65536 - 1
+                irow = string_header - 65536 * (nwordsi + 1)
+                iword += 1
+            icols.append(icol)
+            irows.append(irow)
+            istarts.append(iword)
+            nwords.append(nwordsi)
+            iword += nwordsi
+    return (np.array(icols, dtype='int64'), np.array(irows, dtype='int64'),
+            np.array(istarts, dtype='int64'), np.array(nwords, dtype='int64'))
+
+
+def _ranges(istarts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Concatenates the ranges [istart, istart + count)
+
+    >>> _ranges(np.array([3, 10]), np.array([2, 3]))
+    [3, 4, 10, 11, 12]
+    """
+    ntotal = counts.sum()
+    offsets = np.repeat(istarts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(ntotal, dtype='int64')
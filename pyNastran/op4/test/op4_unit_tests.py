@@ -1,6 +1,8 @@
 """runs various OP4 tests"""
 import os
 import unittest
+import tempfile
+from struct import pack
 
 import numpy as np
 from numpy import ones, reshape, arange
@@ -10,6 +12,7 @@ import scipy.sparse
 from scipy.sparse import coo_matrix  # type: ignore
 
 from pyNastran.op4.op4 import OP4, read_op4, Matrix
+from pyNastran.op4.op4_binary import LazyMatrix
 import pyNastran.op4.test
 
 OP4_PATH = pyNastran.op4.test.__path__[0]
@@ -340,6 +343,96 @@ class TestOP4(unittest.TestCase):
         #for line in Kgg:
             #print(line)
 
+    def test_op4_binary_fast(self):
+        """the bulk column decoding is the same as the standard reader"""
+        fnames = ['mat_b_dn.op4', 'mat_b_s1.op4', 'mat_b_s2.op4', 'testplate_kgg.op4']
+        for fname in fnames:
+            op4_filename = os.path.join(OP4_PATH, fname)
+            op4 = OP4()
+            op4.use_fast_binary = False
+            matrices1 = op4.read_op4(op4_filename)
+            matrices2 = read_op4(op4_filename)
+            self.assertEqual(list(matrices1), list(matrices2))
+            for name, matrix1 in matrices1.items():
+                data1 = matrix1.data
+                data2 = matrices2[name].data
+                self.assertEqual(matrix1.form, matrices2[name].form)
+                self.assertEqual(type(data1), type(data2))
+                self.assertEqual(data1.dtype, data2.dtype)
+                if isinstance(data1, coo_matrix):
+                    self.assertTrue(array_equal(data1.row, data2.row))
+                    self.assertTrue(array_equal(data1.col, data2.col))
+                    self.assertTrue(array_equal(data1.data, data2.data))
+                else:
+                    self.assertTrue(array_equal(data1, data2))
+
+    def test_op4_binary_sparse(self):
+        """tests the sparse_type/lazy options of a sparse binary OP4"""
+        real = scipy.sparse.random(300, 200, density=0.05, format='csc', random_state=1)
+        complex_matrix = (real + 2j * real).tocsc().astype('complex64')
+        with tempfile.TemporaryDirectory() as dirname:
+            op4_filename = os.path.join(dirname, 'sparse.op4')
+            with open(op4_filename, 'wb') as op4_file:
+                _write_sparse_op4(op4_file, 'KAAX', real, matrix_type=2, is_big_mat=False)
+                _write_sparse_op4(op4_file, 'MAA', real, matrix_type=2, is_big_mat=True)
+            for use_fast_binary in [False, True]:
+                op4 = OP4()
+                op4.use_fast_binary = use_fast_binary
+                matrices = op4.read_op4(op4_filename, sparse_type='csc')
+                for name in ['KAAX', 'MAA']:
+                    data = matrices[name].data
+                    assert isinstance(data, scipy.sparse.csc_matrix), type(data)
+                    self.assertEqual(abs(data - real).max(), 0.)
+
+            # the standard reader doesn't support multiple complex strings per column
+            with open(op4_filename, 'ab') as op4_file:
+                _write_sparse_op4(op4_file, 'QHH', complex_matrix, matrix_type=3, is_big_mat=False)
+            data = read_op4(op4_filename)['QHH'].data
+            self.assertEqual(data.dtype, np.complex64)
+            self.assertEqual(abs(data - complex_matrix).max(), 0.)
+
+            matrices = read_op4(op4_filename, matrix_names=['MAA', 'QHH'], lazy=True)
+            self.assertEqual(list(matrices), ['MAA', 'QHH'])
+            matrix = matrices['MAA']
+            assert isinstance(matrix, LazyMatrix), type(matrix)
+            assert matrix._loader is not None
+            assert isinstance(matrix.data, coo_matrix), type(matrix.data)
+            assert matrix._loader is None
+            self.assertEqual(abs(matrix.data - real).max(), 0.)
+            del matrices, matrix
+
+def _write_sparse_op4(op4_file, name: str, matrix: scipy.sparse.csc_matrix,
+                      matrix_type: int, is_big_mat: bool) -> None:
+    """writes a sparse binary OP4 matrix with a string per run of rows"""
+    nrows, ncols = matrix.shape
+    dtype, nwords_per_value = {2: ('<f8', 2), 3: ('<f4', 2)}[matrix_type]
+
+    def write_record(data: bytes) -> None:
+        op4_file.write(pack('<i', len(data)) + data + pack('<i', len(data)))
+
+    nrows_header = -nrows if is_big_mat else nrows
+    write_record(pack('<4i8s', ncols, nrows_header, 2, matrix_type, name.ljust(8).encode()))
+    matrix.sort_indices()
+    for icol in range(ncols):
+        rows = matrix.indices[matrix.indptr[icol]:matrix.indptr[icol+1]]
+        values = matrix.data[matrix.indptr[icol]:matrix.indptr[icol+1]]
+        if len(rows) == 0:
+            continue
+        data = b''
+        ibreaks = np.flatnonzero(np.diff(rows) != 1) + 1
+        for rowsi, valuesi in zip(np.split(rows, ibreaks), np.split(values, ibreaks)):
+            nwords = len(valuesi) * nwords_per_value
+            if is_big_mat:
+                data += pack('<2i', nwords + 1, rowsi[0] + 1)
+            else:
+                data += pack('<i', (nwords + 1) * 65536 + rowsi[0] + 1)
+            if matrix_type == 3:
+                valuesi = np.column_stack([valuesi.real, valuesi.imag])
+            data += np.asarray(valuesi, dtype=dtype).tobytes()
+        write_record(pack('<3i', icol + 1, 0, len(data) // 4) + data)
+    write_record(pack('<3i', ncols + 1, 1, 2) + bytes(8))
+
+
 def get_matrices():
     """creates dummy matrices"""
     strings = np.array([